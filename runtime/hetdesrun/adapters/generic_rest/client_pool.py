@@ -0,0 +1,133 @@
+"""Long-lived HTTP clients for requests to generic REST adapters
+
+Opening a new client for every load or send operation means opening new connections
+(including TLS handshakes) for every execution, which dominates the duration of small
+executions. Instead, every worker process keeps one client per adapter key. Their
+connections are kept alive between executions within the configured limits.
+
+Clients are bound to the event loop they were created in, so new ones are created
+for a new event loop. The number of requests and of opened connections is recorded
+per adapter key to show how often connections are reused.
+"""
+import asyncio
+import logging
+from typing import Any
+
+import httpx
+from pydantic import BaseModel, Field
+
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class AdapterConnectionStatistics(BaseModel):
+    requests: int = Field(0, description="Number of requests sent to the adapter")
+    opened_connections: int = Field(
+        0, description="Number of connections opened to the adapter"
+    )
+    tls_handshakes: int = Field(
+        0, description="Number of TLS handshakes with the adapter"
+    )
+    requests_with_reused_connection: int = Field(
+        0,
+        description=(
+            "Number of requests sent via an already opened connection."
+            " Determined when the statistics are obtained."
+        ),
+    )
+
+
+class AdapterClientPool:
+    """One long-lived httpx client per generic REST adapter"""
+
+    def __init__(self) -> None:
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._statistics: dict[str, AdapterConnectionStatistics] = {}
+
+    def get(self, adapter_key: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # clients of another event loop cannot be used or closed in this one
+            self._clients = {}
+            self._loop = loop
+        client = self._clients.get(adapter_key)
+        if client is None or client.is_closed:
+            client = self._create_client(adapter_key)
+            self._clients[adapter_key] = client
+        return client
+
+    def statistics(self) -> dict[str, AdapterConnectionStatistics]:
+        """Copy of the connection statistics by adapter key"""
+        return {
+            adapter_key: statistics.copy(
+                update={
+                    "requests_with_reused_connection": max(
+                        statistics.requests - statistics.opened_connections, 0
+                    )
+                }
+            )
+            for adapter_key, statistics in self._statistics.items()
+        }
+
+    async def close(self) -> None:
+        if self._loop is asyncio.get_running_loop():
+            for client in self._clients.values():
+                await client.aclose()
+        self._clients = {}
+        self._loop = None
+        for adapter_key, statistics in self.statistics().items():
+            logger.info(
+                "Connection statistics of generic rest adapter %s: %s",
+                adapter_key,
+                statistics.json(),
+            )
+
+    def _create_client(self, adapter_key: str) -> httpx.AsyncClient:
+        statistics = self._statistics.setdefault(
+            adapter_key, AdapterConnectionStatistics()
+        )
+
+        async def trace(event_name: str, _info: dict[str, Any]) -> None:
+            if event_name in (
+                "connection.connect_tcp.complete",
+                "connection.connect_unix_socket.complete",
+            ):
+                statistics.opened_connections += 1
+            elif event_name == "connection.start_tls.complete":
+                statistics.tls_handshakes += 1
+
+        async def record_request(request: httpx.Request) -> None:
+            statistics.requests += 1
+            # extensions are typed as Mapping, so they are replaced by an extended dict
+            request.extensions = {**request.extensions, "trace": trace}
+
+        return httpx.AsyncClient(
+            verify=get_config().hd_adapters_verify_certs,
+            timeout=get_config().external_request_timeout,
+            limits=httpx.Limits(
+                max_connections=get_config().adapter_max_connections,
+                max_keepalive_connections=(
+                    get_config().adapter_max_keepalive_connections
+                ),
+                keepalive_expiry=get_config().adapter_keepalive_expiry,
+            ),
+            http2=get_config().adapter_http2 and _http2_available(),
+            event_hooks={"request": [record_request]},
+        )
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ModuleNotFoundError:
+        logger.warning(
+            "HTTP/2 for generic rest adapters requires the h2 package."
+            " Proceeding with HTTP/1.1."
+        )
+        return False
+    return True
+
+
+adapter_client_pool = AdapterClientPool()
@@ -10,7 +10,8 @@ from enum import Enum
 from typing import Any
 
 import pandas as pd
-from pydantic import create_model
+
+from hetdesrun.datatypes import dynamic_model
 
 logger = logging.getLogger(__name__)
 
@@ -74,12 +75,8 @@ class ValueDataType(str, Enum):
 
         Raises pydantic.ValidationError if parsing fails.
         """
-        DynamicallyParsedValue = create_model(  # type: ignore
-            "DynamicallyParsedValue",
-            value=(
-                self.parse_type,
-                ...,
-            ),
+        DynamicallyParsedValue = dynamic_model(
+            (("value", self.parse_type),), model_name="DynamicallyParsedValue"
         )
 
         if self is ValueDataType.ANY and isinstance(obj, str):
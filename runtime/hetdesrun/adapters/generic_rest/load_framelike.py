@@ -11,8 +11,8 @@ import logging
 from posixpath import join as posix_urljoin
 from typing import Any, Literal
 
+import httpx
 import pandas as pd
-import requests
 
 from hetdesrun.adapters.exceptions import (
     AdapterConnectionError,
@@ -20,10 +20,11 @@ from hetdesrun.adapters.exceptions import (
 )
 from hetdesrun.adapters.generic_rest.auth import get_generic_rest_adapter_auth_headers
 from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
+from hetdesrun.adapters.generic_rest.client_pool import adapter_client_pool
 from hetdesrun.adapters.generic_rest.external_types import ExternalType, df_empty
+from hetdesrun.adapters.generic_rest.ndjson import NDJSONFrameParser, NDJSONParsingError
 from hetdesrun.models.data_selection import FilteredSource
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
-from hetdesrun.webservice.config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -110,26 +111,26 @@ async def load_framelike_data(  # noqa: PLR0915
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
 
-    with requests.Session() as session:
-        try:
+    params: list[tuple[str, str | int | float | bool | None]] = [
+        ("id", (str(filtered_source.ref_id))) for filtered_source in filtered_sources
+    ]
+    params.extend(additional_params)
+
+    try:
+        async with adapter_client_pool.get(adapter_key).stream(
+            "GET",
+            url,
+            params=params,
+            headers=headers,
+        ) as resp:
             start_time = datetime.datetime.now(datetime.timezone.utc)
             logger.info(
                 "Start receiving generic rest adapter %s framelike data at %s",
                 adapter_key,
                 start_time.isoformat(),
             )
-            resp = session.get(
-                url,
-                params=[
-                    ("id", (str(filtered_source.ref_id)))
-                    for filtered_source in filtered_sources
-                ]
-                + additional_params,
-                stream=True,
-                headers=headers,
-                verify=get_config().hd_adapters_verify_certs,
-                timeout=get_config().external_request_timeout,
-            )
+            if resp.status_code != 200:
+                await resp.aread()
             if (
                 resp.status_code == 404
                 and "errorCode" in resp.text
@@ -157,7 +158,12 @@ async def load_framelike_data(  # noqa: PLR0915
                 raise AdapterConnectionError(msg)
             logger.info("Start reading in and parsing framelike data")
 
-            df: pd.DataFrame = pd.read_json(resp.raw, lines=True)
+            # Records are parsed as the chunks arrive, so that the body is never held
+            # in memory completely and other executions proceed while waiting.
+            parser = NDJSONFrameParser()
+            async for chunk in resp.aiter_bytes():
+                parser.feed(chunk)
+            df = parser.finish()
             end_time = datetime.datetime.now(datetime.timezone.utc)
             logger.info(
                 (
@@ -187,14 +193,21 @@ async def load_framelike_data(  # noqa: PLR0915
                 str(df.shape) if len(df) > 0 else "EMPTY RESULT",
                 str(df) if len(df) > 0 else "EMPTY RESULT",
             )
-        except requests.HTTPError as e:
-            msg = (
-                f"Requesting framelike data from generic rest adapter endpoint {url}"
-                f" failed with Exception {str(e)}"
-            )
+    except httpx.HTTPError as e:
+        msg = (
+            f"Requesting framelike data from generic rest adapter endpoint {url}"
+            f" failed with Exception {str(e)}"
+        )
 
-            logger.info(msg)
-            raise AdapterConnectionError(msg) from e
+        logger.info(msg)
+        raise AdapterConnectionError(msg) from e
+    except NDJSONParsingError as e:
+        msg = (
+            f"Could not parse framelike data from generic rest adapter endpoint {url}:"
+            f" {str(e)}"
+        )
+        logger.info(msg)
+        raise AdapterHandlingException(msg) from e
     logger.info("Complete generic rest adapter %s framelike request", adapter_key)
     if len(df) == 0:
         if endpoint == "timeseries":
@@ -13,11 +13,11 @@ from hetdesrun.adapters.exceptions import (
 )
 from hetdesrun.adapters.generic_rest.auth import get_generic_rest_adapter_auth_headers
 from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
+from hetdesrun.adapters.generic_rest.client_pool import adapter_client_pool
 from hetdesrun.adapters.generic_rest.external_types import ExternalType, ValueDataType
 from hetdesrun.models.adapter_data import RefIdType
 from hetdesrun.models.data_selection import FilteredSource
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
-from hetdesrun.webservice.config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +32,7 @@ async def load_single_metadatum_from_adapter(
     filtered_source: FilteredSource,
     adapter_key: str,
     client: httpx.AsyncClient,
+    headers: dict[str, str] | None = None,
 ) -> Any:
     if filtered_source.ref_id_type == RefIdType.SOURCE:
         endpoint = "sources"
@@ -48,7 +49,7 @@ async def load_single_metadatum_from_adapter(
         urllib.parse.quote(str(filtered_source.ref_key)),
     )
     try:
-        resp = await client.get(url, params=filtered_source.filters)
+        resp = await client.get(url, params=filtered_source.filters, headers=headers)
     except httpx.HTTPError as e:
         msg = (
             f"Requesting metadata data from generic rest adapter endpoint {url}"
@@ -126,19 +127,16 @@ async def load_multiple_metadata(
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
 
-    async with httpx.AsyncClient(
-        headers=headers,
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        loaded_metadata = await asyncio.gather(
-            *(
-                load_single_metadatum_from_adapter(
-                    filtered_source,
-                    adapter_key,
-                    client,
-                )
-                for filtered_source in data_to_load.values()
+    client = adapter_client_pool.get(adapter_key)
+    loaded_metadata = await asyncio.gather(
+        *(
+            load_single_metadatum_from_adapter(
+                filtered_source,
+                adapter_key,
+                client,
+                headers=headers,
             )
+            for filtered_source in data_to_load.values()
         )
+    )
     return dict(zip(data_to_load.keys(), loaded_metadata, strict=True))
@@ -1,6 +1,10 @@
+import asyncio
 import logging
+import time
 from collections import defaultdict
 from collections.abc import Iterable
+from itertools import pairwise
+from operator import itemgetter
 from typing import Any
 
 import numpy as np
@@ -12,10 +16,19 @@ from hetdesrun.adapters.exceptions import (
 )
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.generic_rest.load_framelike import load_framelike_data
+from hetdesrun.adapters.generic_rest.timestamps import format_timestamps
+from hetdesrun.adapters.generic_rest.ts_cache import timeseries_cache
 from hetdesrun.models.data_selection import FilteredSource
+from hetdesrun.multitsframe import sort_rows_by_code_and_time
+from hetdesrun.webservice.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Bounds for adapting the length of time windows to a single response
+MIN_WINDOW_LENGTH = pd.Timedelta(seconds=1)
+MAX_WINDOW_GROWTH = 2.0
+MAX_WINDOW_SHRINKAGE = 0.5
+
 
 async def load_ts_data_from_adapter(
     filtered_sources: list[FilteredSource],
@@ -31,10 +44,8 @@ async def load_ts_data_from_adapter(
     a "value" column with automatically inferred dtype
     and a timeseriesId column with dtype str.
 
-    This uses request with stream=True in combination with the raw response as file-like together
-    with Pandas read_json class method to get some minor performance out of the streaming.
-
-    It therefore currently isn't async.
+    The response is streamed and its records are parsed as they arrive (see ndjson
+    module), so that other executions proceed while waiting for the data.
     """
 
     df = await load_framelike_data(
@@ -50,19 +61,169 @@ async def load_ts_data_from_adapter(
     return df
 
 
-def extract_one_channel_series_from_loaded_data(
-    df: pd.DataFrame, ts_id: str
-) -> pd.Series:
+class WindowSizer:
+    """Length of time windows adapted to the observed responses
+
+    After every response the length is scaled such that a window of this length
+    would have taken the target duration and contained the target number of rows,
+    whichever yields the shorter window. The scaling per response is bounded.
+    """
+
+    def __init__(
+        self, length: pd.Timedelta, target_seconds: float, target_rows: int
+    ) -> None:
+        self.length = length
+        self.target_seconds = target_seconds
+        self.target_rows = target_rows
+
+    def observe(
+        self, window_length: pd.Timedelta, row_count: int, seconds: float
+    ) -> None:
+        factor = min(
+            self.target_seconds / max(seconds, 0.001),
+            self.target_rows / max(row_count, 1),
+        )
+        factor = min(max(factor, MAX_WINDOW_SHRINKAGE), MAX_WINDOW_GROWTH)
+        self.length = max(window_length * factor, MIN_WINDOW_LENGTH)
+
+
+def utc_timestamp(value: Any) -> pd.Timestamp | None:
     try:
-        extracted_df = df[df["timeseriesId"] == ts_id].copy()
-        extracted_df.index = extracted_df["timestamp"]
-        extracted_series = extracted_df["value"].sort_index()
-        extracted_series.attrs = df.attrs.get(ts_id, {})
-        logger.debug(
-            "extracted attributes %s for series with id %s",
-            extracted_series.attrs,
-            ts_id,
+        timestamp = pd.Timestamp(value)
+    except (TypeError, ValueError):
+        return None
+    if timestamp is pd.NaT:
+        return None
+    if timestamp.tz is None:
+        return timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC")
+
+
+def merge_time_windows(
+    window_frames: list[tuple[pd.Timestamp, pd.DataFrame]]
+) -> pd.DataFrame:
+    """Concatenate the timeseries data of consecutive time windows
+
+    window_frames are pairs of window start and loaded data in time order. Adapters
+    may include rows at the boundary of two windows in both responses. Therefore rows
+    at the start of a window are dropped if the previous window contains rows of the
+    same timeseries at this timestamp.
+    """
+    frames = [window_frames[0][1]]
+    for (_, previous), (window_start, current) in pairwise(window_frames):
+        if {"timestamp", "timeseriesId"}.issubset(current.columns) and (
+            {"timestamp", "timeseriesId"}.issubset(previous.columns)
+        ):
+            at_boundary = current["timestamp"] == window_start
+            if at_boundary.any():
+                previous_ids = previous.loc[
+                    previous["timestamp"] == window_start, "timeseriesId"
+                ]
+                current = current[
+                    ~(at_boundary & current["timeseriesId"].isin(previous_ids))
+                ]
+        frames.append(current)
+
+    non_empty_frames = [frame for frame in frames if len(frame) != 0]
+    merged = (
+        pd.concat(non_empty_frames, ignore_index=True)
+        if len(non_empty_frames) != 0
+        else frames[0].copy()
+    )
+    merged.attrs = {}
+    for frame in frames:
+        merged.attrs.update(frame.attrs)
+    return merged
+
+
+async def load_ts_data_in_windows(
+    filtered_sources: list[FilteredSource],
+    filter_params: Iterable[tuple[str, Any]],
+    adapter_key: str,
+    window_length: pd.Timedelta,
+) -> pd.DataFrame:
+    """Load data from generic rest adapter timeseries endpoint in time windows
+
+    The time range given by the from and to filter params is split into consecutive
+    windows, which are requested concurrently (up to the configured number at a time).
+    The length of windows requested later is adapted to the durations and sizes of
+    the responses so far (see WindowSizer).
+
+    Returns the data of all windows in time order, like load_ts_data_from_adapter.
+    """
+    params = list(filter_params)
+    start = utc_timestamp(dict(params).get("from"))
+    end = utc_timestamp(dict(params).get("to"))
+    if start is None or end is None or start >= end:
+        return await load_ts_data_from_adapter(filtered_sources, params, adapter_key)
+
+    other_params = [(key, value) for key, value in params if key not in ("from", "to")]
+    config = get_config()
+    sizer = WindowSizer(
+        window_length,
+        target_seconds=config.adapter_timeseries_window_target_seconds,
+        target_rows=config.adapter_timeseries_window_target_rows,
+    )
+
+    async def load_window(
+        window_start: pd.Timestamp, window_end: pd.Timestamp
+    ) -> tuple[pd.DataFrame, float]:
+        window_from, window_to = format_timestamps(
+            pd.DatetimeIndex([window_start, window_end])
+        ).tolist()
+        start_time = time.perf_counter()
+        df = await load_ts_data_from_adapter(
+            filtered_sources,
+            [*other_params, ("from", window_from), ("to", window_to)],
+            adapter_key,
         )
+        return df, time.perf_counter() - start_time
+
+    loaded_windows: dict[pd.Timestamp, pd.DataFrame] = {}
+    pending: dict[asyncio.Task, tuple[pd.Timestamp, pd.Timestamp]] = {}
+    window_start = start
+    try:
+        while window_start < end or len(pending) != 0:
+            while (
+                window_start < end
+                and len(pending) < config.adapter_timeseries_window_concurrency
+            ):
+                window_end = min(window_start + sizer.length, end)
+                task = asyncio.create_task(load_window(window_start, window_end))
+                pending[task] = (window_start, window_end)
+                window_start = window_end
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task_start, task_end = pending.pop(task)
+                df, seconds = task.result()
+                sizer.observe(task_end - task_start, len(df), seconds)
+                loaded_windows[task_start] = df
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    logger.info(
+        "Loaded timeseries data from generic rest adapter %s in %d time windows",
+        adapter_key,
+        len(loaded_windows),
+    )
+    return merge_time_windows(sorted(loaded_windows.items(), key=itemgetter(0)))
+
+
+def split_loaded_data_by_ts_id(
+    df: pd.DataFrame, ts_ids: Iterable[str]
+) -> dict[str, pd.Series]:
+    """Split loaded timeseries data into one Series per timeseries id
+
+    The rows are sorted by timeseries id and timestamp once (unless they already are)
+    and the Series of every id is a slice of the sorted arrays. Hence the rows are not
+    scanned and copied once per timeseries id. Ids without rows get empty Series.
+    """
+    try:
+        codes, received_ids = pd.factorize(df["timeseriesId"])
+        timestamps = pd.DatetimeIndex(df["timestamp"])
+        values = df["value"].array
     except KeyError as e:
         msg = (
             f"Missing keys in received timeseries records. Got columns {str(df.columns)}"
@@ -71,9 +232,94 @@ def extract_one_channel_series_from_loaded_data(
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
 
-    extracted_series.name = ts_id
+    # rows without timeseries id are sorted last and not assigned to any Series
+    codes = np.where(codes < 0, len(received_ids), codes)
+    order, offsets = sort_rows_by_code_and_time(
+        codes, timestamps, len(received_ids) + 1
+    )
+    if order is not None:
+        timestamps = timestamps[order]
+        values = values[order]
+
+    slices = {
+        str(ts_id): slice(offsets[position], offsets[position + 1])
+        for position, ts_id in enumerate(received_ids)
+    }
+
+    timestamps = timestamps.rename("timestamp")
+    split_series = {}
+    for ts_id in ts_ids:
+        rows = slices.get(ts_id, slice(0, 0))
+        series = pd.Series(values[rows], index=timestamps[rows], name=ts_id, copy=False)
+        series.attrs = df.attrs.get(ts_id, {})
+        logger.debug(
+            "extracted attributes %s for series with id %s", series.attrs, ts_id
+        )
+        split_series[ts_id] = series
+    return split_series
+
+
+async def load_ts_data_with_cache(
+    filtered_sources: list[FilteredSource],
+    filter_params: Iterable[tuple[str, Any]],
+    external_type: ExternalType,
+    adapter_key: str,
+) -> pd.DataFrame:
+    """Load data from generic rest adapter timeseries endpoint
+
+    If the timeseries cache is activated, only the parts of the time range which are
+    not covered by the cache are loaded. These and the complete time range without
+    cache are loaded in time windows if configured.
+    """
+    config = get_config()
+
+    async def load_range(filter_params: Iterable[tuple[str, Any]]) -> pd.DataFrame:
+        if config.adapter_timeseries_window_seconds is None:
+            return await load_ts_data_from_adapter(
+                filtered_sources, filter_params, adapter_key=adapter_key
+            )
+        return await load_ts_data_in_windows(
+            filtered_sources,
+            filter_params,
+            adapter_key=adapter_key,
+            window_length=pd.Timedelta(
+                seconds=config.adapter_timeseries_window_seconds
+            ),
+        )
+
+    params = list(filter_params)
+    filters = dict(params)
+    start = utc_timestamp(filters.get("from"))
+    end = utc_timestamp(filters.get("to"))
+    if (
+        config.timeseries_cache_max_bytes == 0
+        or start is None
+        or end is None
+        or start > end
+    ):
+        return await load_range(params)
+
+    other_params = [
+        (key, value) for key, value in filters.items() if key not in ("from", "to")
+    ]
 
-    return extracted_series
+    async def load_cache_range(
+        range_start: pd.Timestamp, range_end: pd.Timestamp
+    ) -> pd.DataFrame:
+        range_from, range_to = format_timestamps(
+            pd.DatetimeIndex([range_start, range_end])
+        ).tolist()
+        return await load_range([*other_params, ("from", range_from), ("to", range_to)])
+
+    return await timeseries_cache.load(
+        adapter_key,
+        [filtered_source.ref_id for filtered_source in filtered_sources],  # type: ignore
+        external_type,
+        frozenset(other_params),
+        start,
+        end,
+        load_cache_range,
+    )
 
 
 async def load_grouped_timeseries_data_together(
@@ -117,21 +363,25 @@ async def load_grouped_timeseries_data_together(
 
     # load each group together:
     for group_tuple, grouped_source_dict in group_by_filters_and_external_type.items():
-        loaded_ts_data_from_adapter = await load_ts_data_from_adapter(
+        loaded_ts_data_from_adapter = await load_ts_data_with_cache(
             list(grouped_source_dict.values()),
             group_tuple[0],
+            external_type=group_tuple[1],
             adapter_key=adapter_key,
         )
 
-        loaded_data.update(
-            {
-                key: extract_one_channel_series_from_loaded_data(
-                    loaded_ts_data_from_adapter,
-                    filtered_source.ref_id,  # type: ignore
-                )
-                for key, filtered_source in grouped_source_dict.items()
-            }
+        queried_ids = [fs.ref_id for fs in grouped_source_dict.values()]
+        series_by_ts_id = split_loaded_data_by_ts_id(
+            loaded_ts_data_from_adapter, queried_ids  # type: ignore
         )
+        assigned_ts_ids = set()
+        for key, filtered_source in grouped_source_dict.items():
+            series = series_by_ts_id[filtered_source.ref_id]  # type: ignore
+            # inputs loading the same timeseries must not share its data
+            loaded_data[key] = (
+                series.copy() if filtered_source.ref_id in assigned_ts_ids else series
+            )
+            assigned_ts_ids.add(filtered_source.ref_id)
 
         try:
             received_ids = loaded_ts_data_from_adapter["timeseriesId"].unique()
@@ -145,8 +395,6 @@ async def load_grouped_timeseries_data_together(
             logger.info(msg)
             raise AdapterHandlingException(msg) from e
 
-        queried_ids = [fs.ref_id for fs in grouped_source_dict.values()]
-
         if not np.isin(received_ids, np.array(queried_ids)).all():
             msg = (
                 f"Found timeseries ids in received data that were not queried."
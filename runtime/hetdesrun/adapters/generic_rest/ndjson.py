@@ -0,0 +1,129 @@
+"""Incremental parsing of NDJSON records into DataFrames
+
+The framelike endpoints of generic REST adapters respond with one JSON record per
+line. Instead of reading the complete body before parsing it, the records of every
+received chunk are parsed into column buffers right away. Integer and float columns
+are buffered as typed arrays, which need a fraction of the memory of Python objects,
+only columns with other values (e.g. timestamp strings) are buffered as lists.
+
+After the last chunk, the dtypes of the columns are inferred like pandas.read_json
+with lines=True does, so that the resulting DataFrame is the same.
+"""
+import json
+import math
+from array import array
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.datatypes import infer_json_like_dtypes
+
+# JSON integers beyond these bounds are kept as Python objects
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+class NDJSONParsingError(ValueError):
+    pass
+
+
+class ColumnBuffer:
+    """Values of a column, as int64 or float64 array as long as possible
+
+    Like pandas, nulls turn integer columns into float columns.
+    """
+
+    def __init__(self, leading_null_count: int = 0) -> None:
+        self.buffer: array | list = array("q")
+        if leading_null_count != 0:
+            self.extend([math.nan] * leading_null_count)
+
+    def extend(self, values: list) -> None:
+        if isinstance(self.buffer, array) and self.buffer.typecode == "q":
+            if all(
+                type(value) is int and INT64_MIN <= value <= INT64_MAX
+                for value in values
+            ):
+                self.buffer.extend(values)
+                return
+            self.buffer = array("d", self.buffer)
+
+        if isinstance(self.buffer, array):
+            if all(
+                type(value) is float
+                or value is None
+                or (type(value) is int and INT64_MIN <= value <= INT64_MAX)
+                for value in values
+            ):
+                self.buffer.extend(
+                    math.nan if value is None else value for value in values
+                )
+                return
+            self.buffer = self.buffer.tolist()
+
+        self.buffer.extend(values)
+
+    def to_array(self) -> np.ndarray | list:
+        if isinstance(self.buffer, array):
+            return np.frombuffer(
+                self.buffer,
+                dtype=np.int64 if self.buffer.typecode == "q" else np.float64,
+            )
+        return self.buffer
+
+
+class NDJSONFrameParser:
+    """Parse NDJSON records chunk by chunk into a DataFrame
+
+    Lines may be split across chunks. Empty lines are ignored.
+    """
+
+    def __init__(self) -> None:
+        self.columns: dict[str, ColumnBuffer] = {}
+        self.row_count = 0
+        self._incomplete_line = b""
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the complete lines of chunk
+
+        Raises NDJSONParsingError if a line is not a JSON object.
+        """
+        lines = (self._incomplete_line + chunk).split(b"\n")
+        self._incomplete_line = lines.pop()
+        self._parse_lines(lines)
+
+    def finish(self) -> pd.DataFrame:
+        """Parse the last line and construct the DataFrame of all records
+
+        Raises NDJSONParsingError if the last line is not a JSON object.
+        """
+        self._parse_lines([self._incomplete_line])
+        self._incomplete_line = b""
+        if self.row_count == 0:
+            return pd.DataFrame()
+        return infer_json_like_dtypes(
+            pd.DataFrame(
+                {name: buffer.to_array() for name, buffer in self.columns.items()}
+            )
+        )
+
+    def _parse_lines(self, lines: list[bytes]) -> None:
+        stripped_lines = [line for line in (line.strip() for line in lines) if line]
+        if len(stripped_lines) == 0:
+            return
+        try:
+            # decoding all lines at once is much faster than decoding them one by one
+            records: list[Any] = json.loads(b"[" + b",".join(stripped_lines) + b"]")
+        except ValueError as e:
+            raise NDJSONParsingError(f"Received invalid NDJSON: {str(e)}") from e
+        if not all(isinstance(record, dict) for record in records):
+            raise NDJSONParsingError("Received NDJSON line which is not a JSON object.")
+
+        for name in dict.fromkeys(name for record in records for name in record):
+            if name not in self.columns:
+                self.columns[name] = ColumnBuffer(leading_null_count=self.row_count)
+        for name, buffer in self.columns.items():
+            # like pandas, missing keys yield NaN and null values None
+            buffer.extend([record.get(name, math.nan) for record in records])
+        self.row_count += len(records)
@@ -1,44 +1,44 @@
 import asyncio
+from typing import Any
 
-import numpy as np
 import pandas as pd
 from httpx import AsyncClient
 
 from hetdesrun.adapters.exceptions import AdapterOutputDataError
-from hetdesrun.adapters.generic_rest.send_framelike import post_framelike_records
+from hetdesrun.adapters.generic_rest.client_pool import adapter_client_pool
+from hetdesrun.adapters.generic_rest.send_framelike import (
+    RecordColumn,
+    post_framelike_records,
+)
+from hetdesrun.adapters.generic_rest.timestamps import isoformat_timestamps
 from hetdesrun.models.data_selection import FilteredSink
-from hetdesrun.webservice.config import get_config
 
 
-def dataframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
+def dataframe_to_record_columns(df: pd.DataFrame) -> dict[Any, RecordColumn]:
     if len(df) == 0:
-        return []
+        return {}
     if not isinstance(df, pd.DataFrame):
         raise AdapterOutputDataError(
             "Did not receive Pandas DataFrame as expected from workflow output."
             f" Got {str(type(df))} instead."
         )
 
-    datetime_column_names = []
-    for column_name in df.columns:
-        if pd.api.types.is_datetime64_any_dtype(df.dtypes[column_name]):
-            datetime_column_names.append(column_name)
-
-    if len(datetime_column_names) == 0:
-        return df.replace({np.nan: None}).to_dict(orient="records")  # type: ignore
-    new_df = df.replace({np.nan: None})
-    for column_name in datetime_column_names:
-        new_df[column_name] = new_df[column_name].apply(lambda x: x.isoformat())
-    return new_df.to_dict(orient="records")  # type: ignore
+    return {
+        column_name: RecordColumn(
+            column,
+            isoformat_timestamps
+            if pd.api.types.is_datetime64_any_dtype(column)
+            else None,
+        )
+        for column_name, column in df.items()
+    }
 
 
 async def post_dataframe(
     df: pd.DataFrame, ref_id: str, adapter_key: str, client: AsyncClient
 ) -> None:
-    records = dataframe_to_list_of_dicts(df)
-
     await post_framelike_records(
-        records,
+        dataframe_to_record_columns(df),
         attributes=df.attrs,
         ref_id=ref_id,
         adapter_key=adapter_key,
@@ -50,16 +50,13 @@ async def post_dataframe(
 async def post_dataframes(
     dfs: list[pd.DataFrame], ref_ids: list[str], adapter_key: str
 ) -> None:
-    async with AsyncClient(
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        await asyncio.gather(
-            *(
-                post_dataframe(df, ref_id, adapter_key=adapter_key, client=client)
-                for df, ref_id in zip(dfs, ref_ids, strict=True)
-            )
+    client = adapter_client_pool.get(adapter_key)
+    await asyncio.gather(
+        *(
+            post_dataframe(df, ref_id, adapter_key=adapter_key, client=client)
+            for df, ref_id in zip(dfs, ref_ids, strict=True)
         )
+    )
 
 
 async def send_dataframes_to_adapter(
@@ -2,15 +2,22 @@
 
 Common utilities for sending data that is frame-like (tabular), i.e. dataframes as well as
 timeseries (where the later can be understood as special dataframe/table)
+
+Records are sent as JSON array which is encoded and streamed chunk by chunk from the
+columns of the data, so that not all records exist as Python objects at the same time.
 """
+import asyncio
 import base64
 import datetime
 import json
 import logging
+from collections.abc import AsyncIterator, Callable
 from posixpath import join as posix_urljoin
 from typing import Any, Literal
 
 import httpx
+import numpy as np
+import pandas as pd
 from httpx import AsyncClient
 
 from hetdesrun.adapters.exceptions import AdapterConnectionError
@@ -20,6 +27,9 @@ from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 
 logger = logging.getLogger(__name__)
 
+# Number of records encoded together when streaming the request body
+RECORDS_CHUNK_SIZE = 10_000
+
 
 def encode_attributes(df_attrs: Any) -> str:
     df_attrs_json_str = json.dumps(df_attrs)
@@ -31,15 +41,82 @@ def encode_attributes(df_attrs: Any) -> str:
     return base64_str
 
 
+class RecordColumn:
+    """Column of records to send, converted to Python objects chunk by chunk
+
+    Holds the values without copying them. Only when a chunk of records is encoded
+    are its values converted to Python objects, with None (JSON null) instead of
+    NaN, NaT or NA, and its timestamps formatted via format_timestamps or
+    isoformat_timestamps if one of them is given.
+    """
+
+    def __init__(
+        self,
+        values: pd.Series | pd.Index,
+        format_timestamps: Callable[[pd.arrays.DatetimeArray], np.ndarray]
+        | None = None,
+    ) -> None:
+        self.array = values.array
+        self.format_timestamps = format_timestamps
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def to_list(self, start: int, stop: int) -> list:
+        chunk = self.array[start:stop]
+        objects = (
+            chunk.to_numpy(dtype=object)
+            if self.format_timestamps is None
+            else self.format_timestamps(chunk)
+        )
+        nulls = chunk.isna()
+        if nulls.any():
+            objects = objects.astype(object)
+            objects[nulls] = None
+        return objects.tolist()  # type: ignore[no-any-return]
+
+
+async def iterate_json_records(
+    record_columns: dict[Any, RecordColumn], chunk_size: int = RECORDS_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Encode the records of the columns as JSON array, chunk by chunk
+
+    Only the records of one chunk exist as Python objects at a time. Control is
+    returned to the event loop after every chunk.
+    """
+    names = tuple(record_columns)
+    row_count = len(record_columns[names[0]]) if len(names) != 0 else 0
+    yield b"["
+    for start in range(0, row_count, chunk_size):
+        rows = zip(
+            *(
+                column.to_list(start, start + chunk_size)
+                for column in record_columns.values()
+            ),
+            strict=True,
+        )
+        records = [dict(zip(names, row, strict=True)) for row in rows]
+        if start != 0:
+            yield b","
+        # without the brackets of the array of this chunk
+        yield json.dumps(records)[1:-1].encode("utf-8")
+        await asyncio.sleep(0)
+    yield b"]"
+
+
 async def post_framelike_records(
-    list_of_records: list[dict],
+    record_columns: dict[Any, RecordColumn],
     attributes: Any | None,
     ref_id: str,
     adapter_key: str,
     endpoint: Literal["timeseries", "dataframe", "multitsframe"],
     client: AsyncClient,
 ) -> None:
-    """Post a list of dicts (records) to the appropriate endpoint"""
+    """Post records to the appropriate endpoint
+
+    The records are given by columns of equal length, which are mapped by the names
+    of the record entries.
+    """
     try:
         headers = await get_generic_rest_adapter_auth_headers(external=True)
     except ServiceAuthenticationError as e:
@@ -53,6 +130,7 @@ async def post_framelike_records(
     if attributes is not None and len(attributes) != 0:
         logger.debug("Sending Data-Attributes via POST request header")
         headers["Data-Attributes"] = encode_attributes(attributes)
+    headers["Content-Type"] = "application/json"
 
     url = posix_urljoin(await get_generic_rest_adapter_base_url(adapter_key), endpoint)
 
@@ -68,7 +146,7 @@ async def post_framelike_records(
         response = await client.post(
             url,
             params=[("timeseriesId" if endpoint == "timeseries" else "id", ref_id)],
-            json=list_of_records,
+            content=iterate_json_records(record_columns),
             headers=headers,
             timeout=60,
         )
@@ -9,21 +9,25 @@ import httpx
 from hetdesrun.adapters.exceptions import AdapterConnectionError
 from hetdesrun.adapters.generic_rest.auth import get_generic_rest_adapter_auth_headers
 from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
+from hetdesrun.adapters.generic_rest.client_pool import adapter_client_pool
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.models.adapter_data import RefIdType
 from hetdesrun.models.data_selection import FilteredSink
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
-from hetdesrun.webservice.config import get_config
 
 logger = logging.getLogger(__name__)
 
 
 async def post_json_with_open_client(
-    open_client: httpx.AsyncClient, url: str, json_payload: dict
+    open_client: httpx.AsyncClient,
+    url: str,
+    json_payload: dict,
+    headers: dict[str, str] | None = None,
 ) -> httpx.Response:
     return await open_client.post(
         url,
         json=json_payload,
+        headers=headers,
     )
 
 
@@ -32,6 +36,7 @@ async def send_single_metadatum_to_adapter(
     metadatum_value: Any,
     adapter_key: str,
     client: httpx.AsyncClient,
+    headers: dict[str, str] | None = None,
 ) -> None:
     if filtered_sink.ref_id_type == RefIdType.SOURCE:
         endpoint = "sources"
@@ -62,6 +67,7 @@ async def send_single_metadatum_to_adapter(
                     "dataType": value_datatype.value,
                 }
             ),
+            headers=headers,
         )
     except httpx.HTTPError as e:
         msg = (
@@ -98,20 +104,17 @@ async def send_multiple_metadata_to_adapter(
         logger.info(msg)
         raise AdapterConnectionError(msg) from e
 
-    async with httpx.AsyncClient(
-        headers=headers,
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        wf_output_names = filtered_sinks.keys()
-        await asyncio.gather(
-            *(
-                send_single_metadatum_to_adapter(
-                    filtered_sinks[wf_output_name],
-                    data_to_send[wf_output_name],
-                    adapter_key=adapter_key,
-                    client=client,
-                )
-                for wf_output_name in wf_output_names
+    client = adapter_client_pool.get(adapter_key)
+    wf_output_names = filtered_sinks.keys()
+    await asyncio.gather(
+        *(
+            send_single_metadatum_to_adapter(
+                filtered_sinks[wf_output_name],
+                data_to_send[wf_output_name],
+                adapter_key=adapter_key,
+                client=client,
+                headers=headers,
             )
+            for wf_output_name in wf_output_names
         )
+    )
@@ -1,21 +1,26 @@
 import asyncio
-import datetime
 
-import numpy as np
 import pandas as pd
-import pytz
 from httpx import AsyncClient
 
 from hetdesrun.adapters.exceptions import AdapterOutputDataError
-from hetdesrun.adapters.generic_rest.send_framelike import post_framelike_records
-from hetdesrun.datatypes import MULTITSFRAME_COLUMN_NAMES
+from hetdesrun.adapters.generic_rest.client_pool import adapter_client_pool
+from hetdesrun.adapters.generic_rest.send_framelike import (
+    RecordColumn,
+    post_framelike_records,
+)
+from hetdesrun.adapters.generic_rest.timestamps import format_timestamps
+from hetdesrun.datatypes import (
+    MULTITSFRAME_COLUMN_NAMES,
+    MultiTSFrameProblem,
+    multitsframe_problem,
+)
 from hetdesrun.models.data_selection import FilteredSink
-from hetdesrun.webservice.config import get_config
 
 
-def multitsframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
+def multitsframe_to_record_columns(df: pd.DataFrame) -> dict[str, RecordColumn]:
     if len(df) == 0:
-        return []
+        return {}
 
     if not isinstance(df, pd.DataFrame):
         raise AdapterOutputDataError(
@@ -23,7 +28,8 @@ def multitsframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
             f" Got {str(type(df))} instead."
         )
 
-    if set(df.columns) != set(MULTITSFRAME_COLUMN_NAMES):
+    problem = multitsframe_problem(df)
+    if problem is MultiTSFrameProblem.COLUMN_NAMES:
         column_names_string = ", ".join(df.columns)
         multitsframe_column_names_string = ", ".join(MULTITSFRAME_COLUMN_NAMES)
         raise AdapterOutputDataError(
@@ -31,48 +37,43 @@ def multitsframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
             f"the column names required for a MultiTSFrame {multitsframe_column_names_string}."
         )
 
-    if df["metric"].isna().any():
+    if problem is MultiTSFrameProblem.METRIC_NULL:
         raise AdapterOutputDataError(
             "Received Pandas Dataframe with null values in the column 'metric'."
         )
 
-    if df["timestamp"].isna().any():
+    if problem is MultiTSFrameProblem.TIMESTAMP_NULL:
         raise AdapterOutputDataError(
             "Received Pandas Dataframe with null values in the column 'timestamp'."
         )
 
-    if not pd.api.types.is_datetime64tz_dtype(df["timestamp"]):
+    if problem is MultiTSFrameProblem.TIMESTAMP_DTYPE:
         raise AdapterOutputDataError(
             "Column 'timestamp' of the received Pandas Dataframe does not have datetime64tz dtype "
             "index as expected for generic rest adapter multitsframe endpoints. "
             f'Got {str(df["timestamp"].dtype)} index dtype instead.'
         )
 
-    if not df["timestamp"].dt.tz in (pytz.UTC, datetime.timezone.utc):
+    if problem is MultiTSFrameProblem.TIMESTAMP_TIMEZONE:
         raise AdapterOutputDataError(
             "Column 'timestamp' of the received Pandas Dataframe does not have UTC timezone "
             "but generic rest adapter only accepts UTC timeseries data. "
             f'Got {str(df["timestamp"].dt.tz)} timezone instead.'
         )
 
-    new_df = df.replace({np.nan: None})
-    new_df["timestamp"] = new_df["timestamp"].apply(
-        lambda x: x.strftime(
-            "%Y-%m-%dT%H:%M:%S.%f"
-        )  # Generic Rest datetime format is yyyy-MM-ddTHH:mm:ss.SSSSSSSSSX
-        + "{:03d}".format(x.nanosecond)  # noqa: UP032
-        + "Z"  # we guaranteed UTC time zone some lines above!
-    )
-    return new_df.to_dict(orient="records")  # type: ignore
+    return {
+        column_name: RecordColumn(
+            column, format_timestamps if column_name == "timestamp" else None
+        )
+        for column_name, column in df.items()
+    }
 
 
 async def post_multitsframe(
     df: pd.DataFrame, ref_id: str, adapter_key: str, client: AsyncClient
 ) -> None:
-    records = multitsframe_to_list_of_dicts(df)
-
     await post_framelike_records(
-        records,
+        multitsframe_to_record_columns(df),
         attributes=df.attrs,
         ref_id=ref_id,
         adapter_key=adapter_key,
@@ -84,16 +85,13 @@ async def post_multitsframe(
 async def post_multitsframes(
     dfs: list[pd.DataFrame], ref_ids: list[str], adapter_key: str
 ) -> None:
-    async with AsyncClient(
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        await asyncio.gather(
-            *(
-                post_multitsframe(df, ref_id, adapter_key=adapter_key, client=client)
-                for df, ref_id in zip(dfs, ref_ids, strict=True)
-            )
+    client = adapter_client_pool.get(adapter_key)
+    await asyncio.gather(
+        *(
+            post_multitsframe(df, ref_id, adapter_key=adapter_key, client=client)
+            for df, ref_id in zip(dfs, ref_ids, strict=True)
         )
+    )
 
 
 async def send_multitsframes_to_adapter(
@@ -1,16 +1,19 @@
 import asyncio
 import datetime
 
-import numpy as np
 import pandas as pd
 import pytz
 from httpx import AsyncClient
 
 from hetdesrun.adapters.exceptions import AdapterOutputDataError
+from hetdesrun.adapters.generic_rest.client_pool import adapter_client_pool
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
-from hetdesrun.adapters.generic_rest.send_framelike import post_framelike_records
+from hetdesrun.adapters.generic_rest.send_framelike import (
+    RecordColumn,
+    post_framelike_records,
+)
+from hetdesrun.adapters.generic_rest.timestamps import format_timestamps
 from hetdesrun.models.data_selection import FilteredSink
-from hetdesrun.webservice.config import get_config
 
 
 def validate_series_dtype(series: pd.Series, sink_type: ExternalType) -> None:
@@ -37,9 +40,11 @@ def validate_series_dtype(series: pd.Series, sink_type: ExternalType) -> None:
         )
 
 
-def ts_to_list_of_dicts(series: pd.Series, sink_type: ExternalType) -> list[dict]:
+def ts_to_record_columns(
+    series: pd.Series, sink_type: ExternalType
+) -> dict[str, RecordColumn]:
     if len(series) == 0:
-        return []
+        return {}
     if not isinstance(series, pd.Series):
         raise AdapterOutputDataError(
             "Did not receive Pandas Series as expected from workflow output."
@@ -60,22 +65,10 @@ def ts_to_list_of_dicts(series: pd.Series, sink_type: ExternalType) -> list[dict
         )
     validate_series_dtype(series, sink_type)
 
-    return (  # type: ignore
-        pd.DataFrame(
-            {
-                "value": series.to_numpy(),
-                "timestamp": pd.Series(series.index, index=series.index).apply(
-                    lambda x: x.strftime(
-                        "%Y-%m-%dT%H:%M:%S.%f"
-                    )  # Generic Rest datetime format is yyyy-MM-ddTHH:mm:ss.SSSSSSSSSX
-                    + "{:03d}".format(x.nanosecond)  # noqa: UP032
-                    + "Z"  # we guaranteed UTC time zone some lines above!
-                ),
-            }
-        )
-        .replace({np.nan: None})
-        .to_dict(orient="records")
-    )
+    return {
+        "value": RecordColumn(series),
+        "timestamp": RecordColumn(series.index, format_timestamps),
+    }
 
 
 async def post_single_timeseries(
@@ -85,10 +78,8 @@ async def post_single_timeseries(
     adapter_key: str,
     client: AsyncClient,
 ) -> None:
-    records = ts_to_list_of_dicts(series, sink_type)
-
     await post_framelike_records(
-        records,
+        ts_to_record_columns(series, sink_type),
         attributes=series.attrs,
         ref_id=ref_id,
         adapter_key=adapter_key,
@@ -103,20 +94,17 @@ async def post_multiple_timeseries(
     sink_types: list[ExternalType],
     adapter_key: str,
 ) -> None:
-    async with AsyncClient(
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        await asyncio.gather(
-            *(
-                post_single_timeseries(
-                    series, ref_id, sink_type, adapter_key=adapter_key, client=client
-                )
-                for series, ref_id, sink_type in zip(
-                    timeseries_list, ref_ids, sink_types, strict=True
-                )
+    client = adapter_client_pool.get(adapter_key)
+    await asyncio.gather(
+        *(
+            post_single_timeseries(
+                series, ref_id, sink_type, adapter_key=adapter_key, client=client
+            )
+            for series, ref_id, sink_type in zip(
+                timeseries_list, ref_ids, sink_types, strict=True
             )
         )
+    )
 
 
 async def send_multiple_timeseries_to_adapter(
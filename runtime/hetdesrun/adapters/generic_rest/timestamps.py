@@ -0,0 +1,60 @@
+"""Formatting timestamps for generic REST adapters
+
+Timestamps of filters and of records sent to generic REST adapters are formatted as
+strings. Formatting them vectorized avoids creating a Timestamp object per value.
+"""
+import numpy as np
+import pandas as pd
+
+
+def format_timestamps(
+    timestamps: pd.Series | pd.DatetimeIndex | pd.arrays.DatetimeArray,
+) -> np.ndarray:
+    """Format UTC timestamps in the generic REST datetime format
+
+    The format is yyyy-MM-ddTHH:mm:ss.SSSSSSSSSZ. The strings are computed directly
+    from the int64 nanosecond representation, without Timestamp objects.
+    """
+    strings: np.ndarray = np.datetime_as_string(
+        pd.DatetimeIndex(timestamps).asi8.view("datetime64[ns]"),
+        unit="ns",
+        timezone="UTC",
+    )
+    return strings
+
+
+def isoformat_timestamps(
+    timestamps: pd.Series | pd.DatetimeIndex | pd.arrays.DatetimeArray,
+) -> np.ndarray:
+    """Format timestamps like Timestamp.isoformat, but vectorized
+
+    Fractions of seconds are given with as many digits as needed for microseconds or
+    nanoseconds, and timezone aware timestamps get their UTC offset.
+    """
+    index = pd.DatetimeIndex(timestamps)
+    wall_nanoseconds = index.asi8 if index.tz is None else index.tz_localize(None).asi8
+    wall_times = wall_nanoseconds.view("datetime64[ns]")
+    fractions = wall_nanoseconds % 1_000_000_000
+    strings = np.where(
+        fractions % 1000 != 0,
+        np.datetime_as_string(wall_times, unit="ns"),
+        np.where(
+            fractions != 0,
+            np.datetime_as_string(wall_times, unit="us"),
+            np.datetime_as_string(wall_times, unit="s"),
+        ),
+    )
+    if index.tz is None:
+        return strings
+
+    offset_minutes = (wall_nanoseconds - index.asi8) // 60_000_000_000
+    offsets = np.char.add(
+        np.where(offset_minutes < 0, "-", "+"),
+        np.char.add(
+            np.char.zfill((np.abs(offset_minutes) // 60).astype(str), 2),
+            np.char.add(
+                ":", np.char.zfill((np.abs(offset_minutes) % 60).astype(str), 2)
+            ),
+        ),
+    )
+    return np.char.add(strings, offsets)
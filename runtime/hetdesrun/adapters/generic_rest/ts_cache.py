@@ -0,0 +1,294 @@
+"""Cache of timeseries loaded from generic REST adapters
+
+Scheduled workflows often load overlapping time ranges, e.g. the last 24 hours every
+10 minutes. Instead of loading the complete time range for every execution, each
+runtime worker process can keep the loaded data of every timeseries together with the
+time intervals it covers. A request then only loads the ranges which are not covered
+yet and takes the rest from the cache.
+
+Timeseries are cached by adapter key, timeseries id, type and all filters except the
+time range. The time ranges of requests are understood as closed intervals, like the
+generic REST adapter from and to filters. Since recent data may still change (e.g. by
+late-arriving data), data newer than the configured mutable tail at the time of
+loading is not considered as covered and therefore loaded again by later requests.
+Covered intervals expire after the configured time to live. Both can be configured
+per adapter key, since sources differ in how late their data arrives and changes.
+
+Timeseries are evicted least recently used first when the estimated size of the
+cached data exceeds the configured maximum.
+"""
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from operator import itemgetter
+from typing import Any
+
+import pandas as pd
+
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+TimeseriesCacheKey = tuple[str, str, ExternalType, frozenset[tuple[Any, Any]]]
+
+
+def utc_now() -> pd.Timestamp:
+    return pd.Timestamp.now(tz="UTC")
+
+
+class CachedTimeseries:
+    """Data of a timeseries with the closed time intervals it covers"""
+
+    def __init__(self) -> None:
+        self.data = pd.Series([], index=pd.DatetimeIndex([], tz="UTC"), dtype=object)
+        self.attrs: Any = {}
+        # sorted, disjoint (start, end, loading time) triples
+        self.intervals: list[tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp]] = []
+        self.size_bytes = 0
+
+    def expire(self, loaded_before: pd.Timestamp) -> None:
+        self.intervals = [
+            interval for interval in self.intervals if interval[2] >= loaded_before
+        ]
+
+    def missing_ranges(
+        self, start: pd.Timestamp, end: pd.Timestamp
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """Parts of the closed interval from start to end which are not covered"""
+        ranges = []
+        for interval_start, interval_end, _ in self.intervals:
+            if interval_end < start:
+                continue
+            if interval_start > end:
+                break
+            if interval_start > start:
+                ranges.append((start, interval_start))
+            start = max(start, interval_end)
+        if start < end or (len(ranges) == 0 and not self.covers(start)):
+            ranges.append((start, end))
+        return ranges
+
+    def covers(self, timestamp: pd.Timestamp) -> bool:
+        return any(
+            interval_start <= timestamp <= interval_end
+            for interval_start, interval_end, _ in self.intervals
+        )
+
+    def insert(
+        self,
+        values: pd.Series,
+        attrs: Any,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        covered_end: pd.Timestamp,
+        loaded_at: pd.Timestamp,
+    ) -> None:
+        """Replace the data from start to end by the loaded values
+
+        Only the interval from start to covered_end is considered as covered.
+        """
+        kept = self.data[(self.data.index < start) | (self.data.index > end)]
+        if len(kept) == 0:
+            self.data = values
+        elif len(values) != 0:
+            self.data = pd.concat([kept, values]).sort_index(kind="stable")
+        else:
+            self.data = kept
+        if len(attrs) != 0:
+            self.attrs = attrs
+        self.size_bytes = int(self.data.memory_usage(index=True, deep=True))
+
+        if covered_end < start:
+            return
+        intervals = []
+        for interval in self.intervals:
+            interval_start, interval_end, interval_loaded_at = interval
+            if interval_end < start or interval_start > covered_end:
+                intervals.append(interval)
+                continue
+            # parts of older intervals not overlapped by the new one remain covered
+            if interval_start < start:
+                intervals.append((interval_start, start, interval_loaded_at))
+            if interval_end > covered_end:
+                intervals.append((covered_end, interval_end, interval_loaded_at))
+        intervals.append((start, covered_end, loaded_at))
+        self.intervals = sorted(intervals, key=itemgetter(0))
+
+    def between(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.Series:
+        return self.data[(self.data.index >= start) & (self.data.index <= end)]
+
+
+class TimeseriesCache:
+    """Least recently used cache of timeseries from generic REST adapters"""
+
+    def __init__(self) -> None:
+        self._timeseries: OrderedDict[
+            TimeseriesCacheKey, CachedTimeseries
+        ] = OrderedDict()
+
+    @property
+    def currsize_bytes(self) -> int:
+        return sum(cached.size_bytes for cached in self._timeseries.values())
+
+    async def load(
+        self,
+        adapter_key: str,
+        ts_ids: list[str],
+        external_type: ExternalType,
+        other_filters: frozenset[tuple[Any, Any]],
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        load_range: Callable[[pd.Timestamp, pd.Timestamp], Awaitable[pd.DataFrame]],
+    ) -> pd.DataFrame:
+        """Load timeseries data for the closed interval from start to end
+
+        load_range must load the data of all ts_ids for a closed time interval from the
+        adapter, like load_ts_data_from_adapter. Only the ranges which are not covered
+        by the cache for some of the timeseries are loaded with it.
+
+        Returns the data in the format of load_ts_data_from_adapter.
+        """
+        config = get_config()
+        ttl_seconds = config.timeseries_cache_ttl_seconds_by_adapter.get(
+            adapter_key, config.timeseries_cache_ttl_seconds
+        )
+        mutable_tail_seconds = (
+            config.timeseries_cache_mutable_tail_seconds_by_adapter.get(
+                adapter_key, config.timeseries_cache_mutable_tail_seconds
+            )
+        )
+        now = utc_now()
+        # references are kept, so that data loaded for some ranges is not lost if
+        # the timeseries are evicted while loading others
+        cached_by_ts_id: dict[str, CachedTimeseries] = {}
+        for ts_id in ts_ids:
+            cached = self._timeseries.get(
+                (adapter_key, ts_id, external_type, other_filters)
+            )
+            if cached is None:
+                cached = CachedTimeseries()
+            elif ttl_seconds is not None:
+                cached.expire(now - pd.Timedelta(seconds=ttl_seconds))
+            cached_by_ts_id[ts_id] = cached
+
+        ranges = _merge_ranges(
+            [
+                missing_range
+                for cached in cached_by_ts_id.values()
+                for missing_range in cached.missing_ranges(start, end)
+            ]
+        )
+        logger.debug(
+            "Loading ranges %s of timeseries %s from adapter %s not covered by cache",
+            str(ranges),
+            str(ts_ids),
+            adapter_key,
+        )
+
+        covered_until = now - pd.Timedelta(seconds=mutable_tail_seconds)
+        for range_start, range_end in ranges:
+            df = await load_range(range_start, range_end)
+            if not _is_cacheable(df):
+                logger.info(
+                    "Cannot cache timeseries data from adapter %s with columns %s."
+                    " Loading without cache.",
+                    adapter_key,
+                    str(df.columns),
+                )
+                if (range_start, range_end) == (start, end):
+                    return df
+                return await load_range(start, end)
+            values_by_ts_id = _values_by_ts_id(df)
+            for ts_id, cached in cached_by_ts_id.items():
+                cached.insert(
+                    values_by_ts_id.get(ts_id, _empty_values(df)),
+                    df.attrs.get(ts_id, {}),
+                    range_start,
+                    range_end,
+                    covered_end=min(range_end, covered_until),
+                    loaded_at=now,
+                )
+
+        result = _assemble(cached_by_ts_id, start, end)
+        for ts_id, cached in cached_by_ts_id.items():
+            key = (adapter_key, ts_id, external_type, other_filters)
+            self._timeseries[key] = cached
+            self._timeseries.move_to_end(key)
+        self._evict(config.timeseries_cache_max_bytes)
+        return result
+
+    def _evict(self, max_bytes: int) -> None:
+        sizes = {key: cached.size_bytes for key, cached in self._timeseries.items()}
+        total_bytes = sum(sizes.values())
+        while total_bytes > max_bytes and len(self._timeseries) != 0:
+            key, _ = self._timeseries.popitem(last=False)
+            total_bytes -= sizes[key]
+
+    def clear(self) -> None:
+        self._timeseries.clear()
+
+
+def _merge_ranges(
+    ranges: list[tuple[pd.Timestamp, pd.Timestamp]]
+) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    merged: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+    for range_start, range_end in sorted(ranges):
+        if len(merged) != 0 and range_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+        else:
+            merged.append((range_start, range_end))
+    return merged
+
+
+def _assemble(
+    cached_by_ts_id: dict[str, CachedTimeseries],
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> pd.DataFrame:
+    frames = []
+    attrs = {}
+    for ts_id, cached in cached_by_ts_id.items():
+        values = cached.between(start, end)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "timeseriesId": pd.Series([ts_id] * len(values), dtype="string"),
+                    "timestamp": values.index,
+                    "value": values.to_numpy(),
+                }
+            )
+        )
+        if len(cached.attrs) != 0:
+            attrs[ts_id] = cached.attrs
+    non_empty_frames = [frame for frame in frames if len(frame) != 0]
+    df = pd.concat(
+        non_empty_frames if len(non_empty_frames) != 0 else frames[:1],
+        ignore_index=True,
+    )
+    df.attrs = attrs
+    return df
+
+
+def _is_cacheable(df: pd.DataFrame) -> bool:
+    return {"timeseriesId", "timestamp", "value"}.issubset(
+        df.columns
+    ) and pd.api.types.is_datetime64tz_dtype(df["timestamp"])
+
+
+def _empty_values(df: pd.DataFrame) -> pd.Series:
+    return pd.Series(df["value"].to_numpy()[:0], index=pd.DatetimeIndex([], tz="UTC"))
+
+
+def _values_by_ts_id(df: pd.DataFrame) -> dict[Hashable, pd.Series]:
+    return {
+        ts_id: pd.Series(
+            group["value"].to_numpy(),
+            index=pd.DatetimeIndex(group["timestamp"]),
+        ).sort_index(kind="stable")
+        for ts_id, group in df.groupby("timeseriesId", sort=False, observed=True)
+    }
+
+
+timeseries_cache = TimeseriesCache()
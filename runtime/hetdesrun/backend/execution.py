@@ -1,17 +1,26 @@
 """Handle execution of transformation revisions."""
 
-import json
+import asyncio
+import datetime
 import logging
+from functools import lru_cache
 from posixpath import join as posix_urljoin
+from typing import Any
 from uuid import UUID, uuid4
 
 import httpx
 from pydantic import BaseModel, Field, ValidationError
 
 from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
-from hetdesrun.models.component import ComponentNode
+from hetdesrun.component.load import hash_code
+from hetdesrun.models.code import CodeModule, CodeModuleReference
+from hetdesrun.models.component import ComponentNode, ComponentRevision
 from hetdesrun.models.run import (
+    BatchExecutionInstance,
+    BatchWorkflowExecutionInput,
+    BatchWorkflowExecutionResult,
     ConfigurationInput,
+    ExecutionEngine,
     PerformanceMeasuredStep,
     WorkflowExecutionInput,
     WorkflowExecutionResult,
@@ -25,12 +34,17 @@ from hetdesrun.persistence.dbservice.revision import (
 )
 from hetdesrun.persistence.models.transformation import TransformationRevision
 from hetdesrun.persistence.models.workflow import WorkflowContent
+from hetdesrun.runtime.code_references import LOADED_CODE_HASHES_HEADER
 from hetdesrun.runtime.logging import execution_context_filter
-from hetdesrun.runtime.service import runtime_service
+from hetdesrun.runtime.service import runtime_batch_service, runtime_service
 from hetdesrun.utils import Type
 from hetdesrun.webservice.auth_dependency import get_auth_headers
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
-from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.config import ResultMediaType, get_config
+from hetdesrun.webservice.result_transport import (
+    BINARY_TABLE_MEDIA_TYPES,
+    parse_binary_result,
+)
 
 logger = logging.getLogger(__name__)
 logger.addFilter(execution_context_filter)
@@ -42,6 +56,61 @@ class ExecByIdInput(BaseModel):
     run_pure_plot_operators: bool = Field(
         False, description="Whether pure plot components should be run."
     )
+    gather_inputs_concurrently: bool = Field(
+        False,
+        description=(
+            "Whether independent upstream operators should be computed simultaneously."
+        ),
+    )
+    prune_operators_without_effect: bool = Field(
+        False,
+        description=(
+            "Whether operators which neither lead to an output"
+            " nor to an operator with side effects should be skipped."
+        ),
+    )
+    profile_operators: bool = Field(
+        False,
+        description=(
+            "Whether time, CPU time and result sizes of every operator should be"
+            " measured and returned in the measured steps."
+        ),
+    )
+    profile_operator_memory: bool = Field(
+        False,
+        description=(
+            "Whether memory allocations of every operator should be traced in addition"
+            " when profiling operators."
+        ),
+    )
+    engine: ExecutionEngine = Field(
+        ExecutionEngine.Plain,
+        description=(
+            "Execution engine to use. The process engine runs synchronous operators"
+            " of independent branches in parallel worker processes."
+        ),
+    )
+    session_id: str | None = Field(
+        None,
+        description=(
+            "If set, the next execution with the same session id only loads data for"
+            " changed input wirings and only runs operators depending on changed inputs."
+        ),
+    )
+    execution_window: datetime.timedelta | None = Field(
+        None,
+        description=(
+            "If set, the time range of the input wirings is split into windows of"
+            " this duration, which are executed one after another."
+        ),
+    )
+    window_overlap: datetime.timedelta | None = Field(
+        None,
+        description=(
+            "Duration of data loaded before every window. Determined from the"
+            " lookback of the components by default."
+        ),
+    )
     job_id: UUID = Field(
         default_factory=uuid4,
         description=(
@@ -73,6 +142,54 @@ class ExecLatestByGroupIdInput(BaseModel):
     run_pure_plot_operators: bool = Field(
         False, description="Whether pure plot components should be run."
     )
+    gather_inputs_concurrently: bool = Field(
+        False,
+        description=(
+            "Whether independent upstream operators should be computed simultaneously."
+        ),
+    )
+    prune_operators_without_effect: bool = Field(
+        False,
+        description=(
+            "Whether operators which neither lead to an output"
+            " nor to an operator with side effects should be skipped."
+        ),
+    )
+    profile_operators: bool = Field(
+        False,
+        description=(
+            "Whether time, CPU time and result sizes of every operator should be"
+            " measured and returned in the measured steps."
+        ),
+    )
+    profile_operator_memory: bool = Field(
+        False,
+        description=(
+            "Whether memory allocations of every operator should be traced in addition"
+            " when profiling operators."
+        ),
+    )
+    engine: ExecutionEngine = Field(
+        ExecutionEngine.Plain,
+        description=(
+            "Execution engine to use. The process engine runs synchronous operators"
+            " of independent branches in parallel worker processes."
+        ),
+    )
+    execution_window: datetime.timedelta | None = Field(
+        None,
+        description=(
+            "If set, the time range of the input wirings is split into windows of"
+            " this duration, which are executed one after another."
+        ),
+    )
+    window_overlap: datetime.timedelta | None = Field(
+        None,
+        description=(
+            "Duration of data loaded before every window. Determined from the"
+            " lookback of the components by default."
+        ),
+    )
     job_id: UUID = Field(
         default_factory=uuid4,
         description="Optional job id, that can be used to track an execution job.",
@@ -83,10 +200,56 @@ class ExecLatestByGroupIdInput(BaseModel):
             id=id,
             wiring=self.wiring,
             run_pure_plot_operators=self.run_pure_plot_operators,
+            gather_inputs_concurrently=self.gather_inputs_concurrently,
+            prune_operators_without_effect=self.prune_operators_without_effect,
+            profile_operators=self.profile_operators,
+            profile_operator_memory=self.profile_operator_memory,
+            engine=self.engine,
+            execution_window=self.execution_window,
+            window_overlap=self.window_overlap,
             job_id=self.job_id,
         )
 
 
+class BatchExecByIdInput(BaseModel):
+    """Payload for executing one transformation revision with several wirings"""
+
+    id: UUID  # noqa: A003
+    wirings: list[WorkflowWiring] = Field(
+        ..., description="One wiring for every execution", min_items=1
+    )
+    run_pure_plot_operators: bool = Field(
+        False, description="Whether pure plot components should be run."
+    )
+    gather_inputs_concurrently: bool = Field(
+        False,
+        description=(
+            "Whether independent upstream operators should be computed simultaneously."
+        ),
+    )
+    prune_operators_without_effect: bool = Field(
+        False,
+        description=(
+            "Whether operators which neither lead to an output"
+            " nor to an operator with side effects should be skipped."
+        ),
+    )
+    profile_operators: bool = Field(
+        False,
+        description=(
+            "Whether time, CPU time and result sizes of every operator should be"
+            " measured and returned in the measured steps."
+        ),
+    )
+    engine: ExecutionEngine = Field(
+        ExecutionEngine.Plain,
+        description=(
+            "Execution engine to use. The process engine runs synchronous operators"
+            " of independent branches in parallel worker processes."
+        ),
+    )
+
+
 class TrafoExecutionError(Exception):
     pass
 
@@ -165,24 +328,22 @@ def nested_nodes(
     return children_nodes(tr_workflow.content, ancestor_children)
 
 
-def prepare_execution_input(exec_by_id_input: ExecByIdInput) -> WorkflowExecutionInput:
-    """Loads trafo revision and prepares execution input from it.
+def load_transformation_for_execution(
+    transformation_id: UUID,
+) -> tuple[
+    TransformationRevision, WorkflowNode, list[CodeModule], list[ComponentRevision]
+]:
+    """Load trafo revision with everything needed for its execution
 
-    Loads the trafo revision specified by id and prepares
-    an workflow execution input object which can be executed by the runtime
-    -- either code or by calling runtime rest endpoint for running
-    workflows.
+    Returns the (possibly wrapping) workflow revision, its workflow node and the code
+    modules and component revisions of all nested components.
 
     Note that trafo revisions of type components will be wrapped in
     an ad-hoc workflow structure for execution.
     """
     try:
-        transformation_revision = read_single_transformation_revision(
-            exec_by_id_input.id
-        )
-        logger.info(
-            "found transformation revision with id %s", str(exec_by_id_input.id)
-        )
+        transformation_revision = read_single_transformation_revision(transformation_id)
+        logger.info("found transformation revision with id %s", str(transformation_id))
     except DBNotFoundError as e:
         raise TrafoExecutionNotFoundError() from e
 
@@ -206,18 +367,49 @@ def prepare_execution_input(exec_by_id_input: ExecByIdInput) -> WorkflowExecutio
         sub_nodes=nested_nodes(tr_workflow, nested_transformations),
     )
 
+    return (
+        tr_workflow,
+        workflow_node,
+        [tr_component.to_code_module() for tr_component in nested_components.values()],
+        [component.to_component_revision() for component in nested_components.values()],
+    )
+
+
+def prepare_execution_input(exec_by_id_input: ExecByIdInput) -> WorkflowExecutionInput:
+    """Loads trafo revision and prepares execution input from it.
+
+    Loads the trafo revision specified by id and prepares
+    an workflow execution input object which can be executed by the runtime
+    -- either code or by calling runtime rest endpoint for running
+    workflows.
+
+    Note that trafo revisions of type components will be wrapped in
+    an ad-hoc workflow structure for execution.
+    """
+    (
+        tr_workflow,
+        workflow_node,
+        code_modules,
+        components,
+    ) = load_transformation_for_execution(exec_by_id_input.id)
+
     execution_input = WorkflowExecutionInput(
-        code_modules=[
-            tr_component.to_code_module() for tr_component in nested_components.values()
-        ],
-        components=[
-            component.to_component_revision()
-            for component in nested_components.values()
-        ],
+        code_modules=code_modules,
+        components=components,
         workflow=workflow_node,
         configuration=ConfigurationInput(
             name=str(tr_workflow.id),
             run_pure_plot_operators=exec_by_id_input.run_pure_plot_operators,
+            gather_inputs_concurrently=exec_by_id_input.gather_inputs_concurrently,
+            prune_operators_without_effect=(
+                exec_by_id_input.prune_operators_without_effect
+            ),
+            profile_operators=exec_by_id_input.profile_operators,
+            profile_operator_memory=exec_by_id_input.profile_operator_memory,
+            session_id=exec_by_id_input.session_id,
+            engine=exec_by_id_input.engine,
+            execution_window=exec_by_id_input.execution_window,
+            window_overlap=exec_by_id_input.window_overlap,
         ),
         workflow_wiring=exec_by_id_input.wiring,
         job_id=exec_by_id_input.job_id,
@@ -225,8 +417,218 @@ def prepare_execution_input(exec_by_id_input: ExecByIdInput) -> WorkflowExecutio
     return execution_input
 
 
+def prepare_batch_execution_input(
+    batch_exec_by_id_input: BatchExecByIdInput,
+) -> BatchWorkflowExecutionInput:
+    """Loads trafo revision once and prepares a batch execution input from it
+
+    Every wiring becomes an instance of the batch with its own job id.
+    """
+    (
+        tr_workflow,
+        workflow_node,
+        code_modules,
+        components,
+    ) = load_transformation_for_execution(batch_exec_by_id_input.id)
+
+    return BatchWorkflowExecutionInput(
+        code_modules=code_modules,
+        components=components,
+        workflow=workflow_node,
+        configuration=ConfigurationInput(
+            name=str(tr_workflow.id),
+            run_pure_plot_operators=batch_exec_by_id_input.run_pure_plot_operators,
+            gather_inputs_concurrently=(
+                batch_exec_by_id_input.gather_inputs_concurrently
+            ),
+            prune_operators_without_effect=(
+                batch_exec_by_id_input.prune_operators_without_effect
+            ),
+            profile_operators=batch_exec_by_id_input.profile_operators,
+            engine=batch_exec_by_id_input.engine,
+        ),
+        instances=[
+            BatchExecutionInstance(workflow_wiring=wiring)
+            for wiring in batch_exec_by_id_input.wirings
+        ],
+    )
+
+
+class RuntimeClientPool:
+    """Long-lived HTTP client for requests to the runtime service
+
+    Reusing the client keeps the connections to the runtime service open between
+    executions instead of establishing a new connection (including TLS handshake) per
+    execution. Clients are bound to the event loop they were created in, so a new one
+    is created for a new event loop.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                verify=get_config().hd_runtime_verify_certs,
+                timeout=get_config().external_request_timeout,
+            )
+            self._loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+
+runtime_client_pool = RuntimeClientPool()
+
+# Hashes of the code the runtime service announced as loaded, see the
+# runtime.code_references module.
+runtime_loaded_code_hashes: set[str] = set()
+
+# Maximal number of code modules whose hashes are kept for reuse
+CODE_HASH_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CODE_HASH_CACHE_SIZE)
+def revision_code_hash(revision_id: UUID, code: str) -> str:  # noqa: ARG001
+    """Hash of the code of a transformation revision
+
+    Cached, so that the code of a revision is not hashed again for every execution.
+    The code is part of the key, since the code of a revision can change: Drafts are
+    edited and even released revisions may be overwritten (allow_overwrite_released).
+    """
+    return hash_code(code)
+
+
+def with_code_module_references(
+    runtime_input: WorkflowExecutionInput | BatchWorkflowExecutionInput,
+) -> WorkflowExecutionInput | BatchWorkflowExecutionInput:
+    """Copy of the input with code loaded by the runtime service sent as references"""
+    code_modules: list[CodeModule] = []
+    code_module_references: list[CodeModuleReference] = []
+    for code_module in runtime_input.code_modules:
+        code_hash = revision_code_hash(code_module.uuid, code_module.code)
+        if code_hash in runtime_loaded_code_hashes:
+            code_module_references.append(
+                CodeModuleReference(uuid=code_module.uuid, code_hash=code_hash)
+            )
+        else:
+            code_modules.append(code_module)
+    return runtime_input.copy(
+        update={
+            "code_modules": code_modules,
+            "code_module_references": code_module_references,
+        }
+    )
+
+
+async def _post_runtime_input(
+    url: str,
+    headers: dict[str, str],
+    runtime_input: WorkflowExecutionInput | BatchWorkflowExecutionInput,
+) -> httpx.Response:
+    try:
+        return await runtime_client_pool.get().post(
+            url,
+            headers={**headers, "Content-Type": "application/json"},
+            content=runtime_input.json(),
+            timeout=None,
+        )
+    except httpx.HTTPError as e:
+        # handles both request errors (connection problems)
+        # and 4xx and 5xx errors. See https://www.python-httpx.org/exceptions/
+        msg = f"Failure connecting to hd runtime endpoint ({url}):\n{str(e)}"
+        logger.info(msg)
+        raise TrafoExecutionRuntimeConnectionError(msg) from e
+
+
+async def post_to_runtime(
+    url_path: str,
+    runtime_input: WorkflowExecutionInput | BatchWorkflowExecutionInput,
+    result_media_type: ResultMediaType | None = None,
+) -> Any:
+    """Send input to an endpoint of the external runtime service
+
+    Code the runtime service announced as loaded is sent as code module references. If
+    the runtime service misses some of it, the input is sent again with all code.
+
+    Returns the parsed JSON response. If a binary table result media type is provided,
+    it is requested via the Accept header and Pandas outputs of a multipart response
+    are parsed into Pandas objects. Raises TrafoExecutionRuntimeConnectionError on
+    errors.
+    """
+    try:
+        headers = await get_auth_headers(external=False)
+    except ServiceAuthenticationError as e:
+        msg = (
+            "Failed to get auth headers for internal runtime execution request."
+            f" Error was:\n{str(e)}"
+        )
+        logger.info(msg)
+        raise TrafoExecutionRuntimeConnectionError(msg) from e
+
+    request_binary_tables = result_media_type in BINARY_TABLE_MEDIA_TYPES
+    if request_binary_tables:
+        assert result_media_type is not None  # hint for mypy  # noqa: S101
+        headers = {
+            **headers,
+            "Accept": f"{result_media_type.value}, application/json;q=0.9",
+        }
+
+    url = posix_urljoin(get_config().hd_runtime_engine_url, url_path)
+    response = await _post_runtime_input(
+        url, headers, with_code_module_references(runtime_input)
+    )
+    if response.status_code == httpx.codes.CONFLICT:
+        missing_code_hashes = response.json().get("missing_code_hashes", [])
+        logger.info(
+            "Runtime service has not loaded the code of %d code modules."
+            " Sending the complete code.",
+            len(missing_code_hashes),
+        )
+        runtime_loaded_code_hashes.difference_update(missing_code_hashes)
+        response = await _post_runtime_input(url, headers, runtime_input)
+
+    runtime_loaded_code_hashes.update(
+        code_hash
+        for code_hash in response.headers.get(LOADED_CODE_HASHES_HEADER, "").split(",")
+        if code_hash != ""
+    )
+
+    content_type = response.headers.get("content-type", "")
+    if request_binary_tables and content_type.startswith("multipart/mixed"):
+        try:
+            return parse_binary_result(response.content, content_type)
+        except ValueError as e:
+            msg = f"Could not parse multipart response of hd runtime:\n{str(e)}"
+            logger.info(msg)
+            raise TrafoExecutionRuntimeConnectionError(msg) from e
+    return response.json()
+
+
+def to_execution_response(
+    execution_result: WorkflowExecutionResult, workflow: WorkflowNode, job_id: UUID
+) -> ExecutionResponseFrontendDto:
+    return ExecutionResponseFrontendDto(
+        error=execution_result.error,
+        output_results_by_output_name=execution_result.output_results_by_output_name,
+        output_types_by_output_name={
+            output.name: output.type for output in workflow.outputs
+        },
+        result=execution_result.result,
+        traceback=execution_result.traceback,
+        job_id=job_id,
+        measured_steps=execution_result.measured_steps,
+    )
+
+
 async def run_execution_input(
-    execution_input: WorkflowExecutionInput,
+    execution_input: WorkflowExecutionInput, binary_tables: bool = False
 ) -> ExecutionResponseFrontendDto:
     """Runs the provided execution input
 
@@ -234,72 +636,36 @@ async def run_execution_input(
     external runtime service endpoint (if this instance is not considered to
     act as runtime service).
 
+    binary_tables must be set if the response is transported with binary tables.
+
     Raises subtypes of TrafoExecutionError on errors.
     """
     run_execution_input_measured_step = PerformanceMeasuredStep.create_and_begin(
         "run_execution_input"
     )
 
-    output_types = {
-        output.name: output.type for output in execution_input.workflow.outputs
-    }
-
     execution_result: WorkflowExecutionResult
 
     if get_config().is_runtime_service:
-        execution_result = await runtime_service(execution_input)
+        execution_result = await runtime_service(
+            execution_input, binary_tables=binary_tables
+        )
     else:
+        json_obj = await post_to_runtime(
+            "runtime", execution_input, get_config().runtime_result_media_type
+        )
         try:
-            headers = await get_auth_headers(external=False)
-        except ServiceAuthenticationError as e:
+            execution_result = WorkflowExecutionResult(**json_obj)
+        except ValidationError as e:
             msg = (
-                "Failed to get auth headers for internal runtime execution request."
-                f" Error was:\n{str(e)}"
+                f"Could not validate hd runtime result object. Exception:\n{str(e)}"
+                f"\nJson Object is:\n{str(json_obj)}"
             )
             logger.info(msg)
-            raise TrafoExecutionRuntimeConnectionError(msg) from e
-
-        async with httpx.AsyncClient(
-            verify=get_config().hd_runtime_verify_certs,
-            timeout=get_config().external_request_timeout,
-        ) as client:
-            url = posix_urljoin(get_config().hd_runtime_engine_url, "runtime")
-            try:
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    json=json.loads(
-                        execution_input.json()
-                    ),  # TODO: avoid double serialization.
-                    # see https://github.com/samuelcolvin/pydantic/issues/1409 and
-                    # https://github.com/samuelcolvin/pydantic/issues/1409#issuecomment-877175194
-                    timeout=None,
-                )
-            except httpx.HTTPError as e:
-                # handles both request errors (connection problems)
-                # and 4xx and 5xx errors. See https://www.python-httpx.org/exceptions/
-                msg = f"Failure connecting to hd runtime endpoint ({url}):\n{str(e)}"
-                logger.info(msg)
-                raise TrafoExecutionRuntimeConnectionError(msg) from e
-            try:
-                json_obj = response.json()
-                execution_result = WorkflowExecutionResult(**json_obj)
-            except ValidationError as e:
-                msg = (
-                    f"Could not validate hd runtime result object. Exception:\n{str(e)}"
-                    f"\nJson Object is:\n{str(json_obj)}"
-                )
-                logger.info(msg)
-                raise TrafoExecutionResultValidationError(msg) from e
+            raise TrafoExecutionResultValidationError(msg) from e
 
-    execution_response = ExecutionResponseFrontendDto(
-        error=execution_result.error,
-        output_results_by_output_name=execution_result.output_results_by_output_name,
-        output_types_by_output_name=output_types,
-        result=execution_result.result,
-        traceback=execution_result.traceback,
-        job_id=execution_input.job_id,
-        measured_steps=execution_result.measured_steps,
+    execution_response = to_execution_response(
+        execution_result, execution_input.workflow, execution_input.job_id
     )
 
     run_execution_input_measured_step.stop()
@@ -311,7 +677,7 @@ async def run_execution_input(
 
 
 async def execute_transformation_revision(
-    exec_by_id_input: ExecByIdInput,
+    exec_by_id_input: ExecByIdInput, binary_tables: bool = False
 ) -> ExecutionResponseFrontendDto:
     """Execute transformation revision
 
@@ -330,8 +696,62 @@ async def execute_transformation_revision(
 
     prep_exec_input_measured_step.stop()
 
-    exec_resp_frontend_dto = await run_execution_input(execution_input)
+    exec_resp_frontend_dto = await run_execution_input(
+        execution_input, binary_tables=binary_tables
+    )
     exec_resp_frontend_dto.measured_steps.prepare_execution_input = (
         prep_exec_input_measured_step
     )
     return exec_resp_frontend_dto
+
+
+async def execute_transformation_revision_batch(
+    batch_exec_by_id_input: BatchExecByIdInput,
+) -> list[ExecutionResponseFrontendDto]:
+    """Execute transformation revision once for every wiring
+
+    The transformation revision is loaded once and the runtime parses it once for all
+    wirings. Returns the execution responses in the order of the wirings.
+
+    raises subtypes of TrafoExecutionError on errors.
+    """
+    prep_exec_input_measured_step = PerformanceMeasuredStep.create_and_begin(
+        "prepare_execution_input"
+    )
+    batch_execution_input = prepare_batch_execution_input(batch_exec_by_id_input)
+    prep_exec_input_measured_step.stop()
+
+    run_execution_input_measured_step = PerformanceMeasuredStep.create_and_begin(
+        "run_execution_input"
+    )
+    batch_execution_result: BatchWorkflowExecutionResult
+    if get_config().is_runtime_service:
+        batch_execution_result = await runtime_batch_service(batch_execution_input)
+    else:
+        json_obj = await post_to_runtime("runtime/batch", batch_execution_input)
+        try:
+            batch_execution_result = BatchWorkflowExecutionResult(**json_obj)
+        except ValidationError as e:
+            msg = (
+                "Could not validate hd runtime batch result object."
+                f" Exception:\n{str(e)}\nJson Object is:\n{str(json_obj)}"
+            )
+            logger.info(msg)
+            raise TrafoExecutionResultValidationError(msg) from e
+    run_execution_input_measured_step.stop()
+
+    execution_responses = []
+    for instance, execution_result in zip(
+        batch_execution_input.instances, batch_execution_result.results, strict=True
+    ):
+        execution_response = to_execution_response(
+            execution_result, batch_execution_input.workflow, instance.job_id
+        )
+        execution_response.measured_steps.prepare_execution_input = (
+            prep_exec_input_measured_step
+        )
+        execution_response.measured_steps.run_execution_input = (
+            run_execution_input_measured_step
+        )
+        execution_responses.append(execution_response)
+    return execution_responses
@@ -191,11 +191,8 @@ async def consume_execution_trigger_message(
                     kafka_ctx.last_unhandled_exception = e
                     logger.error(msg)
                     continue
-                exec_by_id_input = ExecByIdInput(
-                    id=latest_id,
-                    wiring=exec_latest_by_group_id_input.wiring,
-                    run_pure_plot_operators=exec_latest_by_group_id_input.run_pure_plot_operators,
-                    job_id=exec_latest_by_group_id_input.job_id,
+                exec_by_id_input = exec_latest_by_group_id_input.to_exec_by_id(
+                    latest_id
                 )
             logger.info(
                 "Start execution of trafo rev %s with job id %s from Kafka consumer %s",
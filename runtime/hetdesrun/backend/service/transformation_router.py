@@ -8,6 +8,7 @@ import httpx
 from fastapi import (
     APIRouter,
     BackgroundTasks,
+    Header,
     HTTPException,
     Path,
     Query,
@@ -17,12 +18,14 @@ from fastapi import (
 from pydantic import HttpUrl
 
 from hetdesrun.backend.execution import (
+    BatchExecByIdInput,
     ExecByIdInput,
     ExecLatestByGroupIdInput,
     TrafoExecutionNotFoundError,
     TrafoExecutionResultValidationError,
     TrafoExecutionRuntimeConnectionError,
     execute_transformation_revision,
+    execute_transformation_revision_batch,
 )
 from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
 from hetdesrun.component.code import update_code
@@ -54,6 +57,10 @@ from hetdesrun.utils import State, Type
 from hetdesrun.webservice.auth_dependency import get_auth_headers
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.result_transport import (
+    binary_result_response,
+    requested_binary_media_type,
+)
 from hetdesrun.webservice.router import HandleTrailingSlashAPIRouter
 
 logger = logging.getLogger(__name__)
@@ -535,7 +542,7 @@ async def delete_transformation_revision(
 
 
 async def handle_trafo_revision_execution_request(
-    exec_by_id: ExecByIdInput,
+    exec_by_id: ExecByIdInput, binary_tables: bool = False
 ) -> ExecutionResponseFrontendDto:
     internal_full_measured_step = PerformanceMeasuredStep.create_and_begin(
         "internal_full"
@@ -544,7 +551,9 @@ async def handle_trafo_revision_execution_request(
         exec_by_id.job_id = uuid4()
 
     try:
-        exec_response = await execute_transformation_revision(exec_by_id)
+        exec_response = await execute_transformation_revision(
+            exec_by_id, binary_tables=binary_tables
+        )
 
     except TrafoExecutionNotFoundError as e:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail=str(e)) from e
@@ -575,15 +584,61 @@ async def handle_trafo_revision_execution_request(
 )
 async def execute_transformation_revision_endpoint(
     exec_by_id: ExecByIdInput,
-) -> ExecutionResponseFrontendDto:
+    accept: str | None = Header(None),
+) -> ExecutionResponseFrontendDto | Response:
     """Execute a transformation revision.
 
     The transformation will be loaded from the DB and executed with the wiring sent in the request
     body.
 
+    The test wiring will not be updated.
+
+    If the Accept header requests the Arrow IPC stream or the Parquet media type, the result
+    is returned as multipart/mixed response with the Pandas outputs as binary tables.
+    """
+    binary_media_type = requested_binary_media_type(accept)
+    execution_response = await handle_trafo_revision_execution_request(
+        exec_by_id, binary_tables=binary_media_type is not None
+    )
+    if binary_media_type is not None:
+        return binary_result_response(execution_response, binary_media_type)
+    return execution_response
+
+
+@transformation_router.post(
+    "/execute-batch",
+    response_model=list[ExecutionResponseFrontendDto],
+    summary="Executes a transformation revision with several wirings",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Successfully executed the transformation revision"
+        }
+    },
+)
+async def execute_transformation_revision_batch_endpoint(
+    batch_exec_by_id: BatchExecByIdInput,
+) -> list[ExecutionResponseFrontendDto]:
+    """Execute a transformation revision once for every wiring.
+
+    The transformation will be loaded from the DB once and the runtime parses it and imports
+    its components only once for all wirings. The executions are run concurrently, data of all
+    wirings is loaded together where possible. The responses are returned in the order of the
+    wirings, each with its own job id.
+
     The test wiring will not be updated.
     """
-    return await handle_trafo_revision_execution_request(exec_by_id)
+    try:
+        return await execute_transformation_revision_batch(batch_exec_by_id)
+
+    except TrafoExecutionNotFoundError as e:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    except TrafoExecutionRuntimeConnectionError as e:
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+
+    except TrafoExecutionResultValidationError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
 
 callback_router = APIRouter()
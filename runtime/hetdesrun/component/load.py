@@ -2,9 +2,14 @@
 import hashlib
 import importlib
 import logging
+import marshal
+import os
 import sys
+import tempfile
 from collections.abc import Callable, Coroutine
-from types import ModuleType
+from types import CodeType, ModuleType
+
+from hetdesrun.webservice.config import get_config
 
 
 class ComponentCodeImportError(Exception):
@@ -22,6 +27,10 @@ base_module_path = "hetdesrun_loaded_components"
 # level we do not need to recursively register modules:
 sys.modules[base_module_path] = ModuleType(base_module_path, "base module")
 
+# Code of the modules imported by this process by hash of the code. Allows to execute
+# components from code module references (see runtime.code_references module).
+imported_code_by_hash: dict[str, str] = {}
+
 
 def module_path_from_code(code: str) -> str:
     """Generates a unique module path from a hash of the actual code"""
@@ -33,6 +42,53 @@ def hash_code(code: str) -> str:
     return hashlib.sha256(code.encode("utf8")).hexdigest()
 
 
+def bytecode_cache_path(directory: str, code: str) -> str:
+    # marshalled code objects are only valid for the same Python version
+    return os.path.join(
+        directory, hash_code(code) + "." + str(sys.implementation.cache_tag) + ".bin"
+    )
+
+
+def compile_code(code: str) -> CodeType:
+    """Compile code, reusing compiled bytecode from the configured cache directory
+
+    Raises SyntaxError like compile.
+    """
+    directory = get_config().component_bytecode_cache_dir
+    if directory is None:
+        return compile_code_without_cache(code)
+
+    path = bytecode_cache_path(directory, code)
+    try:
+        with open(path, "rb") as cache_file:
+            cached_code = marshal.load(cache_file)  # noqa: S302
+        if isinstance(cached_code, CodeType):
+            return cached_code
+        logger.warning("Ignoring invalid compiled component code %s", path)
+    except FileNotFoundError:
+        pass
+    except Exception:  # noqa: BLE001
+        logger.warning("Could not read compiled component code %s", path, exc_info=True)
+
+    compiled_code = compile_code_without_cache(code)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # write atomically, since other worker processes may read the file concurrently
+        with tempfile.NamedTemporaryFile(
+            dir=directory, suffix=".tmp", delete=False
+        ) as tmp_file:
+            marshal.dump(compiled_code, tmp_file)
+        os.replace(tmp_file.name, path)
+    except OSError:
+        logger.warning("Could not store compiled component code", exc_info=True)
+    return compiled_code
+
+
+def compile_code_without_cache(code: str) -> CodeType:
+    compiled_code: CodeType = compile(code, "<string>", "exec")
+    return compiled_code
+
+
 def import_func_from_code(
     code: str,
     func_name: str,
@@ -72,7 +128,7 @@ def import_func_from_code(
             ] = mod  # now reachable under the constructed module_path
         try:
             # actually import the module;
-            exec(code, mod.__dict__)  # noqa: S102
+            exec(compile_code(code), mod.__dict__)  # noqa: S102
         except SyntaxError as exec_syntax_exception:
             logger.info(
                 "Syntax Error during importing function %s",
@@ -92,5 +148,8 @@ def import_func_from_code(
                 "Could not import code due to Exception"
             ) from exec_exception
 
+        if register_module:
+            imported_code_by_hash[hash_code(code)] = code
+
         func = getattr(mod, func_name)
         return func
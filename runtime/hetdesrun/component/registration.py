@@ -1,8 +1,11 @@
 """Component entrypoint registration utilities"""
 
 import asyncio
+import datetime
 import functools
+import sys
 from collections.abc import Callable
+from typing import Any
 
 from hetdesrun.component.load import ComponentCodeImportError
 from hetdesrun.datatypes import DataType
@@ -25,7 +28,11 @@ def register(
     state: str | None = None,
     released_timestamp: str | None = None,
     disabled_timestamp: str | None = None,
-    is_pure_plot_component: bool | None = None  # noqa: ARG001
+    is_pure_plot_component: bool | None = None,  # noqa: ARG001
+    executor: str | None = None,
+    has_side_effects: bool | None = None,
+    cacheable: bool = False,
+    lookback: str | datetime.timedelta | None = None,
 ) -> Callable[[Callable], Callable]:
     """Additonal features for component entrypoint functions
 
@@ -34,6 +41,24 @@ def register(
 
     is_pure_plot_component: This is deprecated and only exists for backwards compatibility,
     but it is ignored.
+
+    executor: Where a synchronous entrypoint function should be run, i.e. one of
+    "EVENT_LOOP", "THREAD" or "PROCESS". Overrides the configured default if set.
+
+    has_side_effects: Whether the component does something apart from returning its
+    outputs, e.g. storing data. If not set, components of the category "Data Sinks" are
+    assumed to have side effects. Operators without side effects may be skipped if they
+    do not contribute to a workflow output.
+
+    cacheable: Whether the outputs of the component only depend on its inputs, so that
+    results may be reused by later executions with equal inputs. Must not be set for
+    non-deterministic components (e.g. using random numbers or the current time, or
+    loading external data) and components with side effects.
+
+    lookback: How much data before a point in time the component needs to compute its
+    outputs at this point in time, e.g. the window size of a moving average. Either a
+    fixed duration like "1h" or the name of an input providing the duration. Used to
+    determine the overlap of windows in windowed executions.
     """
 
     def wrapper_func(func: Callable) -> Callable:
@@ -64,8 +89,30 @@ def register(
             "state": state,
             "released_timestamp": released_timestamp,
             "disabled_timestamp": disabled_timestamp,
+            "executor": executor,
+            "has_side_effects": has_side_effects,
+            "cacheable": cacheable,
+            "lookback": lookback,
         }
 
         return return_func_or_coro
 
     return wrapper_func
+
+
+def get_registered_option(func: Callable, key: str) -> Any:
+    """Obtain a component option for an entrypoint function
+
+    Options are taken from the register decorator metadata if present and otherwise
+    from a global COMPONENT_INFO dictionary in the module of the function. Returns
+    None if the option is not set.
+    """
+    if hasattr(func, "registered_metadata"):
+        return func.registered_metadata.get(key, None)
+
+    component_info = getattr(
+        sys.modules.get(getattr(func, "__module__", ""), None), "COMPONENT_INFO", None
+    )
+    if isinstance(component_info, dict):
+        return component_info.get(key, None)
+    return None
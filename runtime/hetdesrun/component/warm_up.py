@@ -0,0 +1,86 @@
+"""Importing component code at worker startup
+
+Component code is imported the first time it is executed in a worker process (see
+load module). For components using heavy libraries this first import can take seconds,
+which would be paid by the first executions after a deployment or a worker restart.
+If activated, every runtime worker process therefore imports the code of all released
+components at startup, before it serves requests.
+
+Runtime services which are also backend services read the released components from the
+database, separate runtime services from a directory of transformation revisions like
+the autoimport directory.
+"""
+import logging
+import time
+
+from hetdesrun.component.load import ComponentCodeImportError, import_func_from_code
+from hetdesrun.persistence.dbservice.revision import (
+    get_multiple_transformation_revisions,
+)
+from hetdesrun.persistence.models.transformation import TransformationRevision
+from hetdesrun.trafoutils.filter.params import FilterParams
+from hetdesrun.trafoutils.io.load import load_import_sources_from_directory
+from hetdesrun.utils import State, Type
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+def released_components_to_warm_up() -> list[TransformationRevision]:
+    config = get_config()
+    if config.is_backend_service:
+        return get_multiple_transformation_revisions(
+            FilterParams(
+                type=Type.COMPONENT, state=State.RELEASED, include_deprecated=False
+            )
+        )
+
+    directory = config.component_warm_up_directory or config.autoimport_directory
+    if directory == "":
+        logger.warning(
+            "Component warm up is activated, but no directory to load components from"
+            " is configured."
+        )
+        return []
+    return [
+        transformation_revision
+        for importable in load_import_sources_from_directory(directory)
+        for transformation_revision in importable.transformation_revisions
+        if transformation_revision.type == Type.COMPONENT
+        and transformation_revision.state == State.RELEASED
+    ]
+
+
+def warm_up_component_imports() -> int:
+    """Import the code of all released components
+
+    Components whose code cannot be imported are skipped. Returns the number of
+    imported components.
+    """
+    start = time.perf_counter()
+    try:
+        components = released_components_to_warm_up()
+    except Exception:  # noqa: BLE001
+        logger.warning("Could not load components for warm up", exc_info=True)
+        return 0
+
+    imported_count = 0
+    for component in components:
+        try:
+            import_func_from_code(component.content, "main")  # type: ignore[arg-type]
+        except (ComponentCodeImportError, AttributeError):
+            logger.warning(
+                "Could not import code of component %s (%s) during warm up",
+                component.name,
+                component.id,
+                exc_info=True,
+            )
+        else:
+            imported_count += 1
+
+    logger.info(
+        "Imported code of %d released components in %.2f seconds",
+        imported_count,
+        time.perf_counter() - start,
+    )
+    return imported_count
@@ -1,8 +1,11 @@
+import contextlib
 import datetime
 import json
 import logging
+import weakref
 from collections.abc import Generator
 from enum import Enum
+from functools import lru_cache
 from typing import Any, TypedDict
 from uuid import UUID
 
@@ -17,6 +20,176 @@ logger = logging.getLogger(__name__)
 
 MULTITSFRAME_COLUMN_NAMES = ["timestamp", "metric", "value"]
 
+# pandas.read_json interprets numbers as epoch timestamps if all of them are larger
+# than one year in seconds, trying these units one after another.
+EPOCH_TIMESTAMP_MIN = 31536000
+EPOCH_TIMESTAMP_UNITS = ("s", "ms", "us", "ns")
+
+# Inferred types of object values which pandas.read_json reads back unchanged from
+# their JSON encoding
+JSON_NATIVE_INFERRED_TYPES = ("string", "boolean", "empty")
+
+# Maximal number of field combinations whose dynamic models are kept for reuse
+DYNAMIC_MODEL_CACHE_SIZE = 1024
+
+
+def _try_convert_to_datetime(data: pd.Series | pd.Index) -> pd.Series | pd.Index | None:
+    """Date conversion of pandas.read_json, None if data is not date-like"""
+    if len(data) == 0:
+        return None
+    numeric_data = data
+    if data.dtype == "object":
+        with contextlib.suppress(TypeError, ValueError, OverflowError):
+            numeric_data = data.astype("int64")
+    if issubclass(numeric_data.dtype.type, np.number):
+        values = np.asarray(numeric_data)
+        if not (
+            pd.isna(values)
+            | (values > EPOCH_TIMESTAMP_MIN)
+            | (values == np.iinfo(np.int64).min)
+        ).all():
+            return None
+    for unit in EPOCH_TIMESTAMP_UNITS:
+        try:
+            return pd.to_datetime(numeric_data, errors="raise", unit=unit)
+        except (TypeError, ValueError, OverflowError):
+            continue
+    return None
+
+
+def _convert_json_like_data(
+    data: pd.Series | pd.Index, convert_dates: bool
+) -> pd.Series | pd.Index:
+    """Dtype inference of pandas.read_json for an axis or a column"""
+    if convert_dates:
+        datetime_data = _try_convert_to_datetime(data)
+        if datetime_data is not None:
+            return datetime_data
+    if data.dtype == "object":
+        with contextlib.suppress(TypeError, ValueError):
+            data = data.astype("float64")
+    if data.dtype.kind == "f" and data.dtype != "float64":
+        data = data.astype("float64")
+    if len(data) != 0 and data.dtype in ("float64", "object"):
+        try:
+            int_data = data.astype("int64")
+            if (int_data == data).all():
+                data = int_data
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return data
+
+
+def _is_date_like_column_name(name: Any) -> bool:
+    """Column names which pandas.read_json tries to convert to dates"""
+    if not isinstance(name, str):
+        return False
+    lower_name = name.lower()
+    return (
+        lower_name.endswith(("_at", "_time"))
+        or lower_name in ("modified", "date", "datetime")
+        or lower_name.startswith("timestamp")
+    )
+
+
+def _has_json_like_labels(labels: pd.Index) -> bool:
+    return (
+        isinstance(labels, pd.RangeIndex)
+        or len(labels) == 0
+        or labels.inferred_type == "string"
+    )
+
+
+def _has_json_like_values(data: pd.Series) -> bool:
+    return data.dtype.kind in "bif" or (
+        data.dtype == "object"
+        and pd.api.types.infer_dtype(data, skipna=True) in JSON_NATIVE_INFERRED_TYPES
+    )
+
+
+def frame_from_typed_data(v: Any) -> pd.DataFrame | None:
+    """Construct a DataFrame from a 2-dimensional array or a dict of arrays/Series"""
+    if isinstance(v, np.ndarray) and v.ndim == 2:
+        return pd.DataFrame(v)
+    if (
+        isinstance(v, dict)
+        and len(v) != 0
+        and all(isinstance(column, np.ndarray | pd.Series) for column in v.values())
+    ):
+        return pd.DataFrame(v)
+    return None
+
+
+def series_from_json_like(v: dict | list) -> pd.Series | None:
+    """Construct a Series from decoded JSON without a JSON round trip
+
+    The result equals pandas.read_json(json.dumps(v), typ="series"), but the data is
+    not serialized and parsed again and dtypes are inferred vectorized. Returns None
+    if the shape or the values of v are not supported, e.g. non-string keys or nested
+    objects.
+    """
+    try:
+        series = pd.Series(v, dtype=object if len(v) == 0 else None)
+        if not (_has_json_like_labels(series.index) and _has_json_like_values(series)):
+            return None
+        series.index = _convert_json_like_data(series.index, convert_dates=True)
+        return _convert_json_like_data(series, convert_dates=True)
+    except Exception:  # noqa: BLE001
+        logger.debug("Fast path for Series parsing failed.", exc_info=True)
+        return None
+
+
+def infer_json_like_dtypes(frame: pd.DataFrame) -> pd.DataFrame:
+    """Apply the dtype inference of pandas.read_json to a DataFrame of JSON values
+
+    Axes and columns are converted as pandas.read_json with typ="frame" converts
+    them after constructing the DataFrame from the decoded JSON.
+    """
+    frame.index = _convert_json_like_data(frame.index, convert_dates=True)
+    frame.columns = _convert_json_like_data(frame.columns, convert_dates=True)
+    if len(frame.columns) == 0:
+        return frame
+
+    converted_columns = []
+    for name, column in frame.items():
+        datetime_column = (
+            _try_convert_to_datetime(column)
+            if _is_date_like_column_name(name)
+            else None
+        )
+        converted_columns.append(
+            datetime_column
+            if datetime_column is not None
+            else _convert_json_like_data(column, convert_dates=False)
+        )
+    converted_frame = pd.DataFrame(
+        dict(enumerate(converted_columns)), index=frame.index
+    )
+    converted_frame.columns = frame.columns
+    return converted_frame
+
+
+def frame_from_json_like(v: dict | list) -> pd.DataFrame | None:
+    """Construct a DataFrame from decoded JSON without a JSON round trip
+
+    Supports the shapes of pandas.DataFrame.to_dict like dicts of lists, dicts of
+    dicts and lists of records. The result equals
+    pandas.read_json(json.dumps(v), typ="frame"). Returns None if the shape or the
+    values of v are not supported.
+    """
+    try:
+        frame = pd.DataFrame(v)
+        if not (
+            _has_json_like_labels(frame.index)
+            and _has_json_like_labels(frame.columns)
+            and all(_has_json_like_values(column) for _, column in frame.items())
+        ):
+            return None
+        return infer_json_like_dtypes(frame)
+    except Exception:  # noqa: BLE001
+        logger.debug("Fast path for DataFrame parsing failed.", exc_info=True)
+        return None
+
 
 class DataType(str, Enum):
     """hetida designer data types
@@ -57,6 +230,15 @@ class PydanticPandasSeries:
     def validate(cls, v: pd.Series | str | dict | list) -> pd.Series:
         if isinstance(v, pd.Series):
             return v
+        series = (
+            pd.Series(v)
+            if isinstance(v, np.ndarray) and v.ndim == 1
+            else series_from_json_like(v)
+            if isinstance(v, dict | list)
+            else None
+        )
+        if series is not None:
+            return series
         try:
             return pd.read_json(v, typ="series")
 
@@ -107,6 +289,13 @@ class PydanticPandasDataFrame:
     def validate(cls, v: pd.DataFrame | str | dict | list) -> pd.DataFrame:
         if isinstance(v, pd.DataFrame):
             return v
+        typed_frame = frame_from_typed_data(v)
+        if typed_frame is not None:
+            return typed_frame
+        if isinstance(v, dict | list):
+            frame = frame_from_json_like(v)
+            if frame is not None:
+                return frame
         try:
             return pd.read_json(v, typ="frame")
 
@@ -119,6 +308,68 @@ class PydanticPandasDataFrame:
                 ) from read_json_exception
 
 
+class MultiTSFrameProblem(Enum):
+    """Requirements of a MultiTSFrame, in the order they are checked"""
+
+    COLUMN_NAMES = "column names"
+    METRIC_NULL = "null metric"
+    TIMESTAMP_NULL = "null timestamp"
+    TIMESTAMP_DTYPE = "timestamp dtype"
+    TIMESTAMP_TIMEZONE = "timestamp timezone"
+
+
+def multitsframe_problem(df: pd.DataFrame) -> MultiTSFrameProblem | None:
+    """First requirement of a MultiTSFrame which df violates, None if it is valid
+
+    Each column is scanned at most once. Null metrics of a categorical metric column
+    are found from its integer codes and null timestamps of a datetime64tz column
+    from its integer representation, which is much faster than scanning objects.
+    """
+    if set(df.columns) != set(MULTITSFRAME_COLUMN_NAMES):
+        return MultiTSFrameProblem.COLUMN_NAMES
+
+    metric = df["metric"]
+    if (
+        (metric.cat.codes.to_numpy() == -1).any()
+        if isinstance(metric.dtype, pd.CategoricalDtype)
+        else metric.hasnans
+    ):
+        return MultiTSFrameProblem.METRIC_NULL
+
+    timestamp = df["timestamp"]
+    if timestamp.hasnans:
+        return MultiTSFrameProblem.TIMESTAMP_NULL
+    if not pd.api.types.is_datetime64tz_dtype(timestamp):
+        return MultiTSFrameProblem.TIMESTAMP_DTYPE
+    if timestamp.dt.tz not in (pytz.UTC, datetime.timezone.utc):
+        return MultiTSFrameProblem.TIMESTAMP_TIMEZONE
+    return None
+
+
+# Frames marked as valid MultiTSFrames, by id. Entries vanish with their frames.
+_valid_multitsframes: "weakref.WeakValueDictionary[int, pd.DataFrame]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def mark_as_valid_multitsframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Mark a DataFrame as valid MultiTSFrame to skip its validation
+
+    Intended for adapters whose MultiTSFrames are valid by construction: exactly the
+    columns timestamp (datetime64 with UTC timezone, no nulls), metric (string dtype,
+    no nulls) and value. The next parsing of df as MultiTSFrame returns it without
+    any checks and removes the mark, so that the frame is validated again if it is
+    parsed once more, e.g. after being modified. Returns df.
+    """
+    _valid_multitsframes[id(df)] = df
+    return df
+
+
+def consume_valid_multitsframe_mark(df: pd.DataFrame) -> bool:
+    """Whether df is marked as valid MultiTSFrame, removing the mark"""
+    return _valid_multitsframes.pop(id(df), None) is df
+
+
 class PydanticMultiTimeseriesPandasDataFrame:
     """Custom pydantic Data Type for parsing Multi Timeseries Pandas DataFrames
 
@@ -138,8 +389,12 @@ class PydanticMultiTimeseriesPandasDataFrame:
     ) -> pd.DataFrame:
         df: pd.DataFrame | None = None
         if isinstance(v, pd.DataFrame):
+            if consume_valid_multitsframe_mark(v):
+                return v
             df = v
-        else:
+        elif isinstance(v, dict | list):
+            df = frame_from_json_like(v)
+        if df is None:
             try:
                 df = pd.read_json(v, typ="frame")
 
@@ -154,7 +409,11 @@ class PydanticMultiTimeseriesPandasDataFrame:
         if len(df.columns) == 0:
             df = pd.DataFrame(columns=MULTITSFRAME_COLUMN_NAMES)
 
-        if set(df.columns) != set(MULTITSFRAME_COLUMN_NAMES):
+        if set(df.columns) == set(MULTITSFRAME_COLUMN_NAMES) and len(df.index) == 0:
+            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+
+        problem = multitsframe_problem(df)
+        if problem is MultiTSFrameProblem.COLUMN_NAMES:
             column_names_string = ", ".join(df.columns)
             multitsframe_column_names_string = ", ".join(MULTITSFRAME_COLUMN_NAMES)
             raise ValueError(
@@ -162,33 +421,31 @@ class PydanticMultiTimeseriesPandasDataFrame:
                 f"required for a MultiTSFrame {multitsframe_column_names_string}."
             )
 
-        if df["metric"].isna().any():
+        if problem is MultiTSFrameProblem.METRIC_NULL:
             raise ValueError(
                 "No null values are allowed for the column 'metric' of a MulitTSFrame."
             )
 
-        df["metric"] = df["metric"].astype("string")
-
-        if df["timestamp"].isna().any():
+        if problem is MultiTSFrameProblem.TIMESTAMP_NULL:
             raise ValueError(
                 "No null values are allowed for the column 'timestamp' of a MulitTSFrame."
             )
 
-        if len(df.index) == 0:
-            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-
-        if not pd.api.types.is_datetime64tz_dtype(df["timestamp"]):
+        if problem is MultiTSFrameProblem.TIMESTAMP_DTYPE:
             raise ValueError(
                 "Column 'timestamp' of MultiTSFrame does not have datetime64tz dtype. "
                 f'Got {str(df["timestamp"].dtype)} index dtype instead.'
             )
 
-        if not df["timestamp"].dt.tz in (pytz.UTC, datetime.timezone.utc):
+        if problem is MultiTSFrameProblem.TIMESTAMP_TIMEZONE:
             raise ValueError(
                 "Column 'timestamp' of MultiTSFrame does not have UTC timezone. "
                 f'Got {str(df["timestamp"].dt.tz)} timezone instead.'
             )
 
+        if not isinstance(df["metric"].dtype, pd.StringDtype):
+            df["metric"] = df["metric"].astype("string")
+
         return df
 
 
@@ -291,6 +548,22 @@ class NamedDataTypedValue(TypedDict):
     value: Any
 
 
+@lru_cache(maxsize=DYNAMIC_MODEL_CACHE_SIZE)
+def dynamic_model(
+    fields: tuple[tuple[str, type], ...], model_name: str = "DynamicyModel"
+) -> type[BaseModel]:
+    """Pydantic model with the given required fields
+
+    Creating pydantic models is expensive compared to parsing small inputs with them.
+    Hence the models are cached by their field names and types. Since models are
+    not modified by parsing, they can be shared by all calls.
+    """
+    field_definitions: dict[str, Any] = {
+        name: (field_type, ...) for name, field_type in fields
+    }
+    return create_model(model_name, **field_definitions)
+
+
 def parse_via_pydantic(
     entries: list[NamedDataTypedValue],
     type_map: dict[DataType, type] | None = None,
@@ -303,17 +576,10 @@ def parse_via_pydantic(
 
     May raise the typical exceptions of pydantic parsing.
     """
-    type_dict: dict[str, tuple[type, "ellipsis"]] = {  # noqa: F821
-        entry["name"]: (
-            type_map[entry["type"]]
-            if type_map is not None
-            else data_type_map[entry["type"]],  # default to data_type_map
-            ...,
-        )
-        for entry in entries
-    }
-
-    DynamicModel = create_model("DynamicyModel", **type_dict)  # type: ignore
+    used_type_map = type_map if type_map is not None else data_type_map
+    DynamicModel = dynamic_model(
+        tuple((entry["name"], used_type_map[entry["type"]]) for entry in entries)
+    )
 
     return DynamicModel(**{entry["name"]: entry["value"] for entry in entries})  # type: ignore
 
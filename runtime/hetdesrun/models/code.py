@@ -93,3 +93,15 @@ function called "main".
 """,
     )
     uuid: UUID
+
+
+class CodeModuleReference(BaseModel):
+    """Code module sent without its code
+
+    Used for code the runtime service announced as already loaded.
+    """
+
+    uuid: UUID
+    code_hash: str = Field(
+        ..., description="Hex digest of the SHA-256 hash of the code (UTF-8 encoded)"
+    )
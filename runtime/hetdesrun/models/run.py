@@ -10,7 +10,7 @@ from pydantic import BaseModel, Field, root_validator, validator
 
 from hetdesrun.datatypes import AdvancedTypesOutputSerializationConfig
 from hetdesrun.models.base import Result
-from hetdesrun.models.code import CodeModule
+from hetdesrun.models.code import CodeModule, CodeModuleReference
 from hetdesrun.models.component import ComponentRevision
 from hetdesrun.models.wiring import OutputWiring, WorkflowWiring
 from hetdesrun.models.workflow import WorkflowNode
@@ -18,8 +18,10 @@ from hetdesrun.utils import check_explicit_utc
 
 
 class ExecutionEngine(Enum):
-    # Currently only built-in execution engine
+    # Runs all operators in the event loop of the runtime process
     Plain = "plain"
+    # Runs synchronous operators of independent branches in worker processes
+    Process = "process"
 
 
 class PerformanceMeasuredStep(BaseModel):
@@ -59,11 +61,142 @@ class PerformanceMeasuredStep(BaseModel):
         self.duration = self.end - self.start
 
 
+class CompiledWorkflowCacheInfo(BaseModel):
+    hit: bool = Field(
+        ..., description="Whether the execution plan of this execution was cached"
+    )
+    hits: int
+    misses: int
+    currsize: int
+    maxsize: int
+
+
+class ResultMemoryInfo(BaseModel):
+    """Estimated memory held by the results of the operators of an execution"""
+
+    peak_result_bytes: int = Field(
+        ...,
+        description=(
+            "Maximal size of all operator results held at the same time during"
+            " execution. Results are released as soon as all operators consuming them"
+            " are finished, unless individual node results are requested."
+        ),
+    )
+    peak_result_bytes_without_release: int = Field(
+        ...,
+        description="Size of all operator results, i.e. the peak without releasing.",
+    )
+    released_results: int
+
+
+class ResultCacheInfo(BaseModel):
+    hits: int = Field(
+        ..., description="Number of operators of this execution served from the cache"
+    )
+    misses: int = Field(
+        ...,
+        description="Number of cacheable operators of this execution which were run",
+    )
+    currsize_bytes: int = Field(
+        ..., description="Estimated size of all results in the in-memory cache"
+    )
+    maxsize_bytes: int
+
+
+class IncrementalExecutionInfo(BaseModel):
+    session_id: str
+    reused_operators: list[str] = Field(
+        ...,
+        description=(
+            "Hierarchical ids of the operators whose results of the previous execution"
+            " in the session were reused, since none of their inputs changed."
+        ),
+    )
+    reused_input_data: list[str] = Field(
+        ...,
+        description=(
+            "Names of the workflow inputs whose data was not loaded again, since"
+            " their input wiring did not change."
+        ),
+    )
+
+
+class WindowedExecutionInfo(BaseModel):
+    window_count: int = Field(..., description="Number of executed windows")
+    window_overlap: datetime.timedelta = Field(
+        ...,
+        description=(
+            "Duration of data loaded before every window but the first, determined"
+            " from the lookback of the components if not configured."
+        ),
+    )
+
+
+class OutputSizeInfo(BaseModel):
+    rows: int | None = Field(
+        None, description="Length of Pandas objects and numpy arrays, otherwise None"
+    )
+    size_bytes: int = Field(
+        ...,
+        description=(
+            "Estimated size. Pandas objects and numpy arrays report the size of their"
+            " data buffers, other objects their shallow size."
+        ),
+    )
+
+
+class OperatorProfile(BaseModel):
+    """Measurements of the execution of a single operator"""
+
+    operator_hierarchical_id: str
+    operator_hierarchical_name: str
+    transformation_id: str = Field(..., description="id of the component revision")
+    transformation_tag: str
+    wall_time_seconds: float
+    cpu_time_seconds: float | None = Field(
+        None,
+        description=(
+            "CPU time spent in the component function by the thread or worker process"
+            " running it. Not measured for asynchronous component functions."
+        ),
+    )
+    input_wait_seconds: float = Field(
+        ...,
+        description=(
+            "Time from the availability of all inputs of the operator until its"
+            " start."
+        ),
+    )
+    output_sizes: dict[str, OutputSizeInfo] = Field(
+        ..., description="Sizes of the operator results by output name"
+    )
+    from_result_cache: bool = Field(
+        False,
+        description="Whether the result was taken from the result cache instead.",
+    )
+    tracemalloc_peak_bytes: int | None = Field(
+        None,
+        description=(
+            "Peak of memory allocated in the runtime process while the operator ran,"
+            " relative to the allocated memory at its start. Only measured if"
+            " profile_operator_memory is set, in which case operators run one at a"
+            " time. Operators running in worker processes are not covered."
+        ),
+    )
+
+
 class AllMeasuredSteps(BaseModel):
     internal_full: PerformanceMeasuredStep | None = None
     prepare_execution_input: PerformanceMeasuredStep | None = None
     run_execution_input: PerformanceMeasuredStep | None = None
     runtime_service_handling: PerformanceMeasuredStep | None = None
+    parse_workflow: PerformanceMeasuredStep | None = None
+    compiled_workflow_cache: CompiledWorkflowCacheInfo | None = None
+    result_memory: ResultMemoryInfo | None = None
+    operator_profiles: list[OperatorProfile] | None = None
+    result_cache: ResultCacheInfo | None = None
+    incremental_execution: IncrementalExecutionInfo | None = None
+    windowed_execution: WindowedExecutionInfo | None = None
     pure_execution: PerformanceMeasuredStep | None = None
     load_data: PerformanceMeasuredStep | None = None
     send_data: PerformanceMeasuredStep | None = None
@@ -88,12 +221,143 @@ class ConfigurationInput(BaseModel):
         ),
     )
     return_individual_node_results: bool = False
+    gather_inputs_concurrently: bool = Field(
+        False,
+        description=(
+            "Whether the inputs of an operator should be requested from all its"
+            " independent upstream operators at once instead of one after another."
+            " This allows independent branches of a workflow to make progress"
+            " simultaneously, which reduces wall-clock time for asynchronous/IO-bound"
+            " components."
+        ),
+    )
+    prune_operators_without_effect: bool = Field(
+        False,
+        description=(
+            "Whether operators should be skipped if they neither contribute to a"
+            " workflow output nor to an operator with side effects. Components of the"
+            " category Data Sinks and components which set has_side_effects have"
+            " side effects."
+        ),
+    )
+    profile_operators: bool = Field(
+        False,
+        description=(
+            "Whether time, CPU time and result sizes should be measured for every"
+            " operator. The profiles are returned in the measured steps of the"
+            " execution result and logged."
+        ),
+    )
+    profile_operator_memory: bool = Field(
+        False,
+        description=(
+            "Whether memory allocations of operators should be traced via tracemalloc"
+            " in addition, if profile_operators is set. This slows down execution"
+            " considerably and operators run one at a time."
+        ),
+    )
+    session_id: str | None = Field(
+        None,
+        description=(
+            "If set, the loaded data and the operator results are kept for the next"
+            " execution with the same session id. This execution then only loads data"
+            " for changed input wirings and only runs operators which depend on"
+            " changed inputs or have side effects."
+        ),
+    )
+    execution_window: datetime.timedelta | None = Field(
+        None,
+        description=(
+            "If set, the time range given by the timestampFrom and timestampTo filters"
+            " of the input wirings is split into windows of this duration and the"
+            " workflow is executed for one window after another. The outputs of every"
+            " window are sent to the sinks before the next window is loaded."
+        ),
+    )
+    window_overlap: datetime.timedelta | None = Field(
+        None,
+        description=(
+            "Duration of data before every window which is loaded in addition."
+            " By default this is determined from the lookback declared by the"
+            " components of the workflow."
+        ),
+    )
+
+    @validator("execution_window")
+    def execution_window_positive(
+        cls, execution_window: datetime.timedelta | None
+    ) -> datetime.timedelta | None:
+        if execution_window is not None and execution_window <= datetime.timedelta(0):
+            raise ValueError("The execution window must be positive.")
+        return execution_window
+
+    @validator("window_overlap")
+    def window_overlap_not_negative(
+        cls, window_overlap: datetime.timedelta | None
+    ) -> datetime.timedelta | None:
+        if window_overlap is not None and window_overlap < datetime.timedelta(0):
+            raise ValueError("The window overlap must not be negative.")
+        return window_overlap
+
+    @root_validator(skip_on_failure=True)
+    def windowed_execution_without_session(cls, values: dict) -> dict:
+        if values["execution_window"] is not None and values["session_id"] is not None:
+            raise ValueError(
+                "Windowed executions cannot be combined with execution sessions."
+            )
+        return values
+
+
+def check_wiring_complete(workflow: WorkflowNode, wiring: WorkflowWiring) -> None:
+    """Check that every (non-constant) workflow input and output is wired
+
+    Missing output wirings are added to the wiring as direct provisioning outputs.
+    Raises ValueError if the wiring is incomplete or contains too many wirings.
+    """
+    # Check that every Workflow Input is wired:
+    wired_input_names = {
+        inp_wiring.workflow_input_name for inp_wiring in wiring.input_wirings
+    }
+
+    non_constant_wf_inputs = [wfi for wfi in workflow.inputs if not wfi.constant]
+    for wf_input in non_constant_wf_inputs:
+        if not wf_input.name in wired_input_names:
+            raise ValueError(
+                f"Wiring Incomplete: Workflow Input {wf_input.name} has no wiring!"
+            )
+
+    if len(wired_input_names) > len(non_constant_wf_inputs):
+        raise ValueError("Too many input wirings provided!")
+
+    wired_output_names = {
+        outp_wiring.workflow_output_name for outp_wiring in wiring.output_wirings
+    }
+
+    for wf_output in workflow.outputs:
+        if not wf_output.name in wired_output_names:
+            # Automatically add missing output wirings (make them direct provisioning outputs)
+            wiring.output_wirings.append(
+                OutputWiring(
+                    workflow_output_name=wf_output.name,
+                    adapter_id=1,
+                )
+            )
+
+    if len(wired_output_names) > len(workflow.outputs):
+        raise ValueError("Too many output wirings provided!")
 
 
 class WorkflowExecutionInput(BaseModel):
     code_modules: list[CodeModule] = Field(
         ..., description="The code modules which are used/referenced by the components."
     )
+    code_module_references: list[CodeModuleReference] = Field(
+        [],
+        description=(
+            "Code modules sent without their code, since the runtime service announced"
+            " their code as already loaded. Resolved by the runtime service."
+        ),
+    )
     components: list[ComponentRevision] = Field(
         ...,
         title="Used components",
@@ -145,38 +409,7 @@ class WorkflowExecutionInput(BaseModel):
                 "one of the attributes 'wiring' or 'workflow' is missing!"
             ) from e
 
-        # Check that every Workflow Input is wired:
-        wired_input_names = {
-            inp_wiring.workflow_input_name for inp_wiring in wiring.input_wirings
-        }
-
-        non_constant_wf_inputs = [wfi for wfi in workflow.inputs if not wfi.constant]
-        for wf_input in non_constant_wf_inputs:
-            if not wf_input.name in wired_input_names:
-                raise ValueError(
-                    f"Wiring Incomplete: Workflow Input {wf_input.name} has no wiring!"
-                )
-
-        if len(wired_input_names) > len(non_constant_wf_inputs):
-            raise ValueError("Too many input wirings provided!")
-
-        wired_output_names = {
-            outp_wiring.workflow_output_name for outp_wiring in wiring.output_wirings
-        }
-
-        for wf_output in workflow.outputs:
-            if not wf_output.name in wired_output_names:
-                # Automatically add missing output wirings (make them direct provisioning outputs)
-                wiring.output_wirings.append(
-                    OutputWiring(
-                        workflow_output_name=wf_output.name,
-                        adapter_id=1,
-                    )
-                )
-
-        if len(wired_output_names) > len(workflow.outputs):
-            raise ValueError("Too many output wirings provided!")
-
+        check_wiring_complete(workflow, wiring)
         return values
 
     Config = AdvancedTypesOutputSerializationConfig  # enable Serialization of some advanced types
@@ -209,3 +442,98 @@ class WorkflowExecutionResult(BaseModel):
     measured_steps: AllMeasuredSteps = AllMeasuredSteps()
 
     Config = AdvancedTypesOutputSerializationConfig  # enable Serialization of some advanced types
+
+
+class BatchExecutionInstance(BaseModel):
+    workflow_wiring: WorkflowWiring
+    job_id: UUID = Field(default_factory=uuid4)
+
+
+class BatchWorkflowExecutionInput(BaseModel):
+    """One workflow executed with several wirings
+
+    The workflow is parsed and its components are imported only once for all
+    instances.
+    """
+
+    code_modules: list[CodeModule] = Field(
+        ..., description="The code modules which are used/referenced by the components."
+    )
+    code_module_references: list[CodeModuleReference] = Field(
+        [],
+        description=(
+            "Code modules sent without their code, since the runtime service announced"
+            " their code as already loaded. Resolved by the runtime service."
+        ),
+    )
+    components: list[ComponentRevision] = Field(
+        ...,
+        title="Used components",
+        description="List of References to all used elementary components",
+    )
+    workflow: WorkflowNode = Field(
+        ...,
+        title="Workflow Root Node",
+        description="A Workflow with all its components and sub workflows",
+    )
+    configuration: ConfigurationInput = Field(
+        ..., description="Configuration shared by all instances"
+    )
+    instances: list[BatchExecutionInstance] = Field(
+        ..., description="Wiring and job id of every execution", min_items=1
+    )
+
+    @validator("components")
+    def components_unique(
+        cls, components: list[ComponentRevision]
+    ) -> list[ComponentRevision]:
+        if len({c.uuid for c in components}) != len(components):
+            raise ValueError("Components not unique!")
+        return components
+
+    @validator("code_modules")
+    def code_modules_unique(cls, code_modules: list[CodeModule]) -> list[CodeModule]:
+        if len({c.uuid for c in code_modules}) != len(code_modules):
+            raise ValueError("Code Modules not unique!")
+        return code_modules
+
+    @validator("configuration")
+    def configuration_without_session(
+        cls, configuration: ConfigurationInput
+    ) -> ConfigurationInput:
+        if configuration.session_id is not None:
+            raise ValueError("Sessions are not supported for batch executions!")
+        return configuration
+
+    @root_validator(skip_on_failure=True)
+    def check_wirings_complete(cls, values: dict) -> dict:
+        for index, instance in enumerate(values["instances"]):
+            try:
+                check_wiring_complete(values["workflow"], instance.workflow_wiring)
+            except ValueError as e:
+                raise ValueError(f"Instance {index}: {str(e)}") from e
+        return values
+
+    def to_execution_inputs(self) -> list[WorkflowExecutionInput]:
+        """Execution input for every instance sharing workflow, components and code"""
+        return [
+            WorkflowExecutionInput.construct(
+                code_modules=self.code_modules,
+                components=self.components,
+                workflow=self.workflow,
+                configuration=self.configuration,
+                workflow_wiring=instance.workflow_wiring,
+                job_id=instance.job_id,
+            )
+            for instance in self.instances
+        ]
+
+    Config = AdvancedTypesOutputSerializationConfig  # enable Serialization of some advanced types
+
+
+class BatchWorkflowExecutionResult(BaseModel):
+    results: list[WorkflowExecutionResult] = Field(
+        ..., description="Execution results in the order of the instances"
+    )
+
+    Config = AdvancedTypesOutputSerializationConfig  # enable Serialization of some advanced types
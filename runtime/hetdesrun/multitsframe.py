@@ -0,0 +1,231 @@
+"""Per-metric access to MultiTSFrames
+
+MultiTSFrames are DataFrames in long format with the columns timestamp, metric and
+value. Accessing the values of a single metric requires a boolean mask over all rows
+and converting to a wide DataFrame with one column per metric requires a pivot, both
+of which are expensive for MultiTSFrames with many metrics and rows.
+
+A MultiTSFrame object instead holds the rows sorted by metric and timestamp once,
+together with the offsets of the rows of every metric. Series of a single metric are
+views of these sorted arrays, obtained in constant time. Wide and long DataFrames are
+constructed from them by reshaping instead of pivoting whenever all metrics share the
+same timestamps.
+
+Example usage in a component:
+
+    from hetdesrun.multitsframe import MultiTSFrame
+
+    mtsf = MultiTSFrame(multitsframe)
+    temperature = mtsf.series("temperature")
+    wide_df = mtsf.to_wide()
+"""
+import numpy as np
+import pandas as pd
+
+from hetdesrun.datatypes import mark_as_valid_multitsframe
+
+
+class MultiTSFrame:
+    """MultiTSFrame sorted by metric and timestamp with per-metric offsets
+
+    Expects a valid MultiTSFrame, e.g. an input of type MULTITSFRAME. The DataFrame
+    is not modified. Rows which are already sorted by metric and timestamp are used
+    without copying them.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        metric = _categorical_metric(df["metric"])
+        codes = metric.cat.codes.to_numpy()
+        timestamps = pd.DatetimeIndex(df["timestamp"])
+        values = df["value"].to_numpy()
+
+        order, offsets = sort_rows_by_code_and_time(
+            codes, timestamps, len(metric.cat.categories)
+        )
+        if order is not None:
+            codes = codes[order]
+            timestamps = timestamps[order]
+            values = values[order]
+
+        self._slices: dict[str, slice] = {
+            str(category): slice(offsets[position], offsets[position + 1])
+            for position, category in enumerate(metric.cat.categories)
+            if offsets[position + 1] != offsets[position]
+        }
+        self._codes: np.ndarray = codes
+        self._category_count = len(metric.cat.categories)
+        self._timestamps = timestamps.rename("timestamp")
+        self._values = values
+        self._wide: pd.DataFrame | None = None
+
+    @classmethod
+    def from_wide(cls, df: pd.DataFrame) -> "MultiTSFrame":
+        """MultiTSFrame of a DataFrame with DatetimeIndex and one column per metric
+
+        The timestamps must have UTC timezone. Missing values remain as rows with
+        null value, like in the long format.
+        """
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        row_count, column_count = df.shape
+        return cls(
+            pd.DataFrame(
+                {
+                    "timestamp": df.index.take(
+                        np.tile(np.arange(row_count), column_count)
+                    ),
+                    "metric": pd.Categorical.from_codes(
+                        np.repeat(np.arange(column_count), row_count),
+                        categories=pd.Index(df.columns.astype(str)),
+                    ),
+                    # columns one after another, i.e. sorted by metric and timestamp
+                    "value": df.to_numpy().ravel(order="F"),
+                }
+            )
+        )
+
+    @property
+    def metrics(self) -> list[str]:
+        """Metrics with at least one row, in the order of the metric categories"""
+        return list(self._slices)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, metric: object) -> bool:
+        return metric in self._slices
+
+    def series(self, metric: str) -> pd.Series:
+        """Values of a metric, indexed by timestamp
+
+        The Series is a view of the sorted rows. It is obtained without scanning
+        the rows of other metrics and must not be modified in place.
+
+        Raises KeyError if there are no rows for the metric.
+        """
+        rows = self._slices[metric]
+        return pd.Series(
+            self._values[rows], index=self._timestamps[rows], name=metric, copy=False
+        )
+
+    def to_long(self) -> pd.DataFrame:
+        """MultiTSFrame DataFrame sorted by metric and timestamp
+
+        The DataFrame is marked as valid MultiTSFrame (see datatypes module) and is
+        therefore not validated again if it is passed to a MULTITSFRAME input.
+        """
+        return mark_as_valid_multitsframe(
+            pd.DataFrame(
+                {
+                    "timestamp": self._timestamps,
+                    "metric": pd.array(
+                        np.array(self.metrics, dtype=object)[self._metric_positions()],
+                        dtype="string",
+                    ),
+                    "value": self._values,
+                }
+            ).reset_index(drop=True)
+        )
+
+    def to_wide(self) -> pd.DataFrame:
+        """DataFrame with one column per metric and the timestamps as index
+
+        Corresponds to pivoting the MultiTSFrame. If all metrics have values for the
+        same timestamps, the sorted values are only reshaped. The result is cached
+        and must not be modified in place.
+
+        Raises ValueError if a metric has several values for the same timestamp.
+        """
+        if self._wide is None:
+            self._wide = self._construct_wide()
+        return self._wide
+
+    def _metric_positions(self) -> np.ndarray:
+        """Position of the metric of every row in the metrics property"""
+        if len(self._slices) == self._category_count:
+            return self._codes
+        # categories without rows are not among the metrics
+        return np.repeat(
+            np.arange(len(self._slices)),
+            [rows.stop - rows.start for rows in self._slices.values()],
+        )
+
+    def _construct_wide(self) -> pd.DataFrame:
+        timestamp_ints = self._timestamps.asi8
+        if ((np.diff(self._codes) == 0) & (np.diff(timestamp_ints) == 0)).any():
+            raise ValueError(
+                "Cannot convert MultiTSFrame with several values for the same metric"
+                " and timestamp to a wide DataFrame."
+            )
+
+        metrics = self.metrics
+        columns = pd.Index(metrics, name="metric")
+        if len(metrics) == 0:
+            return pd.DataFrame(
+                index=self._timestamps[:0], columns=columns, dtype=self._values.dtype
+            )
+
+        row_count = len(self._values) // len(metrics)
+        if row_count * len(metrics) == len(self._values):
+            grid = timestamp_ints.reshape(len(metrics), row_count)
+            if (grid == grid[0]).all():
+                # all metrics share the same timestamps
+                return pd.DataFrame(
+                    self._values.reshape(len(metrics), row_count).T,
+                    index=self._timestamps[:row_count],
+                    columns=columns,
+                )
+
+        row_positions, timestamps = pd.factorize(self._timestamps, sort=True)
+        column_positions = self._metric_positions()
+        wide_values = np.full(
+            (len(timestamps), len(metrics)),
+            np.nan,
+            dtype=(
+                np.result_type(self._values.dtype, np.float64)
+                if self._values.dtype.kind in "biuf"
+                else object
+            ),
+        )
+        wide_values[row_positions, column_positions] = self._values
+        return pd.DataFrame(
+            wide_values,
+            index=pd.DatetimeIndex(timestamps, name="timestamp"),
+            columns=columns,
+        )
+
+
+def _categorical_metric(metric: pd.Series) -> pd.Series:
+    """Metric column as categorical, without copying it if it is one already
+
+    Categorical metrics provide the metric of every row as small integer code, which
+    is used for sorting and slicing the rows by metric.
+    """
+    if isinstance(metric.dtype, pd.CategoricalDtype):
+        return metric
+    return metric.astype("category")
+
+
+def sort_rows_by_code_and_time(
+    codes: np.ndarray, timestamps: pd.DatetimeIndex, code_count: int
+) -> tuple[np.ndarray | None, np.ndarray]:
+    """Order of rows sorted by code and timestamp and offsets of the rows of every code
+
+    codes are integers from 0 to code_count - 1, e.g. the codes of a categorical
+    column. The order is None if the rows are sorted already. In the sorted rows, the
+    rows with code i are the rows from offsets[i] to offsets[i + 1].
+    """
+    timestamp_ints = timestamps.asi8
+    code_steps = np.diff(codes)
+    order: np.ndarray | None = None
+    if not (
+        (code_steps > 0) | ((code_steps == 0) & (np.diff(timestamp_ints) >= 0))
+    ).all():
+        order = np.arange(len(codes))
+        if not timestamps.is_monotonic_increasing:
+            order = np.argsort(timestamp_ints, kind="stable")
+        order = order[np.argsort(codes[order], kind="stable")]
+
+    offsets: np.ndarray = np.zeros(code_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes, minlength=code_count), out=offsets[1:])
+    return order, offsets
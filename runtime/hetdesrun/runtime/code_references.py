@@ -0,0 +1,57 @@
+"""Executing workflows from code module references
+
+The backend sends the code of every component with every execution request to the
+runtime service, which for large workflows amounts to megabytes per request, although
+the runtime worker processes import the code only once.
+
+Therefore the runtime service announces the hashes of the code modules of a request,
+whose code it has imported, in the response header X-HD-Loaded-Code-Hashes. For
+subsequent requests the backend sends such code modules as references (uuid and hash)
+instead. The runtime service resolves them from the code it has imported. If this is
+not possible for some references, e.g. since the request is handled by another worker
+process or the runtime service was restarted, it responds with status code 409 and
+the missing hashes, after which the backend repeats the request with the complete code.
+"""
+from hetdesrun.component.load import hash_code, imported_code_by_hash
+from hetdesrun.models.code import CodeModule, CodeModuleReference
+
+LOADED_CODE_HASHES_HEADER = "X-HD-Loaded-Code-Hashes"
+
+
+class MissingCodeModulesError(Exception):
+    def __init__(self, code_hashes: list[str]) -> None:
+        super().__init__(
+            "Code of referenced code modules not loaded: " + ", ".join(code_hashes)
+        )
+        self.code_hashes = code_hashes
+
+
+def resolve_code_module_references(
+    code_modules: list[CodeModule], code_module_references: list[CodeModuleReference]
+) -> list[CodeModule]:
+    """Code modules including the referenced ones
+
+    Raises MissingCodeModulesError if the code of referenced code modules was not
+    imported by this process.
+    """
+    missing_code_hashes = [
+        reference.code_hash
+        for reference in code_module_references
+        if reference.code_hash not in imported_code_by_hash
+    ]
+    if len(missing_code_hashes) != 0:
+        raise MissingCodeModulesError(missing_code_hashes)
+
+    return code_modules + [
+        CodeModule(uuid=reference.uuid, code=imported_code_by_hash[reference.code_hash])
+        for reference in code_module_references
+    ]
+
+
+def loaded_code_hashes(code_modules: list[CodeModule]) -> list[str]:
+    """Hashes of those code modules whose code was imported by this process"""
+    return [
+        code_hash
+        for code_hash in (hash_code(code_module.code) for code_module in code_modules)
+        if code_hash in imported_code_by_hash
+    ]
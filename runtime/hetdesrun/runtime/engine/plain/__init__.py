@@ -2,7 +2,11 @@ import logging
 from typing import Any
 
 from hetdesrun.runtime import runtime_execution_logger
-from hetdesrun.runtime.engine.plain.workflow import Workflow
+from hetdesrun.runtime.engine.plain.plan import (
+    ExecutionPlan,
+    PlanExecutionResult,
+    execute_plan,
+)
 from hetdesrun.runtime.logging import execution_context_filter
 
 logger = logging.getLogger(__name__)
@@ -12,6 +16,9 @@ logger.addFilter(execution_context_filter)
 runtime_execution_logger.addFilter(execution_context_filter)
 
 
-async def workflow_execution_plain(workflow: Workflow) -> dict[str, Any]:
-    res: dict[str, Any] = await workflow.result
-    return res
+async def workflow_execution_plain(
+    plan: ExecutionPlan,
+    input_values: dict[str, Any] | None = None,
+    reusable_results: dict[int, dict[str, Any]] | None = None,
+) -> PlanExecutionResult:
+    return await execute_plan(plan, input_values, reusable_results)
@@ -0,0 +1,123 @@
+"""Cache of parsed and compiled workflows
+
+Parsing a workflow loads every component function, inspects its signature and hashes
+its code. For workflows which are executed repeatedly (e.g. released workflows
+triggered via Kafka) this is avoided by caching the parsed workflow together with its
+execution plan. Since execution plans do not hold any result state (see plan module),
+the cached entries can be reused by subsequent and even concurrent executions.
+
+Entries are keyed by a hash of the workflow structure, the component revisions and the
+code modules. Code modules are identified by their uuid and Python's built-in hash of
+their code, which is much cheaper than the SHA-256 hash used for the module path and
+still detects edits of draft components whose uuid stays the same.
+"""
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from hetdesrun.models.code import CodeModule
+from hetdesrun.models.component import ComponentRevision
+from hetdesrun.models.run import CompiledWorkflowCacheInfo
+from hetdesrun.models.workflow import WorkflowNode
+from hetdesrun.runtime.engine.plain.parsing import parse_workflow_input
+from hetdesrun.runtime.engine.plain.plan import ExecutionPlan, compile_workflow
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledWorkflow:
+    plan: ExecutionPlan
+    cache_info: CompiledWorkflowCacheInfo
+
+
+class CompiledWorkflowCache:
+    """Least recently used cache of execution plans"""
+
+    def __init__(self) -> None:
+        self._plans: OrderedDict[str, ExecutionPlan] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> ExecutionPlan | None:
+        plan = self._plans.get(key)
+        if plan is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._plans.move_to_end(key)
+        return plan
+
+    def put(self, key: str, plan: ExecutionPlan, max_size: int) -> None:
+        self._plans[key] = plan
+        self._plans.move_to_end(key)
+        while len(self._plans) > max_size:
+            self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        self._plans.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self, hit: bool) -> CompiledWorkflowCacheInfo:
+        return CompiledWorkflowCacheInfo(
+            hit=hit,
+            hits=self.hits,
+            misses=self.misses,
+            currsize=len(self._plans),
+            maxsize=get_config().compiled_workflow_cache_size,
+        )
+
+
+compiled_workflow_cache = CompiledWorkflowCache()
+
+
+def compiled_workflow_cache_key(
+    workflow_node: WorkflowNode,
+    components: list[ComponentRevision],
+    code_modules: list[CodeModule],
+) -> str:
+    key_hash = hashlib.sha256(workflow_node.json().encode("utf8"))
+    for component in sorted(components, key=lambda c: str(c.uuid)):
+        key_hash.update(component.json().encode("utf8"))
+    for code_module in sorted(code_modules, key=lambda c: str(c.uuid)):
+        key_hash.update(f"{code_module.uuid}:{hash(code_module.code)}".encode())
+    return key_hash.hexdigest()
+
+
+def obtain_compiled_workflow(
+    workflow_node: WorkflowNode,
+    components: list[ComponentRevision],
+    code_modules: list[CodeModule],
+) -> CompiledWorkflow:
+    """Parse and compile workflow or obtain the plan from the cache
+
+    Raises the exceptions of parse_workflow_input and compile_workflow. Failing
+    workflows are not cached.
+    """
+    max_size = get_config().compiled_workflow_cache_size
+    if max_size == 0:
+        return CompiledWorkflow(
+            plan=compile_workflow(
+                parse_workflow_input(workflow_node, components, code_modules)
+            ),
+            cache_info=compiled_workflow_cache.info(hit=False),
+        )
+
+    key = compiled_workflow_cache_key(workflow_node, components, code_modules)
+    plan = compiled_workflow_cache.get(key)
+    if plan is not None:
+        logger.debug("Using cached execution plan for workflow %s", workflow_node.id)
+        return CompiledWorkflow(
+            plan=plan, cache_info=compiled_workflow_cache.info(hit=True)
+        )
+
+    plan = compile_workflow(
+        parse_workflow_input(workflow_node, components, code_modules)
+    )
+    compiled_workflow_cache.put(key, plan, max_size)
+    return CompiledWorkflow(
+        plan=plan, cache_info=compiled_workflow_cache.info(hit=False)
+    )
@@ -1,13 +1,201 @@
 """Execution helpers"""
 import asyncio
+import contextvars
+import functools
+import logging
+import multiprocessing
+import time
 from collections.abc import Callable
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, cast
+
+from hetdesrun.component.load import import_func_from_code
+from hetdesrun.models.run import ExecutionEngine
+from hetdesrun.runtime.configuration import execution_config
+from hetdesrun.runtime.engine.plain.transfer import (
+    from_shared_memory,
+    release_shared_memory,
+    to_shared_memory,
+)
+from hetdesrun.webservice.config import SyncComponentExecutor, get_config
+
+logger = logging.getLogger(__name__)
+
+# If set, the CPU time of synchronous component functions is appended to the list
+cpu_time_recorder: contextvars.ContextVar[list[float] | None] = contextvars.ContextVar(
+    "cpu_time_recorder", default=None
+)
+
+_thread_pool: ThreadPoolExecutor | None = None
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=get_config().sync_component_thread_pool_size,
+            thread_name_prefix="hd_sync_component",
+        )
+    return _thread_pool
+
+
+def _warm_up_worker() -> None:
+    """Noop which is submitted to start the worker processes"""
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Obtain the process pool, starting all its worker processes on first usage"""
+    global _process_pool
+    if _process_pool is None:
+        pool_size = get_config().sync_component_process_pool_size
+        # The default start method on Linux forks the already multithreaded process
+        _process_pool = ProcessPoolExecutor(
+            max_workers=pool_size,
+            mp_context=multiprocessing.get_context(
+                get_config().sync_component_process_start_method.value
+            ),
+        )
+        for _ in range(pool_size):
+            _process_pool.submit(_warm_up_worker)
+    return _process_pool
+
+
+def shutdown_executor_pools() -> None:
+    global _thread_pool, _process_pool
+    if _thread_pool is not None:
+        _thread_pool.shutdown(wait=False, cancel_futures=True)
+        _thread_pool = None
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _call_recording_cpu_time(
+    func: Callable[..., Any], recorder: list[float], /, **kwargs: Any
+) -> Any:
+    start = time.thread_time()
+    try:
+        return func(**kwargs)
+    finally:
+        recorder.append(time.thread_time() - start)
+
+
+def run_func_from_code(
+    code: str, func_name: str, kwargs: dict[str, Any]
+) -> tuple[dict[str, Any], float]:
+    """Import function from code and call it
+
+    This is run in the worker processes, where the code is only imported once per
+    process, since importing is cached via the module path derived from the code.
+    Large Pandas objects are received and returned via shared memory.
+
+    Returns the result together with the CPU time of the function call. Coroutine
+    functions cannot be run here, since the worker processes do not run an event loop.
+    """
+    func = import_func_from_code(code, func_name)
+    if not callable(func) or asyncio.iscoroutinefunction(func):
+        raise TypeError(
+            f"{func_name} from code is not a synchronous function and cannot be run"
+            " in a worker process."
+        )
+    start = time.thread_time()
+    result = func(**{name: from_shared_memory(value) for name, value in kwargs.items()})
+    cpu_time = time.thread_time() - start
+    if isinstance(result, dict):
+        return (
+            {name: to_shared_memory(value) for name, value in result.items()},
+            cpu_time,
+        )
+    return result, cpu_time
+
+
+async def run_in_process_pool(
+    code: str, func_name: str, kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    global _process_pool
+    transferred_kwargs = {
+        name: to_shared_memory(value) for name, value in kwargs.items()
+    }
+    try:
+        result, cpu_time = await asyncio.get_running_loop().run_in_executor(
+            get_process_pool(),
+            functools.partial(run_func_from_code, code, func_name, transferred_kwargs),
+        )
+    except BrokenProcessPool:
+        # e.g. a worker process was killed. Replace the pool for later executions.
+        logger.warning("Process pool for synchronous components broke. Replacing it.")
+        _process_pool = None
+        raise
+    finally:
+        for value in transferred_kwargs.values():
+            release_shared_memory(value)
+
+    recorder = cpu_time_recorder.get()
+    if recorder is not None:
+        recorder.append(cpu_time)
+
+    if isinstance(result, dict):
+        return {
+            name: from_shared_memory(value, unlink=True)
+            for name, value in result.items()
+        }
+    return result
 
 
 async def run_func_or_coroutine(
-    func_or_coro: Callable[..., Any], kwargs: dict[str, Any]
+    func_or_coro: Callable[..., Any],
+    kwargs: dict[str, Any],
+    executor: SyncComponentExecutor | None = None,
+    code: str | None = None,
+    func_name: str | None = None,
 ) -> dict[str, Any]:
-    """Check if input is coroutine and depending on result either await it or call as function"""
+    """Check if input is coroutine and depending on result either await it or call as function
+
+    Functions are run where the executor says, defaulting to the configured
+    sync_component_executor or to the worker processes if the process engine is
+    used. Running a function in a worker process requires the code
+    of its module and its name, since the function itself cannot be transferred to the
+    worker process. If they are not provided, the function is run in a thread instead.
+
+    If cpu_time_recorder is set, the CPU time of synchronous functions is recorded.
+    """
     if asyncio.iscoroutinefunction(func_or_coro):
         return await func_or_coro(**kwargs)  # type: ignore
+
+    if executor is None:
+        executor = (
+            SyncComponentExecutor.PROCESS
+            if execution_config.get().engine is ExecutionEngine.Process
+            else get_config().sync_component_executor
+        )
+
+    if executor is SyncComponentExecutor.PROCESS:
+        if code is not None and func_name is not None:
+            return await run_in_process_pool(code, func_name, kwargs)
+        logger.debug(
+            "Cannot run function %s in a worker process without its code."
+            " Running it in a thread instead.",
+            getattr(func_or_coro, "__name__", "UNKNOWN"),
+        )
+        executor = SyncComponentExecutor.THREAD
+
+    recorder = cpu_time_recorder.get()
+    if recorder is not None:
+        func_or_coro = functools.partial(
+            _call_recording_cpu_time, func_or_coro, recorder
+        )
+
+    if executor is SyncComponentExecutor.THREAD:
+        # copy context to make execution configuration and logging context available
+        context = contextvars.copy_context()
+        call_in_context = cast(
+            Callable[[], dict[str, Any]],
+            functools.partial(context.run, func_or_coro, **kwargs),
+        )
+        return await asyncio.get_running_loop().run_in_executor(
+            get_thread_pool(), call_in_context
+        )
+
     return func_or_coro(**kwargs)  # type: ignore
@@ -1,8 +1,13 @@
 """Parse workflow input into data structures of plain engine"""
+import datetime
 from collections.abc import Callable, Coroutine
 from typing import cast
+from uuid import UUID
+
+import pandas as pd
 
 from hetdesrun.component.load import ComponentCodeImportError, import_func_from_code
+from hetdesrun.component.registration import get_registered_option
 from hetdesrun.datatypes import DataType, NamedDataTypedValue
 from hetdesrun.models.code import CodeModule
 from hetdesrun.models.component import ComponentOutput, ComponentRevision
@@ -16,6 +21,7 @@ from hetdesrun.models.workflow import (
 from hetdesrun.runtime import runtime_logger
 from hetdesrun.runtime.engine.plain.workflow import ComputationNode, Node, Workflow
 from hetdesrun.runtime.logging import job_id_context_filter
+from hetdesrun.webservice.config import SyncComponentExecutor
 
 runtime_logger.addFilter(job_id_context_filter)
 
@@ -102,6 +108,86 @@ def load_func(
     return component_func
 
 
+def obtain_executor(
+    component: ComponentRevision, component_func: Coroutine | Callable
+) -> SyncComponentExecutor | None:
+    """Obtain executor override from component metadata
+
+    Returns None if the component does not override the configured default executor.
+    """
+    executor = get_registered_option(component_func, "executor")  # type: ignore
+    if executor is None:
+        return None
+    try:
+        return SyncComponentExecutor(str(executor).upper())
+    except ValueError as e:
+        msg = (
+            f"Invalid executor {str(executor)} for component revision with UUID"
+            f" {component.uuid}. Must be one of "
+            + ", ".join(['"' + x.value + '"' for x in list(SyncComponentExecutor)])
+        )
+        runtime_logger.warning(msg)
+        raise NodeFunctionLoadingError(msg) from e
+
+
+# Lookbacks of released base components which were released before components
+# could declare a lookback. Released component revisions must not be changed, so
+# their lookback is kept here, keyed by the id of the component revision.
+RELEASED_COMPONENT_LOOKBACKS: dict[UUID, str] = {
+    # Simple Volatility Score
+    UUID("0c3c74d0-89b6-1948-fedd-753eaa47ca0e"): "window_size",
+    # Moving average time
+    UUID("a2ba0da0-5a9a-60e9-6af5-e07917988021"): "t",
+    # Moving maximum time
+    UUID("037887de-bbee-caeb-f0bd-7060d59f60e9"): "t",
+    # Moving median time
+    UUID("1feea93c-a6e7-4fec-c01c-6f30037f8cca"): "t",
+    # Moving minimum time
+    UUID("33d7c458-762c-7555-7a20-26ef0708bc28"): "t",
+    # Moving standard deviation time
+    UUID("5eb8ca16-bbc7-94b1-3d82-6f074cd63456"): "t",
+}
+
+
+def obtain_lookback(
+    component: ComponentRevision, component_func: Coroutine | Callable
+) -> str | datetime.timedelta | None:
+    """Obtain the lookback declared in component metadata
+
+    The lookback is either the name of an input of the component or a fixed duration,
+    which is checked here. If a component does not declare a lookback, the lookback
+    of released base components is taken from RELEASED_COMPONENT_LOOKBACKS.
+    """
+    lookback = get_registered_option(component_func, "lookback")  # type: ignore
+    if lookback is None:
+        lookback = RELEASED_COMPONENT_LOOKBACKS.get(component.uuid)
+    if lookback is None or lookback in {inp.name for inp in component.inputs}:
+        return lookback  # type: ignore[no-any-return]
+    try:
+        return pd.Timedelta(lookback).to_pytimedelta()  # type: ignore[no-any-return]
+    except (ValueError, TypeError) as e:
+        msg = (
+            f"Invalid lookback {str(lookback)} for component revision with UUID"
+            f" {component.uuid}. Must be a duration or the name of an input."
+        )
+        runtime_logger.warning(msg)
+        raise NodeFunctionLoadingError(msg) from e
+
+
+def obtain_has_side_effects(component_func: Coroutine | Callable) -> bool:
+    """Whether a component does something apart from returning its outputs
+
+    Components can declare this explicitly. Otherwise components of the category
+    "Data Sinks" are assumed to have side effects.
+    """
+    has_side_effects = get_registered_option(
+        component_func, "has_side_effects"  # type: ignore
+    )
+    if has_side_effects is not None:
+        return bool(has_side_effects)
+    return get_registered_option(component_func, "category") == "Data Sinks"  # type: ignore
+
+
 def parse_component_node(
     component_node: ComponentNode,
     component_dict: dict[str, ComponentRevision],
@@ -129,6 +215,7 @@ def parse_component_node(
 
     # Load entrypoint function
     component_func = load_func(comp_rev, code_module_dict)
+    executor = obtain_executor(comp_rev, component_func)
 
     return ComputationNode(
         func=component_func,
@@ -140,7 +227,13 @@ def parse_component_node(
         else component_node_name,
         inputs=None,  # inputs are added later by the surrounding workflow
         has_only_plot_outputs=only_plot_outputs(comp_rev.outputs),
+        has_side_effects=obtain_has_side_effects(component_func),
+        cacheable=bool(get_registered_option(component_func, "cacheable")),  # type: ignore
+        lookback=obtain_lookback(comp_rev, component_func),
         operator_hierarchical_id=id_prefix + component_node.id + "\\",
+        executor=executor,
+        code=code_module_dict[str(comp_rev.code_module_uuid)].code,
+        func_name=comp_rev.function_name,
     )
 
 
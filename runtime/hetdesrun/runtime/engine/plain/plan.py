@@ -0,0 +1,877 @@
+"""Compiled execution plans
+
+Parsing a workflow yields nested Workflow objects. Compiling a workflow flattens all
+nested workflows into a single list of computation nodes in topological order, where
+every input of a node is resolved to either an output of a previous step or to an input
+of the (top level) workflow. Cycles and missing inputs are detected during compilation,
+i.e. before any component code runs. The plan is executed by execute_plan, which stores
+all results itself, so that the same plan can be executed several times. Since the
+executor knows all consumers of a result, it frees every result as soon as it is not
+needed anymore.
+"""
+import asyncio
+import hashlib
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.models.run import (
+    OperatorProfile,
+    OutputSizeInfo,
+    ResultCacheInfo,
+    ResultMemoryInfo,
+)
+from hetdesrun.runtime import runtime_execution_logger
+from hetdesrun.runtime.configuration import execution_config
+from hetdesrun.runtime.context import ExecutionContext
+from hetdesrun.runtime.engine.plain.execution import cpu_time_recorder
+from hetdesrun.runtime.engine.plain.result_cache import (
+    copy_result,
+    result_cache,
+    result_cache_key,
+)
+from hetdesrun.runtime.engine.plain.workflow import (
+    ComputationNode,
+    Node,
+    Workflow,
+    obtain_all_nodes,
+)
+from hetdesrun.runtime.exceptions import (
+    CircularDependency,
+    MissingInputSource,
+    MissingOutputException,
+)
+from hetdesrun.runtime.logging import execution_context_filter
+from hetdesrun.webservice.config import get_config
+
+runtime_execution_logger.addFilter(execution_context_filter)
+
+
+@dataclass(frozen=True)
+class PlanEdge:
+    """Source of a value: an output of a step or an input of the workflow
+
+    If step is None, output_name is the name of an input of the top level workflow.
+
+    via_plot_only_workflow marks values which are obtained through the output mapping
+    of a workflow from a sub node with only plot outputs. Such values are empty
+    dictionaries if pure plot operators are not run.
+    """
+
+    output_name: str
+    step: int | None = None
+    via_plot_only_workflow: bool = False
+
+
+@dataclass
+class PlanStep:
+    node: ComputationNode
+    inputs: dict[str, PlanEdge] = field(default_factory=dict)
+
+
+@dataclass
+class ExecutionPlan:
+    workflow: Workflow
+    steps: list[PlanStep]  # in topological order
+    outputs: dict[str, PlanEdge]
+    input_names: list[str]  # top level workflow inputs which must be provided
+
+
+@dataclass
+class PlanExecutionResult:
+    outputs: dict[str, Any]
+    # (operator_hierarchical_id, result) of every step whose result was not released
+    node_results: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    result_memory: ResultMemoryInfo | None = None
+    result_cache: ResultCacheInfo | None = None
+    # in order of execution, only if profiling is activated
+    operator_profiles: list[OperatorProfile] | None = None
+    # copies of the results of all run or reused steps by index, taken before they were
+    # passed on to other steps, only if reusable results were given
+    step_results: dict[int, dict[str, Any]] | None = None
+    reused_operators: list[str] = field(default_factory=list)
+
+
+def _obtain_input_slots(
+    workflow: Workflow,
+) -> tuple[dict[int, dict[str, str]], set[tuple[int, str]]]:
+    """Find the node inputs fed by not yet provided inputs of the top level workflow
+
+    Returns a dict mapping id(node) to a dict {node input name: workflow input name} and
+    the set of pairs (id(nested workflow), input name) which are fed by these inputs.
+    """
+    slots: dict[int, dict[str, str]] = {}
+    fed_nested_workflow_inputs: set[tuple[int, str]] = set()
+    for wf_inp_name, (sub_node, sub_node_input_name) in workflow.input_mappings.items():
+        if wf_inp_name in workflow.inputs:
+            continue
+        node: Node = sub_node
+        input_name = sub_node_input_name
+        while isinstance(node, Workflow):
+            fed_nested_workflow_inputs.add((id(node), input_name))
+            node, input_name = node.input_mappings[input_name]
+        slots.setdefault(id(node), {})[input_name] = wf_inp_name
+    return slots, fed_nested_workflow_inputs
+
+
+def _check_nested_workflow_inputs(
+    workflow: Workflow, fed_nested_workflow_inputs: set[tuple[int, str]]
+) -> None:
+    """Check that all inputs of nested workflows are provided"""
+    for sub_node in workflow.sub_nodes:
+        if not isinstance(sub_node, Workflow):
+            continue
+        for wf_inp_name, (
+            sub_sub_node,
+            sub_sub_node_input_name,
+        ) in sub_node.input_mappings.items():
+            if (
+                wf_inp_name not in sub_node.inputs
+                and (id(sub_node), wf_inp_name) not in fed_nested_workflow_inputs
+            ):
+                inputs_string = ",".join(sub_node.inputs.keys())
+                raise MissingInputSource(
+                    f"The input mapping with workflow input '{wf_inp_name}' to "
+                    f"subnode input '{sub_sub_node_input_name}' of "
+                    f"subnode '{sub_sub_node.operator_hierarchical_id}'"
+                    f"does not match the inputs of the workflow {inputs_string}."
+                ).set_context(sub_node.context)
+        _check_nested_workflow_inputs(sub_node, fed_nested_workflow_inputs)
+
+
+def _resolve_output(
+    node: Node,
+    output_name: str,
+    context: ExecutionContext,
+    via_plot_only_workflow: bool = False,
+) -> tuple[ComputationNode, str, bool]:
+    """Follow workflow output mappings to the computation node providing an output"""
+    while isinstance(node, Workflow):
+        try:
+            node, output_name = node.output_mappings[output_name]
+        except KeyError as e:
+            runtime_execution_logger.warning(
+                "Compilation failed due to missing output of a workflow"
+            )
+            raise MissingOutputException(
+                f"Workflow {node.operator_hierarchical_id} has no output {output_name}"
+            ).set_context(context) from e
+        via_plot_only_workflow = via_plot_only_workflow or node.has_only_plot_outputs
+    assert isinstance(node, ComputationNode)  # hint for mypy  # noqa: S101
+    return node, output_name, via_plot_only_workflow
+
+
+def _sort_topologically(
+    nodes: list[ComputationNode],
+    resolved_inputs: dict[int, dict[str, tuple[ComputationNode, str, bool]]],
+) -> list[ComputationNode]:
+    """Depth first topological sort raising CircularDependency on cycles"""
+    visiting, done = 1, 2
+    states: dict[int, int] = {}
+    ordered_nodes: list[ComputationNode] = []
+
+    for start_node in nodes:
+        if id(start_node) in states:
+            continue
+        states[id(start_node)] = visiting
+        stack = [(start_node, iter(resolved_inputs[id(start_node)].items()))]
+        while len(stack) > 0:
+            node, remaining_inputs = stack[-1]
+            for input_name, (source_node, output_name, _) in remaining_inputs:
+                source_state = states.get(id(source_node))
+                if source_state == visiting:
+                    msg = (
+                        f"Circular Dependency detected whith input '{input_name}' pointing"
+                        f" to output '{output_name}' of operator"
+                        f" {source_node.operator_hierarchical_id}"
+                    )
+                    runtime_execution_logger.warning(msg)
+                    raise CircularDependency(msg).set_context(node.context)
+                if source_state is None:
+                    states[id(source_node)] = visiting
+                    stack.append(
+                        (source_node, iter(resolved_inputs[id(source_node)].items()))
+                    )
+                    break
+            else:
+                stack.pop()
+                states[id(node)] = done
+                ordered_nodes.append(node)
+
+    return ordered_nodes
+
+
+def compile_workflow(workflow: Workflow) -> ExecutionPlan:
+    """Flatten workflow into a topologically sorted execution plan
+
+    Raises MissingInputSource, MissingOutputException or CircularDependency if the
+    workflow cannot be executed.
+    """
+    input_slots, fed_nested_workflow_inputs = _obtain_input_slots(workflow)
+    _check_nested_workflow_inputs(workflow, fed_nested_workflow_inputs)
+
+    resolved_inputs: dict[int, dict[str, tuple[ComputationNode, str, bool]]] = {}
+    nodes_to_resolve = obtain_all_nodes(workflow)
+    all_nodes: list[ComputationNode] = []
+    # nodes_to_resolve grows while iterating over it
+    for node in nodes_to_resolve:
+        if id(node) in resolved_inputs:
+            continue
+        all_nodes.append(node)
+
+        available_inputs = set(node.inputs.keys()) | set(
+            input_slots.get(id(node), {}).keys()
+        )
+        if not set(node.required_params).issubset(available_inputs):
+            runtime_execution_logger.warning(
+                "Compilation failed due to missing input source"
+            )
+            raise MissingInputSource(
+                "Inputs of computation node are missing"
+            ).set_context(node.context)
+
+        resolved_inputs[id(node)] = {
+            input_name: _resolve_output(another_node, output_name, node.context)
+            for input_name, (another_node, output_name) in node.inputs.items()
+        }
+        # providing nodes which are not sub nodes of any workflow still need to be run
+        nodes_to_resolve.extend(
+            source_node for source_node, _, _ in resolved_inputs[id(node)].values()
+        )
+
+    ordered_nodes = _sort_topologically(all_nodes, resolved_inputs)
+    step_index_by_node_id = {
+        id(node): index for index, node in enumerate(ordered_nodes)
+    }
+
+    steps = [
+        PlanStep(
+            node=node,
+            inputs={
+                **{
+                    input_name: PlanEdge(output_name=wf_input_name)
+                    for input_name, wf_input_name in input_slots.get(
+                        id(node), {}
+                    ).items()
+                },
+                **{
+                    input_name: PlanEdge(
+                        output_name=output_name,
+                        step=step_index_by_node_id[id(source_node)],
+                        via_plot_only_workflow=via_plot_only_workflow,
+                    )
+                    for input_name, (
+                        source_node,
+                        output_name,
+                        via_plot_only_workflow,
+                    ) in resolved_inputs[id(node)].items()
+                },
+            },
+        )
+        for node in ordered_nodes
+    ]
+
+    outputs: dict[str, PlanEdge] = {}
+    for wf_output_name, (
+        sub_node,
+        sub_node_output_name,
+    ) in workflow.output_mappings.items():
+        source_node, output_name, via_plot_only_workflow = _resolve_output(
+            sub_node,
+            sub_node_output_name,
+            workflow.context,
+            via_plot_only_workflow=sub_node.has_only_plot_outputs,
+        )
+        outputs[wf_output_name] = PlanEdge(
+            output_name=output_name,
+            step=step_index_by_node_id[id(source_node)],
+            via_plot_only_workflow=via_plot_only_workflow,
+        )
+
+    return ExecutionPlan(
+        workflow=workflow,
+        steps=steps,
+        outputs=outputs,
+        input_names=sorted(
+            {
+                wf_input_name
+                for slots in input_slots.values()
+                for wf_input_name in slots.values()
+            }
+        ),
+    )
+
+
+def _is_needed(edge: PlanEdge, run_pure_plot_operators: bool) -> bool:
+    """Whether the value of the edge requires the result of its step"""
+    return edge.step is not None and (
+        run_pure_plot_operators or not edge.via_plot_only_workflow
+    )
+
+
+def steps_to_run(
+    plan: ExecutionPlan,
+    run_pure_plot_operators: bool,
+    prune_operators_without_effect: bool = False,
+) -> list[bool]:
+    """Determine which steps are run
+
+    By default every step is run, even if it does not lead to an output. This is
+    necessary for example for the Store Model component. If
+    prune_operators_without_effect is True, only steps which lead to a workflow output
+    or to a step with side effects are run. If pure plot operators should not be run,
+    steps with only plot outputs are skipped, unless another run step needs them.
+    """
+    if run_pure_plot_operators and not prune_operators_without_effect:
+        return [True] * len(plan.steps)
+
+    if prune_operators_without_effect:
+        to_run = [
+            step.node.has_side_effects
+            and (run_pure_plot_operators or not step.node.has_only_plot_outputs)
+            for step in plan.steps
+        ]
+        for edge in plan.outputs.values():
+            if _is_needed(edge, run_pure_plot_operators):
+                to_run[edge.step] = True  # type: ignore[index]
+    else:
+        to_run = [not step.node.has_only_plot_outputs for step in plan.steps]
+
+    # consumers come after their providers in the plan
+    for index in reversed(range(len(plan.steps))):
+        if to_run[index]:
+            for edge in plan.steps[index].inputs.values():
+                if _is_needed(edge, run_pure_plot_operators):
+                    to_run[edge.step] = True  # type: ignore[index]
+    return to_run
+
+
+def step_keys(plan: ExecutionPlan) -> list[str]:
+    """Identities of the steps which are stable across compilations of a workflow
+
+    The key of a step is derived from the operator hierarchical id, the function of its
+    node and the sources of its inputs, including the keys of providing steps. The
+    module path of functions of components contains the hash of their code (see
+    component.load module). Values of constants and workflow inputs are not part of
+    the keys, so that the steps of a workflow with changed constants keep their keys.
+    """
+    keys: list[str] = []
+    for step in plan.steps:
+        node = step.node
+        key_hash = hashlib.sha256(
+            (
+                f"{node.operator_hierarchical_id}:{getattr(node.func, '__module__', '')}"
+                f":{getattr(node.func, '__qualname__', '')}"
+            ).encode()
+        )
+        for input_name, edge in sorted(step.inputs.items()):
+            source = "" if edge.step is None else keys[edge.step]
+            key_hash.update(
+                f"{input_name}:{source}:{edge.output_name}:{edge.via_plot_only_workflow}".encode()
+            )
+        keys.append(key_hash.hexdigest())
+    return keys
+
+
+def reusable_steps(
+    plan: ExecutionPlan,
+    previous_results: dict[str, dict[str, Any]],
+    changed_input_names: set[str],
+    run_pure_plot_operators: bool,
+    changed_constants: set[tuple[int, str]] | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Determine which results of a previous execution can be reused
+
+    previous_results are the results of the steps of a previous execution by their
+    step_keys. The plan may have been compiled again since, e.g. because constants
+    changed. A previous result of a step is reusable if all its inputs are unchanged,
+    i.e. they come from workflow inputs which are not in changed_input_names, from
+    outputs of constant providing steps which are not in changed_constants (as pairs of
+    step index and output name) or from steps whose results are reusable themselves.
+    Steps with side effects are always run again.
+    """
+    changed_constants = changed_constants if changed_constants is not None else set()
+    keys = step_keys(plan)
+    ambiguous_keys = {key for key, count in Counter(keys).items() if count > 1}
+    reusable: dict[int, dict[str, Any]] = {}
+    for index, step in enumerate(plan.steps):
+        key = keys[index]
+        if (
+            key not in previous_results
+            or key in ambiguous_keys
+            or step.node.has_side_effects
+            or step.node.constant_values is not None
+        ):
+            continue
+        unchanged_inputs = (
+            edge.output_name not in changed_input_names
+            if edge.step is None
+            else (
+                (edge.step, edge.output_name) not in changed_constants
+                if plan.steps[edge.step].node.constant_values is not None
+                else edge.step in reusable
+                or not _is_needed(edge, run_pure_plot_operators)
+            )
+            for edge in step.inputs.values()
+        )
+        if all(unchanged_inputs):
+            reusable[index] = previous_results[key]
+    return reusable
+
+
+def estimate_size(value: Any) -> int:
+    """Cheap estimate of the memory (in bytes) held by a result value
+
+    Pandas objects and numpy arrays report the size of their data buffers (without
+    following Python objects in object columns). For other objects the shallow size
+    is used.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, pd.Series | pd.Index):
+        return int(value.memory_usage(index=True, deep=False))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+def output_size_info(value: Any) -> OutputSizeInfo:
+    rows: int | None = None
+    if isinstance(value, pd.DataFrame | pd.Series) or (
+        isinstance(value, np.ndarray) and value.ndim > 0
+    ):
+        rows = len(value)
+    return OutputSizeInfo(rows=rows, size_bytes=estimate_size(value))
+
+
+def _estimate_result_size(result: dict[str, Any]) -> int:
+    # the same object may be returned under several output names
+    distinct_values = {id(value): value for value in result.values()}
+    return sum(estimate_size(value) for value in distinct_values.values())
+
+
+class _MemoryProfiling:
+    """Tracing of memory allocations shared by all executions of the process
+
+    tracemalloc and its peak are global to the process. Tracing is started when the
+    first execution profiling memory begins and stopped when the last one ends, unless
+    it was started elsewhere. Profiled steps of all executions hold the lock while
+    their memory is traced, so that they are not attributed each other's allocations.
+    """
+
+    def __init__(self) -> None:
+        self.active_executions = 0
+        self._started_tracing = False
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        # asyncio locks are bound to the event loop they are used in
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    def begin(self) -> None:
+        if self.active_executions == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.active_executions += 1
+
+    def end(self) -> None:
+        self.active_executions -= 1
+        if self.active_executions == 0 and self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+memory_profiling = _MemoryProfiling()
+
+
+class _PlanRun:
+    """State of one execution of a plan
+
+    If release_results is True, the result of a step is dropped as soon as all steps
+    consuming it are finished. Values for workflow outputs are
+    taken from the results directly when a step finishes.
+
+    Results of cacheable nodes are taken from the result cache if possible. Steps with
+    reusable results are not run at all.
+
+    If profile_operators is True, an OperatorProfile is recorded for every step.
+    Memory is only traced if tracemalloc is tracing, which is taken care of by
+    execute_plan. Since the peak of tracemalloc is process-global, profiled steps of
+    all executions run one at a time while memory is traced (see _MemoryProfiling).
+    """
+
+    def __init__(
+        self,
+        plan: ExecutionPlan,
+        input_values: dict[str, Any],
+        run_pure_plot_operators: bool,
+        release_results: bool,
+        prune_operators_without_effect: bool = False,
+        profile_operators: bool = False,
+        reusable_results: dict[int, dict[str, Any]] | None = None,
+    ) -> None:
+        self.plan = plan
+        self.input_values = input_values
+        self.run_pure_plot_operators = run_pure_plot_operators
+        self.release_results = release_results
+        self.to_run = steps_to_run(
+            plan, run_pure_plot_operators, prune_operators_without_effect
+        )
+        if not all(self.to_run):
+            runtime_execution_logger.info(
+                "Skipping %d of %d operators",
+                len(self.to_run) - sum(self.to_run),
+                len(self.to_run),
+            )
+
+        self.results: dict[int, dict[str, Any]] = {}
+        self.outputs: dict[str, Any] = {
+            wf_output_name: {}
+            for wf_output_name, edge in plan.outputs.items()
+            if not _is_needed(edge, run_pure_plot_operators)
+        }
+        self.output_edges_by_step: dict[int, dict[str, PlanEdge]] = {}
+        for wf_output_name, edge in plan.outputs.items():
+            if _is_needed(edge, run_pure_plot_operators):
+                self.output_edges_by_step.setdefault(edge.step, {})[  # type: ignore
+                    wf_output_name
+                ] = edge
+
+        # steps whose results are read by a step, once per input
+        self.providers: dict[int, list[int]] = {}
+        for index, step in enumerate(plan.steps):
+            if self.to_run[index]:
+                self.providers[index] = [
+                    edge.step
+                    for edge in step.inputs.values()
+                    if edge.step is not None
+                    and _is_needed(edge, run_pure_plot_operators)
+                ]
+
+        self.remaining_reads: dict[int, int] = {
+            index: 0 for index in range(len(plan.steps))
+        }
+        for providers in self.providers.values():
+            for provider in providers:
+                self.remaining_reads[provider] += 1
+
+        self.result_sizes: dict[int, int] = {}
+        self.live_result_bytes = 0
+        self.peak_result_bytes = 0
+        self.total_result_bytes = 0
+        self.released_results = 0
+
+        self.profile_operators = profile_operators
+        self.start_time = time.perf_counter()
+        self.finish_offsets: dict[int, float] = {}
+        self.profiles: list[OperatorProfile] = []
+
+        self.reusable_results = reusable_results if reusable_results is not None else {}
+        self.keep_step_results = reusable_results is not None
+        # Steps may modify their inputs in place, so results are kept as copies taken
+        # before they are passed on. Results which cannot be copied are not kept.
+        self.step_results: dict[int, dict[str, Any]] = {}
+        self.reused_steps: list[int] = []
+        self.steps_from_result_cache: set[int] = set()
+        self.result_cache_misses = 0
+
+    def _obtain_value(self, edge: PlanEdge, context: ExecutionContext) -> Any:
+        if edge.step is None:
+            return self.input_values[edge.output_name]
+        if not _is_needed(edge, self.run_pure_plot_operators):
+            return {}
+        try:
+            return self.results[edge.step][edge.output_name]
+        except KeyError as e:
+            # possibly an output_name missing in the result dict of the providing node!
+            runtime_execution_logger.warning(
+                "Execution failed due to missing output of a node",
+                exc_info=True,
+            )
+            raise MissingOutputException(
+                "Could not obtain output result from another node while preparing to "
+                "run operator"
+            ).set_context(context) from e
+
+    def _release(self, index: int) -> None:
+        self.results.pop(index, None)
+        self.live_result_bytes -= self.result_sizes.pop(index, 0)
+        self.released_results += 1
+
+    def gather_input_values(self, index: int) -> dict[str, Any]:
+        step = self.plan.steps[index]
+        input_values = {
+            input_name: self._obtain_value(edge, step.node.context)
+            for input_name, edge in step.inputs.items()
+        }
+        return input_values
+
+    def store_result(self, index: int, result: dict[str, Any]) -> None:
+        self.results[index] = result
+        for wf_output_name, edge in self.output_edges_by_step.get(index, {}).items():
+            self.outputs[wf_output_name] = self._obtain_value(
+                edge, self.plan.workflow.context
+            )
+
+        size = _estimate_result_size(result)
+        self.result_sizes[index] = size
+        self.live_result_bytes += size
+        self.total_result_bytes += size
+        self.peak_result_bytes = max(self.peak_result_bytes, self.live_result_bytes)
+
+        # the inputs are referenced by the step until it is finished
+        for provider in self.providers[index]:
+            self.remaining_reads[provider] -= 1
+            if self.release_results and self.remaining_reads[provider] == 0:
+                self._release(provider)
+
+        if self.release_results and self.remaining_reads[index] == 0:
+            self._release(index)
+
+    async def run_step(self, index: int) -> dict[str, Any]:
+        node = self.plan.steps[index].node
+        if index in self.reusable_results:
+            reused_result = copy_result(self.reusable_results[index])
+            if reused_result is not None:
+                runtime_execution_logger.debug(
+                    "Reusing result of previous execution for operator %s",
+                    node.operator_hierarchical_id,
+                )
+                self.reused_steps.append(index)
+                # the served copy may be modified, the reused result stays unchanged
+                self.step_results[index] = self.reusable_results[index]
+                return reused_result
+
+        input_values = self.gather_input_values(index)
+        if not node.cacheable:
+            return await node.compute(input_values)
+
+        key = result_cache_key(node, input_values)
+        if key is not None:
+            cached_result = result_cache.get(key)
+            if cached_result is not None:
+                runtime_execution_logger.info(
+                    "Using cached result for operator %s", node.operator_hierarchical_id
+                )
+                self.steps_from_result_cache.add(index)
+                return cached_result
+        self.result_cache_misses += 1
+
+        result = await node.compute(input_values)
+        if key is not None:
+            result_cache.put(key, result, _estimate_result_size(result))
+        return result
+
+    async def run_profiled_step(self, index: int) -> dict[str, Any]:
+        if tracemalloc.is_tracing():
+            # The peak of tracemalloc is process-global, so steps running at the
+            # same time would be attributed each other's allocations.
+            async with memory_profiling.lock:
+                return await self._run_profiled_step(index, trace_memory=True)
+        return await self._run_profiled_step(index, trace_memory=False)
+
+    async def _run_profiled_step(
+        self, index: int, trace_memory: bool
+    ) -> dict[str, Any]:
+        node = self.plan.steps[index].node
+        inputs_available_offset = max(
+            (self.finish_offsets[provider] for provider in self.providers[index]),
+            default=0.0,
+        )
+        if trace_memory:
+            tracemalloc.reset_peak()
+            allocated_at_start = tracemalloc.get_traced_memory()[0]
+
+        recorded_cpu_times: list[float] = []
+        token = cpu_time_recorder.set(recorded_cpu_times)
+        start = time.perf_counter()
+        try:
+            result = await self.run_step(index)
+        finally:
+            cpu_time_recorder.reset(token)
+        end = time.perf_counter()
+        self.finish_offsets[index] = end - self.start_time
+
+        profile = OperatorProfile(
+            operator_hierarchical_id=node.operator_hierarchical_id,
+            operator_hierarchical_name=node.operator_hierarchical_name,
+            transformation_id=node.context.currently_executed_transformation_id,
+            transformation_tag=node.context.currently_executed_transformation_tag,
+            wall_time_seconds=end - start,
+            cpu_time_seconds=(
+                sum(recorded_cpu_times) if len(recorded_cpu_times) > 0 else None
+            ),
+            input_wait_seconds=max(
+                start - self.start_time - inputs_available_offset, 0.0
+            ),
+            from_result_cache=index in self.steps_from_result_cache,
+            output_sizes={
+                output_name: output_size_info(value)
+                for output_name, value in result.items()
+            },
+            tracemalloc_peak_bytes=(
+                max(tracemalloc.get_traced_memory()[1] - allocated_at_start, 0)
+                if trace_memory
+                else None
+            ),
+        )
+        self.profiles.append(profile)
+        runtime_execution_logger.info("Operator profile: %s", profile.json())
+        return result
+
+    async def run_and_store_step(self, index: int) -> None:
+        if self.profile_operators:
+            result = await self.run_profiled_step(index)
+        else:
+            result = await self.run_step(index)
+        if self.keep_step_results and index not in self.step_results:
+            copied_result = copy_result(result)
+            if copied_result is not None:
+                self.step_results[index] = copied_result
+        self.store_result(index, result)
+
+    async def run_sequentially(self) -> None:
+        for index in range(len(self.plan.steps)):
+            if self.to_run[index]:
+                await self.run_and_store_step(index)
+
+    async def run_concurrently(self) -> None:
+        """Start every step as soon as all steps it depends on are finished
+
+        If a step fails, no further steps are started. The first exception is raised
+        after all running steps have finished.
+        """
+        dependents: dict[int, list[int]] = {
+            index: [] for index in range(len(self.plan.steps))
+        }
+        remaining_dependencies: dict[int, int] = {}
+        for index, providers in self.providers.items():
+            for provider in set(providers):
+                dependents[provider].append(index)
+            remaining_dependencies[index] = len(set(providers))
+
+        ready = [index for index, count in remaining_dependencies.items() if count == 0]
+        running: dict[asyncio.Future, int] = {}
+        first_exception: BaseException | None = None
+
+        while True:
+            if first_exception is None:
+                for index in sorted(ready):
+                    running[
+                        asyncio.ensure_future(self.run_and_store_step(index))
+                    ] = index
+            ready = []
+            if len(running) == 0:
+                break
+
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                index = running.pop(task)
+                if task.exception() is not None:
+                    first_exception = first_exception or task.exception()
+                    continue
+                for dependent in dependents[index]:
+                    remaining_dependencies[dependent] -= 1
+                    if remaining_dependencies[dependent] == 0:
+                        ready.append(dependent)
+
+        if first_exception is not None:
+            raise first_exception
+
+
+async def execute_plan(
+    plan: ExecutionPlan,
+    input_values: dict[str, Any] | None = None,
+    reusable_results: dict[int, dict[str, Any]] | None = None,
+) -> PlanExecutionResult:
+    """Run all steps of the plan and collect the workflow outputs
+
+    input_values must contain a value for every name in plan.input_names. Steps are run
+    one after another, or concurrently as soon as their inputs are available if the
+    execution configuration activates gather_inputs_concurrently.
+
+    Results of steps are released as soon as they are not needed anymore, unless the
+    execution configuration requests individual node results.
+
+    If the execution configuration activates profile_operator_memory, tracemalloc is
+    tracing during the execution. It is shared with concurrent executions profiling
+    memory and only stopped after the last of them.
+
+    Copies of reusable_results (see reusable_steps) are used instead of running their
+    steps. If they are given, copies of the results of all steps are returned as
+    step_results, so that they can be reused by a later execution.
+    """
+    input_values = input_values if input_values is not None else {}
+    missing_input_names = set(plan.input_names) - set(input_values.keys())
+    if len(missing_input_names) > 0:
+        raise MissingInputSource(
+            "No values provided for workflow inputs "
+            + ", ".join(sorted(missing_input_names))
+        ).set_context(plan.workflow.context)
+
+    configuration = execution_config.get()
+    plan_run = _PlanRun(
+        plan,
+        input_values,
+        run_pure_plot_operators=configuration.run_pure_plot_operators,
+        release_results=not configuration.return_individual_node_results,
+        prune_operators_without_effect=configuration.prune_operators_without_effect,
+        profile_operators=configuration.profile_operators,
+        reusable_results=reusable_results,
+    )
+
+    profile_memory = (
+        configuration.profile_operators and configuration.profile_operator_memory
+    )
+    if profile_memory:
+        memory_profiling.begin()
+    try:
+        if configuration.gather_inputs_concurrently:
+            await plan_run.run_concurrently()
+        else:
+            await plan_run.run_sequentially()
+    finally:
+        if profile_memory:
+            memory_profiling.end()
+
+    return PlanExecutionResult(
+        outputs={
+            wf_output_name: plan_run.outputs[wf_output_name]
+            for wf_output_name in plan.outputs
+        },
+        node_results=[
+            (plan.steps[index].node.operator_hierarchical_id, plan_run.results[index])
+            for index in sorted(plan_run.results.keys())
+        ],
+        result_memory=ResultMemoryInfo(
+            peak_result_bytes=plan_run.peak_result_bytes,
+            peak_result_bytes_without_release=plan_run.total_result_bytes,
+            released_results=plan_run.released_results,
+        ),
+        result_cache=ResultCacheInfo(
+            hits=len(plan_run.steps_from_result_cache),
+            misses=plan_run.result_cache_misses,
+            currsize_bytes=result_cache.currsize_bytes,
+            maxsize_bytes=get_config().result_cache_max_bytes,
+        ),
+        operator_profiles=plan_run.profiles if plan_run.profile_operators else None,
+        step_results=plan_run.step_results if reusable_results is not None else None,
+        reused_operators=[
+            plan.steps[index].node.operator_hierarchical_id
+            for index in plan_run.reused_steps
+        ],
+    )
@@ -0,0 +1,253 @@
+"""Cache of operator results across executions
+
+Components registered with cacheable=True declare that their outputs only depend on
+their inputs. Results of such operators are cached by a key derived from the code of
+the component and a fingerprint of its input values, so that later executions (e.g.
+scheduled executions loading the same masterdata) can skip running them.
+
+The code is identified by the module path of the component function, which already
+contains the SHA-256 hash of the code (see component.load module). Pandas objects are
+fingerprinted via hash_pandas_object, numpy arrays via their buffers and all other
+values via their pickled representation. Values which cannot be fingerprinted make an
+operator uncacheable for this execution.
+
+Results are kept in memory by each runtime worker process up to a configured total
+size and can additionally be stored as pickle files in a directory. Cached results are
+copied when they are stored and when they are served, so that executions cannot
+modify each other's results.
+"""
+import contextlib
+import copy
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.component.load import base_module_path
+from hetdesrun.runtime.engine.plain.workflow import ComputationNode
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class ValueNotFingerprintable(Exception):
+    pass
+
+
+def _update_with_value(key_hash: "hashlib._Hash", value: Any) -> None:
+    try:
+        if isinstance(value, pd.DataFrame):
+            key_hash.update(
+                pickle.dumps(
+                    (
+                        "DataFrame",
+                        list(value.columns),
+                        [str(dtype) for dtype in value.dtypes],
+                        str(value.index.dtype),
+                        value.attrs,
+                    )
+                )
+            )
+            key_hash.update(
+                pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes()
+            )
+        elif isinstance(value, pd.Series):
+            key_hash.update(
+                pickle.dumps(
+                    (
+                        "Series",
+                        value.name,
+                        str(value.dtype),
+                        str(value.index.dtype),
+                        value.attrs,
+                    )
+                )
+            )
+            key_hash.update(
+                pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes()
+            )
+        elif isinstance(value, np.ndarray) and value.dtype != object:
+            key_hash.update(pickle.dumps(("ndarray", str(value.dtype), value.shape)))
+            key_hash.update(np.ascontiguousarray(value).tobytes())
+        else:
+            key_hash.update(pickle.dumps(value))
+    except TypeError:
+        # e.g. unhashable objects in Pandas object columns
+        try:
+            key_hash.update(pickle.dumps(value))
+        except Exception as e:  # noqa: BLE001
+            raise ValueNotFingerprintable from e
+    except Exception as e:  # noqa: BLE001
+        raise ValueNotFingerprintable from e
+
+
+def value_fingerprint(value: Any) -> str | None:
+    """Hash identifying a value, None if the value cannot be fingerprinted"""
+    key_hash = hashlib.sha256()
+    try:
+        _update_with_value(key_hash, value)
+    except ValueNotFingerprintable:
+        return None
+    return key_hash.hexdigest()
+
+
+def result_cache_key(node: ComputationNode, input_values: dict[str, Any]) -> str | None:
+    """Cache key for the result of node for the input values
+
+    Returns None if the result cannot be cached.
+    """
+    config = get_config()
+    if config.result_cache_max_bytes == 0 and config.result_cache_dir is None:
+        return None
+    module_path = getattr(node.func, "__module__", None)
+    if module_path is None or not module_path.startswith(base_module_path + "."):
+        # only functions imported from code are identified by a hash of their code
+        return None
+
+    key_hash = hashlib.sha256(
+        f"{module_path}:{getattr(node.func, '__qualname__', '')}".encode()
+    )
+    try:
+        for input_name in sorted(input_values.keys()):
+            key_hash.update(input_name.encode())
+            _update_with_value(key_hash, input_values[input_name])
+    except ValueNotFingerprintable:
+        logger.debug(
+            "Cannot fingerprint inputs of operator %s. Not using result cache.",
+            node.operator_hierarchical_id,
+        )
+        return None
+    return key_hash.hexdigest()
+
+
+def copy_result(result: dict[str, Any]) -> dict[str, Any] | None:
+    """Deep copy of the result, None if it cannot be copied"""
+    try:
+        return copy.deepcopy(result)
+    except Exception:  # noqa: BLE001
+        logger.debug("Cannot copy result.", exc_info=True)
+        return None
+
+
+class ResultCache:
+    """Least recently used cache of operator results with an optional disk tier"""
+
+    def __init__(self) -> None:
+        self._results: OrderedDict[str, tuple[dict[str, Any], int]] = OrderedDict()
+        self.currsize_bytes = 0
+
+    def _put_in_memory(self, key: str, result: dict[str, Any], size: int) -> None:
+        max_bytes = get_config().result_cache_max_bytes
+        if size > max_bytes:
+            return
+        self._pop_from_memory(key)
+        self._results[key] = (result, size)
+        self.currsize_bytes += size
+        while self.currsize_bytes > max_bytes:
+            self._pop_from_memory(next(iter(self._results)))
+
+    def _pop_from_memory(self, key: str) -> None:
+        entry = self._results.pop(key, None)
+        if entry is not None:
+            self.currsize_bytes -= entry[1]
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._results.get(key)
+        if entry is not None:
+            self._results.move_to_end(key)
+            return copy.deepcopy(entry[0])
+
+        directory = get_config().result_cache_dir
+        if directory is None:
+            return None
+        path = os.path.join(directory, key + ".pickle")
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)  # noqa: S301
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001
+            logger.warning("Could not read cached result %s", path, exc_info=True)
+            return None
+        if not (
+            isinstance(entry, tuple)
+            and len(entry) == 2
+            and isinstance(entry[0], dict)
+            and isinstance(entry[1], int)
+        ):
+            logger.warning("Ignoring invalid cached result %s", path)
+            return None
+
+        result: dict[str, Any] = entry[0]
+        size: int = entry[1]
+        self._put_in_memory(key, result, size)
+        return copy.deepcopy(result)
+
+    def put(self, key: str, result: dict[str, Any], size: int) -> None:
+        """Store a copy of the result with its estimated size
+
+        Results which cannot be copied or pickled are not cached.
+        """
+        config = get_config()
+        copied_result = copy_result(result)
+        if copied_result is None:
+            logger.debug("Not caching result which cannot be copied.")
+            return
+        result = copied_result
+        self._put_in_memory(key, result, size)
+
+        if config.result_cache_dir is None:
+            return
+        try:
+            os.makedirs(config.result_cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=config.result_cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                try:
+                    pickle.dump((result, size), f)
+                except Exception:
+                    f.close()
+                    os.remove(f.name)
+                    raise
+            os.replace(f.name, os.path.join(config.result_cache_dir, key + ".pickle"))
+        except Exception:  # noqa: BLE001
+            logger.warning("Could not store result in cache directory", exc_info=True)
+            return
+        evict_from_directory(config.result_cache_dir, config.result_cache_dir_max_bytes)
+
+    def clear(self) -> None:
+        self._results.clear()
+        self.currsize_bytes = 0
+
+
+def evict_from_directory(directory: str, max_bytes: int) -> None:
+    """Delete least recently used result files until their total size fits"""
+    try:
+        entries = [
+            entry
+            for entry in os.scandir(directory)
+            if entry.is_file() and entry.name.endswith(".pickle")
+        ]
+        stats = {entry.path: entry.stat() for entry in entries}
+    except OSError:
+        logger.warning("Could not list result cache directory", exc_info=True)
+        return
+
+    total_bytes = sum(stat.st_size for stat in stats.values())
+    for path in sorted(stats, key=lambda path: stats[path].st_mtime):
+        if total_bytes <= max_bytes:
+            break
+        # may have been removed concurrently by another worker process
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        total_bytes -= stats[path].st_size
+
+
+result_cache = ResultCache()
@@ -0,0 +1,138 @@
+"""Execution sessions for incremental re-execution
+
+When a workflow is developed in the designer, it is executed over and over again with
+only one constant or one wiring changed in between. An execution session keeps the
+loaded data and the results of all steps of the last execution. The next execution in
+the same session compares the fingerprints of the workflow input values and of the
+constants (see result_cache module) and only runs the steps which depend on changed
+values, reusing the previous results of all other steps.
+
+Results are identified by step keys (see plan module), which are derived from the
+operators, their code and the sources of their inputs. They do not depend on the
+values of constants, so that results are reused even if a changed constant leads to a
+newly compiled execution plan. Since components may modify their inputs in place, the
+kept results are copies taken before they were passed on to other steps, and reused
+results are copied again before they are passed on. Sessions are kept by each runtime
+worker process, so executions of a session should be routed to the same one.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from hetdesrun.runtime.engine.plain.plan import (
+    ExecutionPlan,
+    reusable_steps,
+    step_keys,
+)
+from hetdesrun.runtime.engine.plain.result_cache import value_fingerprint
+from hetdesrun.webservice.config import get_config
+
+
+def input_fingerprints(input_values: dict[str, Any]) -> dict[str, str | None]:
+    return {name: value_fingerprint(value) for name, value in input_values.items()}
+
+
+def constant_fingerprints(
+    plan: ExecutionPlan,
+) -> dict[tuple[str, str], str | None]:
+    """Fingerprints of the constants by step key and output name"""
+    return {
+        (key, name): value_fingerprint(value)
+        for key, step in zip(step_keys(plan), plan.steps, strict=True)
+        if step.node.constant_values is not None
+        for name, value in step.node.constant_values.items()
+    }
+
+
+@dataclass
+class ExecutionSession:
+    run_pure_plot_operators: bool | None = None
+    input_fingerprints: dict[str, str | None] = field(default_factory=dict)
+    constant_fingerprints: dict[tuple[str, str], str | None] = field(
+        default_factory=dict
+    )
+    # results of the steps of the last execution by step key
+    step_results: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # loaded data by workflow input name together with the JSON of its input wiring
+    loaded_data: dict[str, tuple[str, Any]] = field(default_factory=dict)
+
+    def reusable_results(
+        self,
+        plan: ExecutionPlan,
+        input_fingerprints: dict[str, str | None],
+        run_pure_plot_operators: bool,
+    ) -> dict[int, dict[str, Any]]:
+        """Results of the last execution which can be reused for these inputs
+
+        Input values and constants which cannot be fingerprinted are considered
+        changed.
+        """
+        if run_pure_plot_operators != self.run_pure_plot_operators:
+            return {}
+        changed_input_names = {
+            name
+            for name, fingerprint in input_fingerprints.items()
+            if fingerprint is None or fingerprint != self.input_fingerprints.get(name)
+        }
+        changed_constants = set()
+        for index, key in enumerate(step_keys(plan)):
+            constant_values = plan.steps[index].node.constant_values
+            for name, value in (constant_values or {}).items():
+                fingerprint = value_fingerprint(value)
+                if (
+                    fingerprint is None
+                    or fingerprint != self.constant_fingerprints.get((key, name))
+                ):
+                    changed_constants.add((index, name))
+        return reusable_steps(
+            plan,
+            self.step_results,
+            changed_input_names,
+            run_pure_plot_operators,
+            changed_constants=changed_constants,
+        )
+
+    def store(
+        self,
+        plan: ExecutionPlan,
+        input_fingerprints: dict[str, str | None],
+        run_pure_plot_operators: bool,
+        step_results: dict[int, dict[str, Any]],
+    ) -> None:
+        keys = step_keys(plan)
+        self.input_fingerprints = input_fingerprints
+        self.constant_fingerprints = constant_fingerprints(plan)
+        self.run_pure_plot_operators = run_pure_plot_operators
+        self.step_results = {
+            keys[index]: result for index, result in step_results.items()
+        }
+
+
+class ExecutionSessions:
+    """Least recently used execution sessions by session id"""
+
+    def __init__(self) -> None:
+        self._sessions: OrderedDict[str, ExecutionSession] = OrderedDict()
+
+    def obtain(self, session_id: str) -> ExecutionSession | None:
+        """Get the session or start a new one
+
+        Returns None if sessions are deactivated.
+        """
+        max_count = get_config().execution_session_max_count
+        if max_count == 0:
+            return None
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = ExecutionSession()
+            self._sessions[session_id] = session
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > max_count:
+            self._sessions.popitem(last=False)
+        return session
+
+    def clear(self) -> None:
+        self._sessions.clear()
+
+
+execution_sessions = ExecutionSessions()
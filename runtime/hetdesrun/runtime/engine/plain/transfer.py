@@ -0,0 +1,153 @@
+"""Hand-off of large pandas objects between processes via shared memory
+
+Pickling large Series and DataFrames and sending them through the pipes of a process
+pool is slow. Instead they are written as Arrow IPC streams into shared memory blocks
+and only a small handle referencing the block is pickled.
+
+The process which creates a block writes it and the receiving process reads it.
+Ownership of the blocks always stays with the parent process: It unlinks the blocks it
+created for the inputs after the function call returned and the blocks created by the
+worker processes for the outputs after reading them.
+"""
+import logging
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+SERIES_COLUMN_NAME = "__hd_series_values__"
+
+
+@dataclass(frozen=True)
+class SharedMemoryPandasObject:
+    """Picklable handle of a pandas object written into shared memory"""
+
+    shm_name: str
+    size: int
+    is_series: bool
+    series_name: Any = None
+    attrs: dict = field(default_factory=dict)
+
+
+def arrow_compatible_frame(value: pd.Series | pd.DataFrame) -> pd.DataFrame | None:
+    """Obtain DataFrame for Arrow conversion or None if the round trip is not exact
+
+    Arrow requires string column names, so objects with other column names are
+    pickled as usual.
+    """
+    if isinstance(value, pd.Series):
+        return value.to_frame(name=SERIES_COLUMN_NAME)
+    if isinstance(value.columns, pd.MultiIndex) or not all(
+        isinstance(col, str) for col in value.columns
+    ):
+        return None
+    return value
+
+
+def _write_table(shm: SharedMemory, table: pa.Table) -> None:
+    # Arrow buffers referencing shm.buf must be released before the block is closed,
+    # which happens when this function returns.
+    with pa.ipc.new_stream(
+        pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf)), table.schema
+    ) as writer:
+        writer.write_table(table)
+
+
+def to_shared_memory(value: Any) -> Any:
+    """Write large Series/DataFrame into shared memory and return a handle instead
+
+    All other values (including small or non Arrow compatible pandas objects) are
+    returned unchanged.
+    """
+    if not isinstance(value, pd.Series | pd.DataFrame):
+        return value
+
+    memory_usage = value.memory_usage(index=True, deep=False)
+    if isinstance(memory_usage, pd.Series):
+        memory_usage = memory_usage.sum()
+    if memory_usage < get_config().shared_memory_transfer_min_bytes:
+        return value
+
+    frame = arrow_compatible_frame(value)
+    if frame is None:
+        return value
+
+    try:
+        table = pa.Table.from_pandas(frame, preserve_index=True)
+    except (pa.ArrowException, ValueError, TypeError):
+        logger.debug(
+            "Could not convert pandas object to Arrow. Falling back to pickling.",
+            exc_info=True,
+        )
+        return value
+
+    size_measuring_stream = pa.MockOutputStream()
+    with pa.ipc.new_stream(size_measuring_stream, table.schema) as writer:
+        writer.write_table(table)
+    size = size_measuring_stream.size()
+
+    shm = SharedMemory(create=True, size=size)
+    try:
+        _write_table(shm, table)
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+
+    return SharedMemoryPandasObject(
+        shm_name=shm.name,
+        size=size,
+        is_series=isinstance(value, pd.Series),
+        series_name=value.name if isinstance(value, pd.Series) else None,
+        attrs=value.attrs,
+    )
+
+
+def from_shared_memory(value: Any, unlink: bool = False) -> Any:
+    """Read pandas object from shared memory if value is a handle
+
+    All other values are returned unchanged. If unlink is True the shared memory block
+    is freed after reading.
+    """
+    if not isinstance(value, SharedMemoryPandasObject):
+        return value
+
+    shm = SharedMemory(name=value.shm_name)
+    try:
+        # Copy out of the block in one go, so that the resulting pandas object does
+        # not reference the shared memory, which may be unlinked afterwards.
+        payload = pa.py_buffer(bytes(shm.buf[: value.size]))
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+
+    with pa.ipc.open_stream(payload) as reader:
+        frame = reader.read_all().to_pandas()
+
+    result: pd.Series | pd.DataFrame = (
+        frame[SERIES_COLUMN_NAME].rename(value.series_name)
+        if value.is_series
+        else frame
+    )
+    result.attrs = value.attrs
+    return result
+
+
+def release_shared_memory(value: Any) -> None:
+    """Unlink the shared memory block if value is a handle"""
+    if not isinstance(value, SharedMemoryPandasObject):
+        return
+    try:
+        shm = SharedMemory(name=value.shm_name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
@@ -0,0 +1,224 @@
+"""Windowed execution of workflows over long time ranges
+
+Instead of loading the complete time range given by the timestampFrom and timestampTo
+filters of the input wirings at once, a windowed execution splits it into windows and
+executes the workflow for one window after another. The outputs of every window are
+restricted to the window and sent to the sinks before the next window is loaded, so
+that the memory needed does not grow with the length of the time range.
+
+Components like moving averages need data before a point in time to compute their
+outputs at this point in time. They declare this lookback via the register decorator,
+either as fixed duration or as the name of the input providing it (e.g. the window size
+of a moving average). The lookbacks of operators one after another add up. Every window
+but the first is loaded with an overlap of the largest such sum, which is determined
+from the input values of the first window. The first window starts at the beginning of
+the time range, like a complete execution would.
+"""
+import datetime
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from hetdesrun.adapters.generic_rest.timestamps import format_timestamps
+from hetdesrun.models.wiring import FilterKey, WorkflowWiring
+from hetdesrun.runtime.engine.plain.plan import ExecutionPlan, PlanStep
+
+TIMESTAMP_FROM_FILTER_KEY = FilterKey("timestampFrom")
+TIMESTAMP_TO_FILTER_KEY = FilterKey("timestampTo")
+TIMESTAMP_FILTER_KEYS = (TIMESTAMP_FROM_FILTER_KEY, TIMESTAMP_TO_FILTER_KEY)
+
+
+class WindowingError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ExecutionWindow:
+    start: pd.Timestamp
+    end: pd.Timestamp
+    # the end of the last window belongs to it, like the end of the time range
+    is_last: bool
+
+
+def parse_filter_timestamp(timestamp: str) -> pd.Timestamp:
+    parsed_timestamp = pd.Timestamp(timestamp)
+    if parsed_timestamp.tz is None:
+        return parsed_timestamp.tz_localize("UTC")
+    return parsed_timestamp.tz_convert("UTC")
+
+
+def is_time_filtered(filters: dict[FilterKey, str | None]) -> bool:
+    return all(bool(filters.get(key)) for key in TIMESTAMP_FILTER_KEYS)
+
+
+def time_range_of_wiring(
+    workflow_wiring: WorkflowWiring,
+) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Common time range of all input wirings with timestamp filters
+
+    Raises WindowingError if there is no such input wiring or the time ranges differ.
+    """
+    time_ranges = set()
+    for input_wiring in workflow_wiring.input_wirings:
+        if not is_time_filtered(input_wiring.filters):
+            continue
+        try:
+            time_ranges.add(
+                tuple(
+                    parse_filter_timestamp(input_wiring.filters[key])  # type: ignore
+                    for key in TIMESTAMP_FILTER_KEYS
+                )
+            )
+        except ValueError as e:
+            raise WindowingError(
+                "Could not parse the timestamp filters of the input wiring for"
+                f" {input_wiring.workflow_input_name}: {str(e)}"
+            ) from e
+
+    if len(time_ranges) == 0:
+        raise WindowingError(
+            "Windowed execution requires input wirings with timestampFrom"
+            " and timestampTo filters."
+        )
+    if len(time_ranges) > 1:
+        raise WindowingError(
+            "Windowed execution requires the same timestampFrom and timestampTo"
+            " filters for all input wirings with timestamp filters."
+        )
+    start, end = time_ranges.pop()
+    if start > end:
+        raise WindowingError("timestampFrom must not be after timestampTo.")
+    return start, end
+
+
+def split_into_windows(
+    start: pd.Timestamp, end: pd.Timestamp, window: datetime.timedelta
+) -> list[ExecutionWindow]:
+    window_starts = [start]
+    while window_starts[-1] + window < end:
+        window_starts.append(window_starts[-1] + window)
+    return [
+        ExecutionWindow(
+            start=window_start,
+            end=min(window_start + window, end),
+            is_last=index == len(window_starts) - 1,
+        )
+        for index, window_start in enumerate(window_starts)
+    ]
+
+
+def wiring_for_window(
+    workflow_wiring: WorkflowWiring, load_from: pd.Timestamp, load_to: pd.Timestamp
+) -> WorkflowWiring:
+    """Copy of the wiring with the timestamp filters set to the given range"""
+    windowed_wiring = workflow_wiring.copy(deep=True)
+    filter_from, filter_to = format_timestamps(
+        pd.DatetimeIndex([load_from, load_to])
+    ).tolist()
+    for input_wiring in windowed_wiring.input_wirings:
+        if is_time_filtered(input_wiring.filters):
+            input_wiring.filters[TIMESTAMP_FROM_FILTER_KEY] = filter_from
+            input_wiring.filters[TIMESTAMP_TO_FILTER_KEY] = filter_to
+    return windowed_wiring
+
+
+def _in_window(timestamps: pd.Series | pd.Index, window: ExecutionWindow) -> Any:
+    start, end = window.start, window.end
+    if getattr(timestamps.dtype, "tz", None) is None:
+        start, end = start.tz_localize(None), end.tz_localize(None)
+    before_end = timestamps <= end if window.is_last else timestamps < end
+    return (timestamps >= start) & before_end
+
+
+def restrict_to_window(value: Any, window: ExecutionWindow) -> Any:
+    """Restrict timeseries data to the window
+
+    Series and DataFrames with a datetime index are restricted by their index,
+    DataFrames with a datetime timestamp column (e.g. MULTITSFRAMEs) by this column.
+    All other values are returned unchanged.
+    """
+    if isinstance(value, pd.Series | pd.DataFrame) and isinstance(
+        value.index, pd.DatetimeIndex
+    ):
+        return value[_in_window(value.index, window)]
+    if (
+        isinstance(value, pd.DataFrame)
+        and "timestamp" in value.columns
+        and pd.api.types.is_datetime64_any_dtype(value["timestamp"])
+    ):
+        return value[_in_window(value["timestamp"], window)]
+    return value
+
+
+def combine_window_values(values: list[Any]) -> Any:
+    """Combine the values of an output over all windows
+
+    Series and DataFrames are concatenated. For all other values, e.g. plots, the value
+    of the last window is returned.
+    """
+    if all(isinstance(value, pd.Series) for value in values) or all(
+        isinstance(value, pd.DataFrame) for value in values
+    ):
+        return pd.concat(
+            values, ignore_index=not isinstance(values[0].index, pd.DatetimeIndex)
+        )
+    return values[-1]
+
+
+def _declared_lookback(
+    step: PlanStep,
+    input_values: dict[str, Any],
+    step_results: dict[int, dict[str, Any]],
+) -> datetime.timedelta:
+    lookback = step.node.lookback
+    if lookback is None:
+        return datetime.timedelta(0)
+    if isinstance(lookback, datetime.timedelta):
+        return lookback
+
+    edge = step.inputs.get(lookback)
+    if edge is None:
+        return datetime.timedelta(0)
+    if edge.step is None:
+        value = input_values.get(edge.output_name)
+    elif edge.step in step_results:
+        value = step_results[edge.step].get(edge.output_name)
+    else:
+        # the providing step was not run, so neither was this step
+        return datetime.timedelta(0)
+
+    try:
+        return pd.Timedelta(value).to_pytimedelta()  # type: ignore[no-any-return]
+    except (ValueError, TypeError) as e:
+        raise WindowingError(
+            f"Could not determine the lookback of operator"
+            f" {step.node.operator_hierarchical_name} from the value {str(value)}"
+            f" of its input {lookback}: {str(e)}"
+        ) from e
+
+
+def required_lookback(
+    plan: ExecutionPlan,
+    input_values: dict[str, Any],
+    step_results: dict[int, dict[str, Any]],
+) -> datetime.timedelta:
+    """Largest sum of declared lookbacks along the paths of the plan
+
+    Lookbacks given as input names are determined from the input values of the
+    workflow and the results of the steps of an execution of the plan.
+    """
+    lookbacks: list[datetime.timedelta] = []
+    for step in plan.steps:
+        lookback_of_inputs = max(
+            (
+                lookbacks[edge.step]
+                for edge in step.inputs.values()
+                if edge.step is not None
+            ),
+            default=datetime.timedelta(0),
+        )
+        lookbacks.append(
+            lookback_of_inputs + _declared_lookback(step, input_values, step_results)
+        )
+    return max(lookbacks, default=datetime.timedelta(0))
@@ -1,24 +1,22 @@
+import copy
+import datetime
 from collections.abc import Callable, Coroutine
 from inspect import Parameter, signature
 from typing import Any, Protocol
 
-from cached_property import cached_property  # async compatible variant
 from pydantic import ValidationError
 
 from hetdesrun.datatypes import NamedDataTypedValue, parse_dynamically_from_datatypes
 from hetdesrun.runtime import runtime_execution_logger
-from hetdesrun.runtime.configuration import execution_config
 from hetdesrun.runtime.context import ExecutionContext
 from hetdesrun.runtime.engine.plain.execution import run_func_or_coroutine
 from hetdesrun.runtime.exceptions import (
-    CircularDependency,
-    MissingInputSource,
-    MissingOutputException,
     RuntimeExecutionError,
     WorkflowInputDataValidationError,
 )
 from hetdesrun.runtime.logging import execution_context_filter
 from hetdesrun.utils import Type
+from hetdesrun.webservice.config import SyncComponentExecutor
 
 runtime_execution_logger.addFilter(execution_context_filter)
 
@@ -26,19 +24,10 @@ runtime_execution_logger.addFilter(execution_context_filter)
 class Node(Protocol):
     """Protocol for common structural type features for workflow (sub)nodes"""
 
-    # Note: The result attribute should be defined to be a cached_property in actual implementations
-    # to avoid recomputing the result several times when values are accessed as inputs for more than
-    # one other node.
-
-    _in_computation: bool = False
     has_only_plot_outputs: bool = False
     operator_hierarchical_id: str = "UNKNOWN"
     operator_hierarchical_name: str = "UNKNOWN"
 
-    @cached_property
-    async def result(self) -> dict[str, Any]:  # Outputs can have any type
-        ...
-
     def add_inputs(self, new_inputs: dict[str, tuple["Node", str]]) -> None:
         ...
 
@@ -54,11 +43,9 @@ class ComputationNode:
     Which inputs are actually required depends implicitely on the actual function. This allows
     the function to have true optional (keyword) arguments.
 
-    The result is a cached property such that computation only runs once during the node's lifetime.
-    The computation collects result from other computation nodes result properties and therefore may
-    trigger a self-organizing computation graph execution.
-
-    Circular dependencies are detected during computation and an appropriate exception is raised.
+    Nodes are run by compiling the workflow containing them into an execution plan (see plan
+    module), which obtains the input values from the results of the providing nodes. Missing
+    inputs and circular dependencies are detected during compilation.
     """
 
     def __init__(
@@ -66,11 +53,18 @@ class ComputationNode:
         func: Coroutine | Callable,
         inputs: dict[str, tuple[Node, str]] | None = None,
         has_only_plot_outputs: bool = False,
+        has_side_effects: bool = False,
+        cacheable: bool = False,
+        lookback: str | datetime.timedelta | None = None,
+        constant_values: dict[str, Any] | None = None,
         component_id: str = "UNKNOWN",
         component_name: str = "UNKNOWN",
         component_tag: str = "UNKNOWN",
         operator_hierarchical_id: str = "UNKNOWN",
         operator_hierarchical_name: str = "UNKNOWN",
+        executor: SyncComponentExecutor | None = None,
+        code: str | None = None,
+        func_name: str | None = None,
     ) -> None:
         """
         inputs is a dict {input_name : (another_node, output_name)}, i.e. mapping input names to
@@ -82,15 +76,26 @@ class ComputationNode:
         operator_hierarchical_id, component_id, operator_hierarchical_name and component_name can be
         provided to enrich logging and exception messages.
 
-        The computation node inputs may or may not be complete, i.e. all required inputs are given
-        or not. If not complete, computation of result may simply fail, e.g. with
-            TypeError: <lambda>() missing 1 required positional argument: 'base_value'
-        or
-            TypeError: f() missing 1 required keyword-only argument: 'base_value'
+        has_side_effects marks nodes which must be run even if their outputs are not used.
+
+        cacheable marks nodes whose results only depend on their inputs. The plan executor
+        reuses cached results for them (see result_cache module).
 
-        However the availability of all inputs is checked during execution by inspecting the
-        provided func and comparing to currently set inputs. MissingInputSource exception is
-        raised if inputs are missing.
+        lookback is the duration of data before a time window which the node needs to compute
+        its outputs within the window, or the name of the input providing this duration (see
+        windowing module).
+
+        constant_values are the outputs of a node providing constant values. They allow to
+        detect changed constants without running the node (see sessions module).
+
+        executor determines where func is run if it is not a coroutine function. If None, the
+        configured default is used. Running func in a worker process requires the code of the
+        module defining func and the name of func in this module.
+
+        The computation node inputs may or may not be complete, i.e. all required inputs are given
+        or not. The availability of all inputs is checked when compiling the workflow by
+        inspecting the provided func and comparing to currently set inputs. MissingInputSource
+        exception is raised if inputs are missing.
 
         """
         self.inputs: dict[str, tuple[Node, str]] = {}
@@ -98,12 +103,17 @@ class ComputationNode:
             self.add_inputs(inputs)
 
         self.func = func
+        self.executor = executor
+        self.code = code
+        self.func_name = func_name
 
         self.required_params = self._infer_required_params()
 
-        self._in_computation = False  # to detect cycles
-
         self.has_only_plot_outputs = has_only_plot_outputs
+        self.has_side_effects = has_side_effects
+        self.cacheable = cacheable
+        self.lookback = lookback
+        self.constant_values = constant_values
         self.operator_hierarchical_id = operator_hierarchical_id
         self.operator_hierarchical_name = operator_hierarchical_name
         self.context = ExecutionContext(
@@ -116,7 +126,6 @@ class ComputationNode:
             currently_executed_operator_hierarchical_id=self.operator_hierarchical_id,
             currently_executed_operator_hierarchical_name=self.operator_hierarchical_name,
         )
-        self._in_computation = False
 
     def add_inputs(self, new_inputs: dict[str, tuple[Node, str]]) -> None:
         self.inputs.update(new_inputs)
@@ -133,53 +142,15 @@ class ComputationNode:
             param.name for param in kwargable_params if param.default is Parameter.empty
         ]
 
-    def all_required_inputs_set(self) -> bool:
-        return set(self.required_params).issubset(set(self.inputs.keys()))
-
-    def _check_inputs(self) -> None:
-        """Check and handle missing inputs"""
-        if not self.all_required_inputs_set():
-            runtime_execution_logger.warning(
-                "Computation node execution failed due to missing input source"
-            )
-            raise MissingInputSource(
-                "Inputs of computation node are missing"
-            ).set_context(self.context)
-
-    async def _gather_data_from_inputs(self) -> dict[str, Any]:
-        """Get data from inputs and handle possible cycles"""
-
-        input_value_dict: dict[str, Any] = {}
-
-        for input_name, (another_node, output_name) in self.inputs.items():
-            # Cycle detection logic
-            if another_node._in_computation:
-                msg = (
-                    f"Circular Dependency detected whith input '{input_name}' pointing to "
-                    f"output '{output_name}' of operator {another_node.operator_hierarchical_id}"
-                )
-                runtime_execution_logger.warning(msg)
-                raise CircularDependency(msg).set_context(self.context)
-            # actually get input data from other nodes
-            try:
-                input_value_dict[input_name] = (await another_node.result)[output_name]
-            except KeyError as e:
-                # possibly an output_name missing in the result dict of one of the providing nodes!
-                runtime_execution_logger.warning(
-                    "Execution failed due to missing output of a node",
-                    exc_info=True,
-                )
-                raise MissingOutputException(
-                    "Could not obtain output result from another node while preparing to "
-                    "run operator"
-                ).set_context(self.context) from e
-        return input_value_dict
-
     async def _run_comp_func(self, input_values: dict[str, Any]) -> dict[str, Any]:
         """Running the component func with exception handling"""
         try:
             function_result: dict[str, Any] = await run_func_or_coroutine(
-                self.func, input_values  # type: ignore
+                self.func,  # type: ignore
+                input_values,
+                executor=self.executor,
+                code=self.code,
+                func_name=self.func_name,
             )
             function_result = function_result if function_result is not None else {}
         except (
@@ -208,30 +179,19 @@ class ComputationNode:
 
         return function_result
 
-    async def _compute_result(self) -> dict[str, Any]:
-        # set filter for contextualized logging
+    async def compute(self, input_values: dict[str, Any]) -> dict[str, Any]:
+        """Run the component function on already gathered input values
+
+        This is used by the plan executor, which takes care of obtaining the input values
+        from the results of the providing nodes itself.
+        """
         execution_context_filter.bind_context(**self.context.dict())
 
         runtime_execution_logger.info("Starting computation")
-        self._in_computation = True
-
-        self._check_inputs()
-
-        # Gather data from input sources (detects cycles):
-        input_values = await self._gather_data_from_inputs()
-
-        # Actual execution of current node
-        function_result = await self._run_comp_func(input_values)
-
-        # cleanup
-        self._in_computation = False
-        execution_context_filter.clear_context()
-
-        return function_result
-
-    @cached_property  # compute each nodes result only once
-    async def result(self) -> dict[str, Any]:
-        return await self._compute_result()
+        try:
+            return await self._run_comp_func(input_values)
+        finally:
+            execution_context_filter.clear_context()
 
 
 class Workflow:
@@ -289,7 +249,6 @@ class Workflow:
         if inputs is not None:
             self.add_inputs(inputs)
 
-        self._in_computation: bool = False
         self.has_only_plot_outputs = has_only_plot_outputs
         self.operator_hierarchical_id = operator_hierarchical_id
         self.operator_hierarchical_name = operator_hierarchical_name
@@ -311,6 +270,16 @@ class Workflow:
             sub_node, sub_node_input_name = self.input_mappings[key]
             sub_node.add_inputs({sub_node_input_name: (another_node, output_name)})
 
+    def parse_input_values(self, values: list[NamedDataTypedValue]) -> dict[str, Any]:
+        """Parse values for workflow inputs into their respective data types"""
+        try:
+            return parse_dynamically_from_datatypes(values).dict()
+        except ValidationError as e:
+            raise WorkflowInputDataValidationError(
+                "The provided data or some constant values could not be parsed into the "
+                "respective workflow input datatypes"
+            ).set_context(self.context) from e
+
     def add_constant_providing_node(
         self,
         values: list[NamedDataTypedValue],
@@ -318,90 +287,25 @@ class Workflow:
         id_suffix: str = "",
     ) -> None:
         """Add a node with no inputs providing workflow input data"""
-        try:
-            parsed_values = parse_dynamically_from_datatypes(values).dict()
-        except ValidationError as e:
-            raise WorkflowInputDataValidationError(
-                "The provided data or some constant values could not be parsed into the "
-                "respective workflow input datatypes"
-            ).set_context(self.context) from e
+        parsed_values = self.parse_input_values(values)
 
         Const_Node = ComputationNode(
-            func=lambda: parsed_values,
+            # copy, since the node may be part of a cached execution plan and components
+            # may modify their inputs in place
+            func=lambda: copy.deepcopy(parsed_values),
             inputs={},
+            constant_values=parsed_values,
             operator_hierarchical_name=self.operator_hierarchical_name
             + "constant_provider_"
             + id_suffix
             + "\\",
             operator_hierarchical_id=self.operator_hierarchical_id + "" + "\\",
+            executor=SyncComponentExecutor.EVENT_LOOP,
         )
         if add_new_provider_node_to_workflow:  # make it part of the workflow
             self.sub_nodes.append(Const_Node)
         self.add_inputs({key: (Const_Node, key) for key in parsed_values})
 
-    def _wire_workflow_inputs(self) -> None:
-        """Wire the current inputs via the current input mappings to the appropriate sub nodes"""
-        for (
-            wf_inp_name,
-            (sub_node, sub_node_input_name),
-        ) in self.input_mappings.items():
-            try:
-                sub_node.add_inputs({sub_node_input_name: self.inputs[wf_inp_name]})
-            except KeyError as error:
-                inputs_string = ",".join(self.inputs.keys())
-                raise MissingInputSource(
-                    f"The input mapping with workflow input '{wf_inp_name}' to "
-                    f"subnode input '{sub_node_input_name}' of "
-                    f"subnode '{sub_node.operator_hierarchical_id}'"
-                    f"does not match the inputs of the workflow {inputs_string}."
-                ).set_context(self.context) from error
-
-    @cached_property
-    async def result(self) -> dict[str, Any]:
-        self._wire_workflow_inputs()
-
-        execution_context_filter.bind_context(**self.context.dict())
-
-        runtime_execution_logger.info("Starting computation")
-
-        # gather result from workflow operators
-        results = {}
-        exe_context_config = execution_config.get()
-
-        for (
-            wf_output_name,
-            (
-                sub_node,
-                sub_node_output_name,
-            ),
-        ) in self.output_mappings.items():
-            try:
-                results[wf_output_name] = (
-                    (await sub_node.result)[sub_node_output_name]
-                    if not (
-                        sub_node.has_only_plot_outputs is True
-                        and exe_context_config.run_pure_plot_operators is False
-                    )
-                    else {}
-                )
-            except KeyError as e:
-                # possibly an output_name missing in the result dict of one of the providing nodes!
-                runtime_execution_logger.warning(
-                    "Execution failed due to missing output of a node",
-                    exc_info=True,
-                )
-                raise MissingOutputException(
-                    "Could not obtain output result from another node while preparing to "
-                    "run operator"
-                ).set_context(self.context) from e
-            except RuntimeExecutionError as e:
-                raise e
-
-        # cleanup
-        execution_context_filter.clear_context()
-
-        return results
-
 
 def obtain_all_nodes(wf: Workflow) -> list[ComputationNode]:
     all_nodes: list[ComputationNode] = []
@@ -0,0 +1,40 @@
+"""Multi-core execution engine
+
+The process engine executes the same compiled plan as the plain engine. But it
+starts every step as soon as its inputs are available and runs every synchronous component
+in the pool of worker processes, unless the component explicitly requests another
+executor. Hence independent branches of a workflow run on different cores. Large
+Pandas objects are handed to and from the worker processes via shared memory
+(see hetdesrun.runtime.engine.plain.transfer).
+"""
+import logging
+from typing import Any
+
+from hetdesrun.runtime import runtime_execution_logger
+from hetdesrun.runtime.configuration import execution_config
+from hetdesrun.runtime.engine.plain.plan import (
+    ExecutionPlan,
+    PlanExecutionResult,
+    execute_plan,
+)
+from hetdesrun.runtime.logging import execution_context_filter
+
+logger = logging.getLogger(__name__)
+
+
+logger.addFilter(execution_context_filter)
+runtime_execution_logger.addFilter(execution_context_filter)
+
+
+async def workflow_execution_process(
+    plan: ExecutionPlan,
+    input_values: dict[str, Any] | None = None,
+    reusable_results: dict[int, dict[str, Any]] | None = None,
+) -> PlanExecutionResult:
+    configuration_token = execution_config.set(
+        execution_config.get().copy(update={"gather_inputs_concurrently": True})
+    )
+    try:
+        return await execute_plan(plan, input_values, reusable_results)
+    finally:
+        execution_config.reset(configuration_token)
@@ -60,13 +60,20 @@ class ExecutionContextFilter(logging.Filter):
         super().__init__(*args, **kwargs)
 
     def bind_context(self, **kwargs: Any) -> None:
-        _get_execution_context().update(kwargs)
+        # Set a new dict instead of updating the existing one in place: Tasks share the
+        # dict object of the context they were created from, so updating in place would
+        # leak context information between concurrently executed operators.
+        _WF_EXEC_LOGGING_CONTEXT_VAR.set({**_get_execution_context(), **kwargs})
 
     def unbind_context(self, *args: str) -> None:
         """Remove entries with provided keys from context"""
-        ctx_dict = _get_execution_context()
-        for key in args:
-            ctx_dict.pop(key, None)
+        _WF_EXEC_LOGGING_CONTEXT_VAR.set(
+            {
+                key: value
+                for key, value in _get_execution_context().items()
+                if key not in args
+            }
+        )
 
     def clear_context(self) -> None:
         _WF_EXEC_LOGGING_CONTEXT_VAR.set({})
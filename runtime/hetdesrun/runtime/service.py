@@ -1,81 +1,436 @@
+import asyncio
+import datetime
 import traceback
+from collections import defaultdict
+from typing import Any
+from uuid import UUID
 
+import pandas as pd
 from fastapi.encoders import jsonable_encoder
 
 from hetdesrun.adapters import AdapterHandlingException
 from hetdesrun.datatypes import NamedDataTypedValue
 from hetdesrun.models.run import (
+    BatchWorkflowExecutionInput,
+    BatchWorkflowExecutionResult,
+    ExecutionEngine,
+    IncrementalExecutionInfo,
     PerformanceMeasuredStep,
+    WindowedExecutionInfo,
     WorkflowExecutionInput,
     WorkflowExecutionResult,
 )
+from hetdesrun.models.wiring import WorkflowWiring
 from hetdesrun.runtime import RuntimeExecutionError, runtime_logger
 from hetdesrun.runtime.configuration import execution_config
 from hetdesrun.runtime.engine.plain import workflow_execution_plain
-from hetdesrun.runtime.engine.plain.parsing import (
-    WorkflowParsingException,
-    parse_workflow_input,
+from hetdesrun.runtime.engine.plain.compilation_cache import (
+    CompiledWorkflow,
+    obtain_compiled_workflow,
 )
-from hetdesrun.runtime.engine.plain.workflow import obtain_all_nodes
+from hetdesrun.runtime.engine.plain.parsing import WorkflowParsingException
+from hetdesrun.runtime.engine.plain.plan import ExecutionPlan, PlanExecutionResult
+from hetdesrun.runtime.engine.plain.sessions import (
+    ExecutionSession,
+    execution_sessions,
+    input_fingerprints,
+)
+from hetdesrun.runtime.engine.plain.transfer import arrow_compatible_frame
+from hetdesrun.runtime.engine.plain.windowing import (
+    WindowingError,
+    combine_window_values,
+    required_lookback,
+    restrict_to_window,
+    split_into_windows,
+    time_range_of_wiring,
+    wiring_for_window,
+)
+from hetdesrun.runtime.engine.process import workflow_execution_process
 from hetdesrun.runtime.exceptions import WorkflowInputDataValidationError
 from hetdesrun.runtime.logging import execution_context_filter, job_id_context_filter
 from hetdesrun.utils import model_to_pretty_json_str
+from hetdesrun.webservice.config import get_config
 from hetdesrun.wiring import (
     resolve_and_load_data_from_wiring,
+    resolve_and_load_data_from_wirings,
     resolve_and_send_data_from_wiring,
 )
 
 runtime_logger.addFilter(job_id_context_filter)
 
 
-async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
-    runtime_input: WorkflowExecutionInput,
+def runtime_execution_error_message(e: RuntimeExecutionError) -> str:
+    return (
+        "Exception during execution!\n"
+        f"                  tr type: {e.currently_executed_transformation_type},"
+        f" tr id: {e.currently_executed_transformation_id},"
+        f" tr name: {e.currently_executed_transformation_name},"
+        f" tr tag: {e.currently_executed_transformation_tag},\n"
+        f"                  op id(s): {e.currently_executed_hierarchical_operator_id},\n"
+        f"                  op name(s): {e.currently_executed_hierarchical_operator_name}\n"
+        f"                  reason: {e}"
+    )
+
+
+def compile_runtime_input(
+    runtime_input: WorkflowExecutionInput | BatchWorkflowExecutionInput,
+) -> CompiledWorkflow:
+    return obtain_compiled_workflow(
+        runtime_input.workflow, runtime_input.components, runtime_input.code_modules
+    )
+
+
+def compilation_failure_result(
+    e: WorkflowParsingException
+    | WorkflowInputDataValidationError
+    | RuntimeExecutionError,
+    job_id: UUID,
 ) -> WorkflowExecutionResult:
-    """Running stuff with appropriate error handling, serializing etc.
+    """Failure result for an exception raised by compile_runtime_input
 
-    This function is used by the runtime endpoint
+    Must be called in the except block handling the exception.
     """
+    if isinstance(e, RuntimeExecutionError):
+        runtime_logger.info(
+            "Runtime Execution Error during workflow compilation",
+            exc_info=True,
+        )
+        error = runtime_execution_error_message(e)
+    else:
+        runtime_logger.info(
+            "Workflow Parsing Exception during workflow execution",
+            exc_info=True,
+        )
+        error = str(e)
+    return WorkflowExecutionResult(
+        result="failure",
+        error=error,
+        traceback=traceback.format_exc(),
+        output_results_by_output_name={},
+        job_id=job_id,
+    )
 
-    runtime_service_measured_step = PerformanceMeasuredStep.create_and_begin(
-        "runtime_service"
+
+async def run_plan(
+    execution_plan: ExecutionPlan,
+    input_values: dict[str, Any],
+    reusable_results: dict[int, dict[str, Any]] | None,
+    engine: ExecutionEngine,
+) -> PlanExecutionResult:
+    if engine is ExecutionEngine.Process:
+        return await workflow_execution_process(
+            execution_plan, input_values, reusable_results
+        )
+    return await workflow_execution_plain(
+        execution_plan, input_values, reusable_results
     )
 
-    execution_config.set(runtime_input.configuration)
-    execution_context_filter.bind_context(
-        currently_executed_job_id=runtime_input.job_id
+
+def parse_loaded_data(
+    runtime_input: WorkflowExecutionInput,
+    execution_plan: ExecutionPlan,
+    loaded_data: dict[str, Any],
+) -> dict[str, Any]:
+    wf_inputs_by_name = {inp.name: inp for inp in runtime_input.workflow.inputs}
+    return execution_plan.workflow.parse_input_values(
+        [
+            NamedDataTypedValue(
+                name=inp_name,
+                value=loaded_value,
+                type=wf_inputs_by_name[inp_name].type,
+            )
+            for (inp_name, loaded_value) in loaded_data.items()
+        ]
     )
-    job_id_context_filter.bind_context(currently_executed_job_id=runtime_input.job_id)
 
+
+def check_serializable(
+    wf_exec_result: WorkflowExecutionResult, binary_tables: bool = False
+) -> WorkflowExecutionResult:
+    """Return a failure result instead if the result cannot be serialized
+
+    If binary_tables is set, the outputs are transported as binary tables where
+    possible (see result_transport module). These Series and DataFrames are not
+    encoded as JSON and hence not checked, which would take longer than encoding
+    them as tables.
+    """
     runtime_logger.info(
-        "WORKFLOW EXECUTION INPUT JSON:\n%s",
-        model_to_pretty_json_str(runtime_input),
+        "Workflow Execution Result Pydantic Object: \n%s",
+        wf_exec_result,
     )
 
-    # Parse Workflow
+    # catch arbitrary serialisation errors
+    # (because user can produce arbitrary non-serializable objects)
+    try:
+        if binary_tables:
+            jsonable_encoder(
+                wf_exec_result.copy(
+                    update={
+                        "output_results_by_output_name": {
+                            output_name: value
+                            for output_name, value in (
+                                wf_exec_result.output_results_by_output_name.items()
+                            )
+                            if not (
+                                isinstance(value, pd.Series | pd.DataFrame)
+                                and arrow_compatible_frame(value) is not None
+                            )
+                        }
+                    }
+                )
+            )
+        else:
+            jsonable_encoder(wf_exec_result)
+    except Exception as e:  # noqa: BLE001
+        runtime_logger.info(
+            "Exception during workflow execution response serialisation: %s",
+            str(e),
+            exc_info=True,
+        )
+        return WorkflowExecutionResult(
+            result="failure",
+            error=(
+                f"Exception during workflow execution response serialisation: {str(e)}"
+            ),
+            traceback=traceback.format_exc(),
+            output_results_by_output_id={},
+            output_results_by_output_name={},
+            job_id=wf_exec_result.job_id,
+        )
+
+    runtime_logger.info("Workflow Execution Result serialized successfully.")
+    return wf_exec_result
+
+
+async def windowed_runtime_service(
+    runtime_input: WorkflowExecutionInput, execution_plan: ExecutionPlan
+) -> WorkflowExecutionResult:
+    """Execute the workflow for one time window after another
+
+    See the windowing module. The outputs of every window are sent to the sinks before
+    the next window is loaded. Outputs which are returned directly are combined over
+    all windows.
+    """
+    configuration = runtime_input.configuration
+    window_overlap = configuration.window_overlap
+    window = None
+    direct_return_values: dict[str, list[Any]] = defaultdict(list)
+
     try:
-        parsed_wf = parse_workflow_input(
-            runtime_input.workflow, runtime_input.components, runtime_input.code_modules
+        start, end = time_range_of_wiring(runtime_input.workflow_wiring)
+        windows = split_into_windows(
+            start, end, configuration.execution_window  # type: ignore[arg-type]
         )
-    except (WorkflowParsingException, WorkflowInputDataValidationError) as e:
+        for window in windows:
+            window_wiring = wiring_for_window(
+                runtime_input.workflow_wiring,
+                max(start, window.start - (window_overlap or datetime.timedelta(0))),
+                window.end,
+            )
+            input_values = parse_loaded_data(
+                runtime_input,
+                execution_plan,
+                await resolve_and_load_data_from_wiring(window_wiring),
+            )
+            plan_result = await run_plan(
+                execution_plan,
+                input_values,
+                # step results of the first window are needed to determine the lookback
+                {} if window_overlap is None else None,
+                configuration.engine,
+            )
+            if window_overlap is None:
+                window_overlap = required_lookback(
+                    execution_plan,
+                    input_values,
+                    plan_result.step_results,  # type: ignore[arg-type]
+                )
+                runtime_logger.info(
+                    "Loading windows with an overlap of %s", window_overlap
+                )
+
+            direct_return_data = await resolve_and_send_data_from_wiring(
+                window_wiring,
+                {
+                    output_name: restrict_to_window(value, window)
+                    for output_name, value in plan_result.outputs.items()
+                },
+            )
+            for output_name, value in direct_return_data.items():
+                direct_return_values[output_name].append(value)
+    except (
+        AdapterHandlingException,
+        WindowingError,
+        WorkflowInputDataValidationError,
+        WorkflowParsingException,
+        RuntimeExecutionError,
+    ) as e:
         runtime_logger.info(
-            "Workflow Parsing Exception during workflow execution",
+            "Exception during windowed execution."
+            " Sending data to external sources may be partly done.",
             exc_info=True,
         )
+        error = (
+            runtime_execution_error_message(e)
+            if isinstance(e, RuntimeExecutionError)
+            else str(e)
+        )
         return WorkflowExecutionResult(
             result="failure",
-            error=str(e),
+            error=error
+            if window is None
+            else f"Window from {window.start} to {window.end}: {error}",
             traceback=traceback.format_exc(),
             output_results_by_output_name={},
             job_id=runtime_input.job_id,
         )
 
+    wf_exec_result = WorkflowExecutionResult(
+        result="ok",
+        output_results_by_output_name={
+            output_name: combine_window_values(values)
+            for output_name, values in direct_return_values.items()
+        },
+        job_id=runtime_input.job_id,
+    )
+    wf_exec_result.measured_steps.windowed_execution = WindowedExecutionInfo(
+        window_count=len(windows),
+        window_overlap=window_overlap or datetime.timedelta(0),
+    )
+    return wf_exec_result
+
+
+async def load_data_in_session(
+    workflow_wiring: WorkflowWiring, session: ExecutionSession
+) -> tuple[dict[str, Any], list[str]]:
+    """Load only data of input wirings which changed since the last session execution
+
+    Returns the data by workflow input name and the names of the inputs whose data
+    from the last execution was reused.
+    """
+    wiring_jsons = {
+        input_wiring.workflow_input_name: input_wiring.json()
+        for input_wiring in workflow_wiring.input_wirings
+    }
+    reused_input_names = [
+        input_name
+        for input_name, wiring_json in wiring_jsons.items()
+        if input_name in session.loaded_data
+        and session.loaded_data[input_name][0] == wiring_json
+    ]
+    loaded_data = await resolve_and_load_data_from_wiring(
+        WorkflowWiring(
+            input_wirings=[
+                input_wiring
+                for input_wiring in workflow_wiring.input_wirings
+                if input_wiring.workflow_input_name not in reused_input_names
+            ]
+        )
+    )
+    loaded_data.update(
+        {
+            input_name: session.loaded_data[input_name][1]
+            for input_name in reused_input_names
+        }
+    )
+    session.loaded_data = {
+        input_name: (wiring_json, loaded_data[input_name])
+        for input_name, wiring_json in wiring_jsons.items()
+        if input_name in loaded_data
+    }
+    return loaded_data, reused_input_names
+
+
+async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
+    runtime_input: WorkflowExecutionInput,
+    compiled_workflow: CompiledWorkflow | None = None,
+    loaded_data: dict[str, Any] | None = None,
+    binary_tables: bool = False,
+) -> WorkflowExecutionResult:
+    """Running stuff with appropriate error handling, serializing etc.
+
+    This function is used by the runtime endpoint
+
+    Batch executions provide the compiled workflow and possibly the already loaded data
+    for the workflow inputs, in which case parsing and loading are skipped.
+
+    binary_tables must be set if the result is transported with binary tables, see
+    check_serializable.
+    """
+
+    runtime_service_measured_step = PerformanceMeasuredStep.create_and_begin(
+        "runtime_service"
+    )
+
+    execution_config.set(runtime_input.configuration)
+    execution_context_filter.bind_context(
+        currently_executed_job_id=runtime_input.job_id
+    )
+    job_id_context_filter.bind_context(currently_executed_job_id=runtime_input.job_id)
+
+    parse_workflow_measured_step: PerformanceMeasuredStep | None = None
+    if compiled_workflow is not None:
+        # the workflow is logged once for the complete batch
+        runtime_logger.info(
+            "WORKFLOW EXECUTION WIRING JSON:\n%s",
+            model_to_pretty_json_str(runtime_input.workflow_wiring),
+        )
+    else:
+        runtime_logger.info(
+            "WORKFLOW EXECUTION INPUT JSON:\n%s",
+            model_to_pretty_json_str(runtime_input),
+        )
+
+        # Parse and compile Workflow
+        # Compiling detects cycles and missing inputs before any component code runs.
+        try:
+            parse_workflow_measured_step = PerformanceMeasuredStep.create_and_begin(
+                "parse_workflow"
+            )
+            compiled_workflow = compile_runtime_input(runtime_input)
+            parse_workflow_measured_step.stop()
+        except (
+            WorkflowParsingException,
+            WorkflowInputDataValidationError,
+            RuntimeExecutionError,
+        ) as e:
+            return compilation_failure_result(e, runtime_input.job_id)
+
+    execution_plan = compiled_workflow.plan
+
+    if runtime_input.configuration.execution_window is not None:
+        wf_exec_result = check_serializable(
+            await windowed_runtime_service(runtime_input, execution_plan),
+            binary_tables=binary_tables,
+        )
+        wf_exec_result.measured_steps.parse_workflow = parse_workflow_measured_step
+        wf_exec_result.measured_steps.compiled_workflow_cache = (
+            compiled_workflow.cache_info
+        )
+        runtime_service_measured_step.stop()
+        wf_exec_result.measured_steps.runtime_service_handling = (
+            runtime_service_measured_step
+        )
+        return wf_exec_result
+
+    session = (
+        execution_sessions.obtain(runtime_input.configuration.session_id)
+        if runtime_input.configuration.session_id is not None
+        else None
+    )
+
     # Load data
     try:
         load_data_measured_step = PerformanceMeasuredStep.create_and_begin("load_data")
 
-        loaded_data = await resolve_and_load_data_from_wiring(
-            runtime_input.workflow_wiring
-        )
+        if loaded_data is None and session is not None:
+            loaded_data, reused_input_names = await load_data_in_session(
+                runtime_input.workflow_wiring, session
+            )
+        elif loaded_data is None:
+            loaded_data = await resolve_and_load_data_from_wiring(
+                runtime_input.workflow_wiring
+            )
 
         load_data_measured_step.stop()
     except AdapterHandlingException as exc:
@@ -91,20 +446,9 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
             job_id=runtime_input.job_id,
         )
 
-    wf_inputs_by_name = {inp.name: inp for inp in runtime_input.workflow.inputs}
-
-    constant_providing_data = [
-        NamedDataTypedValue(
-            name=inp_name, value=loaded_value, type=wf_inputs_by_name[inp_name].type
-        )
-        for (inp_name, loaded_value) in loaded_data.items()
-    ]
-
-    # Provide data as constants
+    # Parse provided data
     try:
-        parsed_wf.add_constant_providing_node(
-            constant_providing_data, id_suffix="dynamic_data"
-        )
+        input_values = parse_loaded_data(runtime_input, execution_plan, loaded_data)
     except WorkflowInputDataValidationError as exc:
         runtime_logger.info(
             "Input Data Validation Error during data provision",
@@ -118,29 +462,31 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
             job_id=runtime_input.job_id,
         )
 
-    # run workflow
+    # Only run operators depending on changed inputs in sessions
+    run_pure_plot_operators = runtime_input.configuration.run_pure_plot_operators
+    if session is not None:
+        fingerprints = input_fingerprints(input_values)
+        reusable_results = session.reusable_results(
+            execution_plan, fingerprints, run_pure_plot_operators
+        )
+    else:
+        reusable_results = None
 
-    all_nodes = obtain_all_nodes(parsed_wf)
+    # run workflow
 
     pure_execution_measured_step = PerformanceMeasuredStep.create_and_begin(
         "pure_execution"
     )
 
     try:
-        workflow_result = await workflow_execution_plain(parsed_wf)
-
-        # make sure every computation node result is requested at least once
-        # to ensure that every node is run, even if in a part of the graph not leading
-        # to a final output. This is necessary for example for the Store Model component.
-        for computation_node in all_nodes:
-            _res = (
-                await computation_node.result
-                if not (
-                    computation_node.has_only_plot_outputs is True
-                    and runtime_input.configuration.run_pure_plot_operators is False
-                )
-                else {}
-            )
+        # Every step of the plan is run, even if it does not lead to a final output.
+        # This is necessary for example for the Store Model component.
+        plan_result = await run_plan(
+            execution_plan,
+            input_values,
+            reusable_results,
+            runtime_input.configuration.engine,
+        )
 
         pure_execution_measured_step.stop()
 
@@ -164,27 +510,26 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
         )
         return WorkflowExecutionResult(
             result="failure",
-            error=(
-                "Exception during execution!\n"
-                f"                  tr type: {e.currently_executed_transformation_type},"
-                f" tr id: {e.currently_executed_transformation_id},"
-                f" tr name: {e.currently_executed_transformation_name},"
-                f" tr tag: {e.currently_executed_transformation_tag},\n"
-                f"                  op id(s): {e.currently_executed_hierarchical_operator_id},\n"
-                f"                  op name(s): {e.currently_executed_hierarchical_operator_name}\n"
-                f"                  reason: {e}"
-            ),
+            error=runtime_execution_error_message(e),
             traceback=traceback.format_exc(),
             output_results_by_output_name={},
             job_id=runtime_input.job_id,
         )
 
+    if session is not None:
+        session.store(
+            execution_plan,
+            fingerprints,
+            run_pure_plot_operators,
+            plan_result.step_results,  # type: ignore[arg-type]
+        )
+
     if runtime_input.configuration.return_individual_node_results:
         # prepare individual results
         all_results_str = "\n".join(
             [
-                str(x.operator_hierarchical_id) + " " + str(await x.result)
-                for x in all_nodes
+                str(operator_hierarchical_id) + " " + str(node_result)
+                for operator_hierarchical_id, node_result in plan_result.node_results
             ]
         )
 
@@ -204,7 +549,7 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
         send_data_measured_step = PerformanceMeasuredStep.create_and_begin("send_data")
 
         direct_return_data: dict = await resolve_and_send_data_from_wiring(
-            runtime_input.workflow_wiring, workflow_result
+            runtime_input.workflow_wiring, plan_result.outputs
         )
 
         send_data_measured_step.stop()
@@ -233,37 +578,22 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
     )
 
     # attach measured steps
+    wf_exec_result.measured_steps.parse_workflow = parse_workflow_measured_step
+    wf_exec_result.measured_steps.compiled_workflow_cache = compiled_workflow.cache_info
+    wf_exec_result.measured_steps.result_memory = plan_result.result_memory
+    wf_exec_result.measured_steps.operator_profiles = plan_result.operator_profiles
+    wf_exec_result.measured_steps.result_cache = plan_result.result_cache
+    if session is not None:
+        wf_exec_result.measured_steps.incremental_execution = IncrementalExecutionInfo(
+            session_id=str(runtime_input.configuration.session_id),
+            reused_operators=plan_result.reused_operators,
+            reused_input_data=reused_input_names,
+        )
     wf_exec_result.measured_steps.pure_execution = pure_execution_measured_step
     wf_exec_result.measured_steps.load_data = load_data_measured_step
     wf_exec_result.measured_steps.send_data = send_data_measured_step
 
-    runtime_logger.info(
-        "Workflow Execution Result Pydantic Object: \n%s",
-        wf_exec_result,
-    )
-
-    # catch arbitrary serialisation errors
-    # (because user can produce arbitrary non-serializable objects)
-    try:
-        jsonable_encoder(wf_exec_result)
-    except Exception as e:  # noqa: BLE001
-        runtime_logger.info(
-            "Exception during workflow execution response serialisation: %s",
-            str(e),
-            exc_info=True,
-        )
-        return WorkflowExecutionResult(
-            result="failure",
-            error=(
-                f"Exception during workflow execution response serialisation: {str(e)}"
-            ),
-            traceback=traceback.format_exc(),
-            output_results_by_output_id={},
-            output_results_by_output_name={},
-            job_id=runtime_input.job_id,
-        )
-
-    runtime_logger.info("Workflow Execution Result serialized successfully.")
+    wf_exec_result = check_serializable(wf_exec_result, binary_tables=binary_tables)
 
     runtime_service_measured_step.stop()
 
@@ -273,3 +603,80 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
 
     # TODO: avoid double serialization
     return wf_exec_result
+
+
+async def runtime_batch_service(
+    batch_input: BatchWorkflowExecutionInput,
+) -> BatchWorkflowExecutionResult:
+    """Execute one workflow with several wirings
+
+    The workflow is parsed and compiled once. The data of all instances is loaded
+    together, with one call per adapter. If this fails, every instance loads its data
+    itself, so that errors are reported for the affected instances only. Instances are
+    executed concurrently, at most batch_execution_max_concurrency at a time.
+    """
+    runtime_logger.info(
+        "BATCH WORKFLOW EXECUTION INPUT JSON:\n%s",
+        model_to_pretty_json_str(batch_input),
+    )
+    execution_inputs = batch_input.to_execution_inputs()
+
+    try:
+        compiled_workflow = compile_runtime_input(batch_input)
+    except (
+        WorkflowParsingException,
+        WorkflowInputDataValidationError,
+        RuntimeExecutionError,
+    ) as e:
+        failure_result = compilation_failure_result(e, execution_inputs[0].job_id)
+        return BatchWorkflowExecutionResult(
+            results=[
+                failure_result.copy(update={"job_id": execution_input.job_id})
+                for execution_input in execution_inputs
+            ]
+        )
+
+    loaded_data_of_instances: list[dict[str, Any] | None]
+    if batch_input.configuration.execution_window is not None:
+        # every instance loads the data for its windows itself
+        loaded_data_of_instances = [None] * len(execution_inputs)
+    else:
+        try:
+            loaded_data_of_instances = list(
+                await resolve_and_load_data_from_wirings(
+                    [
+                        execution_input.workflow_wiring
+                        for execution_input in execution_inputs
+                    ]
+                )
+            )
+        except AdapterHandlingException:
+            runtime_logger.info(
+                "Adapter Handling Exception during data loading for batch."
+                " Loading data for every instance separately.",
+                exc_info=True,
+            )
+            loaded_data_of_instances = [None] * len(execution_inputs)
+
+    semaphore = asyncio.Semaphore(get_config().batch_execution_max_concurrency)
+
+    async def run_instance(
+        execution_input: WorkflowExecutionInput, loaded_data: dict[str, Any] | None
+    ) -> WorkflowExecutionResult:
+        async with semaphore:
+            return await runtime_service(
+                execution_input,
+                compiled_workflow=compiled_workflow,
+                loaded_data=loaded_data,
+            )
+
+    return BatchWorkflowExecutionResult(
+        results=await asyncio.gather(
+            *(
+                run_instance(execution_input, loaded_data)
+                for execution_input, loaded_data in zip(
+                    execution_inputs, loaded_data_of_instances, strict=True
+                )
+            )
+        )
+    )
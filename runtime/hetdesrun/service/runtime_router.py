@@ -1,10 +1,33 @@
 import logging
 
+from fastapi import Header, status
+from pydantic import Field
+from starlette.responses import JSONResponse, Response
+
 from hetdesrun import VERSION
+from hetdesrun.adapters.generic_rest.client_pool import (
+    AdapterConnectionStatistics,
+    adapter_client_pool,
+)
 from hetdesrun.models.base import VersionInfo
-from hetdesrun.models.run import WorkflowExecutionInput, WorkflowExecutionResult
-from hetdesrun.runtime.service import runtime_service
+from hetdesrun.models.run import (
+    BatchWorkflowExecutionInput,
+    BatchWorkflowExecutionResult,
+    WorkflowExecutionInput,
+    WorkflowExecutionResult,
+)
+from hetdesrun.runtime.code_references import (
+    LOADED_CODE_HASHES_HEADER,
+    MissingCodeModulesError,
+    loaded_code_hashes,
+    resolve_code_module_references,
+)
+from hetdesrun.runtime.service import runtime_batch_service, runtime_service
 from hetdesrun.webservice.auth_dependency import get_auth_deps
+from hetdesrun.webservice.result_transport import (
+    binary_result_response,
+    requested_binary_media_type,
+)
 from hetdesrun.webservice.router import HandleTrailingSlashAPIRouter
 
 logger = logging.getLogger(__name__)
@@ -12,6 +35,34 @@ logger = logging.getLogger(__name__)
 runtime_router = HandleTrailingSlashAPIRouter(tags=["runtime"])
 
 
+class RuntimeInfo(VersionInfo):
+    worker_process_adapter_connection_statistics: dict[
+        str, AdapterConnectionStatistics
+    ] = Field(
+        {},
+        description=(
+            "Statistics of the connections to generic rest adapters by adapter key,"
+            " for the worker process which answers the request"
+        ),
+    )
+
+
+def missing_code_modules_response(error: MissingCodeModulesError) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": str(error), "missing_code_hashes": error.code_hashes},
+    )
+
+
+def announce_loaded_code(
+    response: Response,
+    runtime_input: WorkflowExecutionInput | BatchWorkflowExecutionInput,
+) -> None:
+    response.headers[LOADED_CODE_HASHES_HEADER] = ",".join(
+        loaded_code_hashes(runtime_input.code_modules)
+    )
+
+
 @runtime_router.post(
     "/runtime",
     response_model=WorkflowExecutionResult,
@@ -19,14 +70,73 @@ runtime_router = HandleTrailingSlashAPIRouter(tags=["runtime"])
 )
 async def runtime_endpoint(
     runtime_input: WorkflowExecutionInput,
-) -> WorkflowExecutionResult:
-    return await runtime_service(runtime_input)
+    response: Response,
+    accept: str | None = Header(None),
+) -> WorkflowExecutionResult | Response:
+    """Execute a workflow
+
+    If the Accept header requests the Arrow IPC stream or the Parquet media type, the
+    result is returned as multipart/mixed response with the Pandas outputs as binary
+    tables.
+
+    Code modules may be referenced by the hash of their code, if this was announced
+    as loaded in the X-HD-Loaded-Code-Hashes header of a previous response. If such
+    code is not loaded, the response has status code 409 and lists the missing hashes.
+    """
+    try:
+        runtime_input.code_modules = resolve_code_module_references(
+            runtime_input.code_modules, runtime_input.code_module_references
+        )
+    except MissingCodeModulesError as e:
+        return missing_code_modules_response(e)
+
+    binary_media_type = requested_binary_media_type(accept)
+    execution_result = await runtime_service(
+        runtime_input, binary_tables=binary_media_type is not None
+    )
+    if binary_media_type is not None:
+        response = binary_result_response(execution_result, binary_media_type)
+        announce_loaded_code(response, runtime_input)
+        return response
+    announce_loaded_code(response, runtime_input)
+    return execution_result
+
+
+@runtime_router.post(
+    "/runtime/batch",
+    response_model=BatchWorkflowExecutionResult,
+    dependencies=get_auth_deps(),
+)
+async def runtime_batch_endpoint(
+    batch_input: BatchWorkflowExecutionInput,
+    response: Response,
+) -> BatchWorkflowExecutionResult | Response:
+    """Execute one workflow with several wirings
+
+    The workflow is parsed once and its components are imported once for all
+    instances. Results are returned in the order of the instances. Code modules may be
+    referenced like for the runtime endpoint.
+    """
+    try:
+        batch_input.code_modules = resolve_code_module_references(
+            batch_input.code_modules, batch_input.code_module_references
+        )
+    except MissingCodeModulesError as e:
+        return missing_code_modules_response(e)
+
+    batch_result = await runtime_batch_service(batch_input)
+    announce_loaded_code(response, batch_input)
+    return batch_result
 
 
-@runtime_router.get("/info", response_model=VersionInfo)
-async def info_service() -> dict:
+@runtime_router.get("/info", response_model=RuntimeInfo)
+async def info_service() -> RuntimeInfo:
     """Version Info Endpoint
 
-    Unauthorized, may be used for readiness probes.
+    Unauthorized, may be used for readiness probes. Also shows how often the
+    connections to generic rest adapters were reused.
     """
-    return {"version": VERSION}
+    return RuntimeInfo(
+        version=VERSION,
+        worker_process_adapter_connection_statistics=(adapter_client_pool.statistics()),
+    )
@@ -12,6 +12,8 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
 from hetdesrun import VERSION
+from hetdesrun.adapters.generic_rest.client_pool import adapter_client_pool
+from hetdesrun.backend.execution import runtime_client_pool
 from hetdesrun.backend.service.adapter_router import adapter_router
 from hetdesrun.backend.service.base_item_router import base_item_router
 from hetdesrun.backend.service.component_router import component_router
@@ -21,6 +23,8 @@ from hetdesrun.backend.service.maintenance_router import maintenance_router
 from hetdesrun.backend.service.transformation_router import transformation_router
 from hetdesrun.backend.service.wiring_router import wiring_router
 from hetdesrun.backend.service.workflow_router import workflow_router
+from hetdesrun.component.warm_up import warm_up_component_imports
+from hetdesrun.runtime.engine.plain.execution import shutdown_executor_pools
 from hetdesrun.webservice.auth_dependency import get_auth_deps
 from hetdesrun.webservice.config import get_config
 
@@ -31,6 +35,13 @@ if get_config().hd_kafka_consumer_enabled:
 logger = logging.getLogger(__name__)
 
 
+async def release_execution_resources() -> None:
+    """Shut down executor process pools and close connections to runtime and adapters"""
+    shutdown_executor_pools()
+    await runtime_client_pool.close()
+    await adapter_client_pool.close()
+
+
 class AdditionalLoggingRoute(APIRoute):
     """Additional logging and information in case of errors
 
@@ -169,6 +180,8 @@ def init_app() -> FastAPI:
     @app.on_event("startup")
     async def startup_event() -> None:
         logger.info("Initializing application ...")
+        if get_config().component_warm_up and get_config().is_runtime_service:
+            warm_up_component_imports()
         if get_config().hd_kafka_consumer_enabled and get_config().is_backend_service:
             logger.info("Initializing Kafka consumer...")
             kakfa_worker_context = get_kafka_worker_context()
@@ -181,5 +194,6 @@ def init_app() -> FastAPI:
             logger.info("Shutting down Kafka consumer...")
             kakfa_worker_context = get_kafka_worker_context()
             await kakfa_worker_context.stop()
+        await release_execution_resources()
 
     return app
@@ -3,7 +3,15 @@ import os
 import re
 from enum import Enum
 
-from pydantic import BaseSettings, Field, Json, SecretStr, validator
+from pydantic import (
+    BaseSettings,
+    Field,
+    Json,
+    NonNegativeFloat,
+    PositiveFloat,
+    SecretStr,
+    validator,
+)
 from sqlalchemy.engine import URL as SQLAlchemy_DB_URL
 
 from hetdesrun.webservice.auth_outgoing import ServiceCredentials
@@ -33,6 +41,27 @@ class InternalAuthMode(str, Enum):
     FORWARD_OR_FIXED = "FORWARD_OR_FIXED"
 
 
+class SyncComponentExecutor(str, Enum):
+    # where the entrypoint functions of synchronous (i.e. non-async) components are run
+    EVENT_LOOP = "EVENT_LOOP"
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
+class ProcessStartMethod(str, Enum):
+    # how the worker processes for synchronous components are started, see the
+    # start methods of the multiprocessing module
+    SPAWN = "spawn"
+    FORKSERVER = "forkserver"
+
+
+class ResultMediaType(str, Enum):
+    # media types in which execution results can be transported
+    JSON = "application/json"
+    ARROW_STREAM = "application/vnd.apache.arrow.stream"
+    PARQUET = "application/vnd.apache.parquet"
+
+
 class RuntimeConfig(BaseSettings):
     """Configuration for Hetida Designer Runtime
 
@@ -56,6 +85,165 @@ class RuntimeConfig(BaseSettings):
         ),
     )
 
+    sync_component_executor: SyncComponentExecutor = Field(
+        SyncComponentExecutor.EVENT_LOOP,
+        env="HD_SYNC_COMPONENT_EXECUTOR",
+        description=(
+            "Where the entrypoint functions of synchronous (i.e. non-async) components"
+            " are run by default. EVENT_LOOP runs them directly on the event loop,"
+            " blocking all other requests handled by the same worker while they run."
+            " THREAD runs them in a bounded thread pool and PROCESS in a pool of"
+            " worker processes, which allows CPU-bound components to use more than"
+            " one core. Components may override this default via the executor"
+            " argument of the register decorator or the executor entry of COMPONENT_INFO."
+            " One of "
+            + ", ".join(['"' + x.value + '"' for x in list(SyncComponentExecutor)])
+        ),
+    )
+
+    sync_component_thread_pool_size: int = Field(
+        4,
+        env="HD_SYNC_COMPONENT_THREAD_POOL_SIZE",
+        description="Maximal number of threads for running synchronous components.",
+        gt=0,
+    )
+
+    sync_component_process_pool_size: int = Field(
+        2,
+        env="HD_SYNC_COMPONENT_PROCESS_POOL_SIZE",
+        description=(
+            "Number of worker processes for running synchronous components."
+            " The worker processes are started together when the pool is first used"
+            " and are kept alive afterwards."
+        ),
+        gt=0,
+    )
+
+    sync_component_process_start_method: ProcessStartMethod = Field(
+        ProcessStartMethod.SPAWN,
+        env="HD_SYNC_COMPONENT_PROCESS_START_METHOD",
+        description=(
+            "Start method of the worker processes for running synchronous components."
+            " Forking is not offered, since the pool is started from within the"
+            " running service, which already has threads, and forking a multithreaded"
+            " process can deadlock. FORKSERVER is not available on Windows."
+            " One of "
+            + ", ".join(['"' + x.value + '"' for x in list(ProcessStartMethod)])
+        ),
+    )
+
+    shared_memory_transfer_min_bytes: int = Field(
+        1_000_000,
+        env="HD_SHARED_MEMORY_TRANSFER_MIN_BYTES",
+        description=(
+            "Pandas Series and DataFrames of at least this size (in bytes) are handed"
+            " to and from worker processes via shared memory as Arrow IPC streams"
+            " instead of being pickled and sent through a pipe."
+        ),
+        ge=0,
+    )
+
+    compiled_workflow_cache_size: int = Field(
+        128,
+        env="HD_COMPILED_WORKFLOW_CACHE_SIZE",
+        description=(
+            "Maximal number of parsed and compiled workflows kept by each runtime"
+            " worker process for reuse by later executions of the same workflow."
+            " Set to 0 to deactivate caching."
+        ),
+        ge=0,
+    )
+
+    result_cache_max_bytes: int = Field(
+        100_000_000,
+        env="HD_RESULT_CACHE_MAX_BYTES",
+        description=(
+            "Maximal estimated size (in bytes) of the results of cacheable components"
+            " kept in memory by each runtime worker process for reuse by later"
+            " executions with equal inputs. Least recently used results are evicted"
+            " first. Set to 0 to deactivate the in-memory result cache."
+        ),
+        ge=0,
+    )
+
+    result_cache_dir: str | None = Field(
+        None,
+        env="HD_RESULT_CACHE_DIR",
+        description=(
+            "Directory for a second tier of the result cache on disk, which may be"
+            " shared by runtime worker processes. Results are stored as pickle files,"
+            " so the directory must only be writable by the runtime. If not set,"
+            " results are only cached in memory."
+        ),
+    )
+
+    result_cache_dir_max_bytes: int = Field(
+        1_000_000_000,
+        env="HD_RESULT_CACHE_DIR_MAX_BYTES",
+        description=(
+            "Maximal size (in bytes) of the files in the result cache directory."
+            " Least recently used files are deleted first."
+        ),
+        ge=0,
+    )
+
+    execution_session_max_count: int = Field(
+        8,
+        env="HD_EXECUTION_SESSION_MAX_COUNT",
+        description=(
+            "Maximal number of execution sessions for incremental re-execution kept"
+            " by each runtime worker process. Every session holds the loaded data and"
+            " all operator results of its last execution. Least recently used"
+            " sessions are dropped first. Set to 0 to deactivate sessions."
+        ),
+        ge=0,
+    )
+
+    batch_execution_max_concurrency: int = Field(
+        8,
+        env="HD_BATCH_EXECUTION_MAX_CONCURRENCY",
+        description=(
+            "Maximal number of instances of a batch execution which are executed"
+            " concurrently by a runtime worker process."
+        ),
+        gt=0,
+    )
+
+    component_bytecode_cache_dir: str | None = Field(
+        None,
+        env="HD_COMPONENT_BYTECODE_CACHE_DIR",
+        description=(
+            "Directory in which the compiled bytecode of component code is stored by"
+            " the hash of the code, so that other worker processes and restarted"
+            " workers do not need to compile it again. The directory must only be"
+            " writable by the runtime. If not set, component code is compiled on every"
+            " first import."
+        ),
+    )
+
+    component_warm_up: bool = Field(
+        False,
+        env="HD_COMPONENT_WARM_UP",
+        description=(
+            "Whether the code of all released components should be imported when a"
+            " worker process starts, so that the first executions do not need to"
+            " import the component code and the libraries it uses. Components are"
+            " read from the database for backend services and from"
+            " component_warm_up_directory otherwise."
+        ),
+    )
+
+    component_warm_up_directory: str = Field(
+        "",
+        env="HD_COMPONENT_WARM_UP_DIRECTORY",
+        description=(
+            "Directory with transformation revision files (like the autoimport"
+            " directory) whose released components are imported at startup of"
+            " runtime services without database, if component_warm_up is set."
+            " Defaults to the autoimport directory."
+        ),
+    )
+
     swagger_prefix: str = Field(
         "",
         env="OPENAPI_PREFIX",
@@ -301,6 +489,18 @@ class RuntimeConfig(BaseSettings):
         description="URL to runtime",
     )
 
+    runtime_result_media_type: ResultMediaType = Field(
+        ResultMediaType.JSON,
+        env="HD_RUNTIME_RESULT_MEDIA_TYPE",
+        description=(
+            "Media type in which the backend requests execution results from a"
+            " separate runtime service, i.e. one of "
+            + ", ".join(['"' + x.value + '"' for x in list(ResultMediaType)])
+            + ". With the Arrow or Parquet media types, Pandas outputs are transported"
+            " as binary tables instead of JSON."
+        ),
+    )
+
     hd_runtime_verify_certs: bool = Field(
         True, env="HETIDA_DESIGNER_RUNTIME_VERIFY_CERTS"
     )
@@ -340,6 +540,135 @@ class RuntimeConfig(BaseSettings):
     hd_adapters_verify_certs: bool = Field(
         True, env="HETIDA_DESIGNER_ADAPTERS_VERIFY_CERTS"
     )
+    adapter_max_connections: int = Field(
+        100,
+        env="HD_ADAPTER_MAX_CONNECTIONS",
+        description=(
+            "Maximal number of concurrent connections of a worker process to each"
+            " generic REST adapter."
+        ),
+        gt=0,
+    )
+    adapter_max_keepalive_connections: int = Field(
+        20,
+        env="HD_ADAPTER_MAX_KEEPALIVE_CONNECTIONS",
+        description=(
+            "Maximal number of idle connections of a worker process to each generic"
+            " REST adapter which are kept open for later requests."
+        ),
+        ge=0,
+    )
+    adapter_keepalive_expiry: float = Field(
+        30.0,
+        env="HD_ADAPTER_KEEPALIVE_EXPIRY",
+        description=(
+            "Time (in seconds) after which idle connections to generic REST adapters"
+            " are closed."
+        ),
+        ge=0,
+    )
+    adapter_http2: bool = Field(
+        False,
+        env="HD_ADAPTER_HTTP2",
+        description=(
+            "Whether HTTP/2 is used for requests to generic REST adapters which"
+            " support it. Requires the h2 package."
+        ),
+    )
+    adapter_timeseries_window_seconds: float | None = Field(
+        None,
+        env="HD_ADAPTER_TIMESERIES_WINDOW_SECONDS",
+        description=(
+            "Initial length (in seconds) of the time windows into which the time range"
+            " of timeseries loaded from generic REST adapters is split. The windows are"
+            " requested concurrently and their length is adapted to the observed"
+            " responses. If not set, the complete time range is loaded with one"
+            " request."
+        ),
+        gt=0,
+    )
+    adapter_timeseries_window_concurrency: int = Field(
+        4,
+        env="HD_ADAPTER_TIMESERIES_WINDOW_CONCURRENCY",
+        description=(
+            "Maximal number of time windows of a timeseries request to a generic REST"
+            " adapter which are requested concurrently."
+        ),
+        gt=0,
+    )
+    adapter_timeseries_window_target_seconds: float = Field(
+        10.0,
+        env="HD_ADAPTER_TIMESERIES_WINDOW_TARGET_SECONDS",
+        description=(
+            "Duration (in seconds) of a time window request to a generic REST adapter"
+            " which the length of the windows is adapted to."
+        ),
+        gt=0,
+    )
+    adapter_timeseries_window_target_rows: int = Field(
+        1_000_000,
+        env="HD_ADAPTER_TIMESERIES_WINDOW_TARGET_ROWS",
+        description=(
+            "Number of received rows per time window request to a generic REST"
+            " adapter which the length of the windows is adapted to."
+        ),
+        gt=0,
+    )
+    timeseries_cache_max_bytes: int = Field(
+        0,
+        env="HD_TIMESERIES_CACHE_MAX_BYTES",
+        description=(
+            "Maximal estimated memory size (in bytes) of timeseries data loaded from"
+            " generic REST adapters which each runtime worker process keeps to load"
+            " only the not yet loaded parts of overlapping time ranges. Least recently"
+            " used timeseries are evicted first. The default 0 deactivates the cache."
+        ),
+        ge=0,
+    )
+    timeseries_cache_ttl_seconds: float | None = Field(
+        None,
+        env="HD_TIMESERIES_CACHE_TTL_SECONDS",
+        description=(
+            "Time (in seconds) after which cached timeseries data is loaded again from"
+            " the generic REST adapter. If not set, cached data does not expire."
+        ),
+        gt=0,
+    )
+    timeseries_cache_mutable_tail_seconds: float = Field(
+        0.0,
+        env="HD_TIMESERIES_CACHE_MUTABLE_TAIL_SECONDS",
+        description=(
+            "Cached timeseries data with timestamps less than this number of seconds"
+            " before the time of loading is loaded again by later requests, since"
+            " recent data may still change, e.g. by late-arriving data."
+        ),
+        ge=0,
+    )
+    timeseries_cache_ttl_seconds_by_adapter: dict[str, PositiveFloat | None] = Field(
+        {},
+        env="HD_TIMESERIES_CACHE_TTL_SECONDS_BY_ADAPTER",
+        description=(
+            "Time to live (in seconds) of cached timeseries data for individual generic"
+            " REST adapters, overriding HD_TIMESERIES_CACHE_TTL_SECONDS. A null value"
+            " means that cached data of the adapter does not expire."
+            " The environment variable expects this to be a mapping from adapter keys"
+            " to numbers as json string."
+        ),
+        example={"sensor-adapter": 600, "archive-adapter": None},
+    )
+    timeseries_cache_mutable_tail_seconds_by_adapter: dict[
+        str, NonNegativeFloat
+    ] = Field(
+        {},
+        env="HD_TIMESERIES_CACHE_MUTABLE_TAIL_SECONDS_BY_ADAPTER",
+        description=(
+            "Mutable tail (in seconds) of cached timeseries data for individual generic"
+            " REST adapters, overriding HD_TIMESERIES_CACHE_MUTABLE_TAIL_SECONDS."
+            " The environment variable expects this to be a mapping from adapter keys"
+            " to numbers as json string."
+        ),
+        example={"sensor-adapter": 3600, "archive-adapter": 0},
+    )
 
     hd_kafka_consumer_enabled: bool = Field(
         False,
@@ -0,0 +1,218 @@
+"""Binary transport of Pandas outputs of execution results
+
+Serializing large Series and DataFrames to JSON is slow, both for the service and for
+the client parsing it. Clients of the execution endpoints can therefore request them as
+binary tables by sending an Accept header with the Arrow IPC stream or the Parquet
+media type.
+
+The response is then a multipart/mixed message. Its first part is the JSON execution
+result without the outputs transported as tables, but with an additional entry
+"binary_outputs" listing them. Every listed output follows as a part in the requested
+format, in the order of the list and named by its output name in the
+Content-Disposition header. Every part has a Content-Length header.
+
+Series are transported as tables with their index and a single column named
+__hd_series_values__. Pandas objects which cannot be represented exactly in Arrow
+(e.g. DataFrames with non-string column names) and all other outputs remain in the
+JSON part.
+"""
+import io
+import json
+import logging
+from typing import Any
+from urllib.parse import quote
+from uuid import uuid4
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from hetdesrun.runtime.engine.plain.transfer import (
+    SERIES_COLUMN_NAME,
+    arrow_compatible_frame,
+)
+from hetdesrun.webservice.config import ResultMediaType
+
+logger = logging.getLogger(__name__)
+
+BINARY_TABLE_MEDIA_TYPES = (ResultMediaType.ARROW_STREAM, ResultMediaType.PARQUET)
+
+
+def requested_binary_media_type(accept: str | None) -> ResultMediaType | None:
+    """Binary table format requested by an Accept header
+
+    Media ranges are considered in the order given. Returns None if JSON is requested
+    first or no binary table format is requested.
+    """
+    if accept is None:
+        return None
+    for media_range in accept.split(","):
+        media_type = media_range.split(";")[0].strip().lower()
+        if media_type in ("application/json", "application/*", "*/*"):
+            return None
+        for binary_media_type in BINARY_TABLE_MEDIA_TYPES:
+            if media_type == binary_media_type.value:
+                return binary_media_type
+    return None
+
+
+def encode_table(
+    value: pd.Series | pd.DataFrame, media_type: ResultMediaType
+) -> bytes | None:
+    """Encode a Pandas object, None if it cannot be represented in Arrow"""
+    frame = arrow_compatible_frame(value)
+    if frame is None:
+        return None
+    try:
+        table = pa.Table.from_pandas(frame, preserve_index=True)
+    except (pa.ArrowException, ValueError, TypeError):
+        logger.debug("Could not convert output to Arrow. Using JSON.", exc_info=True)
+        return None
+
+    if media_type is ResultMediaType.PARQUET:
+        parquet_buffer = io.BytesIO()
+        pq.write_table(table, parquet_buffer)
+        return parquet_buffer.getvalue()
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()  # type: ignore[no-any-return]
+
+
+def decode_table(
+    payload: bytes,
+    media_type: ResultMediaType,
+    is_series: bool,
+    series_name: Any = None,
+) -> pd.Series | pd.DataFrame:
+    if media_type is ResultMediaType.PARQUET:
+        frame = pq.read_table(pa.py_buffer(payload)).to_pandas()
+    else:
+        with pa.ipc.open_stream(payload) as reader:
+            frame = reader.read_all().to_pandas()
+    if is_series:
+        return frame[SERIES_COLUMN_NAME].rename(series_name)
+    return frame
+
+
+def _encode_part(headers: dict[str, str], content: bytes) -> bytes:
+    header_lines = [
+        *(f"{name}: {value}" for name, value in headers.items()),
+        f"Content-Length: {len(content)}",
+    ]
+    return "\r\n".join(header_lines).encode("latin-1") + b"\r\n\r\n" + content
+
+
+def binary_result_response(result: BaseModel, media_type: ResultMediaType) -> Response:
+    """Multipart response for an execution result with output_results_by_output_name
+
+    Series and DataFrames among the outputs are transported as binary tables.
+    """
+    json_outputs: dict[str, Any] = {}
+    binary_outputs: list[dict[str, Any]] = []
+    parts: list[bytes] = []
+    for output_name, value in result.output_results_by_output_name.items():  # type: ignore
+        payload = (
+            encode_table(value, media_type)
+            if isinstance(value, pd.Series | pd.DataFrame)
+            else None
+        )
+        if payload is None:
+            json_outputs[output_name] = value
+            continue
+        is_series = isinstance(value, pd.Series)
+        binary_outputs.append(
+            {
+                "name": output_name,
+                "type": "SERIES" if is_series else "DATAFRAME",
+                "series_name": value.name if is_series else None,
+            }
+        )
+        parts.append(
+            _encode_part(
+                {
+                    "Content-Type": media_type.value,
+                    "Content-Disposition": (
+                        f"attachment; name*=UTF-8''{quote(output_name)}"
+                    ),
+                },
+                payload,
+            )
+        )
+
+    envelope = json.loads(
+        result.copy(update={"output_results_by_output_name": json_outputs}).json()
+    )
+    envelope["binary_outputs"] = binary_outputs
+    parts.insert(
+        0,
+        _encode_part(
+            {"Content-Type": "application/json"},
+            json.dumps(envelope, default=str).encode("utf8"),
+        ),
+    )
+
+    boundary = uuid4().hex
+    delimiter = b"--" + boundary.encode("ascii")
+    body = (
+        b"".join(delimiter + b"\r\n" + part + b"\r\n" for part in parts)
+        + delimiter
+        + b"--\r\n"
+    )
+    return Response(content=body, media_type=f"multipart/mixed; boundary={boundary}")
+
+
+def _boundary(content_type: str) -> str:
+    for parameter in content_type.split(";")[1:]:
+        name, _, value = parameter.strip().partition("=")
+        if name.lower() == "boundary":
+            return value.strip('"')
+    raise ValueError(f"No boundary in content type {content_type}")
+
+
+def _split_parts(body: bytes, boundary: str) -> list[tuple[dict[str, str], bytes]]:
+    """Parts of a multipart body whose parts all have a Content-Length header"""
+    delimiter = b"--" + boundary.encode("ascii")
+    parts = []
+    position = body.index(delimiter) + len(delimiter)
+    while not body.startswith(b"--", position):
+        header_end = body.index(b"\r\n\r\n", position)
+        headers = {}
+        for header_line in body[position:header_end].decode("latin-1").split("\r\n"):
+            if header_line.strip() == "":
+                continue
+            name, _, value = header_line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        content_start = header_end + 4
+        content_end = content_start + int(headers["content-length"])
+        parts.append((headers, body[content_start:content_end]))
+        position = body.index(delimiter, content_end) + len(delimiter)
+    return parts
+
+
+def parse_binary_result(body: bytes, content_type: str) -> dict[str, Any]:
+    """Parse a multipart execution result into a dict with Pandas outputs
+
+    Raises ValueError if the body is not a valid multipart execution result.
+    """
+    try:
+        parts = _split_parts(body, _boundary(content_type))
+        envelope = json.loads(parts[0][1])
+        binary_outputs = envelope.pop("binary_outputs")
+        for output_info, (headers, payload) in zip(
+            binary_outputs, parts[1:], strict=True
+        ):
+            envelope["output_results_by_output_name"][
+                output_info["name"]
+            ] = decode_table(
+                payload,
+                ResultMediaType(headers["content-type"]),
+                is_series=output_info["type"] == "SERIES",
+                series_name=output_info["series_name"],
+            )
+    except (KeyError, IndexError, TypeError, ValueError, pa.ArrowException) as e:
+        raise ValueError(f"Invalid multipart execution result: {str(e)}") from e
+    return envelope  # type: ignore[no-any-return]
@@ -1,3 +1,4 @@
+import copy
 from collections import defaultdict
 from typing import Any
 
@@ -42,6 +43,72 @@ async def resolve_and_load_data_from_wiring(
     return loaded_data
 
 
+async def resolve_and_load_data_from_wirings(
+    workflow_wirings: list[WorkflowWiring],
+) -> list[dict[str, Any]]:
+    """Loads data for several wirings of the same workflow at once
+
+    Sources of all wirings are loaded with one call per adapter and identical filtered
+    sources are loaded only once. Returns the loaded data for every wiring as a dict with
+    the workflow input names as keys. Data of identical sources is copied, so that
+    executions do not share input objects.
+    """
+    # filtered sources by adapter, keyed by their JSON to detect identical sources
+    sources_by_adapter: dict[str | int, dict[str, FilteredSource]] = defaultdict(dict)
+    # adapter and source key for every input of every wiring
+    source_keys: list[dict[str, tuple[str | int, str]]] = []
+
+    for workflow_wiring in workflow_wirings:
+        source_keys_of_wiring = {}
+        for input_wiring in workflow_wiring.input_wirings:
+            filtered_source = FilteredSource(
+                ref_id=input_wiring.ref_id,
+                ref_id_type=input_wiring.ref_id_type,
+                ref_key=input_wiring.ref_key,
+                type=input_wiring.type,
+                filters=input_wiring.filters,
+            )
+            source_key = filtered_source.json()
+            sources_by_adapter[input_wiring.adapter_id][source_key] = filtered_source
+            source_keys_of_wiring[input_wiring.workflow_input_name] = (
+                input_wiring.adapter_id,
+                source_key,
+            )
+        source_keys.append(source_keys_of_wiring)
+
+    loaded_data_by_adapter: dict[str | int, dict[str, Any]] = {}
+    for adapter_key, sources in sources_by_adapter.items():
+        # short names for the adapter call instead of the JSON of the sources
+        source_names = {source_key: str(pos) for pos, source_key in enumerate(sources)}
+        loaded_data_from_adapter: dict = await load_data_from_adapter(
+            adapter_key,
+            {
+                source_names[source_key]: source
+                for source_key, source in sources.items()
+            },
+        )
+        loaded_data_by_adapter[adapter_key] = {
+            source_key: loaded_data_from_adapter[name]
+            for source_key, name in source_names.items()
+        }
+
+    loaded_data_of_wirings = []
+    used_source_keys: set[tuple[str | int, str]] = set()
+    for source_keys_of_wiring in source_keys:
+        loaded_data = {}
+        for workflow_input_name, (
+            adapter_key,
+            source_key,
+        ) in source_keys_of_wiring.items():
+            value = loaded_data_by_adapter[adapter_key][source_key]
+            if (adapter_key, source_key) in used_source_keys:
+                value = copy.deepcopy(value)
+            used_source_keys.add((adapter_key, source_key))
+            loaded_data[workflow_input_name] = value
+        loaded_data_of_wirings.append(loaded_data)
+    return loaded_data_of_wirings
+
+
 async def resolve_and_send_data_from_wiring(
     workflow_wiring: WorkflowWiring, result_data: dict[str, Any]
 ) -> dict[str, Any]:
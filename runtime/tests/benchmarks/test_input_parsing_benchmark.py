@@ -0,0 +1,85 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.datatypes import PydanticPandasDataFrame, PydanticPandasSeries
+from tests.benchmarks.timing import BENCHMARK_SIZES, best_time, report_speedup
+
+pytestmark = pytest.mark.benchmark
+
+
+def timestamps(size: int) -> pd.DatetimeIndex:
+    return pd.date_range("2020-01-01", periods=size, freq="1s", tz="UTC")
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_series_from_index_value_dict(size: int) -> None:
+    series_dict = dict(
+        zip(
+            timestamps(size).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            np.random.default_rng(0).random(size).tolist(),
+            strict=True,
+        )
+    )
+
+    fast_time = best_time(lambda: PydanticPandasSeries.validate(series_dict))
+    reference_time = best_time(
+        lambda: pd.read_json(json.dumps(series_dict), typ="series"), repeat=1
+    )
+    report_speedup("Series from index-value dict", size, fast_time, reference_time)
+    assert fast_time < reference_time
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_frame_from_dict_of_lists(size: int) -> None:
+    frame_dict = {
+        "timestamp": timestamps(size).strftime("%Y-%m-%dT%H:%M:%S.%fZ").tolist(),
+        "metric": (["a", "b", "c", "d"] * (size // 4 + 1))[:size],
+        "value": np.random.default_rng(0).random(size).tolist(),
+    }
+
+    fast_time = best_time(lambda: PydanticPandasDataFrame.validate(frame_dict))
+    reference_time = best_time(
+        lambda: pd.read_json(json.dumps(frame_dict), typ="frame"), repeat=1
+    )
+    report_speedup("DataFrame from dict of lists", size, fast_time, reference_time)
+    assert fast_time < reference_time
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_frame_from_records(size: int) -> None:
+    records = pd.DataFrame(
+        {
+            "a": np.arange(size),
+            "b": np.random.default_rng(0).random(size),
+            "c": (["x", "y"] * (size // 2 + 1))[:size],
+        }
+    ).to_dict(orient="records")
+
+    fast_time = best_time(lambda: PydanticPandasDataFrame.validate(records))
+    reference_time = best_time(
+        lambda: pd.read_json(json.dumps(records), typ="frame"), repeat=1
+    )
+    report_speedup("DataFrame from records", size, fast_time, reference_time)
+    assert fast_time < reference_time
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_frame_from_numpy_columns(size: int) -> None:
+    columns = {
+        "a": np.arange(size),
+        "b": np.random.default_rng(0).random(size),
+    }
+
+    fast_time = best_time(lambda: PydanticPandasDataFrame.validate(columns))
+    reference_time = best_time(
+        lambda: pd.read_json(
+            json.dumps({name: values.tolist() for name, values in columns.items()}),
+            typ="frame",
+        ),
+        repeat=1,
+    )
+    report_speedup("DataFrame from numpy columns", size, fast_time, reference_time)
+    assert fast_time < reference_time
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.datatypes import PydanticMultiTimeseriesPandasDataFrame
+from hetdesrun.multitsframe import MultiTSFrame
+from tests.benchmarks.timing import BENCHMARK_SIZES, best_time, report_speedup
+
+pytestmark = pytest.mark.benchmark
+
+METRIC_COUNT = 5000
+
+
+def shuffled_multitsframe(size: int) -> pd.DataFrame:
+    timestamps = pd.date_range(
+        "2020-01-01", periods=size // METRIC_COUNT, freq="1s", tz="UTC"
+    )
+    metrics = np.array([f"metric_{i}" for i in range(METRIC_COUNT)], dtype=object)
+    return PydanticMultiTimeseriesPandasDataFrame.validate(
+        pd.DataFrame(
+            {
+                "timestamp": np.tile(timestamps, METRIC_COUNT),
+                "metric": np.repeat(metrics, len(timestamps)),
+                "value": np.random.default_rng(0).random(
+                    len(timestamps) * METRIC_COUNT
+                ),
+            }
+        )
+        .sample(frac=1, random_state=0)
+        .reset_index(drop=True)
+    )
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_metric_selection_and_pivot(size: int) -> None:
+    df = shuffled_multitsframe(size)
+    mtsf = MultiTSFrame(df)
+
+    selection_time = best_time(lambda: mtsf.series("metric_42"))
+    mask_time = best_time(lambda: df[df["metric"] == "metric_42"])
+    report_speedup("Selecting one of 5000 metrics", size, selection_time, mask_time)
+
+    wide_time = best_time(lambda: MultiTSFrame(df).to_wide(), repeat=1)
+    pivot_time = best_time(
+        lambda: df.pivot(  # noqa: PD010
+            index="timestamp", columns="metric", values="value"
+        ),
+        repeat=1,
+    )
+    report_speedup("Wide DataFrame including sorting", size, wide_time, pivot_time)
+    assert selection_time < mask_time
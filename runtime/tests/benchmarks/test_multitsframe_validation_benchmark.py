@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.datatypes import PydanticMultiTimeseriesPandasDataFrame
+from tests.benchmarks.timing import BENCHMARK_SIZES, best_time, report_speedup
+
+pytestmark = pytest.mark.benchmark
+
+
+def multitsframe(size: int) -> pd.DataFrame:
+    metrics = np.array([f"metric_{i}" for i in range(100)], dtype=object)
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2020-01-01", periods=size, freq="1s", tz="UTC"),
+            "metric": metrics[np.random.default_rng(0).integers(0, 100, size)],
+            "value": np.random.default_rng(0).random(size),
+        }
+    )
+
+
+def scanning_validation(df: pd.DataFrame) -> None:
+    """Separate scans of every check with a string copy of the metric column"""
+    assert set(df.columns) == {"timestamp", "metric", "value"}
+    assert not df["metric"].isna().any()
+    df["metric"] = df["metric"].astype("string")
+    assert not df["timestamp"].isna().any()
+    assert pd.api.types.is_datetime64tz_dtype(df["timestamp"])
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_multitsframe_validation(size: int) -> None:
+    df = multitsframe(size)
+
+    fast_time = best_time(
+        lambda: PydanticMultiTimeseriesPandasDataFrame.validate(df.copy()), repeat=1
+    )
+    reference_time = best_time(lambda: scanning_validation(df.copy()), repeat=1)
+    report_speedup("MultiTSFrame validation", size, fast_time, reference_time)
+
+    validated_df = PydanticMultiTimeseriesPandasDataFrame.validate(df.copy())
+    revalidation_time = best_time(
+        lambda: PydanticMultiTimeseriesPandasDataFrame.validate(validated_df)
+    )
+    report_speedup(
+        "MultiTSFrame validation with string metric",
+        size,
+        revalidation_time,
+        reference_time,
+    )
+    assert revalidation_time < reference_time
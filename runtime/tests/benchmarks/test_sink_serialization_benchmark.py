@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.adapters.generic_rest.send_dataframe import dataframe_to_record_columns
+from hetdesrun.adapters.generic_rest.send_framelike import (
+    RecordColumn,
+    iterate_json_records,
+)
+from hetdesrun.adapters.generic_rest.send_multitsframe import (
+    multitsframe_to_record_columns,
+)
+from hetdesrun.adapters.generic_rest.send_ts_data import ts_to_record_columns
+from tests.benchmarks.timing import BENCHMARK_SIZES, best_time, report_speedup
+
+pytestmark = pytest.mark.benchmark
+
+
+def series(size: int) -> pd.Series:
+    values = np.random.default_rng(0).random(size)
+    values[::10] = np.nan
+    return pd.Series(
+        values,
+        index=pd.date_range("2020-01-01", periods=size, freq="1s", tz="UTC"),
+    )
+
+
+def multitsframe(size: int) -> pd.DataFrame:
+    metrics = np.array([f"metric_{i}" for i in range(100)], dtype=object)
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2020-01-01", periods=size, freq="1s", tz="UTC"),
+            "metric": metrics[np.random.default_rng(0).integers(0, 100, size)],
+            "value": np.random.default_rng(0).random(size),
+        }
+    )
+
+
+def format_timestamp(timestamp: pd.Timestamp) -> str:
+    return (
+        timestamp.strftime("%Y-%m-%dT%H:%M:%S.%f") + f"{timestamp.nanosecond:03d}" + "Z"
+    )
+
+
+def ts_body_via_records(series: pd.Series) -> bytes:
+    """Formatting every timestamp and encoding one list of records"""
+    records = (
+        pd.DataFrame(
+            {
+                "value": series.to_numpy(),
+                "timestamp": pd.Series(series.index, index=series.index).apply(
+                    format_timestamp
+                ),
+            }
+        )
+        .replace({np.nan: None})
+        .to_dict(orient="records")
+    )
+    return json.dumps(records).encode("utf-8")
+
+
+def multitsframe_body_via_records(df: pd.DataFrame) -> bytes:
+    """Formatting every timestamp and encoding one list of records"""
+    new_df = df.replace({np.nan: None})
+    new_df["timestamp"] = new_df["timestamp"].apply(format_timestamp)
+    return json.dumps(new_df.to_dict(orient="records")).encode("utf-8")
+
+
+def streamed_body(record_columns: dict[str, RecordColumn]) -> bytes:
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in iterate_json_records(record_columns)])
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_timeseries_sink_serialization(size: int) -> None:
+    ts = series(size)
+    assert json.loads(
+        streamed_body(ts_to_record_columns(ts, ExternalType.TIMESERIES_FLOAT))
+    ) == json.loads(ts_body_via_records(ts))
+
+    fast_time = best_time(
+        lambda: streamed_body(ts_to_record_columns(ts, ExternalType.TIMESERIES_FLOAT)),
+        repeat=1,
+    )
+    reference_time = best_time(lambda: ts_body_via_records(ts), repeat=1)
+    report_speedup("Timeseries sink serialization", size, fast_time, reference_time)
+    assert fast_time < reference_time
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_multitsframe_sink_serialization(size: int) -> None:
+    df = multitsframe(size)
+
+    fast_time = best_time(
+        lambda: streamed_body(multitsframe_to_record_columns(df)), repeat=1
+    )
+    reference_time = best_time(lambda: multitsframe_body_via_records(df), repeat=1)
+    report_speedup("MultiTSFrame sink serialization", size, fast_time, reference_time)
+    assert fast_time < reference_time
+
+
+def dataframe_body_via_records(df: pd.DataFrame) -> bytes:
+    """Calling isoformat for every timestamp and encoding one list of records"""
+    new_df = df.replace({np.nan: None})
+    new_df["timestamp"] = new_df["timestamp"].apply(lambda x: x.isoformat())
+    return json.dumps(new_df.to_dict(orient="records")).encode("utf-8")
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+def test_dataframe_sink_serialization(size: int) -> None:
+    df = multitsframe(size)
+    assert json.loads(streamed_body(dataframe_to_record_columns(df))) == json.loads(
+        dataframe_body_via_records(df)
+    )
+
+    fast_time = best_time(
+        lambda: streamed_body(dataframe_to_record_columns(df)), repeat=1
+    )
+    reference_time = best_time(lambda: dataframe_body_via_records(df), repeat=1)
+    report_speedup("DataFrame sink serialization", size, fast_time, reference_time)
+    assert fast_time < reference_time
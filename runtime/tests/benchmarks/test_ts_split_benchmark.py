@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.adapters.generic_rest.load_ts_data import split_loaded_data_by_ts_id
+from tests.benchmarks.timing import BENCHMARK_SIZES, best_time, report_speedup
+
+pytestmark = pytest.mark.benchmark
+
+TS_ID_COUNT = 2000
+
+
+def loaded_data(size: int) -> pd.DataFrame:
+    """Response rows of many timeseries, ordered by timestamp"""
+    timestamps = pd.date_range(
+        "2020-01-01", periods=size // TS_ID_COUNT, freq="1s", tz="UTC"
+    )
+    ts_ids = np.array([f"ts_{i}" for i in range(TS_ID_COUNT)], dtype=object)
+    return pd.DataFrame(
+        {
+            "timeseriesId": pd.Series(np.tile(ts_ids, len(timestamps)), dtype="string"),
+            "timestamp": timestamps.repeat(TS_ID_COUNT),
+            "value": np.random.default_rng(0).random(len(timestamps) * TS_ID_COUNT),
+        }
+    )
+
+
+def split_by_masks(df: pd.DataFrame, ts_ids: list[str]) -> dict[str, pd.Series]:
+    """Masking and copying the rows once per timeseries id"""
+    split_series = {}
+    for ts_id in ts_ids:
+        extracted_df = df[df["timeseriesId"] == ts_id].copy()
+        extracted_df.index = extracted_df["timestamp"]
+        split_series[ts_id] = extracted_df["value"].sort_index().rename(ts_id)
+    return split_series
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES[:3])
+def test_split_loaded_data_by_ts_id(size: int) -> None:
+    df = loaded_data(size)
+    ts_ids = [f"ts_{i}" for i in range(TS_ID_COUNT)]
+    split_series = split_loaded_data_by_ts_id(df, ts_ids)
+    for ts_id, series in split_by_masks(df, ts_ids[:10]).items():
+        pd.testing.assert_series_equal(split_series[ts_id], series)
+
+    fast_time = best_time(lambda: split_loaded_data_by_ts_id(df, ts_ids), repeat=1)
+    reference_time = best_time(lambda: split_by_masks(df, ts_ids), repeat=1)
+    report_speedup(
+        f"Splitting {TS_ID_COUNT} timeseries", size, fast_time, reference_time
+    )
+    assert fast_time < reference_time
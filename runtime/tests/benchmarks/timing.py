@@ -0,0 +1,24 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+BENCHMARK_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def best_time(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Minimal wall clock time of repeated calls of func in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def report_speedup(
+    name: str, size: int, fast_time: float, reference_time: float
+) -> None:
+    print(
+        f"\n{name} ({size} rows): {fast_time:.4f}s instead of {reference_time:.4f}s,"
+        f" speedup {reference_time / fast_time:.1f}x"
+    )
@@ -51,6 +51,22 @@ def pytest_addoption(parser: Any) -> None:
         dest="use_in_memory_db",
         default=True,
     )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        dest="run_benchmarks",
+        default=False,
+        help="run the benchmarks in tests/benchmarks, which are skipped otherwise",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    if config.getoption("run_benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmarks run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 @pytest.fixture(scope="session")
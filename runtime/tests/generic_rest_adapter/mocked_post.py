@@ -0,0 +1,6 @@
+import json
+
+
+async def posted_records(post_kwargs: dict) -> list:
+    """Records of the JSON body streamed by a mocked post call"""
+    return json.loads(b"".join([chunk async for chunk in post_kwargs["content"]]))
@@ -0,0 +1,98 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from hetdesrun.adapters.generic_rest.client_pool import (
+    AdapterClientPool,
+    adapter_client_pool,
+)
+
+
+class KeepAliveServer:
+    """Local HTTP server answering every request on a connection with ok"""
+
+    def __init__(self) -> None:
+        self.opened_connections = 0
+        self.url = ""
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.opened_connections += 1
+        try:
+            # answer every request on the connection, keeping it alive
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+
+@pytest_asyncio.fixture()
+async def keep_alive_server() -> AsyncGenerator:
+    keep_alive_server = KeepAliveServer()
+    server = await asyncio.start_server(keep_alive_server.handle, "127.0.0.1", 0)
+    keep_alive_server.url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/"
+    yield keep_alive_server
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_adapter_client_pool_reuses_clients_and_connections(
+    keep_alive_server: KeepAliveServer,
+) -> None:
+    pool = AdapterClientPool()
+    try:
+        client = pool.get("adapter_a")
+        assert pool.get("adapter_a") is client
+        assert pool.get("adapter_b") is not client
+
+        for _ in range(3):
+            response = await pool.get("adapter_a").get(keep_alive_server.url)
+            assert response.text == "ok"
+    finally:
+        await pool.close()
+
+    assert client.is_closed
+    assert keep_alive_server.opened_connections == 1
+    statistics = pool.statistics()
+    assert statistics["adapter_a"].requests == 3
+    assert statistics["adapter_a"].opened_connections == 1
+    assert statistics["adapter_a"].tls_handshakes == 0
+    assert statistics["adapter_a"].requests_with_reused_connection == 2
+    assert statistics["adapter_b"].requests == 0
+
+    # closed clients are replaced
+    assert pool.get("adapter_a") is not client
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_runtime_info_shows_adapter_connection_statistics(
+    keep_alive_server: KeepAliveServer, async_test_client: AsyncClient
+) -> None:
+    adapter_key = "test_runtime_info_adapter_key"
+    try:
+        for _ in range(2):
+            response = await adapter_client_pool.get(adapter_key).get(
+                keep_alive_server.url
+            )
+            assert response.text == "ok"
+    finally:
+        await adapter_client_pool.close()
+
+    async with async_test_client as ac:
+        response = await ac.get("engine/info")
+    assert response.status_code == 200
+    assert response.json()["worker_process_adapter_connection_statistics"][
+        adapter_key
+    ] == {
+        "requests": 2,
+        "opened_connections": 1,
+        "tls_handshakes": 0,
+        "requests_with_reused_connection": 1,
+    }
@@ -1,5 +1,6 @@
 from unittest import mock
 
+import httpx
 import pandas as pd
 import pytest
 
@@ -107,21 +108,21 @@ async def mock_load_generic_rest_dataframe_with_timestamp_col(*args, **kwargs):
 
 @pytest.mark.asyncio
 async def test_end_to_end_load_dataframe_data_with_timestamp_column():
-    resp_mock = mock.Mock()
-    resp_mock.status_code = 200
-    resp_mock.raw = """\n
+    response = httpx.Response(
+        200,
+        content=b"""\n
         {"timestamp": "2020-03-11T13:45:18.194000000Z", "a": 42.3}
         {"timestamp": "2020-03-11T14:45:18.194000000Z", "a": 41.7}
         {"timestamp": "2020-03-11T15:45:18.194000000Z", "a": 15.89922333}
-        """
-    resp_mock.headers = {}
+        """,
+    )
     with mock.patch(  # noqa: SIM117
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.send",
+            return_value=response,
         ):
             loaded_data = await load_data(
                 {
@@ -138,22 +139,23 @@ async def test_end_to_end_load_dataframe_data_with_timestamp_column():
 
 @pytest.mark.asyncio
 async def test_end_to_end_load_dataframe_data_with_attrs():
-    resp_mock = mock.Mock()
-    resp_mock.status_code = 200
     attributes = {"b": 2}
-    resp_mock.headers = {"Data-Attributes": encode_attributes(attributes)}
-    resp_mock.raw = """\n
+    response = httpx.Response(
+        200,
+        headers={"Data-Attributes": encode_attributes(attributes)},
+        content=b"""\n
         {"timestamp": "2020-03-11T13:45:18.194000000Z", "a": 42.3}
         {"timestamp": "2020-03-11T14:45:18.194000000Z", "a": 41.7}
         {"timestamp": "2020-03-11T15:45:18.194000000Z", "a": 15.89922333}
-        """
+        """,
+    )
     with mock.patch(  # noqa: SIM117
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.send",
+            return_value=response,
         ):
             loaded_data = await load_data(
                 {
@@ -1,5 +1,6 @@
 from unittest import mock
 
+import httpx
 import pandas as pd
 import pytest
 
@@ -16,8 +17,8 @@ from hetdesrun.models.data_selection import FilteredSource
 
 @pytest.mark.asyncio
 async def test_load_single_multitsframe_from_adapter_end_to_end() -> None:
-    resp_mock = mock.Mock(
-        status_code=200,
+    response = httpx.Response(
+        200,
         headers={
             "Data-Attributes": encode_attributes(
                 {
@@ -26,7 +27,7 @@ async def test_load_single_multitsframe_from_adapter_end_to_end() -> None:
                 }
             )
         },
-        raw="""
+        content=b"""
         {"timestamp": "2019-08-01T15:45:36.000Z", "metric": "a", "value": 1.0}
         {"timestamp": "2019-08-01T15:45:37.000Z", "metric": "b", "value": 1.2}
         {"timestamp": "2019-08-01T15:45:37.000Z", "metric": "c", "value": 0.5}
@@ -43,8 +44,8 @@ async def test_load_single_multitsframe_from_adapter_end_to_end() -> None:
         return_value="https://hetida.de",
     ):
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.send",
+            return_value=response,
         ):
             mtsf = await load_single_multitsframe_from_adapter(
                 FilteredSource(
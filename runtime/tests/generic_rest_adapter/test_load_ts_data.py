@@ -1,8 +1,10 @@
+import asyncio
 from unittest import mock
 
+import httpx
+import numpy as np
 import pandas as pd
 import pytest
-import requests
 
 from hetdesrun.adapters.exceptions import (
     AdapterClientWiringInvalidError,
@@ -13,7 +15,12 @@ from hetdesrun.adapters.generic_rest import (
     load_grouped_timeseries_data_together,
 )
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
-from hetdesrun.adapters.generic_rest.load_ts_data import load_ts_data_from_adapter
+from hetdesrun.adapters.generic_rest.load_ts_data import (
+    WindowSizer,
+    load_ts_data_from_adapter,
+    load_ts_data_in_windows,
+    split_loaded_data_by_ts_id,
+)
 from hetdesrun.models.data_selection import FilteredSource
 
 
@@ -23,14 +30,11 @@ async def test_load_ts_adapter_request():
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
-        resp_mock = mock.Mock()
-        resp_mock.status_code = 200
-        resp_mock.raw = """\n
+        ndjson = b"""\n
             {"timeseriesId": "1", "timestamp": "2020-03-11T13:45:18.194000000Z", "value": 42.3}
             {"timeseriesId": "1", "timestamp": "2020-03-11T14:45:18.194000000Z", "value": 41.7}
             {"timeseriesId": "1", "timestamp": "2020-03-11T15:45:18.194000000Z", "value": 15.89922333}
             """
-        resp_mock.headers = {}
 
         filtered_sources = [
             FilteredSource(
@@ -51,9 +55,14 @@ async def test_load_ts_adapter_request():
             }
         )
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
-        ) as get_request_mock:
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.send",
+            side_effect=[
+                httpx.Response(200, content=ndjson),
+                httpx.Response(400, text="my adapter error"),
+                httpx.Response(404, json={"errorCode": "RESULT_EMPTY"}),
+                httpx.Response(200, content=b""),
+            ],
+        ) as send_mock:
             df = await load_ts_data_from_adapter(
                 filtered_sources,
                 filter_params=filter_params,
@@ -63,16 +72,16 @@ async def test_load_ts_adapter_request():
             assert df.shape == (3, 3)
             assert df["timeseriesId"].dtype == "string"
 
-            assert get_request_mock.call_count == 1
-            kwargs = get_request_mock.call_args.kwargs
-            assert len(kwargs["params"]) == 4
-            assert ("id", "1") in kwargs["params"]
-            assert ("filter_key", "filter_value") in kwargs["params"]
-            assert ("from", "2018-09-01T00:00:00Z") in kwargs["params"]
-            assert ("to", "2020-01-01T00:00:00Z") in kwargs["params"]
+            assert send_mock.call_count == 1
+            request = send_mock.call_args.kwargs["request"]
+            assert request.method == "GET"
+            params = request.url.params.multi_items()
+            assert len(params) == 4
+            assert ("id", "1") in params
+            assert ("filter_key", "filter_value") in params
+            assert ("from", "2018-09-01T00:00:00Z") in params
+            assert ("to", "2020-01-01T00:00:00Z") in params
 
-            resp_mock.status_code = 400
-            resp_mock.text = "my adapter error"
             with pytest.raises(AdapterConnectionError, match="my adapter error"):
                 await load_ts_data_from_adapter(
                     filtered_sources,
@@ -80,10 +89,6 @@ async def test_load_ts_adapter_request():
                     adapter_key="test_load_ts_generic_adapter_key",
                 )
 
-            resp_mock.status_code = 404
-            resp_mock.text = "errorCode"
-            resp_mock.json = mock.Mock(return_value={"errorCode": "RESULT_EMPTY"})
-
             df = await load_ts_data_from_adapter(
                 filtered_sources,
                 filter_params=filter_params,
@@ -92,8 +97,6 @@ async def test_load_ts_adapter_request():
 
             assert df.shape == (0, 3)
 
-            resp_mock.status_code = 200
-            resp_mock.raw = ""
             df = await load_ts_data_from_adapter(
                 filtered_sources,
                 filter_params=filter_params,
@@ -371,8 +374,8 @@ async def test_end_to_end_load_ts_with_exception():
         return_value="https://hetida.de",
     ):
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=mock.Mock(status_code=406, text="my adapter error"),
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.send",
+            return_value=httpx.Response(406, text="my adapter error"),
         ), pytest.raises(AdapterConnectionError, match="my adapter error"):
             await load_data(
                 {
@@ -389,8 +392,8 @@ async def test_end_to_end_load_ts_with_exception():
             )
 
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            side_effect=requests.HTTPError("my http error"),
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.send",
+            side_effect=httpx.ConnectError("my http error"),
         ), pytest.raises(AdapterConnectionError, match="my http error"):
             await load_data(
                 {
@@ -405,3 +408,137 @@ async def test_end_to_end_load_ts_with_exception():
                 },
                 adapter_key="end_to_end_only_ts_data",
             )
+
+
+def timeseries_records(start: str, periods: int) -> pd.DataFrame:
+    timestamps = pd.date_range(start, periods=periods, freq="1h", tz="UTC")
+    return pd.DataFrame(
+        {
+            "timeseriesId": pd.Series(["id_1", "id_2"] * periods, dtype="string"),
+            "timestamp": timestamps.repeat(2),
+            "value": range(2 * periods),
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_ts_data_in_windows():
+    records = timeseries_records("2020-01-01", periods=10 * 24)
+    requested_ranges = []
+    concurrent_requests = 0
+    max_concurrent_requests = 0
+
+    async def load_range(filtered_sources, additional_params, adapter_key, endpoint):
+        nonlocal concurrent_requests, max_concurrent_requests
+        params = dict(additional_params)
+        assert params["filter_key"] == "filter_value"
+        requested_ranges.append((params["from"], params["to"]))
+        concurrent_requests += 1
+        max_concurrent_requests = max(max_concurrent_requests, concurrent_requests)
+        await asyncio.sleep(0.01)
+        concurrent_requests -= 1
+        # from and to are both inclusive
+        window = records[
+            (records["timestamp"] >= pd.Timestamp(params["from"]))
+            & (records["timestamp"] <= pd.Timestamp(params["to"]))
+        ].reset_index(drop=True)
+        window.attrs = {"id_1": {"from": params["from"]}}
+        return window
+
+    filter_params = [
+        ("from", "2020-01-01T00:00:00Z"),
+        ("to", "2020-01-10T23:00:00Z"),
+        ("filter_key", "filter_value"),
+    ]
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_ts_data.load_framelike_data",
+        new=load_range,
+    ), mock.patch(
+        "hetdesrun.webservice.config.runtime_config.adapter_timeseries_window_concurrency",
+        3,
+    ):
+        df = await load_ts_data_in_windows(
+            [FilteredSource(ref_id="id_1", type="timeseries(int)")],
+            filter_params,
+            adapter_key="test_load_ts_in_windows_adapter_key",
+            window_length=pd.Timedelta(hours=12),
+        )
+
+    pd.testing.assert_frame_equal(df, records)
+    assert len(requested_ranges) > 3
+    assert max_concurrent_requests == 3
+    # consecutive windows covering the complete range
+    sorted_ranges = sorted(requested_ranges)
+    assert sorted_ranges[0][0] == "2020-01-01T00:00:00.000000000Z"
+    assert sorted_ranges[-1][1] == "2020-01-10T23:00:00.000000000Z"
+    for (_, previous_to), (next_from, _) in zip(
+        sorted_ranges, sorted_ranges[1:], strict=False
+    ):
+        assert previous_to == next_from
+    assert df.attrs == {"id_1": {"from": sorted_ranges[-1][0]}}
+
+    # fallback to one request for ranges which cannot be split
+    requested_ranges.clear()
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_ts_data.load_framelike_data",
+        new=load_range,
+    ):
+        df = await load_ts_data_in_windows(
+            [FilteredSource(ref_id="id_1", type="timeseries(int)")],
+            [
+                ("from", "2020-01-01T00:00:00Z"),
+                ("to", "2020-01-01T00:00:00Z"),
+                ("filter_key", "filter_value"),
+            ],
+            adapter_key="test_load_ts_in_windows_adapter_key",
+            window_length=pd.Timedelta(hours=12),
+        )
+    assert requested_ranges == [("2020-01-01T00:00:00Z", "2020-01-01T00:00:00Z")]
+    assert len(df) == 2
+
+
+def test_window_sizer():
+    sizer = WindowSizer(pd.Timedelta(hours=1), target_seconds=10, target_rows=1000)
+
+    # fast and small responses: grow by at most a factor of two
+    sizer.observe(pd.Timedelta(hours=1), row_count=10, seconds=0.1)
+    assert sizer.length == pd.Timedelta(hours=2)
+
+    # too many rows: shrink to the target number of rows
+    sizer.observe(pd.Timedelta(hours=2), row_count=1600, seconds=1)
+    assert sizer.length == pd.Timedelta(hours=1.25)
+
+    # too slow: shrink by at most a factor of two
+    sizer.observe(pd.Timedelta(hours=1), row_count=100, seconds=60)
+    assert sizer.length == pd.Timedelta(minutes=30)
+
+    sizer.observe(pd.Timedelta(seconds=1), row_count=10_000, seconds=60)
+    assert sizer.length == pd.Timedelta(seconds=1)
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_split_loaded_data_by_ts_id(shuffle):
+    df = timeseries_records("2020-01-01", periods=48)
+    df = df.sort_values(["timeseriesId", "timestamp"]).reset_index(drop=True)
+    if shuffle:
+        df = df.sample(frac=1, random_state=0).reset_index(drop=True)
+    # rows without timeseries id are ignored
+    df.loc[len(df) - 1, "timeseriesId"] = pd.NA
+    df.attrs = {"id_1": {"unit": "K"}}
+
+    split_series = split_loaded_data_by_ts_id(df, ["id_1", "id_2", "id_3"])
+
+    for ts_id in ["id_1", "id_2"]:
+        expected = df[df["timeseriesId"] == ts_id].set_index("timestamp")["value"]
+        pd.testing.assert_series_equal(
+            split_series[ts_id], expected.sort_index().rename(ts_id)
+        )
+    assert split_series["id_1"].attrs == {"unit": "K"}
+    assert split_series["id_2"].attrs == {}
+    assert len(split_series["id_3"]) == 0
+    assert split_series["id_3"].dtype == df["value"].dtype
+    assert pd.api.types.is_datetime64tz_dtype(split_series["id_3"].index)
+
+    if not shuffle:
+        # already sorted rows are not copied
+        assert np.shares_memory(split_series["id_2"].to_numpy(), df["value"].to_numpy())
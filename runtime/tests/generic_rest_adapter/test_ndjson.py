@@ -0,0 +1,134 @@
+import asyncio
+import io
+from unittest import mock
+
+import httpx
+import pandas as pd
+import pytest
+
+from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.adapters.generic_rest.load_framelike import load_framelike_data
+from hetdesrun.adapters.generic_rest.ndjson import (
+    NDJSONFrameParser,
+    NDJSONParsingError,
+)
+from hetdesrun.models.data_selection import FilteredSource
+
+NDJSON_EXAMPLES = [
+    b"""
+    {"timeseriesId": "1", "timestamp": "2020-03-11T13:45:18.194000000Z", "value": 42.3}
+    {"timeseriesId": "1", "timestamp": "2020-03-11T14:45:18.194000000Z", "value": 41}
+
+    {"timeseriesId": "2", "timestamp": "2020-03-11T15:45:18.194000000Z", "value": null}
+    """,
+    b'{"timestamp": 1583934318194, "value": 1}\n{"timestamp": 1583934319194, "value": 2}',
+    b'{"a": 1, "b": true}\n{"a": 2, "c": "x"}\n{"b": false, "c": "y", "a": 3}\n',
+    b'{"a": 1}\n{"a": "text"}\n{"a": [1, 2]}\n{"a": 18446744073709551}\n',
+    b'{"metric": "a", "value": "ok"}\n{"metric": "b", "value": null}\n',
+]
+
+
+def parse_in_chunks(ndjson: bytes, chunk_size: int) -> pd.DataFrame:
+    parser = NDJSONFrameParser()
+    for start in range(0, len(ndjson), chunk_size):
+        parser.feed(ndjson[start : start + chunk_size])
+    return parser.finish()
+
+
+@pytest.mark.parametrize("ndjson", NDJSON_EXAMPLES)
+@pytest.mark.parametrize("chunk_size", [1, 7, 10_000])
+def test_ndjson_frame_parser_matches_read_json(ndjson: bytes, chunk_size: int) -> None:
+    pd.testing.assert_frame_equal(
+        parse_in_chunks(ndjson, chunk_size),
+        pd.read_json(io.BytesIO(ndjson), lines=True),
+    )
+
+
+def test_ndjson_frame_parser_buffers_numbers_as_typed_arrays() -> None:
+    parser = NDJSONFrameParser()
+    parser.feed(b'{"a": 1, "b": 1, "c": "x"}\n{"a": 2, "b": null, "c": "y"}\n')
+    assert parser.columns["a"].buffer.typecode == "q"
+    assert parser.columns["b"].buffer.typecode == "d"
+    assert isinstance(parser.columns["c"].buffer, list)
+
+    df = parser.finish()
+    assert df["a"].dtype == "int64"
+    assert df["b"].dtype == "float64"
+
+
+def test_ndjson_frame_parser_without_records() -> None:
+    parser = NDJSONFrameParser()
+    parser.feed(b"\n  \n")
+    assert parser.finish().empty
+
+
+@pytest.mark.parametrize("ndjson", [b'{"a": 1}\n{"a": ', b"[1, 2]\n", b"{'a': 1}\n"])
+def test_ndjson_frame_parser_invalid_lines(ndjson: bytes) -> None:
+    with pytest.raises(NDJSONParsingError):
+        parse_in_chunks(ndjson, chunk_size=len(ndjson))
+
+
+class SlowStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+
+    async def __aiter__(self):  # type: ignore[no-untyped-def]
+        for chunk in self.chunks:
+            await asyncio.sleep(0.01)
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_load_framelike_data_does_not_block_event_loop() -> None:
+    chunks = [
+        b'{"timestamp": "2020-03-11T13:45:18.194000000Z", "a": 42.3}\n{"timest',
+        b'amp": "2020-03-11T14:45:18.194000000Z", "a": 41.7}\n',
+    ] * 5
+    ticks = 0
+
+    async def count_ticks() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.send",
+        return_value=httpx.Response(200, stream=SlowStream(chunks)),
+    ):
+        ticker = asyncio.create_task(count_ticks())
+        df = await load_framelike_data(
+            [FilteredSource(ref_id="id_1", type=ExternalType.DATAFRAME)],
+            additional_params=[],
+            adapter_key="test_ndjson_adapter_key",
+            endpoint="dataframe",
+        )
+        ticker.cancel()
+
+    assert df.shape == (10, 2)
+    assert pd.api.types.is_datetime64tz_dtype(df.index)
+    # the counting task was running while the chunks were received
+    assert ticks >= len(chunks)
+
+
+@pytest.mark.asyncio
+async def test_load_framelike_data_with_invalid_ndjson() -> None:
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.send",
+        return_value=httpx.Response(200, content=b'{"a": 1}\n<html>'),
+    ), pytest.raises(
+        AdapterHandlingException, match="invalid NDJSON"
+    ):
+        await load_framelike_data(
+            [FilteredSource(ref_id="id_1", type=ExternalType.DATAFRAME)],
+            additional_params=[],
+            adapter_key="test_ndjson_adapter_key",
+            endpoint="dataframe",
+        )
@@ -9,6 +9,7 @@ from hetdesrun.adapters.generic_rest import send_data
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.generic_rest.load_framelike import decode_attributes
 from hetdesrun.models.data_selection import FilteredSink
+from tests.generic_rest_adapter.mocked_post import posted_records
 
 
 @pytest.mark.asyncio
@@ -78,7 +79,7 @@ async def test_end_to_end_send_only_multitsframe_data() -> None:
         assert post_mock.called  # we got through to actually posting!
         _, _, kwargs_1 = post_mock.mock_calls[0]
         assert kwargs_1["params"] == [("id", "sink_id_1")]
-        assert kwargs_1["json"] == [
+        assert (await posted_records(kwargs_1)) == [
             {
                 "timestamp": "2019-08-01T15:45:36.000000000Z",
                 "metric": "a",
@@ -132,7 +133,7 @@ async def test_end_to_end_send_only_multitsframe_data() -> None:
 
         _, _, kwargs_2 = post_mock.mock_calls[1]
         assert kwargs_2["params"] == [("id", "sink_id_2")]
-        assert kwargs_2["json"] == [
+        assert (await posted_records(kwargs_2)) == [
             {
                 "timestamp": "2019-08-01T15:45:36.000000000Z",
                 "metric": "a",
@@ -168,7 +169,7 @@ async def test_end_to_end_send_only_multitsframe_data() -> None:
 
         _, _, kwargs_3 = post_mock.mock_calls[2]
         assert kwargs_3["params"] == [("id", "sink_id_3")]
-        assert kwargs_3["json"] == []
+        assert (await posted_records(kwargs_3)) == []
 
         no_mtsf = pd.Series([1.0], index=pd.to_datetime(["2019-08-01T15:45:36Z"]))
         with pytest.raises(
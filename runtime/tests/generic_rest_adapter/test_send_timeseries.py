@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import numpy as np
@@ -7,7 +8,13 @@ import pytest
 from hetdesrun.adapters.generic_rest import send_data
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.generic_rest.load_framelike import decode_attributes
+from hetdesrun.adapters.generic_rest.send_framelike import (
+    RecordColumn,
+    iterate_json_records,
+)
+from hetdesrun.adapters.generic_rest.timestamps import format_timestamps
 from hetdesrun.models.data_selection import FilteredSink
+from tests.generic_rest_adapter.mocked_post import posted_records
 
 
 @pytest.mark.asyncio
@@ -49,7 +56,7 @@ async def test_end_to_end_send_only_timeseries_data():
 
             func_name, args, kwargs = post_mock.mock_calls[0]
             assert kwargs["params"] == [("timeseriesId", "sink_id_1")]
-            assert kwargs["json"] == [
+            assert (await posted_records(kwargs)) == [
                 {"timestamp": "2020-01-15T00:00:00.000000000Z", "value": 1.2},
                 {"timestamp": "2020-01-15T01:00:00.000000000Z", "value": 3.4},
                 {"timestamp": "2020-01-15T02:00:00.000000000Z", "value": 5.9},
@@ -87,8 +94,11 @@ async def test_end_to_end_send_only_timeseries_data():
             # note: can be async!
             func_name_1, args_1, kwargs_1 = post_mock.mock_calls[1]
             func_name_2, args_2, kwargs_2 = post_mock.mock_calls[2]
-            assert (len(kwargs_1["json"]) == 3) or (len(kwargs_2["json"]) == 3)
-            assert (len(kwargs_1["json"]) == 2) or (len(kwargs_2["json"]) == 2)
+            record_counts = {
+                len(await posted_records(kwargs_1)),
+                len(await posted_records(kwargs_2)),
+            }
+            assert record_counts == {2, 3}
 
             # a timeseries with attributes
             ts_3 = pd.Series(
@@ -115,9 +125,51 @@ async def test_end_to_end_send_only_timeseries_data():
             # note: can be async!
             func_name_3, args_3, kwargs_3 = post_mock.mock_calls[3]
 
-            assert kwargs_3["json"][2]["value"] is None  # np.nan comes through as null
+            records_3 = await posted_records(kwargs_3)
+            assert records_3[2]["value"] is None  # np.nan comes through as null
             assert "Data-Attributes" in kwargs_3["headers"]
             received_attrs = decode_attributes(kwargs_3["headers"]["Data-Attributes"])
             for key, value in ts_3_attrs.items():
                 assert key in received_attrs
                 assert received_attrs[key] == value
+
+
+def test_record_column_converts_chunks_without_copying_values():
+    values = pd.Series([1.5, np.nan, 3.0])
+    column = RecordColumn(values)
+    assert np.shares_memory(column.array.to_numpy(), values.to_numpy())
+    assert column.to_list(0, 2) == [1.5, None]
+    assert column.to_list(2, 4) == [3.0]
+
+    index = pd.DatetimeIndex(["2020-01-01T00:00:00Z", None], tz="UTC")
+    assert RecordColumn(index, format_timestamps).to_list(0, 2) == [
+        "2020-01-01T00:00:00.000000000Z",
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 2, 10])
+async def test_iterate_json_records(chunk_size):
+    index = pd.date_range("2020-01-01", periods=5, freq="1h", tz="UTC")
+    values = pd.Series([1.5, np.nan, 3, 4.25, None])
+    chunks = [
+        chunk
+        async for chunk in iterate_json_records(
+            {
+                "timestamp": RecordColumn(index, format_timestamps),
+                "value": RecordColumn(values),
+            },
+            chunk_size=chunk_size,
+        )
+    ]
+    assert json.loads(b"".join(chunks)) == [
+        {"timestamp": timestamp, "value": value}
+        for timestamp, value in zip(
+            format_timestamps(index), [1.5, None, 3.0, 4.25, None], strict=True
+        )
+    ]
+    # the records are encoded chunk by chunk
+    assert len(chunks) >= 5 // chunk_size
+
+    assert [chunk async for chunk in iterate_json_records({})] == [b"[", b"]"]
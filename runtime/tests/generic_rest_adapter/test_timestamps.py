@@ -0,0 +1,42 @@
+import pandas as pd
+
+from hetdesrun.adapters.generic_rest.timestamps import (
+    format_timestamps,
+    isoformat_timestamps,
+)
+
+
+def test_format_timestamps():
+    index = pd.DatetimeIndex(
+        [
+            "1970-01-01T00:00:00Z",
+            "2020-01-15T01:02:03.123456789Z",
+            "2262-04-11T23:47:16.854775807Z",
+        ]
+    )
+    assert list(format_timestamps(index)) == [
+        timestamp.strftime("%Y-%m-%dT%H:%M:%S.%f") + f"{timestamp.nanosecond:03d}" + "Z"
+        for timestamp in index
+    ]
+    assert list(format_timestamps(pd.Series(index))) == list(format_timestamps(index))
+
+
+def test_isoformat_timestamps():
+    index = pd.DatetimeIndex(
+        [
+            "1969-12-31T23:59:59.999999999Z",
+            "1970-01-01T00:00:00Z",
+            "2020-03-29T00:59:59.5Z",
+            "2020-03-29T01:00:00.000001Z",
+            "2020-10-25T00:30:00.123Z",
+        ]
+    )
+    for timestamps in [
+        index,
+        index.tz_convert("Europe/Berlin"),
+        index.tz_convert("America/St_Johns"),
+        index.tz_localize(None),
+    ]:
+        assert list(isoformat_timestamps(timestamps)) == [
+            timestamp.isoformat() for timestamp in timestamps
+        ]
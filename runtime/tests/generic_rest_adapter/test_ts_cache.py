@@ -0,0 +1,278 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.adapters.generic_rest.load_ts_data import (
+    load_grouped_timeseries_data_together,
+)
+from hetdesrun.adapters.generic_rest.ts_cache import TimeseriesCache, timeseries_cache
+from hetdesrun.models.data_selection import FilteredSource
+
+NOW = pd.Timestamp("2020-01-11T00:00:00Z")
+
+RECORDS = pd.DataFrame(
+    {
+        "timeseriesId": pd.Series(["id_1", "id_2"] * 10 * 24, dtype="string"),
+        "timestamp": pd.date_range(
+            "2020-01-01", periods=10 * 24, freq="1h", tz="UTC"
+        ).repeat(2),
+        "value": [float(value) for value in range(2 * 10 * 24)],
+    }
+)
+
+
+class FakeAdapter:
+    def __init__(self, records: pd.DataFrame = RECORDS) -> None:
+        self.records = records
+        self.requested_ranges: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+
+    async def load_range(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        self.requested_ranges.append((start, end))
+        # from and to are both inclusive
+        df = self.records[
+            (self.records["timestamp"] >= start) & (self.records["timestamp"] <= end)
+        ].reset_index(drop=True)
+        df.attrs = {"id_1": {"unit": "K"}}
+        return df
+
+
+def direct_load(start: str, end: str, records: pd.DataFrame = RECORDS) -> pd.DataFrame:
+    df = records[
+        (records["timestamp"] >= pd.Timestamp(start))
+        & (records["timestamp"] <= pd.Timestamp(end))
+    ]
+    return df.sort_values(["timeseriesId", "timestamp"], kind="stable").reset_index(
+        drop=True
+    )
+
+
+async def load_from_cache(
+    cache: TimeseriesCache,
+    adapter: FakeAdapter,
+    start: str,
+    end: str,
+    filter_value: str = "a",
+) -> pd.DataFrame:
+    return await cache.load(
+        "test_ts_cache_adapter_key",
+        ["id_1", "id_2"],
+        ExternalType.TIMESERIES_FLOAT,
+        frozenset([("filter_key", filter_value)]),
+        pd.Timestamp(start),
+        pd.Timestamp(end),
+        adapter.load_range,
+    )
+
+
+@pytest.fixture()
+def _cache_config():
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.timeseries_cache_max_bytes",
+        10**9,
+    ), mock.patch("hetdesrun.adapters.generic_rest.ts_cache.utc_now", return_value=NOW):
+        yield
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_cache_config")
+async def test_timeseries_cache_loads_only_missing_ranges():
+    cache = TimeseriesCache()
+    adapter = FakeAdapter()
+
+    df = await load_from_cache(
+        cache, adapter, "2020-01-02T00:00:00Z", "2020-01-03T00:00:00Z"
+    )
+    pd.testing.assert_frame_equal(
+        df, direct_load("2020-01-02T00:00:00Z", "2020-01-03T00:00:00Z")
+    )
+    assert df.attrs == {"id_1": {"unit": "K"}}
+
+    # overlapping range: only the uncovered parts before and after are loaded
+    df = await load_from_cache(
+        cache, adapter, "2020-01-01T12:00:00Z", "2020-01-04T00:00:00Z"
+    )
+    pd.testing.assert_frame_equal(
+        df, direct_load("2020-01-01T12:00:00Z", "2020-01-04T00:00:00Z")
+    )
+    assert adapter.requested_ranges[1:] == [
+        (pd.Timestamp("2020-01-01T12:00:00Z"), pd.Timestamp("2020-01-02T00:00:00Z")),
+        (pd.Timestamp("2020-01-03T00:00:00Z"), pd.Timestamp("2020-01-04T00:00:00Z")),
+    ]
+    assert df.attrs == {"id_1": {"unit": "K"}}
+
+    # covered range (including single points) is served without requests
+    for start, end in [
+        ("2020-01-02T06:00:00Z", "2020-01-03T18:00:00Z"),
+        ("2020-01-03T00:00:00Z", "2020-01-03T00:00:00Z"),
+    ]:
+        df = await load_from_cache(cache, adapter, start, end)
+        pd.testing.assert_frame_equal(df, direct_load(start, end))
+    assert len(adapter.requested_ranges) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_cache_config")
+async def test_timeseries_cache_reloads_mutable_tail_and_expired_data():
+    records = RECORDS.copy()
+    cache = TimeseriesCache()
+    adapter = FakeAdapter(records)
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.timeseries_cache_mutable_tail_seconds",
+        2 * 24 * 3600,
+    ):
+        await load_from_cache(
+            cache, adapter, "2020-01-08T00:00:00Z", "2020-01-10T00:00:00Z"
+        )
+        # late-arriving data in the mutable tail is visible to later requests
+        records.loc[records["timestamp"] >= "2020-01-09", "value"] = -1.0
+        df = await load_from_cache(
+            cache, adapter, "2020-01-08T00:00:00Z", "2020-01-10T00:00:00Z"
+        )
+    pd.testing.assert_frame_equal(
+        df, direct_load("2020-01-08T00:00:00Z", "2020-01-10T00:00:00Z", records)
+    )
+    assert adapter.requested_ranges[1] == (
+        pd.Timestamp("2020-01-09T00:00:00Z"),
+        pd.Timestamp("2020-01-10T00:00:00Z"),
+    )
+
+    # expired data is loaded again
+    cache = TimeseriesCache()
+    adapter = FakeAdapter(records)
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.timeseries_cache_ttl_seconds",
+        3600,
+    ):
+        for now in [NOW, NOW + pd.Timedelta(minutes=30), NOW + pd.Timedelta(hours=2)]:
+            with mock.patch(
+                "hetdesrun.adapters.generic_rest.ts_cache.utc_now", return_value=now
+            ):
+                await load_from_cache(
+                    cache, adapter, "2020-01-01T00:00:00Z", "2020-01-02T00:00:00Z"
+                )
+    assert len(adapter.requested_ranges) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_cache_config")
+async def test_timeseries_cache_settings_per_adapter():
+    cache = TimeseriesCache()
+    adapter = FakeAdapter()
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.timeseries_cache_ttl_seconds",
+        3600,
+    ), mock.patch(
+        "hetdesrun.webservice.config.runtime_config"
+        ".timeseries_cache_ttl_seconds_by_adapter",
+        {"test_ts_cache_adapter_key": None},
+    ), mock.patch(
+        "hetdesrun.webservice.config.runtime_config"
+        ".timeseries_cache_mutable_tail_seconds_by_adapter",
+        {"test_ts_cache_adapter_key": 2 * 24 * 3600},
+    ):
+        for now in [NOW, NOW + pd.Timedelta(hours=2)]:
+            with mock.patch(
+                "hetdesrun.adapters.generic_rest.ts_cache.utc_now", return_value=now
+            ):
+                await load_from_cache(
+                    cache, adapter, "2020-01-01T00:00:00Z", "2020-01-10T00:00:00Z"
+                )
+    # the data of the adapter does not expire, but its mutable tail is loaded again
+    assert adapter.requested_ranges[1] == (
+        pd.Timestamp("2020-01-09T00:00:00Z"),
+        pd.Timestamp("2020-01-10T00:00:00Z"),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_cache_config")
+async def test_timeseries_cache_evicts_least_recently_used_timeseries():
+    cache = TimeseriesCache()
+    adapter = FakeAdapter()
+    await load_from_cache(
+        cache, adapter, "2020-01-01T00:00:00Z", "2020-01-02T00:00:00Z", "a"
+    )
+    size_bytes = cache.currsize_bytes
+    assert size_bytes > 0
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.timeseries_cache_max_bytes",
+        2 * size_bytes,
+    ):
+        for filter_value in ["b", "a", "c", "a"]:
+            await load_from_cache(
+                cache,
+                adapter,
+                "2020-01-01T00:00:00Z",
+                "2020-01-02T00:00:00Z",
+                filter_value,
+            )
+        assert cache.currsize_bytes <= 2 * size_bytes
+        # "b" was evicted when loading "c", since "a" was used more recently
+        assert len(adapter.requested_ranges) == 3
+        await load_from_cache(
+            cache, adapter, "2020-01-01T00:00:00Z", "2020-01-02T00:00:00Z", "b"
+        )
+        assert len(adapter.requested_ranges) == 4
+
+
+@pytest.mark.asyncio
+async def test_load_grouped_timeseries_data_together_with_cache():
+    requested_params = []
+
+    async def load_framelike_data(
+        filtered_sources, additional_params, adapter_key, endpoint
+    ):
+        params = dict(additional_params)
+        requested_params.append(params)
+        df = direct_load(params["from"], params["to"])
+        df["timeseriesId"] = df["timeseriesId"].astype(object)
+        return df
+
+    def data_to_load(timestamp_from: str, timestamp_to: str) -> dict:
+        return {
+            inp_name: FilteredSource(
+                ref_id=ts_id,
+                type="timeseries(float)",
+                filters={
+                    "timestampFrom": timestamp_from,
+                    "timestampTo": timestamp_to,
+                    "filter_key": "filter_value",
+                },
+            )
+            for inp_name, ts_id in [("inp_1", "id_1"), ("inp_2", "id_2")]
+        }
+
+    timeseries_cache.clear()
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_ts_data.load_framelike_data",
+        new=load_framelike_data,
+    ), mock.patch(
+        "hetdesrun.webservice.config.runtime_config.timeseries_cache_max_bytes",
+        10**9,
+    ):
+        await load_grouped_timeseries_data_together(
+            data_to_load("2020-01-01T00:00:00Z", "2020-01-02T00:00:00Z"),
+            adapter_key="test_load_grouped_with_cache_adapter_key",
+        )
+        loaded_data = await load_grouped_timeseries_data_together(
+            data_to_load("2020-01-01T12:00:00Z", "2020-01-03T00:00:00Z"),
+            adapter_key="test_load_grouped_with_cache_adapter_key",
+        )
+    timeseries_cache.clear()
+
+    assert requested_params[1] == {
+        "filter_key": "filter_value",
+        "from": "2020-01-02T00:00:00.000000000Z",
+        "to": "2020-01-03T00:00:00.000000000Z",
+    }
+    expected = direct_load("2020-01-01T12:00:00Z", "2020-01-03T00:00:00Z")
+    for inp_name, ts_id in [("inp_1", "id_1"), ("inp_2", "id_2")]:
+        assert loaded_data[inp_name].name == ts_id
+        assert loaded_data[inp_name].to_numpy().tolist() == (
+            expected[expected["timeseriesId"] == ts_id]["value"].tolist()
+        )
+        assert len(loaded_data[inp_name]) == 37
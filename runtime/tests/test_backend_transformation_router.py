@@ -3,12 +3,16 @@ import logging
 from copy import deepcopy
 from posixpath import join as posix_urljoin
 from unittest import mock
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi import HTTPException
 
-from hetdesrun.backend.execution import ExecByIdInput, ExecLatestByGroupIdInput
+from hetdesrun.backend.execution import (
+    BatchExecByIdInput,
+    ExecByIdInput,
+    ExecLatestByGroupIdInput,
+)
 from hetdesrun.component.code import update_code
 from hetdesrun.models.wiring import InputWiring, WorkflowWiring
 from hetdesrun.persistence import get_db_engine, sessionmaker
@@ -1562,6 +1566,58 @@ async def test_execute_for_transformation_revision_without_job_id(
             assert "job_id" in resp_data
 
 
+@pytest.mark.asyncio
+async def test_execute_batch_for_transformation_revision(
+    async_test_client, clean_test_db_engine
+):
+    patched_session = sessionmaker(clean_test_db_engine)
+    with mock.patch(  # noqa: SIM117
+        "hetdesrun.persistence.dbservice.nesting.Session",
+        patched_session,
+    ):
+        with mock.patch(
+            "hetdesrun.persistence.dbservice.revision.Session",
+            patched_session,
+        ):
+            tr_component_1 = TransformationRevision(**tr_json_component_1)
+            tr_component_1.content = update_code(tr_component_1)
+            store_single_transformation_revision(tr_component_1)
+            tr_workflow_2 = TransformationRevision(**tr_json_workflow_2_update)
+
+            store_single_transformation_revision(tr_workflow_2)
+
+            update_or_create_nesting(tr_workflow_2)
+
+            batch_exec_by_id_input = BatchExecByIdInput(
+                id=tr_workflow_2.id,
+                wirings=[tr_workflow_2.test_wiring, tr_workflow_2.test_wiring],
+            )
+
+            async with async_test_client as ac:
+                response = await ac.post(
+                    "/api/transformations/execute-batch",
+                    json=json.loads(batch_exec_by_id_input.json()),
+                )
+                batch_exec_by_id_input.id = uuid4()
+                not_found_response = await ac.post(
+                    "/api/transformations/execute-batch",
+                    json=json.loads(batch_exec_by_id_input.json()),
+                )
+
+            assert response.status_code == 200
+            resp_data = response.json()
+            assert len(resp_data) == 2
+            assert resp_data[0]["job_id"] != resp_data[1]["job_id"]
+            for exec_response in resp_data:
+                assert exec_response["result"] == "ok"
+                assert "output_types_by_output_name" in exec_response
+            assert (
+                resp_data[0]["output_results_by_output_name"]
+                == resp_data[1]["output_results_by_output_name"]
+            )
+            assert not_found_response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_execute_for_separate_runtime_container(
     async_test_client, clean_test_db_engine
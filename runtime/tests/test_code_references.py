@@ -0,0 +1,176 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from hetdesrun.backend.execution import (
+    post_to_runtime,
+    revision_code_hash,
+    runtime_loaded_code_hashes,
+    with_code_module_references,
+)
+from hetdesrun.component.load import hash_code, imported_code_by_hash
+from hetdesrun.models.code import CodeModule, CodeModuleReference
+from hetdesrun.models.run import WorkflowExecutionInput
+from hetdesrun.runtime.code_references import (
+    LOADED_CODE_HASHES_HEADER,
+    MissingCodeModulesError,
+    resolve_code_module_references,
+)
+from hetdesrun.trafoutils.io.load import load_json
+
+
+def nested_wf_execution_input() -> WorkflowExecutionInput:
+    return WorkflowExecutionInput(
+        **load_json(os.path.join("tests", "data", "nested_wf_execution_input.json"))
+    )
+
+
+def test_resolve_code_module_references():
+    execution_input = nested_wf_execution_input()
+    code_module = execution_input.code_modules[0]
+    reference = CodeModuleReference(
+        uuid=code_module.uuid, code_hash=hash_code(code_module.code)
+    )
+
+    with mock.patch.dict(imported_code_by_hash, clear=True):
+        with pytest.raises(MissingCodeModulesError) as exc_info:
+            resolve_code_module_references([], [reference])
+        assert exc_info.value.code_hashes == [reference.code_hash]
+
+        imported_code_by_hash[reference.code_hash] = code_module.code
+        assert resolve_code_module_references(
+            execution_input.code_modules[1:], [reference]
+        ) == [*execution_input.code_modules[1:], code_module]
+
+
+@pytest.mark.asyncio
+async def test_runtime_endpoint_with_code_module_references(
+    async_test_client: AsyncClient,
+):
+    execution_input = nested_wf_execution_input()
+    references = [
+        CodeModuleReference(
+            uuid=code_module.uuid, code_hash=hash_code(code_module.code)
+        )
+        for code_module in execution_input.code_modules
+    ]
+    referencing_input = execution_input.copy(
+        update={"code_modules": [], "code_module_references": references}
+    )
+
+    async with async_test_client as client:
+        response = await client.post(
+            "engine/runtime", json=json.loads(execution_input.json())
+        )
+        assert response.status_code == 200
+        assert set(response.headers[LOADED_CODE_HASHES_HEADER].split(",")) == {
+            reference.code_hash for reference in references
+        }
+
+        referencing_response = await client.post(
+            "engine/runtime", json=json.loads(referencing_input.json())
+        )
+        assert referencing_response.status_code == 200
+        assert (
+            referencing_response.json()["output_results_by_output_name"]
+            == response.json()["output_results_by_output_name"]
+        )
+
+        with mock.patch.dict(imported_code_by_hash, clear=True):
+            missing_response = await client.post(
+                "engine/runtime", json=json.loads(referencing_input.json())
+            )
+        assert missing_response.status_code == 409
+        assert set(missing_response.json()["missing_code_hashes"]) == {
+            reference.code_hash for reference in references
+        }
+
+
+@pytest.mark.asyncio
+async def test_post_to_runtime_sends_references_for_loaded_code(
+    app_without_auth: FastAPI,
+):
+    execution_input = nested_wf_execution_input()
+    code_hashes = {
+        hash_code(code_module.code) for code_module in execution_input.code_modules
+    }
+    sent_inputs = []
+
+    async with AsyncClient(app=app_without_auth, base_url="http://test") as client:
+        original_post = client.post
+
+        async def recording_post(*args, **kwargs):  # type: ignore[no-untyped-def]
+            sent_inputs.append(json.loads(kwargs["content"]))
+            return await original_post(*args, **kwargs)
+
+        with mock.patch(
+            "hetdesrun.backend.execution.runtime_client_pool.get",
+            return_value=mock.Mock(post=recording_post),
+        ), mock.patch(
+            "hetdesrun.webservice.config.runtime_config.hd_runtime_engine_url",
+            "http://test/engine/",
+        ), mock.patch(
+            "hetdesrun.backend.execution.runtime_loaded_code_hashes", set()
+        ) as loaded_code_hashes:
+            first_result = await post_to_runtime("runtime", execution_input)
+            assert loaded_code_hashes == code_hashes
+            second_result = await post_to_runtime("runtime", execution_input)
+
+            # the runtime lost the code, e.g. due to a restart
+            with mock.patch.dict(imported_code_by_hash, clear=True):
+                third_result = await post_to_runtime("runtime", execution_input)
+
+    assert len(sent_inputs[0]["code_modules"]) == len(code_hashes)
+    assert sent_inputs[0]["code_module_references"] == []
+    assert sent_inputs[1]["code_modules"] == []
+    assert {
+        reference["code_hash"] for reference in sent_inputs[1]["code_module_references"]
+    } == code_hashes
+    # references answered with 409, then the complete code
+    assert sent_inputs[2]["code_modules"] == []
+    assert len(sent_inputs[3]["code_modules"]) == len(code_hashes)
+    assert len(sent_inputs) == 4
+
+    for result in (first_result, second_result, third_result):
+        assert result["result"] == "ok"
+        assert (
+            result["output_results_by_output_name"]
+            == first_result["output_results_by_output_name"]
+        )
+    assert runtime_loaded_code_hashes == set()
+
+
+def test_code_hashes_are_reused_between_executions():
+    execution_input = nested_wf_execution_input()
+    code_hashes = {
+        hash_code(code_module.code) for code_module in execution_input.code_modules
+    }
+    revision_code_hash.cache_clear()
+
+    with mock.patch(
+        "hetdesrun.backend.execution.hash_code", wraps=hash_code
+    ) as hash_code_mock, mock.patch(
+        "hetdesrun.backend.execution.runtime_loaded_code_hashes", code_hashes
+    ):
+        for _ in range(2):
+            referencing_input = with_code_module_references(execution_input)
+            assert referencing_input.code_modules == []
+            assert {
+                reference.code_hash
+                for reference in referencing_input.code_module_references
+            } == code_hashes
+        assert hash_code_mock.call_count == len(execution_input.code_modules)
+
+        # changed code of a draft revision is hashed again
+        code_module = execution_input.code_modules[0]
+        changed_code_module = CodeModule(
+            uuid=code_module.uuid, code=code_module.code + "\n"
+        )
+        assert with_code_module_references(
+            execution_input.copy(update={"code_modules": [changed_code_module]})
+        ).code_modules == [changed_code_module]
+        assert hash_code_mock.call_count == len(execution_input.code_modules) + 1
@@ -1,3 +1,5 @@
+import json
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -6,10 +8,17 @@ from pydantic import BaseModel
 
 from hetdesrun.datatypes import (
     DataType,
+    MultiTSFrameProblem,
     PydanticMultiTimeseriesPandasDataFrame,
     PydanticPandasDataFrame,
     PydanticPandasSeries,
+    dynamic_model,
+    frame_from_json_like,
+    mark_as_valid_multitsframe,
+    multitsframe_problem,
     parse_dynamically_from_datatypes,
+    parse_via_pydantic,
+    series_from_json_like,
 )
 
 
@@ -38,6 +47,29 @@ def test_parsing():
     assert result.dict() == {}
 
 
+def test_dynamic_models_are_reused():
+    first_result = parse_dynamically_from_datatypes(
+        [{"name": "x", "type": DataType.Float, "value": 1.5}]
+    )
+    second_result = parse_dynamically_from_datatypes(
+        [{"name": "x", "type": DataType.Float, "value": 2.5}]
+    )
+    assert type(first_result) is type(second_result)
+    assert second_result.x == 2.5
+    assert type(first_result) is dynamic_model((("x", float),))
+
+    integer_result = parse_dynamically_from_datatypes(
+        [{"name": "x", "type": DataType.Integer, "value": 3}]
+    )
+    assert type(integer_result) is not type(first_result)
+
+    string_result = parse_via_pydantic(
+        [{"name": "x", "type": DataType.Integer, "value": 3}],
+        type_map={DataType.Integer: str},
+    )
+    assert string_result.x == "3"
+
+
 def test_series_parsing():
     class MySeriesModel(BaseModel):
         s: PydanticPandasSeries
@@ -194,6 +226,78 @@ def test_multitsframe_parsing():
         )
 
 
+def test_multitsframe_metric_is_string():
+    timestamps = pd.to_datetime(["2019-08-01T15:45:36Z", "2019-08-01T15:45:37Z"])
+    for metric in [[1, 2], pd.Categorical(["1", "2"])]:
+        mtsf = PydanticMultiTimeseriesPandasDataFrame.validate(
+            pd.DataFrame(
+                {"timestamp": timestamps, "metric": metric, "value": [1.0, 2.0]}
+            )
+        )
+        assert isinstance(mtsf["metric"].dtype, pd.StringDtype)
+        assert list(mtsf["metric"]) == ["1", "2"]
+        assert multitsframe_problem(mtsf) is None
+
+    empty_mtsf = PydanticMultiTimeseriesPandasDataFrame.validate({})
+    assert isinstance(empty_mtsf["metric"].dtype, pd.StringDtype)
+    assert pd.api.types.is_datetime64tz_dtype(empty_mtsf["timestamp"])
+
+
+def test_multitsframe_problem():
+    timestamps = pd.to_datetime(["2019-08-01T15:45:36Z", "2019-08-01T15:45:37Z"])
+    assert (
+        multitsframe_problem(pd.DataFrame({"timestamp": timestamps, "value": [1, 2]}))
+        is MultiTSFrameProblem.COLUMN_NAMES
+    )
+    assert (
+        multitsframe_problem(
+            pd.DataFrame(
+                {
+                    "timestamp": timestamps,
+                    "metric": pd.Categorical(["a", None]),
+                    "value": [1, 2],
+                }
+            )
+        )
+        is MultiTSFrameProblem.METRIC_NULL
+    )
+    assert (
+        multitsframe_problem(
+            pd.DataFrame(
+                {
+                    "timestamp": timestamps.tz_convert("Europe/Berlin"),
+                    "metric": ["a", "b"],
+                    "value": [1, 2],
+                }
+            )
+        )
+        is MultiTSFrameProblem.TIMESTAMP_TIMEZONE
+    )
+    assert (
+        multitsframe_problem(
+            pd.DataFrame(
+                {
+                    "timestamp": timestamps.tz_convert(None),
+                    "metric": ["a", "b"],
+                    "value": [1, 2],
+                }
+            )
+        )
+        is MultiTSFrameProblem.TIMESTAMP_DTYPE
+    )
+
+
+def test_marked_multitsframe_is_not_validated():
+    invalid_mtsf = pd.DataFrame({"timestamp": [None], "metric": ["a"], "value": [1]})
+
+    assert mark_as_valid_multitsframe(invalid_mtsf) is invalid_mtsf
+    assert PydanticMultiTimeseriesPandasDataFrame.validate(invalid_mtsf) is invalid_mtsf
+
+    # the mark is consumed by the first validation
+    with pytest.raises(ValueError, match=r"No null values.*timestamp"):
+        PydanticMultiTimeseriesPandasDataFrame.validate(invalid_mtsf)
+
+
 def test_parsing_of_boolean_series():
     test_obj = ExampleObj(s="[true, true, false]")
 
@@ -245,6 +349,95 @@ def test_dt_index_parsing():
     assert is_datetime64_any_dtype(test_obj.s.index.dtype)
 
 
+@pytest.mark.parametrize(
+    "series_input",
+    [
+        {"a": 1.0, "b": 2.0},
+        {"0": 1.0, "1": 2.5},
+        {"2020-01-01T00:00:00Z": 1.5, "2020-01-02T00:00:00Z": 2},
+        {"2020-01-01T00:00:00+01:00": 1, "2020-01-02T00:00:00+02:00": 2},
+        {"x": 1e9, "y": 2e9},
+        {"a": None, "b": None},
+        {"a": "2020-01-01T00:00:00Z", "b": "x"},
+        {},
+        [],
+        [1, 2.5, None],
+        ["a", "b", None],
+        [True, None],
+        [1e12, 1.5e12],
+        ["1", "2"],
+    ],
+)
+def test_series_from_json_like_equals_read_json(series_input):
+    series = series_from_json_like(series_input)
+    assert series is not None
+    pd.testing.assert_series_equal(
+        series, pd.read_json(json.dumps(series_input), typ="series")
+    )
+    pd.testing.assert_series_equal(PydanticPandasSeries.validate(series_input), series)
+
+
+@pytest.mark.parametrize(
+    "frame_input",
+    [
+        {"a": [1, 2], "b": [1.5, None]},
+        [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}],
+        [{"a": 1}, {"b": 2}],
+        {"a": {"x": 1, "y": 2}, "b": {"x": 3}},
+        {"a": {"2020-01-01T00:00:00Z": 1.0, "2020-01-02T00:00:00Z": 2.0}},
+        {
+            "timestamp": ["2020-01-01T00:00:00Z", "2020-01-01T01:00:00Z"],
+            "metric": ["a", "b"],
+            "value": [1.0, 2.0],
+        },
+        {"created_at": [1e9, 2e9], "modified": ["x", "y"], "date": [1, 2]},
+        {"1": [1, 2], "2": [3, 4]},
+        [[1, 2], [3, 4]],
+        {"a": [None, None], "b": [True, False]},
+        {"a": []},
+        {},
+    ],
+)
+def test_frame_from_json_like_equals_read_json(frame_input):
+    frame = frame_from_json_like(frame_input)
+    assert frame is not None
+    pd.testing.assert_frame_equal(
+        frame, pd.read_json(json.dumps(frame_input), typ="frame")
+    )
+    pd.testing.assert_frame_equal(PydanticPandasDataFrame.validate(frame_input), frame)
+
+
+def test_unsupported_json_like_inputs_fall_back_to_read_json():
+    assert series_from_json_like({"a": 1, "b": "x"}) is None
+    assert series_from_json_like({"a": [1, 2]}) is None
+    assert frame_from_json_like({"a": [1, 2], "b": [1]}) is None
+
+    assert PydanticPandasSeries.validate({"a": 1, "b": "x"}).to_dict() == {
+        "a": 1,
+        "b": "x",
+    }
+    with pytest.raises(ValueError, match="Could not parse"):
+        PydanticPandasDataFrame.validate({"a": [1, 2], "b": [1]})
+
+
+def test_parsing_of_typed_inputs():
+    values = np.array([1.5, 2.5])
+    pd.testing.assert_series_equal(
+        PydanticPandasSeries.validate(values), pd.Series(values)
+    )
+    pd.testing.assert_frame_equal(
+        PydanticPandasDataFrame.validate(np.array([[1, 2], [3, 4]])),
+        pd.DataFrame([[1, 2], [3, 4]]),
+    )
+    index = pd.date_range("2020-01-01", periods=2, tz="UTC")
+    pd.testing.assert_frame_equal(
+        PydanticPandasDataFrame.validate(
+            {"a": pd.Series(values, index=index), "b": pd.Series([1, 2], index=index)}
+        ),
+        pd.DataFrame({"a": values, "b": [1, 2]}, index=index),
+    )
+
+
 def test_any_parsing():
     result = parse_dynamically_from_datatypes(
         [
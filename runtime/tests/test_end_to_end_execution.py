@@ -1,9 +1,12 @@
 import json
 import os
 from typing import Any
+from unittest import mock
 from uuid import uuid4
 
+import pandas as pd
 import pytest
+from fastapi.encoders import jsonable_encoder
 from httpx import AsyncClient
 
 from hetdesrun.models.code import CodeModule
@@ -20,8 +23,10 @@ from hetdesrun.models.run import (
 )
 from hetdesrun.models.wiring import InputWiring, OutputWiring, WorkflowWiring
 from hetdesrun.models.workflow import WorkflowInput, WorkflowNode, WorkflowOutput
+from hetdesrun.runtime.engine.plain.compilation_cache import compiled_workflow_cache
 from hetdesrun.trafoutils.io.load import load_json
 from hetdesrun.utils import get_uuid_from_seed
+from hetdesrun.webservice.result_transport import parse_binary_result
 
 
 async def run_workflow_with_client(
@@ -51,7 +56,7 @@ def gen_execution_input_from_single_component(
 
     # Build up execution input Json
     code_module_uuid = str(get_uuid_from_seed("code_module_uuid"))
-    component_uuid = str(get_uuid_from_seed("component_uuid"))
+    component_uuid = tr_component_json["id"]
 
     comp_inputs = [
         ComponentInput(id=str(uuid4()), name=inp["name"], type=inp["data_type"])
@@ -303,3 +308,416 @@ async def test_multitsframe_wf_execution(async_test_client: AsyncClient) -> None
                 "8": "2019-08-03T15:45:36.000Z",
             },
         }
+
+
+@pytest.mark.asyncio
+async def test_nested_wf_execution_with_process_engine(
+    async_test_client: AsyncClient,
+) -> None:
+    async with async_test_client as client:
+        with open(
+            os.path.join("tests", "data", "nested_wf_execution_input.json"),
+            encoding="utf8",
+        ) as f:
+            loaded_workflow_exe_input = json.load(f)
+        loaded_workflow_exe_input["configuration"]["engine"] = "process"
+        loaded_workflow_exe_input["configuration"]["profile_operators"] = True
+        response_status_code, response_json = await run_workflow_with_client(
+            loaded_workflow_exe_input, client
+        )
+
+        assert response_status_code == 200
+        assert response_json["result"] == "ok"
+        assert response_json["output_results_by_output_name"][
+            "limit_violation_timestamp"
+        ].startswith("2020-05-28T20:16:41")
+        operator_profiles = response_json["measured_steps"]["operator_profiles"]
+        assert len(operator_profiles) > 0
+        # CPU time is measured in the worker processes
+        assert all(
+            profile["cpu_time_seconds"] is not None for profile in operator_profiles
+        )
+
+
+@pytest.mark.asyncio
+async def test_repeated_execution_uses_compiled_workflow_cache(
+    async_test_client: AsyncClient,
+) -> None:
+    compiled_workflow_cache.clear()
+    async with async_test_client as client:
+        with open(
+            os.path.join("tests", "data", "nested_wf_execution_input.json"),
+            encoding="utf8",
+        ) as f:
+            loaded_workflow_exe_input = json.load(f)
+
+        cache_infos = []
+        for _ in range(2):
+            response_status_code, response_json = await run_workflow_with_client(
+                loaded_workflow_exe_input, client
+            )
+            assert response_status_code == 200
+            assert response_json["result"] == "ok"
+            assert response_json["output_results_by_output_name"][
+                "limit_violation_timestamp"
+            ].startswith("2020-05-28T20:16:41")
+            cache_infos.append(
+                response_json["measured_steps"]["compiled_workflow_cache"]
+            )
+
+        assert cache_infos[0]["hit"] is False
+        assert cache_infos[1]["hit"] is True
+        assert cache_infos[1]["hits"] == 1
+        assert cache_infos[1]["misses"] == 1
+
+        # changed code of a code module with the same uuid is not served from cache
+        loaded_workflow_exe_input["code_modules"][0]["code"] += "\n# edited\n"
+        _, response_json = await run_workflow_with_client(
+            loaded_workflow_exe_input, client
+        )
+        assert response_json["result"] == "ok"
+        assert (
+            response_json["measured_steps"]["compiled_workflow_cache"]["hit"] is False
+        )
+
+
+@pytest.mark.asyncio
+async def test_incremental_execution_in_session(
+    async_test_client: AsyncClient,
+) -> None:
+    async with async_test_client as client:
+        with open(
+            os.path.join("tests", "data", "nested_wf_execution_input.json"),
+            encoding="utf8",
+        ) as f:
+            loaded_workflow_exe_input = json.load(f)
+        loaded_workflow_exe_input["configuration"]["session_id"] = str(uuid4())
+
+        incremental_execution_infos = []
+        for limit in ("1.3", "1.3", "1.4"):
+            loaded_workflow_exe_input["workflow_wiring"]["input_wirings"][1]["filters"][
+                "value"
+            ] = limit
+            response_status_code, response_json = await run_workflow_with_client(
+                loaded_workflow_exe_input, client
+            )
+            assert response_status_code == 200
+            assert response_json["result"] == "ok"
+            incremental_execution_infos.append(
+                response_json["measured_steps"]["incremental_execution"]
+            )
+
+        first_info, repeated_info, changed_info = incremental_execution_infos
+        assert first_info["reused_operators"] == []
+        assert first_info["reused_input_data"] == []
+
+        assert len(repeated_info["reused_operators"]) > 0
+        assert sorted(repeated_info["reused_input_data"]) == [
+            "inp_series",
+            "limit",
+            "num_days_forecast",
+            "postive_step_size",
+        ]
+
+        # only operators not depending on the limit are reused
+        assert "limit" not in changed_info["reused_input_data"]
+        assert (
+            0
+            < len(changed_info["reused_operators"])
+            < len(repeated_info["reused_operators"])
+        )
+
+        # the incremental result equals the result of a complete execution
+        del loaded_workflow_exe_input["configuration"]["session_id"]
+        _, complete_response_json = await run_workflow_with_client(
+            loaded_workflow_exe_input, client
+        )
+        assert complete_response_json["measured_steps"]["incremental_execution"] is None
+        assert (
+            response_json["output_results_by_output_name"]
+            == complete_response_json["output_results_by_output_name"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_incremental_execution_in_session_with_changed_constant(
+    async_test_client: AsyncClient,
+) -> None:
+    with open(
+        os.path.join("tests", "data", "nested_wf_execution_input.json"),
+        encoding="utf8",
+    ) as f:
+        loaded_workflow_exe_input = json.load(f)
+    loaded_workflow_exe_input["configuration"]["session_id"] = str(uuid4())
+    (constant_input,) = (
+        inp
+        for sub_node in loaded_workflow_exe_input["workflow"]["sub_nodes"]
+        for inp in sub_node.get("inputs", [])
+        if inp.get("constant", False)
+    )
+
+    incremental_execution_infos = []
+    async with async_test_client as client:
+        # results are reused although every execution compiles a new plan
+        with mock.patch(
+            "hetdesrun.webservice.config.runtime_config.compiled_workflow_cache_size",
+            0,
+        ):
+            for frequency in ("5min", "10min"):
+                constant_input["constantValue"]["value"] = frequency
+                response_status_code, response_json = await run_workflow_with_client(
+                    loaded_workflow_exe_input, client
+                )
+                assert response_status_code == 200
+                assert response_json["result"] == "ok"
+                incremental_execution_infos.append(
+                    response_json["measured_steps"]["incremental_execution"]
+                )
+        first_info, changed_info = incremental_execution_infos
+        assert first_info["reused_operators"] == []
+        # only the operator consuming the constant and its dependents are run again
+        consuming_operator_id = constant_input["id_of_sub_node"]
+        assert not any(
+            consuming_operator_id in operator_id
+            for operator_id in changed_info["reused_operators"]
+        )
+        # e.g. the input operator of the nested workflow providing its timeseries
+        assert any(
+            "82132623-2aaa-4797-b478-3857d93bde09" in operator_id
+            for operator_id in changed_info["reused_operators"]
+        )
+
+        del loaded_workflow_exe_input["configuration"]["session_id"]
+        _, complete_response_json = await run_workflow_with_client(
+            loaded_workflow_exe_input, client
+        )
+    assert (
+        response_json["output_results_by_output_name"]
+        == complete_response_json["output_results_by_output_name"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_execution(
+    async_test_client: AsyncClient,
+) -> None:
+    async with async_test_client as client:
+        with open(
+            os.path.join("tests", "data", "nested_wf_execution_input.json"),
+            encoding="utf8",
+        ) as f:
+            loaded_workflow_exe_input = json.load(f)
+
+        instances = []
+        for limit in ("1.3", "1.4", "1.3"):
+            workflow_wiring = json.loads(
+                json.dumps(loaded_workflow_exe_input["workflow_wiring"])
+            )
+            workflow_wiring["input_wirings"][1]["filters"]["value"] = limit
+            instances.append({"workflow_wiring": workflow_wiring})
+
+        response = await client.post(
+            "engine/runtime/batch",
+            json={
+                "code_modules": loaded_workflow_exe_input["code_modules"],
+                "components": loaded_workflow_exe_input["components"],
+                "workflow": loaded_workflow_exe_input["workflow"],
+                "configuration": loaded_workflow_exe_input["configuration"],
+                "instances": instances,
+            },
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 3
+        assert len({result["job_id"] for result in results}) == 3
+        assert all(result["result"] == "ok" for result in results)
+
+        # each instance has the result of its own execution
+        for instance, result in zip(instances, results, strict=True):
+            response_status_code, single_response_json = await run_workflow_with_client(
+                {**loaded_workflow_exe_input, **instance}, client
+            )
+            assert response_status_code == 200
+            assert (
+                result["output_results_by_output_name"]
+                == single_response_json["output_results_by_output_name"]
+            )
+        assert (
+            results[0]["output_results_by_output_name"]
+            != results[1]["output_results_by_output_name"]
+        )
+
+        # session ids are not allowed for batch executions
+        response = await client.post(
+            "engine/runtime/batch",
+            json={
+                "code_modules": loaded_workflow_exe_input["code_modules"],
+                "components": loaded_workflow_exe_input["components"],
+                "workflow": loaded_workflow_exe_input["workflow"],
+                "configuration": {
+                    **loaded_workflow_exe_input["configuration"],
+                    "session_id": "some_session",
+                },
+                "instances": instances,
+            },
+        )
+        assert response.status_code == 422
+
+        # at least one instance is required
+        response = await client.post(
+            "engine/runtime/batch",
+            json={
+                "code_modules": loaded_workflow_exe_input["code_modules"],
+                "components": loaded_workflow_exe_input["components"],
+                "workflow": loaded_workflow_exe_input["workflow"],
+                "configuration": loaded_workflow_exe_input["configuration"],
+                "instances": [],
+            },
+        )
+        assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_windowed_execution_equals_complete_execution(
+    async_test_client: AsyncClient,
+) -> None:
+    full_series = pd.Series(
+        [float(i % 7) for i in range(3 * 24 * 4)],
+        index=pd.date_range("2023-01-01", periods=3 * 24 * 4, freq="15min", tz="UTC"),
+    )
+    loaded_ranges = []
+
+    async def load_from_time_range(workflow_wiring: WorkflowWiring) -> dict:
+        loaded_data: dict[str, Any] = {}
+        for input_wiring in workflow_wiring.input_wirings:
+            if input_wiring.workflow_input_name == "data":
+                timestamp_from = pd.Timestamp(input_wiring.filters["timestampFrom"])
+                timestamp_to = pd.Timestamp(input_wiring.filters["timestampTo"])
+                loaded_ranges.append((timestamp_from, timestamp_to))
+                loaded_data["data"] = full_series[timestamp_from:timestamp_to]
+            else:
+                loaded_data[input_wiring.workflow_input_name] = input_wiring.filters[
+                    "value"
+                ]
+        return loaded_data
+
+    execution_input = gen_execution_input_from_single_component(
+        os.path.join(
+            "transformations",
+            "components",
+            "statistic",
+            "moving-average-time_100_a2ba0da0-5a9a-60e9-6af5-e07917988021.json",
+        ),
+        wf_wiring=WorkflowWiring(
+            input_wirings=[
+                InputWiring(
+                    workflow_input_name="data",
+                    adapter_id="timeseries-adapter",
+                    ref_id="some_series",
+                    filters={
+                        "timestampFrom": "2023-01-01T00:00:00.000000000Z",
+                        "timestampTo": "2023-01-03T23:45:00.000000000Z",
+                    },
+                ),
+                InputWiring(
+                    workflow_input_name="t",
+                    adapter_id="direct_provisioning",
+                    filters={"value": "2h"},
+                ),
+            ],
+            output_wirings=[
+                OutputWiring(workflow_output_name="mavg", adapter_id=1),
+            ],
+        ),
+    )
+
+    async with async_test_client as client:
+        with mock.patch(
+            "hetdesrun.runtime.service.resolve_and_load_data_from_wiring",
+            load_from_time_range,
+        ):
+            _, complete_response_json = await run_workflow_with_client(
+                json.loads(execution_input.json()), client
+            )
+            execution_input.configuration.execution_window = "P1D"
+            loaded_ranges.clear()
+            (
+                response_status_code,
+                windowed_response_json,
+            ) = await run_workflow_with_client(
+                json.loads(execution_input.json()), client
+            )
+
+    assert response_status_code == 200
+    assert windowed_response_json["result"] == "ok"
+    assert windowed_response_json["measured_steps"]["windowed_execution"] == {
+        "window_count": 3,
+        "window_overlap": 7200.0,
+    }
+    # every window but the first is loaded with the lookback of the moving average
+    assert [(start.day, start.hour, end.day) for start, end in loaded_ranges] == [
+        (1, 0, 2),
+        (1, 22, 3),
+        (2, 22, 3),
+    ]
+    assert (
+        windowed_response_json["output_results_by_output_name"]
+        == complete_response_json["output_results_by_output_name"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_execution_with_binary_result_transport(
+    async_test_client: AsyncClient,
+) -> None:
+    series_data = {f"2023-01-01T0{i}:00:00Z": i + 0.5 for i in range(6)}
+    execution_input_json = json.loads(
+        gen_execution_input_from_single_component(
+            os.path.join(
+                "transformations",
+                "components",
+                "connectors",
+                "pass-through-series_100_bfa27afc-dea8-b8aa-4b15-94402f0739b6.json",
+            ),
+            {"input": json.dumps(series_data)},
+        ).json()
+    )
+
+    async with async_test_client as client:
+        json_response = await client.post("engine/runtime", json=execution_input_json)
+        with mock.patch(
+            "hetdesrun.runtime.service.jsonable_encoder", wraps=jsonable_encoder
+        ) as mocked_jsonable_encoder:
+            arrow_response = await client.post(
+                "engine/runtime",
+                json=execution_input_json,
+                headers={"Accept": "application/vnd.apache.arrow.stream"},
+            )
+
+    # outputs transported as binary tables are not encoded as JSON
+    assert mocked_jsonable_encoder.call_count == 1
+    checked_result = mocked_jsonable_encoder.call_args.args[0]
+    assert checked_result.output_results_by_output_name == {}
+
+    assert json_response.headers["content-type"] == "application/json"
+    assert arrow_response.status_code == 200
+    assert arrow_response.headers["content-type"].startswith("multipart/mixed")
+
+    arrow_result = parse_binary_result(
+        arrow_response.content, arrow_response.headers["content-type"]
+    )
+    assert arrow_result["result"] == "ok"
+    output_series = arrow_result["output_results_by_output_name"]["output"]
+    assert isinstance(output_series, pd.Series)
+    pd.testing.assert_series_equal(
+        output_series,
+        pd.Series(list(series_data.values()), index=pd.to_datetime(list(series_data))),
+        check_names=False,
+    )
+    # serialized as JSON, the output equals the output of the JSON response
+    assert (
+        json.loads(WorkflowExecutionResult(**arrow_result).json())[
+            "output_results_by_output_name"
+        ]
+        == json_response.json()["output_results_by_output_name"]
+    )
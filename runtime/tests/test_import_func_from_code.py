@@ -1,6 +1,18 @@
+import json
+import os
+import sys
+from unittest import mock
+from uuid import uuid4
+
 import pytest
 
-from hetdesrun.component.load import import_func_from_code
+from hetdesrun.component.load import (
+    ComponentCodeImportError,
+    import_func_from_code,
+    module_path_from_code,
+)
+from hetdesrun.component.warm_up import warm_up_component_imports
+from hetdesrun.trafoutils.io.load import load_json
 
 
 def test_importing():
@@ -26,3 +38,69 @@ def test_importing():
         raise_if_not_found=True,
         register_module=True,
     )
+
+
+def test_importing_with_bytecode_cache(tmp_path):
+    code = f'VALUE = "{uuid4()}"\n\ndef main():\n    return VALUE\n'
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.component_bytecode_cache_dir",
+        str(tmp_path),
+    ):
+        func = import_func_from_code(code, "main")
+        assert len(list(tmp_path.glob("*.bin"))) == 1
+
+        # e.g. another worker process
+        del sys.modules[func.__module__]
+        with mock.patch(
+            "hetdesrun.component.load.compile",
+            side_effect=AssertionError("code compiled again"),
+            create=True,
+        ):
+            func_from_cache = import_func_from_code(code, "main")
+        assert func_from_cache() == func()
+
+        # invalid cache files are replaced
+        next(tmp_path.glob("*.bin")).write_bytes(b"invalid")
+        del sys.modules[func.__module__]
+        assert import_func_from_code(code, "main")() == func()
+
+    with pytest.raises(ComponentCodeImportError):
+        import_func_from_code("def main(:\n    pass", "main")
+
+
+def test_warm_up_component_imports(tmp_path):
+    component_json = load_json(
+        os.path.join(
+            "transformations",
+            "components",
+            "statistic",
+            "moving-average-time_100_a2ba0da0-5a9a-60e9-6af5-e07917988021.json",
+        )
+    )
+    draft_component_json = {
+        **component_json,
+        "id": str(uuid4()),
+        "state": "DRAFT",
+        "released_timestamp": None,
+        "content": component_json["content"] + "\n# draft\n",
+    }
+    (tmp_path / "components").mkdir()
+    for json_to_store in (component_json, draft_component_json):
+        with open(
+            tmp_path / "components" / (json_to_store["id"] + ".json"),
+            "w",
+            encoding="utf8",
+        ) as f:
+            json.dump(json_to_store, f)
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.is_backend_service", False
+    ), mock.patch(
+        "hetdesrun.webservice.config.runtime_config.component_warm_up_directory",
+        str(tmp_path),
+    ):
+        assert warm_up_component_imports() == 1
+
+    assert module_path_from_code(component_json["content"]) in sys.modules
+    assert module_path_from_code(draft_component_json["content"]) not in sys.modules
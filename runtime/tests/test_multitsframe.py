@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.datatypes import (
+    PydanticMultiTimeseriesPandasDataFrame,
+    consume_valid_multitsframe_mark,
+)
+from hetdesrun.multitsframe import MultiTSFrame, sort_rows_by_code_and_time
+
+TIMESTAMPS = pd.date_range("2023-01-01", periods=4, freq="1h", tz="UTC")
+
+
+def unsorted_multitsframe() -> pd.DataFrame:
+    return PydanticMultiTimeseriesPandasDataFrame.validate(
+        pd.DataFrame(
+            {
+                "timestamp": [*TIMESTAMPS[::-1], *TIMESTAMPS, TIMESTAMPS[1]],
+                "metric": ["b"] * 4 + ["a"] * 4 + ["c"],
+                "value": np.arange(9.0),
+            }
+        )
+    )
+
+
+def test_series_of_metric():
+    mtsf = MultiTSFrame(unsorted_multitsframe())
+
+    assert mtsf.metrics == ["a", "b", "c"]
+    assert len(mtsf) == 9
+    assert "c" in mtsf
+    assert "d" not in mtsf
+    pd.testing.assert_series_equal(
+        mtsf.series("b"),
+        pd.Series(
+            [3.0, 2.0, 1.0, 0.0],
+            index=pd.DatetimeIndex(TIMESTAMPS, name="timestamp"),
+            name="b",
+        ),
+        check_freq=False,
+    )
+    # views of the same sorted values
+    assert mtsf.series("a").to_numpy().base is mtsf.series("c").to_numpy().base
+    with pytest.raises(KeyError):
+        mtsf.series("d")
+
+
+def test_wide_equals_pivot():
+    df = unsorted_multitsframe()
+    expected_wide_df = df.pivot(  # noqa: PD010
+        index="timestamp", columns="metric", values="value"
+    )
+    expected_wide_df.columns = pd.Index(
+        expected_wide_df.columns.astype(str), name="metric"
+    )
+
+    wide_df = MultiTSFrame(df).to_wide()
+    pd.testing.assert_frame_equal(wide_df, expected_wide_df, check_freq=False)
+
+    # all metrics with the same timestamps
+    complete_df = df[df["metric"] != "c"]
+    complete_wide_df = MultiTSFrame(complete_df).to_wide()
+    pd.testing.assert_frame_equal(
+        complete_wide_df, expected_wide_df[["a", "b"]], check_freq=False
+    )
+
+    with pytest.raises(ValueError, match="several values"):
+        MultiTSFrame(pd.concat([df, df.iloc[:1]])).to_wide()
+
+
+def test_wide_long_round_trip():
+    wide_df = pd.DataFrame(
+        {"x": [1.0, 2.0, np.nan, 4.0], "y": [5.0, 6.0, 7.0, 8.0]},
+        index=TIMESTAMPS[::-1],
+    )
+    mtsf = MultiTSFrame.from_wide(wide_df)
+    assert mtsf.metrics == ["x", "y"]
+
+    long_df = mtsf.to_long()
+    assert list(long_df.columns) == ["timestamp", "metric", "value"]
+    assert isinstance(long_df["metric"].dtype, pd.StringDtype)
+    assert len(long_df) == 8
+    assert consume_valid_multitsframe_mark(long_df)
+
+    pd.testing.assert_frame_equal(
+        MultiTSFrame(long_df).to_wide(),
+        wide_df.sort_index().rename_axis(index="timestamp", columns="metric"),
+        check_freq=False,
+    )
+
+
+def test_empty_multitsframe():
+    mtsf = MultiTSFrame(PydanticMultiTimeseriesPandasDataFrame.validate({}))
+    assert mtsf.metrics == []
+    assert len(mtsf.to_wide()) == 0
+    assert len(mtsf.to_long()) == 0
+
+
+def test_sort_rows_by_code_and_time():
+    codes = np.array([1, 0, 1, 0])
+    timestamps = TIMESTAMPS[[3, 2, 1, 0]]
+    order, offsets = sort_rows_by_code_and_time(codes, timestamps, 3)
+    assert list(order) == [3, 1, 2, 0]
+    # no rows with code 2
+    assert list(offsets) == [0, 2, 4, 4]
+
+    order, offsets = sort_rows_by_code_and_time(np.array([0, 0, 1]), TIMESTAMPS[:3], 2)
+    assert order is None
+    assert list(offsets) == [0, 2, 3]
@@ -1,7 +1,16 @@
+import asyncio
 import logging
+import os
+import time
 
 import pytest
 
+from hetdesrun.component.load import import_func_from_code
+from hetdesrun.component.registration import get_registered_option
+from hetdesrun.models.run import ConfigurationInput
+from hetdesrun.runtime.configuration import execution_config
+from hetdesrun.runtime.engine.plain.execution import shutdown_executor_pools
+from hetdesrun.runtime.engine.plain.plan import compile_workflow, execute_plan
 from hetdesrun.runtime.engine.plain.workflow import ComputationNode, Workflow
 from hetdesrun.runtime.exceptions import (
     CircularDependency,
@@ -9,6 +18,24 @@ from hetdesrun.runtime.exceptions import (
     MissingOutputException,
     RuntimeExecutionError,
 )
+from hetdesrun.webservice.config import SyncComponentExecutor
+
+
+async def execute_workflow(wf: Workflow) -> dict:
+    return (await execute_plan(compile_workflow(wf))).outputs
+
+
+async def execute_node(node: ComputationNode, output_name: str) -> dict:
+    """Execute the node and the nodes it depends on, returning one of its outputs"""
+    wf = Workflow(
+        sub_nodes=[node],
+        input_mappings={},
+        output_mappings={output_name: (node, output_name)},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    return await execute_workflow(wf)
 
 
 @pytest.mark.asyncio
@@ -24,7 +51,7 @@ async def test_computation_nodes():
         func=add_two_values, inputs={"c": (source_node, "a"), "d": (source_node, "b")}
     )
 
-    res = await target_node.result
+    res = await execute_node(target_node, "sum")
     assert res["sum"] == 3.7
 
 
@@ -50,7 +77,7 @@ async def test_computation_nodes_wrong_inputs():
     )
 
     with pytest.raises(MissingOutputException):
-        _res = await target_node.result
+        _res = await execute_node(target_node, "sum")
 
 
 @pytest.mark.asyncio
@@ -71,7 +98,7 @@ async def test_computation_wrong_input_source():
     )
 
     with pytest.raises(MissingInputSource):
-        _res = await target_node.result
+        _res = await execute_node(target_node, "sum")
 
 
 @pytest.mark.asyncio
@@ -93,7 +120,7 @@ async def test_computation_cycle_detection():
     source_node.add_inputs({"some_input": (target_node, "sum")})
 
     with pytest.raises(CircularDependency):
-        _res = await target_node.result
+        _res = await execute_node(target_node, "sum")
 
 
 @pytest.mark.asyncio
@@ -121,7 +148,7 @@ async def test_computation_nodes_user_raised_runtime_error_and_logging(caplog):
     with caplog.at_level(logging.INFO):
         caplog.clear()
         with pytest.raises(RuntimeExecutionError):
-            _res = await target_node.result
+            _res = await execute_node(target_node, "sum")
 
         assert "User raised" in caplog.text
 
@@ -148,7 +175,7 @@ async def test_basic_workflow_execution():
         tr_tag="UNKNOWN",
     )
 
-    res = await wf.result
+    res = await execute_workflow(wf)
     assert res["sum_result"] == 3.7
 
 
@@ -181,7 +208,7 @@ async def test_workflow_with_inputs_via_constant_node():
         ]
     )
 
-    res = await wf.result
+    res = await execute_workflow(wf)
     assert res["sum_result"] == 2.0
 
 
@@ -224,5 +251,179 @@ async def test_nested_workflow():
         tr_tag="UNKNOWN",
     )
 
-    res = await wf.result
+    res = await execute_workflow(wf)
     assert res["sum_result"] == 3.7
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gathering_of_independent_branches(caplog):
+    execution_config.set(ConfigurationInput(gather_inputs_concurrently=True))
+
+    call_counts = {"source": 0}
+
+    async def provide_value():
+        call_counts["source"] += 1
+        await asyncio.sleep(0.01)
+        return {"value": 1.0}
+
+    async def slow_increment(*, x):
+        await asyncio.sleep(0.2)
+        return {"value": x + 1.0}
+
+    def add_values(*, a, b, c):
+        return {"sum": a + b + c}
+
+    source_node = ComputationNode(
+        func=provide_value, operator_hierarchical_id="SOURCE_ID"
+    )
+    branch_nodes = [
+        ComputationNode(
+            func=slow_increment,
+            inputs={"x": (source_node, "value")},
+            operator_hierarchical_id="BRANCH_" + str(i),
+        )
+        for i in range(3)
+    ]
+    target_node = ComputationNode(
+        func=add_values,
+        inputs={
+            "a": (branch_nodes[0], "value"),
+            "b": (branch_nodes[1], "value"),
+            "c": (branch_nodes[2], "value"),
+        },
+        operator_hierarchical_id="TARGET_ID",
+    )
+
+    wf = Workflow(
+        sub_nodes=[source_node, *branch_nodes, target_node],
+        input_mappings={},
+        output_mappings={
+            "sum_result": (target_node, "sum"),
+            "branch_result": (branch_nodes[0], "value"),
+        },
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    with caplog.at_level(logging.INFO):
+        start = time.perf_counter()
+        res = await execute_workflow(wf)
+        duration = time.perf_counter() - start
+
+    assert res["sum_result"] == 6.0
+    assert res["branch_result"] == 2.0
+    # the source node shared by all branches is only computed once
+    assert call_counts["source"] == 1
+    # branches ran simultaneously instead of one after another
+    assert duration < 0.5
+
+    started_operator_ids = [
+        record.currently_executed_operator_hierarchical_id
+        for record in caplog.records
+        if record.message == "Starting computation"
+    ]
+    assert sorted(
+        op_id for op_id in started_operator_ids if op_id.startswith("BRANCH_")
+    ) == ["BRANCH_0", "BRANCH_1", "BRANCH_2"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gathering_cycle_detection():
+    execution_config.set(ConfigurationInput(gather_inputs_concurrently=True))
+
+    async def provide_value(*, some_input=None):
+        await asyncio.sleep(0.01)
+        return {"value": 1.0}
+
+    def add_values(*, a, b):
+        return {"sum": a + b}
+
+    source_node = ComputationNode(func=provide_value)
+    independent_node = ComputationNode(func=provide_value)
+    target_node = ComputationNode(
+        func=add_values,
+        inputs={"a": (source_node, "value"), "b": (independent_node, "value")},
+    )
+    source_node.add_inputs({"some_input": (target_node, "sum")})
+
+    with pytest.raises(CircularDependency):
+        _res = await execute_node(target_node, "sum")
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_keeps_event_loop_responsive():
+    def blocking_computation():
+        time.sleep(0.3)
+        return {"value": 1.0}
+
+    node = ComputationNode(
+        func=blocking_computation, executor=SyncComponentExecutor.THREAD
+    )
+
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    try:
+        res = await execute_node(node, "value")
+    finally:
+        ticker.cancel()
+        shutdown_executor_pools()
+
+    assert res["value"] == 1.0
+    assert ticks > 10
+
+
+component_code_with_process_executor = """
+import os
+
+from hetdesrun.component.registration import register
+from hetdesrun.datatypes import DataType
+
+
+@register(
+    inputs={"x": DataType.Float},
+    outputs={"y": DataType.Float, "pid": DataType.Integer},
+    executor="PROCESS",
+)
+def main(*, x):
+    return {"y": 2 * x, "pid": os.getpid()}
+"""
+
+
+@pytest.mark.asyncio
+async def test_process_executor_runs_component_in_worker_process():
+    func = import_func_from_code(component_code_with_process_executor, "main")
+    assert get_registered_option(func, "executor") == "PROCESS"
+
+    source_node = ComputationNode(func=lambda: {"x": 2.5})
+    node = ComputationNode(
+        func=func,
+        inputs={"x": (source_node, "x")},
+        executor=SyncComponentExecutor.PROCESS,
+        code=component_code_with_process_executor,
+        func_name="main",
+    )
+
+    try:
+        res = await execute_workflow(
+            Workflow(
+                sub_nodes=[node],
+                input_mappings={},
+                output_mappings={"y": (node, "y"), "pid": (node, "pid")},
+                tr_id="UNKNOWN",
+                tr_name="UNKNOWN",
+                tr_tag="UNKNOWN",
+            )
+        )
+    finally:
+        shutdown_executor_pools()
+
+    assert res["y"] == 5.0
+    assert res["pid"] != os.getpid()
@@ -1,7 +1,19 @@
+import datetime
+import json
+from uuid import UUID, uuid4
+
 import pytest
 
+from hetdesrun.component.load import import_func_from_code
+from hetdesrun.component.registration import register
+from hetdesrun.models.component import ComponentInput, ComponentRevision
 from hetdesrun.models.run import WorkflowExecutionInput
-from hetdesrun.runtime.engine.plain.parsing import parse_workflow_input
+from hetdesrun.runtime.engine.plain.parsing import (
+    obtain_has_side_effects,
+    obtain_lookback,
+    parse_workflow_input,
+)
+from hetdesrun.runtime.engine.plain.plan import compile_workflow, execute_plan
 
 
 @pytest.mark.asyncio
@@ -13,7 +25,73 @@ async def test_plain_wf_parsing_and_execution(input_json_with_wiring):
 
     assert len(parsed_wf.sub_nodes) == 3  # (2 operators + 1 constant provider node)
 
-    res = await parsed_wf.result  # workflow execution
+    res = (
+        await execute_plan(compile_workflow(parsed_wf))
+    ).outputs  # workflow execution
 
     assert "z" in res
     assert res["z"] == 4.0
+
+
+def test_obtain_has_side_effects():
+    def store(*, obj):
+        return {}
+
+    assert obtain_has_side_effects(store) is False
+
+    assert obtain_has_side_effects(
+        register(inputs={}, outputs={}, has_side_effects=True)(store)
+    )
+    assert obtain_has_side_effects(
+        register(inputs={}, outputs={}, category="Data Sinks")(store)
+    )
+    assert not obtain_has_side_effects(
+        register(inputs={}, outputs={}, category="Data Sinks", has_side_effects=False)(
+            store
+        )
+    )
+
+    # released base component relies on the default of its category
+    with open(
+        "transformations/components/data-sinks/"
+        "store-object_100_26d99461-38a9-5e92-df4f-d0fd2752879e.json",
+        encoding="utf8",
+    ) as f:
+        store_object_code = json.load(f)["content"]
+    assert obtain_has_side_effects(import_func_from_code(store_object_code, "main"))
+
+
+def test_obtain_lookback():
+    def moving_average(*, data, t):
+        return {}
+
+    def component_revision(uuid: UUID) -> ComponentRevision:
+        return ComponentRevision(
+            uuid=uuid,
+            tag="1.0.0",
+            code_module_uuid=uuid,
+            function_name="main",
+            inputs=[
+                ComponentInput(id=uuid4(), name="data", type="SERIES"),
+                ComponentInput(id=uuid4(), name="t", type="STRING"),
+            ],
+            outputs=[],
+        )
+
+    component = component_revision(uuid4())
+    assert obtain_lookback(component, moving_average) is None
+    assert (
+        obtain_lookback(
+            component, register(inputs={}, outputs={}, lookback="t")(moving_average)
+        )
+        == "t"
+    )
+    assert obtain_lookback(
+        component, register(inputs={}, outputs={}, lookback="1h")(moving_average)
+    ) == datetime.timedelta(hours=1)
+
+    # released "Moving average time" component without registered lookback
+    released_component = component_revision(
+        UUID("a2ba0da0-5a9a-60e9-6af5-e07917988021")
+    )
+    assert obtain_lookback(released_component, moving_average) == "t"
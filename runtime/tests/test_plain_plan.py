@@ -0,0 +1,536 @@
+import asyncio
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from hetdesrun.models.run import ConfigurationInput
+from hetdesrun.runtime.configuration import execution_config
+from hetdesrun.runtime.engine.plain.plan import (
+    compile_workflow,
+    execute_plan,
+    memory_profiling,
+    reusable_steps,
+    step_keys,
+)
+from hetdesrun.runtime.engine.plain.workflow import ComputationNode, Workflow
+from hetdesrun.runtime.exceptions import (
+    CircularDependency,
+    MissingInputSource,
+    RuntimeExecutionError,
+)
+
+
+def add_two_values(*, c, d):
+    return {"sum": c + d}
+
+
+def nested_workflow_with_input(called_operators: list[str]) -> Workflow:
+    def provide_value():
+        called_operators.append("source")
+        return {"a": 1.2}
+
+    def dangling(*, x):
+        called_operators.append("dangling")
+        return {"y": x}
+
+    source_node = ComputationNode(func=provide_value, operator_hierarchical_id="source")
+    target_node_in_sub_wf = ComputationNode(
+        func=add_two_values, operator_hierarchical_id="sum"
+    )
+    dangling_node = ComputationNode(
+        func=dangling,
+        inputs={"x": (source_node, "a")},
+        operator_hierarchical_id="dangling",
+    )
+
+    sub_wf = Workflow(
+        sub_nodes=[target_node_in_sub_wf],
+        input_mappings={
+            "sub_wf_first_inp": (target_node_in_sub_wf, "c"),
+            "sub_wf_second_inp": (target_node_in_sub_wf, "d"),
+        },
+        output_mappings={"sub_wf_sum_outp": (target_node_in_sub_wf, "sum")},
+        inputs={"sub_wf_first_inp": (source_node, "a")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    return Workflow(
+        sub_nodes=[sub_wf, source_node, dangling_node],
+        input_mappings={"wf_inp": (sub_wf, "sub_wf_second_inp")},
+        output_mappings={"sum_result": (sub_wf, "sub_wf_sum_outp")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+
+@pytest.mark.asyncio
+async def test_compiled_nested_workflow_execution():
+    called_operators: list[str] = []
+    plan = compile_workflow(nested_workflow_with_input(called_operators))
+
+    assert plan.input_names == ["wf_inp"]
+    step_ids = [step.node.operator_hierarchical_id for step in plan.steps]
+    assert step_ids.index("source") < step_ids.index("sum")
+    assert step_ids.index("source") < step_ids.index("dangling")
+
+    result = await execute_plan(plan, {"wf_inp": 2.5})
+    assert result.outputs["sum_result"] == 3.7
+    # nodes not leading to an output are run as well
+    assert sorted(called_operators) == ["dangling", "source"]
+    # all results were released after use
+    assert result.node_results == []
+    assert result.result_memory.released_results == 3
+
+    # the plan can be executed again
+    result = await execute_plan(plan, {"wf_inp": 0.3})
+    assert result.outputs["sum_result"] == 1.5
+
+    with pytest.raises(MissingInputSource):
+        await execute_plan(plan, {})
+
+
+def test_compilation_detects_cycle_before_running_anything():
+    called = []
+
+    def provide_value(*, some_input):
+        called.append("source")
+        return {"a": 1.2, "b": 2.5}
+
+    source_node = ComputationNode(func=provide_value)
+    target_node = ComputationNode(
+        func=add_two_values,
+        inputs={"c": (source_node, "a"), "d": (source_node, "b")},
+    )
+    source_node.add_inputs({"some_input": (target_node, "sum")})
+
+    wf = Workflow(
+        sub_nodes=[source_node, target_node],
+        input_mappings={},
+        output_mappings={"sum_result": (target_node, "sum")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    with pytest.raises(CircularDependency):
+        compile_workflow(wf)
+    assert called == []
+
+
+def test_compilation_detects_missing_inputs():
+    target_node = ComputationNode(
+        func=add_two_values, inputs={}, operator_hierarchical_id="sum"
+    )
+    sub_wf = Workflow(
+        sub_nodes=[target_node],
+        input_mappings={
+            "first": (target_node, "c"),
+            "second": (target_node, "d"),
+        },
+        output_mappings={"sum_result": (target_node, "sum")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    wf = Workflow(
+        sub_nodes=[sub_wf],
+        input_mappings={"first": (sub_wf, "first")},
+        output_mappings={"sum_result": (sub_wf, "sum_result")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    with pytest.raises(MissingInputSource):
+        compile_workflow(wf)
+
+
+@pytest.mark.asyncio
+async def test_plan_execution_skips_pure_plot_operators():
+    execution_config.set(ConfigurationInput(run_pure_plot_operators=False))
+    called = []
+
+    def provide_value():
+        return {"a": 1.0}
+
+    def plot(*, x):
+        called.append("plot")
+        return {"plot": {"data": x}}
+
+    source_node = ComputationNode(func=provide_value)
+    plot_node = ComputationNode(
+        func=plot, inputs={"x": (source_node, "a")}, has_only_plot_outputs=True
+    )
+    wf = Workflow(
+        sub_nodes=[source_node, plot_node],
+        input_mappings={},
+        output_mappings={"value": (source_node, "a"), "plot": (plot_node, "plot")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    result = await execute_plan(compile_workflow(wf))
+    assert result.outputs == {"value": 1.0, "plot": {}}
+    assert called == []
+
+    execution_config.set(ConfigurationInput(run_pure_plot_operators=True))
+    result = await execute_plan(compile_workflow(wf))
+    assert result.outputs == {"value": 1.0, "plot": {"data": 1.0}}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_plan_execution():
+    execution_config.set(ConfigurationInput(gather_inputs_concurrently=True))
+
+    async def slow_increment(*, x):
+        await asyncio.sleep(0.2)
+        return {"value": x + 1.0}
+
+    async def failing(*, x):
+        raise ValueError("failure in branch")
+
+    source_node = ComputationNode(func=lambda: {"value": 1.0})
+    branch_nodes = [
+        ComputationNode(func=slow_increment, inputs={"x": (source_node, "value")})
+        for _ in range(3)
+    ]
+    target_node = ComputationNode(
+        func=lambda a, b, c: {"sum": a + b + c},
+        inputs={
+            "a": (branch_nodes[0], "value"),
+            "b": (branch_nodes[1], "value"),
+            "c": (branch_nodes[2], "value"),
+        },
+    )
+    wf = Workflow(
+        sub_nodes=[source_node, *branch_nodes, target_node],
+        input_mappings={},
+        output_mappings={"sum_result": (target_node, "sum")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    start = time.perf_counter()
+    result = await execute_plan(compile_workflow(wf))
+    assert time.perf_counter() - start < 0.5
+    assert result.outputs["sum_result"] == 6.0
+
+    wf.sub_nodes.append(
+        ComputationNode(func=failing, inputs={"x": (source_node, "value")})
+    )
+    with pytest.raises(RuntimeExecutionError, match="Unexpected error"):
+        await execute_plan(compile_workflow(wf))
+
+
+def chain_of_large_results() -> Workflow:
+    nodes = [ComputationNode(func=lambda: {"values": np.zeros(100_000)})]
+    for _ in range(4):
+        nodes.append(
+            ComputationNode(
+                func=lambda *, x: {"values": x + 1},
+                inputs={"x": (nodes[-1], "values")},
+            )
+        )
+    return Workflow(
+        sub_nodes=nodes,
+        input_mappings={},
+        output_mappings={"values": (nodes[-1], "values")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+
+@pytest.mark.asyncio
+async def test_plan_execution_releases_results_after_last_use():
+    plan = compile_workflow(chain_of_large_results())
+
+    result = await execute_plan(plan)
+    assert (result.outputs["values"] == 4).all()
+    # only the input and the output of one step are alive at the same time
+    assert result.result_memory.peak_result_bytes == 2 * 800_000
+    assert result.result_memory.peak_result_bytes_without_release >= 5 * 800_000
+    assert result.node_results == []
+
+    execution_config.set(ConfigurationInput(return_individual_node_results=True))
+    result = await execute_plan(plan)
+    assert len(result.node_results) == 5
+    assert result.result_memory.released_results == 0
+    assert result.result_memory.peak_result_bytes >= 5 * 800_000
+
+
+@pytest.mark.asyncio
+async def test_pruning_of_operators_without_effect():
+    called = []
+
+    def record_call(name):
+        def func(**kwargs):
+            called.append(name)
+            return {"value": 1.0}
+
+        return func
+
+    source_node = ComputationNode(func=record_call("source"))
+    debug_node = ComputationNode(
+        func=record_call("debug"), inputs={"x": (source_node, "value")}
+    )
+    sink_feeding_node = ComputationNode(func=record_call("sink_feeding"))
+    sink_node = ComputationNode(
+        func=record_call("sink"),
+        inputs={"x": (sink_feeding_node, "value")},
+        has_side_effects=True,
+    )
+    wf = Workflow(
+        sub_nodes=[source_node, debug_node, sink_feeding_node, sink_node],
+        input_mappings={},
+        output_mappings={"value": (source_node, "value")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    plan = compile_workflow(wf)
+
+    await execute_plan(plan)
+    assert sorted(called) == ["debug", "sink", "sink_feeding", "source"]
+
+    called.clear()
+    execution_config.set(ConfigurationInput(prune_operators_without_effect=True))
+    result = await execute_plan(plan)
+    assert result.outputs["value"] == 1.0
+    assert sorted(called) == ["sink", "sink_feeding", "source"]
+
+
+@pytest.mark.asyncio
+async def test_operator_profiles():
+    plan = compile_workflow(chain_of_large_results())
+    result = await execute_plan(plan)
+    assert result.operator_profiles is None
+
+    execution_config.set(
+        ConfigurationInput(profile_operators=True, profile_operator_memory=True)
+    )
+    result = await execute_plan(plan)
+    assert result.operator_profiles is not None
+    assert len(result.operator_profiles) == 5
+    first_profile, last_profile = (
+        result.operator_profiles[0],
+        result.operator_profiles[-1],
+    )
+    assert first_profile.operator_hierarchical_id == (
+        plan.steps[0].node.operator_hierarchical_id
+    )
+    assert all(profile.input_wait_seconds >= 0 for profile in result.operator_profiles)
+    assert last_profile.wall_time_seconds >= 0
+    assert last_profile.cpu_time_seconds is not None
+    assert last_profile.output_sizes["values"].rows == 100_000
+    assert last_profile.output_sizes["values"].size_bytes == 800_000
+    assert last_profile.tracemalloc_peak_bytes is not None
+    assert last_profile.tracemalloc_peak_bytes >= 800_000
+
+
+@pytest.mark.asyncio
+async def test_concurrent_operator_memory_profiles():
+    async def wait_and_return_small_result():
+        await asyncio.sleep(0.05)
+        return {"value": 1.0}
+
+    async def allocate_while_waiting():
+        await asyncio.sleep(0)
+        values = np.ones(1_000_000)
+        await asyncio.sleep(0.01)
+        return {"value": float(values.sum())}
+
+    waiting_node = ComputationNode(
+        func=wait_and_return_small_result, operator_hierarchical_id="waiting"
+    )
+    allocating_node = ComputationNode(
+        func=allocate_while_waiting, operator_hierarchical_id="allocating"
+    )
+    plan = compile_workflow(
+        Workflow(
+            sub_nodes=[waiting_node, allocating_node],
+            input_mappings={},
+            output_mappings={
+                "small": (waiting_node, "value"),
+                "sum": (allocating_node, "value"),
+            },
+            tr_id="UNKNOWN",
+            tr_name="UNKNOWN",
+            tr_tag="UNKNOWN",
+        )
+    )
+
+    execution_config.set(
+        ConfigurationInput(
+            gather_inputs_concurrently=True,
+            profile_operators=True,
+            profile_operator_memory=True,
+        )
+    )
+    result = await execute_plan(plan)
+    assert result.operator_profiles is not None
+    profiles = {
+        profile.operator_hierarchical_id: profile
+        for profile in result.operator_profiles
+    }
+    # the allocations of the other operator are not attributed to the waiting one
+    assert profiles["allocating"].tracemalloc_peak_bytes >= 8_000_000
+    assert profiles["waiting"].tracemalloc_peak_bytes < 1_000_000
+    # both inputless operators were ready at once, but ran one after another
+    assert sum(profile.input_wait_seconds for profile in profiles.values()) >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executions_profiling_memory():
+    async def return_small_result():
+        await asyncio.sleep(0.01)
+        return {"value": 1.0}
+
+    async def allocate_later():
+        await asyncio.sleep(0.05)
+        values = np.ones(1_000_000)
+        return {"value": float(values.sum())}
+
+    def single_node_plan(func, operator_hierarchical_id):
+        node = ComputationNode(
+            func=func, operator_hierarchical_id=operator_hierarchical_id
+        )
+        return compile_workflow(
+            Workflow(
+                sub_nodes=[node],
+                input_mappings={},
+                output_mappings={"value": (node, "value")},
+                tr_id="UNKNOWN",
+                tr_name="UNKNOWN",
+                tr_tag="UNKNOWN",
+            )
+        )
+
+    execution_config.set(
+        ConfigurationInput(profile_operators=True, profile_operator_memory=True)
+    )
+    assert not tracemalloc.is_tracing()
+    # the first execution ends while the second one is still tracing memory
+    small_result, allocating_result = await asyncio.gather(
+        execute_plan(single_node_plan(return_small_result, "small")),
+        execute_plan(single_node_plan(allocate_later, "allocating")),
+    )
+    assert small_result.operator_profiles is not None
+    assert allocating_result.operator_profiles is not None
+    assert small_result.operator_profiles[0].tracemalloc_peak_bytes < 1_000_000
+    assert allocating_result.operator_profiles[0].tracemalloc_peak_bytes >= 8_000_000
+    # tracing is stopped after the last execution
+    assert memory_profiling.active_executions == 0
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.asyncio
+async def test_plan_execution_reusing_previous_results():
+    called = []
+
+    def record_call(name):
+        def func(**kwargs):
+            called.append(name)
+            return {"value": sum(kwargs.values()) + 1.0}
+
+        return func
+
+    source_node = ComputationNode(func=record_call("source"))
+    independent_node = ComputationNode(
+        func=record_call("independent"), inputs={"x": (source_node, "value")}
+    )
+    dependent_node = ComputationNode(
+        func=record_call("dependent"), inputs={"x": (source_node, "value")}
+    )
+    sink_node = ComputationNode(
+        func=record_call("sink"),
+        inputs={"x": (independent_node, "value")},
+        has_side_effects=True,
+    )
+    wf = Workflow(
+        sub_nodes=[source_node, independent_node, dependent_node, sink_node],
+        input_mappings={"y": (dependent_node, "y")},
+        output_mappings={
+            "independent": (independent_node, "value"),
+            "dependent": (dependent_node, "value"),
+        },
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    plan = compile_workflow(wf)
+
+    first_result = await execute_plan(plan, {"y": 1.0}, reusable_results={})
+    assert first_result.reused_operators == []
+    assert len(first_result.step_results) == 4
+    assert first_result.outputs == {"independent": 2.0, "dependent": 3.0}
+
+    keys = step_keys(plan)
+    reusable = reusable_steps(
+        plan,
+        {keys[index]: result for index, result in first_result.step_results.items()},
+        {"y"},
+        run_pure_plot_operators=True,
+    )
+    # the sink is run again, since it has side effects
+    assert {plan.steps[index].node for index in reusable} == {
+        source_node,
+        independent_node,
+    }
+
+    called.clear()
+    result = await execute_plan(plan, {"y": 2.0}, reusable_results=reusable)
+    assert sorted(called) == ["dependent", "sink"]
+    assert result.outputs == {"independent": 2.0, "dependent": 4.0}
+    assert len(result.reused_operators) == 2
+
+
+@pytest.mark.asyncio
+async def test_reused_results_are_not_modified_by_consumers():
+    def provide_values():
+        return {"values": [1.0, 2.0]}
+
+    def append_in_place(*, values, y):
+        values.append(y)
+        return {"total": sum(values)}
+
+    source_node = ComputationNode(func=provide_values)
+    consumer_node = ComputationNode(
+        func=append_in_place, inputs={"values": (source_node, "values")}
+    )
+    wf = Workflow(
+        sub_nodes=[source_node, consumer_node],
+        input_mappings={"y": (consumer_node, "y")},
+        output_mappings={"total": (consumer_node, "total")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    plan = compile_workflow(wf)
+
+    first_result = await execute_plan(plan, {"y": 10.0}, reusable_results={})
+    assert first_result.outputs == {"total": 13.0}
+
+    keys = step_keys(plan)
+    previous_results = {
+        keys[index]: result for index, result in first_result.step_results.items()
+    }
+    for y in [20.0, 30.0]:
+        reusable = reusable_steps(
+            plan, previous_results, {"y"}, run_pure_plot_operators=True
+        )
+        assert {plan.steps[index].node for index in reusable} == {source_node}
+        result = await execute_plan(plan, {"y": y}, reusable_results=reusable)
+        assert result.reused_operators == [source_node.operator_hierarchical_id]
+        # the same as a fresh execution
+        assert result.outputs == {"total": 3.0 + y}
+        previous_results = {
+            keys[index]: result for index, result in result.step_results.items()
+        }
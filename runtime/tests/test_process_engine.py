@@ -0,0 +1,123 @@
+import os
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.component.load import import_func_from_code
+from hetdesrun.models.run import ConfigurationInput, ExecutionEngine
+from hetdesrun.runtime.configuration import execution_config
+from hetdesrun.runtime.engine.plain.execution import shutdown_executor_pools
+from hetdesrun.runtime.engine.plain.plan import compile_workflow
+from hetdesrun.runtime.engine.plain.transfer import (
+    SharedMemoryPandasObject,
+    from_shared_memory,
+    to_shared_memory,
+)
+from hetdesrun.runtime.engine.plain.workflow import ComputationNode, Workflow
+from hetdesrun.runtime.engine.process import workflow_execution_process
+
+
+@pytest.fixture()
+def transfer_everything_via_shared_memory():
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.shared_memory_transfer_min_bytes",
+        0,
+    ) as _fixture:
+        yield _fixture
+
+
+def test_series_round_trip_via_shared_memory(transfer_everything_via_shared_memory):
+    series = pd.Series(
+        [1.0, np.nan, 3.5],
+        index=pd.to_datetime(
+            ["2020-01-01T00:00:00Z", "2020-01-01T01:00:00Z", "2020-01-01T02:00:00Z"],
+            utc=True,
+        ),
+        name="temperature",
+    )
+    series.attrs = {"unit": "°C"}
+
+    handle = to_shared_memory(series)
+    assert isinstance(handle, SharedMemoryPandasObject)
+
+    received = from_shared_memory(handle, unlink=True)
+    pd.testing.assert_series_equal(received, series)
+    assert received.attrs == {"unit": "°C"}
+
+    with pytest.raises(FileNotFoundError):
+        from_shared_memory(handle)
+
+
+def test_dataframe_round_trip_via_shared_memory(transfer_everything_via_shared_memory):
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2020-01-01", periods=4, freq="h", tz="UTC"),
+            "metric": pd.Categorical(["a", "b", "a", "b"]),
+            "value": [1, 2, 3, 4],
+        }
+    )
+    received = from_shared_memory(to_shared_memory(df), unlink=True)
+    pd.testing.assert_frame_equal(received, df)
+
+
+def test_transfer_falls_back_to_pickling(transfer_everything_via_shared_memory):
+    # Arrow requires string column names
+    df = pd.DataFrame({1: [1.0, 2.0], 2: [3.0, 4.0]})
+    assert to_shared_memory(df) is df
+    assert to_shared_memory(42) == 42
+
+
+def test_small_objects_are_not_transferred_via_shared_memory():
+    series = pd.Series([1.0, 2.0])
+    assert to_shared_memory(series) is series
+
+
+component_code_doubling_series = """\
+import os
+
+def main(*, series):
+    return {"doubled": 2 * series, "pid": os.getpid()}
+"""
+
+
+@pytest.mark.asyncio
+async def test_process_engine_runs_sync_components_in_worker_processes(
+    transfer_everything_via_shared_memory,
+):
+    series = pd.Series(np.arange(10_000, dtype=float), name="values")
+    source_node = ComputationNode(func=lambda: {"series": series})
+    doubling_nodes = [
+        ComputationNode(
+            func=import_func_from_code(component_code_doubling_series, "main"),
+            inputs={"series": (source_node, "series")},
+            operator_hierarchical_id=f"doubling_{i}",
+            code=component_code_doubling_series,
+            func_name="main",
+        )
+        for i in range(2)
+    ]
+    wf = Workflow(
+        sub_nodes=[source_node, *doubling_nodes],
+        input_mappings={},
+        output_mappings={
+            "doubled_0": (doubling_nodes[0], "doubled"),
+            "doubled_1": (doubling_nodes[1], "doubled"),
+            "pid": (doubling_nodes[0], "pid"),
+        },
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+    execution_config.set(ConfigurationInput(engine=ExecutionEngine.Process))
+    try:
+        res = (await workflow_execution_process(compile_workflow(wf))).outputs
+    finally:
+        execution_config.set(ConfigurationInput())
+        shutdown_executor_pools()
+
+    pd.testing.assert_series_equal(res["doubled_0"], 2 * series)
+    pd.testing.assert_series_equal(res["doubled_1"], 2 * series)
+    assert res["pid"] != os.getpid()
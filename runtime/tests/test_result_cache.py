@@ -0,0 +1,187 @@
+import pickle
+import sys
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.component.load import import_func_from_code
+from hetdesrun.runtime.engine.plain.plan import compile_workflow, execute_plan
+from hetdesrun.runtime.engine.plain.result_cache import (
+    evict_from_directory,
+    result_cache,
+    result_cache_key,
+)
+from hetdesrun.runtime.engine.plain.workflow import ComputationNode, Workflow
+
+CODE = """
+CALLS = []
+
+def scale(*, series, factor):
+    CALLS.append(factor)
+    return {"scaled": series * factor}
+"""
+
+
+@pytest.fixture()
+def cacheable_scale_node() -> ComputationNode:
+    result_cache.clear()
+    func = import_func_from_code(CODE, "scale")
+    sys.modules[func.__module__].CALLS.clear()
+    return ComputationNode(
+        func=func,
+        inputs={},
+        operator_hierarchical_id="scale",
+        cacheable=True,
+        code=CODE,
+        func_name="scale",
+    )
+
+
+def calls_of(node: ComputationNode) -> list:
+    return sys.modules[node.func.__module__].CALLS
+
+
+def workflow_with(node: ComputationNode) -> Workflow:
+    return Workflow(
+        sub_nodes=[node],
+        input_mappings={"series": (node, "series"), "factor": (node, "factor")},
+        output_mappings={"scaled": (node, "scaled")},
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+
+
+def test_result_cache_key(cacheable_scale_node):
+    series = pd.Series([1.0, 2.0, 3.0], name="a")
+    key = result_cache_key(cacheable_scale_node, {"series": series, "factor": 2})
+    assert key is not None
+    assert key == result_cache_key(
+        cacheable_scale_node, {"factor": 2, "series": series.copy()}
+    )
+    for other_inputs in (
+        {"series": series, "factor": 3},
+        {"series": pd.Series([1.0, 2.0, 4.0], name="a"), "factor": 2},
+        {"series": series.rename("b"), "factor": 2},
+        {"series": pd.Series([1.0, 2.0, 3.0], index=[1, 2, 3], name="a"), "factor": 2},
+        {"series": series.to_frame(), "factor": 2},
+        {"series": series.to_numpy(), "factor": 2},
+    ):
+        assert key != result_cache_key(cacheable_scale_node, other_inputs)
+
+    # unhashable objects in object columns are pickled
+    assert (
+        result_cache_key(
+            cacheable_scale_node,
+            {"series": pd.Series([[1], [2]], dtype=object), "factor": 2},
+        )
+        is not None
+    )
+
+    # values which can be neither hashed nor pickled cannot be cached
+    assert (
+        result_cache_key(cacheable_scale_node, {"series": lambda: 1, "factor": 2})
+        is None
+    )
+
+    # functions not imported from code are not identified by their code
+    assert (
+        result_cache_key(ComputationNode(func=lambda *, x: {"y": x}), {"x": 1}) is None
+    )
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.result_cache_max_bytes", 0
+    ):
+        assert (
+            result_cache_key(cacheable_scale_node, {"series": series, "factor": 2})
+            is None
+        )
+
+
+@pytest.mark.asyncio
+async def test_cacheable_operator_is_run_once_per_input(cacheable_scale_node):
+    plan = compile_workflow(workflow_with(cacheable_scale_node))
+    series = pd.Series([1.0, 2.0, 3.0])
+
+    result = await execute_plan(plan, {"series": series, "factor": 2})
+    assert result.result_cache.hits == 0
+    assert result.result_cache.misses == 1
+    assert result.result_cache.currsize_bytes > 0
+
+    # results served from the cache are copies
+    result.outputs["scaled"].iloc[0] = 100.0
+
+    result = await execute_plan(plan, {"series": series.copy(), "factor": 2})
+    assert result.result_cache.hits == 1
+    assert result.outputs["scaled"].tolist() == [2.0, 4.0, 6.0]
+    assert calls_of(cacheable_scale_node) == [2]
+
+    result = await execute_plan(plan, {"series": series, "factor": 3})
+    assert result.result_cache.hits == 0
+    assert calls_of(cacheable_scale_node) == [2, 3]
+
+    cacheable_scale_node.cacheable = False
+    result = await execute_plan(plan, {"series": series, "factor": 2})
+    assert result.result_cache.misses == 0
+    assert calls_of(cacheable_scale_node) == [2, 3, 2]
+
+
+@pytest.mark.asyncio
+async def test_result_cache_evicts_least_recently_used(cacheable_scale_node):
+    plan = compile_workflow(workflow_with(cacheable_scale_node))
+    series = pd.Series(np.zeros(1000))  # results of about 8 KB
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.result_cache_max_bytes", 20_000
+    ):
+        for factor in (1, 2, 3, 1):
+            await execute_plan(plan, {"series": series, "factor": factor})
+        assert calls_of(cacheable_scale_node) == [1, 2, 3, 1]
+        assert result_cache.currsize_bytes <= 20_000
+
+
+@pytest.mark.asyncio
+async def test_result_cache_directory(cacheable_scale_node, tmp_path):
+    plan = compile_workflow(workflow_with(cacheable_scale_node))
+    series = pd.Series([1.0, 2.0, 3.0])
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.result_cache_dir", str(tmp_path)
+    ):
+        await execute_plan(plan, {"series": series, "factor": 2})
+        assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+        # e.g. a new runtime worker process
+        result_cache.clear()
+        result = await execute_plan(plan, {"series": series, "factor": 2})
+        assert result.result_cache.hits == 1
+        assert result.outputs["scaled"].tolist() == [2.0, 4.0, 6.0]
+        assert calls_of(cacheable_scale_node) == [2]
+
+    evict_from_directory(str(tmp_path), 0)
+    assert len(list(tmp_path.glob("*.pickle"))) == 0
+
+
+@pytest.mark.asyncio
+async def test_invalid_files_in_result_cache_directory_are_misses(
+    cacheable_scale_node, tmp_path
+):
+    plan = compile_workflow(workflow_with(cacheable_scale_node))
+    series = pd.Series([1.0, 2.0, 3.0])
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.result_cache_dir", str(tmp_path)
+    ):
+        await execute_plan(plan, {"series": series, "factor": 2})
+        (path,) = tmp_path.glob("*.pickle")
+        with open(path, "wb") as f:
+            pickle.dump(["not", "a", "cached", "result"], f)
+
+        result_cache.clear()
+        result = await execute_plan(plan, {"series": series, "factor": 2})
+        assert result.result_cache.hits == 0
+        assert result.result_cache.misses == 1
+        assert result.outputs["scaled"].tolist() == [2.0, 4.0, 6.0]
+        assert calls_of(cacheable_scale_node) == [2, 2]
@@ -0,0 +1,119 @@
+import os
+from unittest import mock
+from uuid import uuid4
+
+import httpx
+import pandas as pd
+import pytest
+
+from hetdesrun.backend.execution import post_to_runtime
+from hetdesrun.models.run import (
+    Result,
+    WorkflowExecutionInput,
+    WorkflowExecutionResult,
+)
+from hetdesrun.trafoutils.io.load import load_json
+from hetdesrun.webservice.config import ResultMediaType
+from hetdesrun.webservice.result_transport import (
+    binary_result_response,
+    parse_binary_result,
+    requested_binary_media_type,
+)
+
+
+def execution_result_with_pandas_outputs() -> WorkflowExecutionResult:
+    index = pd.date_range("2023-01-01", periods=4, freq="1h", tz="UTC")
+    return WorkflowExecutionResult(
+        result=Result.OK,
+        output_results_by_output_name={
+            "series": pd.Series([1.0, None, 3.5, 4.0], index=index, name="values"),
+            "frame": pd.DataFrame(
+                {"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]}, index=index
+            ),
+            "frame_with_int_columns": pd.DataFrame({0: [1.0, 2.0], 1: [3.0, 4.0]}),
+            "number": 42,
+        },
+        job_id=uuid4(),
+    )
+
+
+def test_requested_binary_media_type():
+    assert requested_binary_media_type(None) is None
+    assert requested_binary_media_type("application/json") is None
+    assert requested_binary_media_type("*/*") is None
+    assert (
+        requested_binary_media_type(
+            "application/vnd.apache.arrow.stream, application/json;q=0.9"
+        )
+        is ResultMediaType.ARROW_STREAM
+    )
+    assert (
+        requested_binary_media_type("text/html, application/vnd.apache.parquet")
+        is ResultMediaType.PARQUET
+    )
+    assert (
+        requested_binary_media_type(
+            "application/json, application/vnd.apache.arrow.stream"
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    "media_type", [ResultMediaType.ARROW_STREAM, ResultMediaType.PARQUET]
+)
+def test_binary_result_round_trip(media_type):
+    execution_result = execution_result_with_pandas_outputs()
+    response = binary_result_response(execution_result, media_type)
+    assert response.media_type.startswith("multipart/mixed; boundary=")
+
+    parsed = parse_binary_result(response.body, response.media_type)
+    outputs = parsed["output_results_by_output_name"]
+    expected_outputs = execution_result.output_results_by_output_name
+
+    pd.testing.assert_series_equal(
+        outputs["series"], expected_outputs["series"], check_freq=False
+    )
+    pd.testing.assert_frame_equal(
+        outputs["frame"], expected_outputs["frame"], check_freq=False
+    )
+    # not representable in Arrow, hence transported as JSON
+    assert isinstance(outputs["frame_with_int_columns"], dict)
+    assert outputs["number"] == 42
+    assert parsed["result"] == "ok"
+    assert parsed["job_id"] == str(execution_result.job_id)
+    assert "binary_outputs" not in parsed
+
+    with pytest.raises(ValueError, match="Invalid multipart execution result"):
+        parse_binary_result(response.body[:-100], response.media_type)
+    with pytest.raises(ValueError, match="No boundary"):
+        parse_binary_result(response.body, "multipart/mixed")
+
+
+@pytest.mark.asyncio
+async def test_post_to_runtime_parses_binary_result():
+    binary_response = binary_result_response(
+        execution_result_with_pandas_outputs(), ResultMediaType.ARROW_STREAM
+    )
+    with mock.patch(
+        "hetdesrun.backend.execution.httpx.AsyncClient.post",
+        return_value=httpx.Response(
+            200,
+            content=binary_response.body,
+            headers={"content-type": binary_response.media_type},
+        ),
+    ) as mocked_post:
+        json_obj = await post_to_runtime(
+            "runtime",
+            WorkflowExecutionInput(
+                **load_json(
+                    os.path.join("tests", "data", "nested_wf_execution_input.json")
+                )
+            ),
+            ResultMediaType.ARROW_STREAM,
+        )
+    assert mocked_post.call_args.kwargs["headers"]["Accept"].startswith(
+        "application/vnd.apache.arrow.stream"
+    )
+    assert isinstance(json_obj["output_results_by_output_name"]["series"], pd.Series)
+    WorkflowExecutionResult(**json_obj)
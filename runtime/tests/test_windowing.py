@@ -0,0 +1,194 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from hetdesrun.models.wiring import InputWiring, WorkflowWiring
+from hetdesrun.runtime.engine.plain.plan import compile_workflow, execute_plan
+from hetdesrun.runtime.engine.plain.windowing import (
+    ExecutionWindow,
+    WindowingError,
+    combine_window_values,
+    required_lookback,
+    restrict_to_window,
+    split_into_windows,
+    time_range_of_wiring,
+    wiring_for_window,
+)
+from hetdesrun.runtime.engine.plain.workflow import ComputationNode, Workflow
+
+
+def time_filtered_wiring(timestamp_from: str, timestamp_to: str) -> WorkflowWiring:
+    return WorkflowWiring(
+        input_wirings=[
+            InputWiring(
+                workflow_input_name="series",
+                adapter_id="some_adapter",
+                ref_id="some_source",
+                filters={"timestampFrom": timestamp_from, "timestampTo": timestamp_to},
+            ),
+            InputWiring(
+                workflow_input_name="window",
+                adapter_id="direct_provisioning",
+                filters={"value": "2h"},
+            ),
+        ]
+    )
+
+
+def test_split_into_windows():
+    workflow_wiring = time_filtered_wiring(
+        "2023-01-01T00:00:00.000000000Z", "2023-01-03T12:00:00.000000000Z"
+    )
+    start, end = time_range_of_wiring(workflow_wiring)
+    windows = split_into_windows(start, end, datetime.timedelta(days=1))
+
+    assert [(window.start.day, window.end.day) for window in windows] == [
+        (1, 2),
+        (2, 3),
+        (3, 3),
+    ]
+    assert windows[-1].end == end
+    assert [window.is_last for window in windows] == [False, False, True]
+
+    windowed_wiring = wiring_for_window(
+        workflow_wiring, windows[1].start - datetime.timedelta(hours=2), windows[1].end
+    )
+    assert windowed_wiring.input_wirings[0].filters == {
+        "timestampFrom": "2023-01-01T22:00:00.000000000Z",
+        "timestampTo": "2023-01-03T00:00:00.000000000Z",
+    }
+    assert windowed_wiring.input_wirings[1].filters == {"value": "2h"}
+    # the original wiring is unchanged
+    assert (
+        workflow_wiring.input_wirings[0].filters["timestampFrom"]
+        == "2023-01-01T00:00:00.000000000Z"
+    )
+
+    with pytest.raises(WindowingError, match="same timestampFrom"):
+        time_range_of_wiring(
+            WorkflowWiring(
+                input_wirings=[
+                    *workflow_wiring.input_wirings[:1],
+                    InputWiring(
+                        workflow_input_name="other_series",
+                        adapter_id="some_adapter",
+                        ref_id="other_source",
+                        filters={
+                            "timestampFrom": "2023-01-02T00:00:00.000000000Z",
+                            "timestampTo": "2023-01-03T12:00:00.000000000Z",
+                        },
+                    ),
+                ]
+            )
+        )
+    with pytest.raises(WindowingError, match="requires input wirings"):
+        time_range_of_wiring(
+            WorkflowWiring(input_wirings=workflow_wiring.input_wirings[1:])
+        )
+
+
+def test_restrict_and_combine_window_values():
+    series = pd.Series(
+        range(5),
+        index=pd.date_range("2023-01-01", periods=5, freq="1h", tz="UTC"),
+    )
+    windows = [
+        ExecutionWindow(
+            start=pd.Timestamp("2023-01-01T00:00:00Z"),
+            end=pd.Timestamp("2023-01-01T02:00:00Z"),
+            is_last=False,
+        ),
+        ExecutionWindow(
+            start=pd.Timestamp("2023-01-01T02:00:00Z"),
+            end=pd.Timestamp("2023-01-01T04:00:00Z"),
+            is_last=True,
+        ),
+    ]
+    restricted = [restrict_to_window(series, window) for window in windows]
+    assert restricted[0].tolist() == [0, 1]
+    assert restricted[1].tolist() == [2, 3, 4]
+    pd.testing.assert_series_equal(combine_window_values(restricted), series)
+
+    multitsframe = pd.DataFrame(
+        {
+            "timestamp": series.index.repeat(2),
+            "metric": ["a", "b"] * 5,
+            "value": range(10),
+        }
+    )
+    restricted_frames = [restrict_to_window(multitsframe, window) for window in windows]
+    assert len(restricted_frames[0]) == 4
+    pd.testing.assert_frame_equal(
+        combine_window_values(restricted_frames), multitsframe
+    )
+
+    # values without timestamps are taken from the last window
+    assert restrict_to_window(42, windows[0]) == 42
+    assert combine_window_values([{"plot": 1}, {"plot": 2}]) == {"plot": 2}
+
+
+@pytest.mark.asyncio
+async def test_required_lookback():
+    def moving_mean(*, series, window):
+        return {"mean": series.rolling(window).mean()}
+
+    def shift(*, series):
+        return {"shifted": series.shift(1)}
+
+    first_mean = ComputationNode(
+        func=moving_mean, lookback="window", operator_hierarchical_id="first"
+    )
+    fixed_lookback_shift = ComputationNode(
+        func=shift,
+        inputs={"series": (first_mean, "mean")},
+        lookback=datetime.timedelta(minutes=30),
+        operator_hierarchical_id="shift",
+    )
+    second_mean = ComputationNode(
+        func=moving_mean,
+        inputs={"series": (fixed_lookback_shift, "shifted")},
+        lookback="window",
+        operator_hierarchical_id="second",
+    )
+    parallel_shift = ComputationNode(
+        func=shift,
+        inputs={"series": (first_mean, "mean")},
+        operator_hierarchical_id="parallel",
+    )
+    workflow = Workflow(
+        sub_nodes=[first_mean, fixed_lookback_shift, second_mean, parallel_shift],
+        input_mappings={
+            "series": (first_mean, "series"),
+            "window": (first_mean, "window"),
+            "second_window": (second_mean, "window"),
+        },
+        output_mappings={
+            "mean": (second_mean, "mean"),
+            "shifted": (parallel_shift, "shifted"),
+        },
+        tr_id="UNKNOWN",
+        tr_name="UNKNOWN",
+        tr_tag="UNKNOWN",
+    )
+    plan = compile_workflow(workflow)
+    input_values = {
+        "series": pd.Series(
+            range(10),
+            index=pd.date_range("2023-01-01", periods=10, freq="1h", tz="UTC"),
+        ),
+        "window": "2h",
+        "second_window": "3h",
+    }
+    result = await execute_plan(plan, input_values, reusable_results={})
+
+    assert required_lookback(
+        plan, input_values, result.step_results  # type: ignore[arg-type]
+    ) == datetime.timedelta(hours=5, minutes=30)
+
+    with pytest.raises(WindowingError, match="lookback of operator"):
+        required_lookback(
+            plan,
+            {**input_values, "window": "not a duration"},
+            result.step_results,  # type: ignore[arg-type]
+        )
@@ -1,5 +1,10 @@
+from unittest import mock
+
 import pytest
 
+from hetdesrun.models.wiring import InputWiring, WorkflowWiring
+from hetdesrun.wiring import resolve_and_load_data_from_wirings
+
 
 async def run_workflow_with_client(workflow_json, open_async_test_client):
     response = await open_async_test_client.post("engine/runtime", json=workflow_json)
@@ -63,3 +68,48 @@ async def test_wiring_direct_input_provisioning(
 
         assert "32.0" in node_results  # intermediate result
         assert "64.0" in node_results
+
+
+@pytest.mark.asyncio
+async def test_resolve_and_load_data_from_wirings_loads_identical_sources_once():
+    def wiring_with(x_value: str) -> WorkflowWiring:
+        return WorkflowWiring(
+            input_wirings=[
+                InputWiring(
+                    workflow_input_name="x",
+                    adapter_id="some_adapter",
+                    ref_id="x_source",
+                    filters={"value": x_value},
+                ),
+                InputWiring(
+                    workflow_input_name="y",
+                    adapter_id="some_adapter",
+                    ref_id="y_source",
+                ),
+            ]
+        )
+
+    async def load_data(adapter_key, filtered_sources):
+        return {
+            name: [source.ref_id, source.filters.get("value")]
+            for name, source in filtered_sources.items()
+        }
+
+    with mock.patch(
+        "hetdesrun.wiring.load_data_from_adapter", side_effect=load_data
+    ) as mocked_load:
+        loaded_data = await resolve_and_load_data_from_wirings(
+            [wiring_with("1"), wiring_with("2"), wiring_with("1")]
+        )
+
+    mocked_load.assert_called_once()
+    assert len(mocked_load.call_args.args[1]) == 3  # x with "1" and "2", y
+
+    assert loaded_data == [
+        {"x": ["x_source", "1"], "y": ["y_source", None]},
+        {"x": ["x_source", "2"], "y": ["y_source", None]},
+        {"x": ["x_source", "1"], "y": ["y_source", None]},
+    ]
+    # identical sources are copied for every further wiring
+    assert loaded_data[0]["x"] is not loaded_data[2]["x"]
+    assert loaded_data[0]["y"] is not loaded_data[1]["y"]